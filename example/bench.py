@@ -0,0 +1,328 @@
+"""
+Замеры TeleData и Map на синтетических ячейках основных типов и на example/data1, example/data2
+Запуск: python -m example.bench [--size 20] [--count 200] [--repeat 3] [--output results.json]
+Результаты - JSON (список замеров), для сравнения прогонов между собой
+"""
+import os
+import sys
+import json
+import time
+import struct
+import argparse
+import platform
+import tracemalloc
+
+from example.telegram import TeleData
+
+VECTOR = 0x1cb5c415
+SAMPLES = os.path.dirname(os.path.abspath(__file__))
+
+
+class CellWriter(object):
+    """
+    Сборка ячейки TL из примитивов
+    >>> cell = CellWriter().int32(0x9db1bc6d).int32(42).bytes()
+    >>> data = TeleData(cell)
+    >>> print(data.peer_deserialize(data.read_int32))
+    {'user_id': 42}
+    """
+    def __init__(self):
+        self.parts = list()
+
+    def int32(self, value):
+        self.parts.append(struct.pack('<I', value & 0xffffffff))
+        return self
+
+    def int64(self, value):
+        self.parts.append(struct.pack('<Q', value & 0xffffffffffffffff))
+        return self
+
+    def string(self, value):
+        data = value.encode('utf-8') if isinstance(value, str) else bytes(value)
+        if len(data) < 254:
+            head = bytes((len(data),))
+        else:
+            head = b'\xfe' + struct.pack('<I', len(data))[:3]
+        padding = -(len(head) + len(data)) % 4
+        self.parts.append(head + data + b'\x00' * padding)
+        return self
+
+    def vector(self, items, write):
+        self.int32(VECTOR).int32(len(items))
+        for item in items:
+            write(self, item)
+        return self
+
+    def bytes(self):
+        return b''.join(self.parts)
+
+
+def _peer_user(cell, user_id):
+    cell.int32(0x9db1bc6d).int32(user_id)
+
+
+def _file_location(cell, local_id):
+    cell.int32(0xbc7fc6cd).int64(local_id * 7919).int32(local_id)
+
+
+def _photo_size(cell, number):
+    cell.int32(0x77bfb61b).string('sm'[number % 2])
+    _file_location(cell, number)
+    cell.int32(90 * (number + 1)).int32(60 * (number + 1)).int32(1024 * (number + 1))
+
+
+def _photo(cell, sizes):
+    cell.int32(0xd07504a5).int32(0).int64(sizes * 31).int64(sizes * 37).string(b'\x01\x02\x03\x04')
+    cell.int32(1500000000 + sizes).vector(list(range(sizes)), _photo_size).int32(2)
+
+
+def _rich_text(cell, number):
+    # textConcat [textBold(textPlain), textPlain]
+    cell.int32(0x7e6260d7).int32(VECTOR).int32(2)
+    cell.int32(0x6724abc4).int32(0x744694e0).string('bold {}'.format(number))
+    cell.int32(0x744694e0).string('paragraph {} '.format(number) * 4)
+
+
+def _page_block(cell, number):
+    if number % 5 == 0:
+        cell.int32(0x70abc3fd).int32(0x744694e0).string('title {}'.format(number))
+    else:
+        cell.int32(0x467a0766)
+        _rich_text(cell, number)
+
+
+def _page(cell, blocks):
+    cell.int32(0xae891bec).int32(0).string('https://example.com/page')
+    cell.vector(list(range(blocks)), _page_block)
+    cell.vector([2], lambda writer, sizes: _photo(writer, sizes))
+    cell.int32(VECTOR).int32(0)
+
+
+def _web_page(cell, size):
+    cell.int32(0x5f07b4bc).int32(2 | 4 | 8 | 16 | 1024).int64(size * 101)
+    cell.string('https://example.com/{}'.format(size)).string('example.com/{}'.format(size)).int32(size)
+    cell.string('Example').string('Title {}'.format(size)).string('Description ' * 8)
+    _photo(cell, 3)
+    _page(cell, size)
+
+
+def web_page_cell(size):
+    """
+    :param size: число блоков страницы
+    """
+    cell = CellWriter()
+    _web_page(cell, size)
+    return cell.bytes()
+
+
+def _message_head(cell, flags, text):
+    cell.int32(0x44f9b43d).int32(flags).int32(7).int32(5)
+    _peer_user(cell, 42)
+    cell.int32(1500000000).string(text)
+
+
+def _entity(cell, number):
+    cell.int32(0xbd610bc9).int32(number * 4).int32(3)
+
+
+def message_photo_cell(size):
+    """
+    :param size: число размеров фото и сущностей текста
+    """
+    cell = CellWriter()
+    _message_head(cell, 256 | 512 | 128 | 1024, 'photo message ' * 4)
+    cell.int32(0x695150d7).int32(1 | 2)
+    _photo(cell, size)
+    cell.string('caption')
+    cell.vector(list(range(size)), _entity).int32(100)
+    return cell.bytes()
+
+
+def message_web_page_cell(size):
+    """
+    :param size: число блоков страницы во вложенной web-странице
+    """
+    cell = CellWriter()
+    _message_head(cell, 256 | 512, 'https://example.com/{}'.format(size))
+    cell.int32(0xa32dd600)
+    _web_page(cell, size)
+    return cell.bytes()
+
+
+def user_cell(size):
+    """
+    :param size: длина имён (в повторах)
+    """
+    cell = CellWriter()
+    cell.int32(0x2e13f4c3).int32(1 | 2 | 4 | 8 | 16 | 32 | 64).int32(size)
+    cell.int64(size * 13).string('First' * size).string('Last' * size).string('user{}'.format(size))
+    cell.string('79990000000')
+    cell.int32(0xecd75d8c).int64(size * 17)
+    _file_location(cell, 1)
+    _file_location(cell, 2)
+    cell.int32(2).int32(0xedb93949).int32(1500000000)
+    return cell.bytes()
+
+
+def _participant(cell, number):
+    cell.int32(0xc8d7493e).int32(1000 + number).int32(1000).int32(1500000000 + number)
+
+
+def chat_full_cell(size):
+    """
+    :param size: число участников чата
+    """
+    cell = CellWriter()
+    cell.int32(0x1b7c9db3).int32(4 | 64).int32(size).string('About chat ' * 4)
+    cell.int32(0x3f460fed).int32(size).vector(list(range(size)), _participant).int32(1)
+    _photo(cell, 3)
+    cell.int32(0xaf509d20).int32(0)
+    cell.int32(0x69df3769)
+    cell.int32(size)
+    return cell.bytes()
+
+
+def sticker_set_cell(size):
+    """
+    :param size: длина названия (в повторах)
+    """
+    cell = CellWriter()
+    cell.int32(0xcd303b41).int32(1 | 4).int64(size * 19).int64(size * 23)
+    cell.string('Stickers ' * size).string('stickers_{}'.format(size)).int32(size).int32(size * 3)
+    return cell.bytes()
+
+
+# имя: (тип ячейки для TeleData, генератор ячейки по размеру)
+SYNTHETIC = {
+    'message_photo': ('message', message_photo_cell),
+    'message_web_page': ('message', message_web_page_cell),
+    'user': ('user', user_cell),
+    'chat_full': ('chat_full', chat_full_cell),
+    'web_page': ('web_page', web_page_cell),
+    'sticker_set': ('sticker_set', sticker_set_cell),
+}
+
+
+def sample_cells():
+    """
+    :return: {имя: ячейка} для example/data1, example/data2
+    """
+    cells = dict()
+    for name in ('data1', 'data2'):
+        with open(os.path.join(SAMPLES, name), 'rb') as sample:
+            cells[name] = sample.read()
+    return cells
+
+
+def _measure(func, repeat):
+    # лучшее время из repeat прогонов и пик памяти (отдельный прогон под tracemalloc)
+    best = None
+    for i in range(repeat):
+        started = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - started
+        best = seconds if best is None else min(best, seconds)
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def bench_decode(name, kind, cell, count, repeat, **options):
+    """
+    Разбор count копий ячейки через TeleData.decode_many
+    :return: dict с objects_per_second, bytes_per_second, peak_memory
+    """
+    counter = TeleData(cell, **options)
+    getattr(counter, kind + '_deserialize')(counter.read_int32)
+    objects = len(counter.instances)
+    cells = [cell] * count
+    seconds, peak = _measure(lambda: list(TeleData.decode_many(cells, kind, **options)), repeat)
+    return {
+        'case': name, 'operation': 'decode', 'kind': kind, 'options': {k: str(v) for k, v in options.items()},
+        'cells': count, 'cell_bytes': len(cell), 'objects_per_cell': objects, 'seconds': seconds,
+        'cells_per_second': count / seconds, 'objects_per_second': objects * count / seconds,
+        'bytes_per_second': len(cell) * count / seconds, 'peak_memory': peak,
+    }
+
+
+def bench_map(name, kind, cell, count, repeat):
+    """
+    Операции Map на разобранном дереве: uncover, find_key (без индекса и с индексом), get_value
+    :return: список dict с operations_per_second и peak_memory
+    """
+    data = TeleData(cell)
+    tree = getattr(data, kind + '_deserialize')(data.read_int32)
+    ways = tree.uncover()
+    key = max(ways, key=len)[-1] if ways else None
+    indexed = TeleData(cell)
+    indexed = getattr(indexed, kind + '_deserialize')(indexed.read_int32).build_index()
+    operations = [
+        ('uncover', lambda: tree.uncover()),
+        ('find_key', lambda: list(tree.find_key(key))),
+        ('find_key_indexed', lambda: list(indexed.find_key(key))),
+        ('get_value', lambda: [tree.get_value(way) for way in ways]),
+        ('get_values', lambda: tree.get_values(ways)),
+    ]
+    results = list()
+    for operation, func in operations:
+        seconds, peak = _measure(lambda: [func() for i in range(count)], repeat)
+        results.append({
+            'case': name, 'operation': operation, 'kind': kind, 'paths': len(ways), 'calls': count,
+            'seconds': seconds, 'operations_per_second': count / seconds, 'peak_memory': peak,
+        })
+    return results
+
+
+def run(size=20, count=200, repeat=3, cases=None):
+    """
+    :param size: размер синтетических ячеек (блоки страницы, участники, размеры фото, ...)
+    :param count: число ячеек (вызовов) в одном замере
+    :param repeat: число повторов замера, берётся лучший
+    :param cases: имена замеров (ключи SYNTHETIC, data1, data2), по умолчанию все
+    :return: список результатов
+    >>> results = run(size=2, count=2, repeat=1, cases=['user', 'sticker_set'])
+    >>> print(sorted({(item['case'], item['operation']) for item in results})[:3])
+    [('sticker_set', 'decode'), ('sticker_set', 'find_key'), ('sticker_set', 'find_key_indexed')]
+    >>> print(all(item['seconds'] > 0 and item['peak_memory'] > 0 for item in results))
+    True
+    """
+    cells = {name: (kind, build(size)) for name, (kind, build) in SYNTHETIC.items()}
+    cells.update((name, ('message', cell)) for name, cell in sample_cells().items())
+    results = list()
+    for name, (kind, cell) in cells.items():
+        if cases and name not in cases:
+            continue
+        results.append(bench_decode(name, kind, cell, count, repeat))
+        results.append(bench_decode(name, kind, cell, count, repeat, output=TeleData.OUTPUT_RECORDS))
+        results.extend(bench_map(name, kind, cell, count, repeat))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=20)
+    parser.add_argument('--count', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--case', action='append', dest='cases')
+    parser.add_argument('--output', help='файл для JSON результатов (по умолчанию stdout)')
+    args = parser.parse_args(argv)
+    report = {
+        'python': platform.python_version(), 'platform': platform.platform(),
+        'size': args.size, 'count': args.count, 'repeat': args.repeat,
+        'results': run(args.size, args.count, args.repeat, args.cases),
+    }
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
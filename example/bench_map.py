@@ -0,0 +1,29 @@
+"""
+Замер стоимости присваивания полей Map (путь, через который проходит каждое поле в _tl_* парсерах)
+Запуск: python -m example.bench_map
+"""
+import timeit
+
+SETUP = "from map import Map\nm = Map()\nd = dict()"
+CASES = [
+    ('dict[key] = value', "d['field'] = 1"),
+    ('Map[key] = value', "m['field'] = 1"),
+    ('Map.key = value', "m.field = 1"),
+    ('Map[int] = value', "m[42] = 1"),
+    ('del Map.key', "m.field = 1; del m.field"),
+]
+
+
+def measure(statement, number=200000, repeat=5):
+    """
+    :param statement: выражение для timeit
+    :param number: число выполнений в одном замере
+    :param repeat: число замеров
+    :return: лучшее время одного выполнения, нс
+    """
+    return min(timeit.repeat(statement, SETUP, number=number, repeat=repeat)) / number * 1e9
+
+
+if __name__ == '__main__':
+    for name, statement in CASES:
+        print("{:<20} {:8.1f} ns".format(name, measure(statement)))
@@ -0,0 +1,67 @@
+"""
+Чтение ячеек из базы кэша Telegram (cache4.db) с разбором через TeleData
+"""
+import sqlite3
+
+from example.telegram import TeleData
+
+# таблица: (ключевая колонка, колонка с ячейкой, тип ячейки для TeleData.decode_many)
+TABLES = {
+    'messages': ('mid', 'data', 'message'),
+    'messages_v2': ('mid', 'data', 'message'),
+    'users': ('uid', 'data', 'user'),
+    'chats': ('uid', 'data', 'chat'),
+    'enc_chats': ('uid', 'data', 'encrypted_chat'),
+    'chat_settings_v2': ('uid', 'info', 'chat_full'),
+}
+
+
+def connect(path):
+    """
+    Открывает базу кэша только на чтение
+    :param path: путь к cache4.db
+    :return: sqlite3.Connection
+    """
+    return sqlite3.connect('file:{}?mode=ro'.format(path), uri=True)
+
+
+def read_table(database, table, chunk_size=1000, where=None, skip_errors=False, **options):
+    """
+    Выбирает ячейки таблицы порциями по chunk_size строк и разбирает их TeleData.decode_many
+    :param database: путь к cache4.db или открытое sqlite3.Connection
+    :param table: имя таблицы из TABLES
+    :param chunk_size: число строк, выбираемых за один fetchmany
+    :param where: дополнительное SQL условие отбора строк
+    :param skip_errors: отдавать None вместо исключения на битой ячейке
+    :param options: параметры TeleData (track_instances, bytes_mode, ...)
+    :return: генератор пар (ключ, Map)
+    >>> import struct
+    >>> db = sqlite3.connect(':memory:')
+    >>> _ = db.execute('CREATE TABLE messages (mid INTEGER, uid INTEGER, data BLOB)')
+    >>> for mid in range(1, 6):
+    ...     cell = struct.pack('<6I', 0x44f9b43d, 0, mid, 0x9db1bc6d, 42, 0) + b'\\x02hi\\x00'
+    ...     _ = db.execute('INSERT INTO messages VALUES (?, ?, ?)', (mid, 42, cell))
+    >>> for mid, message in read_table(db, 'messages', chunk_size=2, where='mid > 2'):
+    ...     print(mid, message.id, message.message)
+    3 3 hi
+    4 4 hi
+    5 5 hi
+    """
+    key, column, kind = TABLES[table]
+    connection = database if isinstance(database, sqlite3.Connection) else connect(database)
+    query = 'SELECT {0}, {1} FROM {2} WHERE {1} IS NOT NULL'.format(key, column, table)
+    if where:
+        query += ' AND ({})'.format(where)
+    try:
+        cursor = connection.execute(query)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            keys = [row[0] for row in rows]
+            cells = [row[1] for row in rows]
+            for pair in zip(keys, TeleData.decode_many(cells, kind, skip_errors, **options)):
+                yield pair
+    finally:
+        if connection is not database:
+            connection.close()
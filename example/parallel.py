@@ -0,0 +1,138 @@
+"""
+Параллельный разбор ячеек Telegram на пуле процессов
+"""
+import os
+import time
+import itertools
+import collections
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from map import Map
+from example.telegram import TeleData
+from example.records import Record
+
+
+def to_plain(value):
+    """
+    Преобразует дерево Map в обычные dict/list (дешевле передавать между процессами)
+    :param value: Map, Record, список или лист дерева
+    :return: копия дерева из dict и list
+    """
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {k: to_plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [to_plain(v) for v in value]
+    return value
+
+
+def _decode_chunk(cells, kind, as_dict, skip_errors, options):
+    started = time.perf_counter()
+    results = list(TeleData.decode_many(cells, kind, skip_errors, **options))
+    if as_dict:
+        results = [to_plain(item) for item in results]
+    return os.getpid(), results, sum(len(cell) for cell in cells), time.perf_counter() - started
+
+
+class ParallelDecoder(object):
+    """
+    Разбор пачек ячеек в ProcessPoolExecutor: ячейки режутся на порции по chunk_size,
+    каждая порция разбирается в процессе-исполнителе через TeleData.decode_many.
+    stats хранит счётчики по каждому процессу: порции, ячейки, байты, секунды разбора
+    """
+    def __init__(self, kind='message', workers=None, chunk_size=1000, ordered=True, as_dict=False,
+                 skip_errors=False, **options):
+        """
+        :param kind: тип ячеек, префикс метода *_deserialize
+        :param workers: число процессов (по умолчанию os.cpu_count())
+        :param chunk_size: число ячеек в одной отправке исполнителю
+        :param ordered: сохранять порядок входных ячеек
+        :param as_dict: возвращать dict вместо Map
+        :param skip_errors: отдавать None вместо исключения на битой ячейке
+        :param options: параметры TeleData (track_instances, bytes_mode, ...);
+            BYTES_VIEW заменяется на BYTES_RAW: memoryview в ячейку процесса-исполнителя не передаётся
+        >>> import struct
+        >>> cells = [struct.pack('<6I', 0x44f9b43d, 0, mid, 0x9db1bc6d, 42, 0) + b'\\x00' * 4 for mid in range(10)]
+        >>> decoder = ParallelDecoder(workers=2, chunk_size=3, as_dict=True)
+        >>> print([message['id'] for message in decoder.decode(cells)])
+        [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+        >>> print(sum(counter.cells for counter in decoder.stats.values()))
+        10
+        >>> decoder = ParallelDecoder(workers=2, chunk_size=3, output=TeleData.OUTPUT_RECORDS,
+        ...                           bytes_mode=TeleData.BYTES_VIEW)
+        >>> print([type(message).__name__ for message in decoder.decode(cells[:2])], decoder.options['bytes_mode'])
+        ['tl_message', 'tl_message'] raw
+        """
+        self.kind = kind
+        self.workers = workers or os.cpu_count()
+        self.chunk_size = chunk_size
+        self.ordered = ordered
+        self.as_dict = as_dict
+        self.skip_errors = skip_errors
+        if options.get('bytes_mode') == TeleData.BYTES_VIEW:
+            options['bytes_mode'] = TeleData.BYTES_RAW
+        self.options = options
+        self.stats = dict()
+
+    def _chunks(self, cells):
+        cells = iter(cells)
+        while True:
+            chunk = [bytes(cell) for cell in itertools.islice(cells, self.chunk_size)]
+            if not chunk:
+                return
+            yield chunk
+
+    def _collect(self, future):
+        pid, results, size, seconds = future.result()
+        counter = self.stats.get(pid)
+        if counter is None:
+            counter = self.stats[pid] = Map(chunks=0, cells=0, bytes=0, seconds=0.0)
+        counter.chunks += 1
+        counter.cells += len(results)
+        counter.bytes += size
+        counter.seconds += seconds
+        return results
+
+    def _drain(self, pending, all_pending):
+        if self.ordered:
+            while pending and (all_pending or pending[0].done()):
+                yield self._collect(pending.popleft())
+        else:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            if all_pending:
+                done = list(pending)
+            for future in done:
+                pending.remove(future)
+                yield self._collect(future)
+
+    def decode(self, cells):
+        """
+        :param cells: итерируемое с байтами ячеек
+        :return: генератор разобранных объектов
+        """
+        max_pending = self.workers * 2
+        with ProcessPoolExecutor(self.workers) as executor:
+            pending = collections.deque()
+            for chunk in self._chunks(cells):
+                pending.append(executor.submit(_decode_chunk, chunk, self.kind, self.as_dict,
+                                               self.skip_errors, self.options))
+                while len(pending) >= max_pending:
+                    if self.ordered:
+                        wait([pending[0]])
+                    for results in self._drain(pending, False):
+                        for item in results:
+                            yield item
+            for results in self._drain(pending, True):
+                for item in results:
+                    yield item
+
+    def throughput(self):
+        """
+        :return: {pid: Map(cells_per_second, bytes_per_second)} по накопленным stats
+        """
+        return {
+            pid: Map(cells_per_second=counter.cells / counter.seconds if counter.seconds else 0.0,
+                     bytes_per_second=counter.bytes / counter.seconds if counter.seconds else 0.0)
+            for pid, counter in self.stats.items()
+        }
@@ -0,0 +1,138 @@
+"""
+Компактные __slots__ записи вместо Map для объектов TeleData
+"""
+
+
+class Record(object):
+    """
+    Базовый класс записей: поля объекта в __slots__, отсутствующие поля читаются как None (как у Map)
+    """
+    __slots__ = ()
+
+    def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        return None
+
+    def _items(self):
+        for key in self.__slots__:
+            try:
+                yield key, object.__getattribute__(self, key)
+            except AttributeError:
+                pass
+
+    def keys(self):
+        return [key for key, value in self._items()]
+
+    def values(self):
+        return [value for key, value in self._items()]
+
+    def items(self):
+        return list(self._items())
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        try:
+            return object.__getattribute__(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __bool__(self):
+        for key, value in self._items():
+            return True
+        return False
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, ", ".join(
+            "{}={!r}".format(key, value) for key, value in self._items()))
+
+    def to_dict(self):
+        """
+        :return: дерево из dict и list, пригодное для json.dumps
+        """
+        return {key: _to_plain(value) for key, value in self._items()}
+
+    def __reduce__(self):
+        # классы записей создаются type() и недоступны pickle по имени:
+        # запись восстанавливается через record_types() класса парсеров
+        return _restore_record, (self._parser_class, self._parser, tuple(self._items()))
+
+
+def _restore_record(parser_class, name, items):
+    record = parser_class.record_types()[name]()
+    for key, value in items:
+        setattr(record, key, value)
+    return record
+
+
+def _to_plain(value):
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+    return value
+
+
+def record_fields(cls):
+    """
+    Схемы объектов: поля из описания LAYOUTS и поля сверх него из RECORD_FIELDS
+    (парсеры без описания, поля, которые заполняют эвристики и *_deserialize)
+    :param cls: класс с _tl_* парсерами, таблицами *_PARSERS, LAYOUTS и RECORD_FIELDS
+    :return: {имя парсера: кортеж полей в порядке чтения}
+    >>> from example.telegram import TeleData
+    >>> fields = record_fields(TeleData)
+    >>> print(fields['_tl_photoSize'], fields['_tl_photoSizeEmpty'])
+    ('type', 'location', 'w', 'h', 'size') ('typeof', 'type')
+    """
+    names = {name for name in dir(cls) if name.startswith('_tl_') and not name.endswith('_tail')}
+    for table in dir(cls):
+        if table.endswith('_PARSERS'):
+            names.update(parser.__name__ for parser in getattr(cls, table).values())
+    fields = dict()
+    for name in names:
+        own = [item.split(':', 1)[0] for item in cls.LAYOUTS.get(name, '').split()]
+        fields[name] = tuple(own + [field for field in cls.RECORD_FIELDS.get(name, ()) if field not in own])
+    return fields
+
+
+def build_records(cls):
+    """
+    :param cls: класс с _tl_* парсерами
+    :return: {имя парсера: класс записи}, записи сериализуются pickle (через cls.record_types())
+    >>> import pickle, struct
+    >>> from example.telegram import TeleData
+    >>> cell = struct.pack('<6I', 0x44f9b43d, 0, 7, 0x9db1bc6d, 42, 0) + b'\\x02hi\\x00'
+    >>> data = TeleData(cell, output=TeleData.OUTPUT_RECORDS)
+    >>> message = pickle.loads(pickle.dumps(data.message_deserialize(data.read_int32)))
+    >>> print(type(message).__name__, message.id, message.to_id.user_id, message.message)
+    tl_message 7 42 hi
+    """
+    records = dict()
+    for name, fields in record_fields(cls).items():
+        records[name] = type(name.lstrip('_'), (Record,), {
+            '__slots__': fields, '_parser_class': cls, '_parser': name})
+    return records
@@ -1,13 +1,495 @@
 """
 порт десереализатора Телеграм для ЯП Python
 """
-import io
+import re
+import copy
 import struct
 import base64
-import inspect
+import time
 import datetime
+import functools
 
-from map import Map
+from map import Map, LazyMap
+from example.records import Record, build_records
+
+# примитивы TL читаются прямо из memoryview ячейки, без промежуточных bytes
+_unpack_int32 = struct.Struct('<I').unpack_from
+_unpack_int64 = struct.Struct('<Q').unpack_from
+_unpack_double = struct.Struct('<d').unpack_from
+
+
+class InstanceFlags(set):
+    """
+    Замена списка instances, когда полный след не нужен:
+    хранит только имена объектов, которые проверяют эвристики парсеров
+    """
+    WATCHED = frozenset((
+        '_tl_peerUser', '_tl_peerChannel',
+        '_tl_messageMediaEmpty', '_tl_messageMediaWebPage',
+        '_tl_videoEncrypted', '_tl_audioEncrypted',
+    ))
+
+    def append(self, name):
+        if name in self.WATCHED:
+            self.add(name)
+
+
+class SeenNames(set):
+    """
+    instances читателя пропуска: все имена без фильтра, append - встроенный set.add
+    """
+    append = set.add
+
+
+class SkippedParams(object):
+    """
+    Заглушка вместо Map в режиме пропуска (TeleData.skip): поля складываются в атрибуты
+    без проверок Map, отсутствующие поля читаются как None
+    """
+    def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        return None
+
+
+# метка поля, отсутствующего в проекции
+SKIPPED = object()
+
+
+def _skipped_params(name):
+    return SkippedParams()
+
+
+class ParsedMap(Map):
+    """
+    Map объекта, прочитанного TeleData (OUTPUT_MAP): слот _parser хранит имя парсера,
+    по нему example.tl_encoder выбирает конструктор; слот не ключ словаря и переживает copy и pickle
+    >>> import pickle
+    >>> params = _parsed_map('_tl_peerUser')
+    >>> params.user_id = 42
+    >>> restored = pickle.loads(pickle.dumps(params))
+    >>> print(restored, restored._parser, Map(restored)._parser)
+    {'user_id': 42} _tl_peerUser None
+    """
+    __slots__ = ('_parser',)
+
+    def __getstate__(self):
+        return None, {'_parser': self._parser}
+
+    def __setstate__(self, state):
+        object.__setattr__(self, '_parser', state[1]['_parser'])
+
+
+class LazyParsedMap(LazyMap):
+    """
+    LazyMap сообщения TeleData(lazy=True) с именем парсера в слоте _parser (как у ParsedMap);
+    copy и pickle получают уже загруженный ParsedMap
+    """
+    __slots__ = ('_parser',)
+
+    def __reduce_ex__(self, protocol):
+        return ParsedMap, (), (None, {'_parser': self._parser}), None, iter(dict.items(self.materialize()))
+
+
+def _parsed_map(name):
+    params = ParsedMap()
+    object.__setattr__(params, '_parser', name)
+    return params
+
+
+def _lazy_parsed_map(name):
+    params = LazyParsedMap()
+    object.__setattr__(params, '_parser', name)
+    return params
+
+
+# шаги пропуска по описанию полей (compile_layout): (имя флагов, маска, операция, аргумент)
+_SKIP_FIXED, _SKIP_FLAGS, _SKIP_SLICE, _SKIP_OBJECT, _SKIP_OBJECTS, _SKIP_NUMBERS, _SKIP_BARE = range(7)
+_LAYOUT_SIZES = {'int': 4, 'long': 8, 'double': 8, 'Bool': 4}
+_LAYOUT_FIELD = re.compile(r'^(\w+):(?:(\w+)\.(\d+)\?)?([\w#<>]+)$')
+
+
+def compile_layout(layout):
+    """
+    Шаги пропуска объекта по описанию его полей (TeleData.LAYOUTS)
+    :param layout: поля в порядке чтения: 'имя:тип' или 'имя:флаги.бит?тип'
+    :return: (кортеж шагов, frozenset имён полей); подряд идущие поля постоянного размера
+        сливаются в один шаг
+    >>> steps, fields = compile_layout('flags:# id:int access_hash:long title:flags.0?string sizes:Vector<photo_size>')
+    >>> print(steps)
+    ((None, 0, 1, 'flags'), (None, 0, 0, 12), ('flags', 1, 2, None), (None, 0, 4, 'photo_size'))
+    >>> print(sorted(fields))
+    ['access_hash', 'flags', 'id', 'sizes', 'title']
+    """
+    steps, fields = list(), set()
+    for item in layout.split():
+        match = _LAYOUT_FIELD.match(item)
+        if match is None:
+            raise ValueError("bad layout field: {}".format(item))
+        name, flags, bit, kind = match.groups()
+        fields.add(name)
+        mask = 1 << int(bit) if flags else 0
+        if flags and not any(step[2] == _SKIP_FLAGS and step[3] == flags for step in steps):
+            raise ValueError("flags {} are not read before {}".format(flags, item))
+        if kind == 'true':
+            continue
+        if kind == '#':
+            step = (None, 0, _SKIP_FLAGS, name)
+        elif kind in _LAYOUT_SIZES:
+            step = (flags, mask, _SKIP_FIXED, _LAYOUT_SIZES[kind])
+        elif kind in ('string', 'bytes'):
+            step = (flags, mask, _SKIP_SLICE, None)
+        elif kind in ('Vector<int>', 'Vector<long>'):
+            step = (flags, mask, _SKIP_NUMBERS, _LAYOUT_SIZES[kind[7:-1]])
+        elif kind.startswith('Vector<'):
+            step = (flags, mask, _SKIP_OBJECTS, kind[7:-1])
+        elif kind.startswith('_tl_'):
+            step = (flags, mask, _SKIP_BARE, kind)
+        else:
+            step = (flags, mask, _SKIP_OBJECT, kind)
+        if step[:3] == (None, 0, _SKIP_FIXED) and steps and steps[-1][:3] == step[:3]:
+            step = (None, 0, _SKIP_FIXED, steps.pop()[3] + step[3])
+        steps.append(step)
+    return tuple(steps), frozenset(fields)
+
+
+class SkipReads(object):
+    """
+    Примесь для читателя пропуска (TeleData.skipper): строки и байты только сдвигают курсор,
+    векторы проходятся по числу элементов без построения списков, объекты с описанием
+    в LAYOUTS пропускаются по нему, без вызова парсеров
+    >>> reader = TeleData(b'\\x05hello\\x00\\x00' + struct.pack('<4I', 0x1cb5c415, 2, 1, 2)).skipper()
+    >>> print(reader.read_string, reader.pos, reader.read_int32_vector(), reader.pos)
+    ? 8 () 24
+    """
+    def _skip_tl_slice(self):
+        # длина TL строки/байтов и сдвиг курсора за данные с выравниванием, без memoryview
+        cell = self.cell
+        pos = self.pos
+        size = len(cell)
+        if pos >= size:
+            return 0
+        l = cell[pos]
+        if l >= 254:
+            if pos + 4 > size:
+                self.pos = size
+                return 0
+            l = cell[pos + 1] | cell[pos + 2] << 8 | cell[pos + 3] << 16
+            head = 4
+        else:
+            head = 1
+        if pos + head + l > size:
+            self.pos = size
+            return 0
+        self.pos = pos + ((head + l + 3) & ~3)
+        return l
+
+    @property
+    def read_bytes(self):
+        self._skip_tl_slice()
+        return self.convert_bytes(self.cell[:0])
+
+    @property
+    def read_string(self):
+        # строка не декодируется; сохраняется только то, что проверяют эвристики парсеров:
+        # пустая ли она и начинается ли с "-1" (attachPath у сообщений)
+        pos = self.pos
+        if not self._skip_tl_slice():
+            return ''
+        cell = self.cell
+        start = pos + (4 if cell[pos] >= 254 else 1)
+        if cell[start] == 0x2d and self.pos - start > 1 and cell[start + 1] == 0x31:
+            return '-1'
+        return '?'
+
+    def read_vector(self, deserialize, field=None):
+        magic = self.read_int32
+        assert (magic == 0x1cb5c415), "magic in {} vector".format(field or deserialize.__name__)
+        read_int32 = TeleData.read_int32.fget
+        for i in range(read_int32(self)):
+            deserialize(read_int32(self))
+        return ()
+
+    def _dispatch(self, parsers, constructor, field=None, projection=None):
+        # без проекции и статистики
+        parser = parsers.get(constructor)
+        assert (parser is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
+        return self.skip_parser(parser)
+
+    def _read_numbers(self, code, size):
+        magic = self.read_int32
+        assert (magic == 0x1cb5c415), "magic in number vector"
+        count = self.read_int32
+        self.pos = min(self.pos + count * size, len(self.cell))
+        return ()
+
+    def skip_object(self, kind):
+        """
+        Пропуск объекта типа kind с текущей позиции: по LAYOUTS, при ошибке или обрезанной ячейке -
+        парсерами с начала объекта
+        :param kind: префикс метода *_deserialize
+        """
+        if not self._skip_walk(lambda pos: self._skip_at(kind, pos)):
+            getattr(self, kind + '_deserialize')(self.read_int32)
+
+    def skip_parser(self, parser):
+        """
+        Пропуск объекта, конструктор которого уже прочитан
+        :param parser: _tl_* функция объекта
+        :return: SkippedParams; после пропуска по LAYOUTS поля дочитываются
+            парсером только при обращении к ним (эвристики родителя)
+        >>> reader = TeleData(struct.pack('<I', 5)).skipper()
+        >>> params = reader.skip_parser(TeleData._tl_peerChannel)
+        >>> print(reader.pos, sorted(reader.instances), params.user_id, params.channel_id)
+        4 ['_tl_peerChannel'] None 5
+        """
+        name = parser.__name__
+        layout = self.skip_layout(name)
+        start = self.pos
+        if layout is not None and self._skip_walk(lambda pos: self._skip_steps(layout[0], pos)):
+            self.instances.append(name)
+            return DeferredSkippedParams(self, start, parser, layout[1])
+        return parser(self)
+
+    def _skip_walk(self, walk):
+        # walk(начало) -> позиция после объекта; ошибка или выход за ячейку - курсор и instances на месте
+        start, seen = self.pos, self.instances
+        self.instances = SeenNames(seen)
+        try:
+            pos = walk(start)
+        except (IndexError, struct.error, AssertionError):
+            pos = None
+        if pos is not None and pos <= len(self.cell):
+            self.pos = pos
+            return True
+        self.pos, self.instances = start, seen
+        return False
+
+    def _skip_at(self, kind, pos):
+        # объект с конструктором: по LAYOUTS или парсерами читателя пропуска
+        table = self._skip_tables.get(kind)
+        if table is None:
+            table = self.skip_table(kind)
+        entry = table.get(_unpack_int32(self.cell, pos)[0])
+        if entry is None:
+            self.pos = pos
+            getattr(self, kind + '_deserialize')(self.read_int32)
+            return self.pos
+        self.instances.append(entry[0])
+        return self._skip_steps(entry[1], pos + 4)
+
+    def _skip_bare(self, name, pos):
+        # прямой вызов парсера без конструктора (self._tl_peerUser() и т.п.)
+        layout = self.skip_layout(name)
+        if layout is None:
+            self.pos = pos
+            getattr(self, name)()
+            return self.pos
+        self.instances.append(name)
+        return self._skip_steps(layout[0], pos)
+
+    def _skip_steps(self, steps, pos):
+        cell = self.cell
+        flags = dict()
+        for name, mask, operation, argument in steps:
+            if mask and not flags[name] & mask:
+                continue
+            if operation == _SKIP_FIXED:
+                pos += argument
+            elif operation == _SKIP_SLICE:
+                length = cell[pos]
+                if length < 254:
+                    pos += (length + 4) & -4
+                else:
+                    pos += ((cell[pos + 1] | cell[pos + 2] << 8 | cell[pos + 3] << 16) + 7) & -4
+            elif operation == _SKIP_FLAGS:
+                flags[argument] = _unpack_int32(cell, pos)[0]
+                pos += 4
+            elif operation == _SKIP_OBJECT:
+                pos = self._skip_at(argument, pos)
+            elif operation == _SKIP_BARE:
+                pos = self._skip_bare(argument, pos)
+            else:
+                assert (_unpack_int32(cell, pos)[0] == 0x1cb5c415), "magic in vector"
+                count = _unpack_int32(cell, pos + 4)[0]
+                pos += 8
+                if operation == _SKIP_NUMBERS:
+                    pos += count * argument
+                else:
+                    for i in range(count):
+                        pos = self._skip_at(argument, pos)
+        return pos
+
+    @classmethod
+    def skip_layout(cls, name):
+        """
+        :param name: имя _tl_* парсера
+        :return: compile_layout(LAYOUTS[name]) или None, если парсер не описан; компилируется один раз
+        >>> steps, fields = TeleData.skipper_class().skip_layout('_tl_peerChannel')
+        >>> print(steps, sorted(fields))
+        ((None, 0, 0, 4),) ['channel_id']
+        """
+        layouts = cls._skip_layouts
+        if name not in layouts:
+            layout = cls.LAYOUTS.get(name)
+            layouts[name] = None if layout is None else compile_layout(layout)
+        return layouts[name]
+
+    @classmethod
+    def skip_table(cls, kind):
+        """
+        :param kind: префикс метода *_deserialize
+        :return: {конструктор: (имя парсера, шаги)} для конструкторов с описанием в LAYOUTS,
+            остальные пропускаются парсерами
+        """
+        tables = cls._skip_tables
+        table = tables.get(kind)
+        if table is None:
+            table = tables[kind] = dict()
+            for constructor, parser in getattr(cls, kind.upper() + '_PARSERS', dict()).items():
+                layout = cls.skip_layout(parser.__name__)
+                if layout is not None:
+                    table[constructor] = (parser.__name__, layout[0])
+        return table
+
+
+class DeferredSkippedParams(SkippedParams):
+    """
+    SkippedParams объекта, пропущенного без разбора: поля читаются парсером при первом обращении
+    """
+    def __init__(self, reader, pos, parser, fields):
+        # ячейка запоминается вместе с позицией: к моменту обращения reset() мог переключить читателя
+        self._source = (reader, reader.cell, pos, parser, fields)
+
+    def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        source = self.__dict__.get('_source')
+        if source is None or attr not in source[4]:
+            # поле, которое парсер не заполняет, разбор не нужен
+            return None
+        del self._source
+        reader, cell, pos, parser, fields = source
+        reader = reader.fork(pos)
+        reader.cell = cell
+        self.__dict__.update(vars(parser(reader)))
+        return self.__dict__.get(attr)
+
+
+class LazyBase64(object):
+    """
+    Байты TL, кодируемые в base64 только при первом str()
+    >>> value = LazyBase64(b'key')
+    >>> print(value, bytes(value), value == 'a2V5')
+    a2V5 b'key' True
+    """
+    __slots__ = ('raw', '_encoded')
+
+    def __init__(self, raw):
+        self.raw = raw
+        self._encoded = None
+
+    def __str__(self):
+        if self._encoded is None:
+            self._encoded = base64.b64encode(self.raw).decode()
+        return self._encoded
+
+    def __repr__(self):
+        return "LazyBase64({!r})".format(bytes(self.raw))
+
+    def __bytes__(self):
+        return bytes(self.raw)
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyBase64):
+            return self.raw == other.raw
+        if isinstance(other, str):
+            return str(self) == other
+        return self.raw == other
+
+    def __hash__(self):
+        return hash(bytes(self.raw))
+
+    def __reduce__(self):
+        # raw - memoryview внутрь ячейки, pickle передаёт копию байтов
+        return LazyBase64, (bytes(self.raw),)
+
+
+_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+# смещения часовых поясов кратны 15 минутам: внутри 15-минутного интервала без перевода часов
+# местное время отличается от начала интервала только минутами и секундами
+_TIME_BUCKET = 900
+
+
+def _format_time(ts):
+    try:
+        result = datetime.datetime.fromtimestamp(ts).strftime(_TIME_FORMAT)
+    except OSError:
+        result = ts
+    return result
+
+
+@functools.lru_cache(maxsize=4096)
+def _time_bucket(bucket):
+    try:
+        start = datetime.datetime.fromtimestamp(bucket * _TIME_BUCKET)
+        end = datetime.datetime.fromtimestamp(bucket * _TIME_BUCKET + _TIME_BUCKET - 1)
+    except (OSError, OverflowError, ValueError):
+        return None
+    if start.second or start.minute % 15 or (end - start).total_seconds() != _TIME_BUCKET - 1:
+        return None  # смещение пояса не кратно 15 минутам или внутри интервала переводятся часы
+    prefix = start.strftime('%Y-%m-%d %H:')
+    return tuple('{}{:02d}:'.format(prefix, start.minute + minute) for minute in range(_TIME_BUCKET // 60))
+
+
+_SECONDS = tuple('{:02d}'.format(second) for second in range(60))
+
+
+def _format_time_cached(ts):
+    bucket, offset = divmod(ts, _TIME_BUCKET)
+    minutes = _time_bucket(bucket)
+    if minutes is None:
+        return _format_time(ts)
+    minute, second = divmod(offset, 60)
+    return minutes[minute] + _SECONDS[second]
+
+
+class LazyTime(object):
+    """
+    Время TL (unix time), форматируемое в строку только при первом str()
+    >>> value = LazyTime(1500000000)
+    >>> print(int(value), value == 1500000000, str(value) == TeleData.time_from_ts(1500000000))
+    1500000000 True True
+    """
+    __slots__ = ('ts', '_formatted')
+
+    def __init__(self, ts):
+        self.ts = ts
+        self._formatted = None
+
+    def __str__(self):
+        if self._formatted is None:
+            self._formatted = _format_time_cached(self.ts)
+        return str(self._formatted)
+
+    def __repr__(self):
+        return "LazyTime({!r})".format(self.ts)
+
+    def __int__(self):
+        return self.ts
+
+    def __eq__(self, other):
+        if isinstance(other, LazyTime):
+            return self.ts == other.ts
+        if isinstance(other, str):
+            return str(self) == other
+        return self.ts == other
+
+    def __hash__(self):
+        return hash(self.ts)
 
 
 class TeleData(object):
@@ -52,15 +534,178 @@ class TeleData(object):
     MESSAGE_FLAG_EDITED = 0x00008000
     MESSAGE_FLAG_MEGAGROUP = 0x80000000
     LAYER = 70
+    OUTPUT_MAP = 'map'
+    OUTPUT_RECORDS = 'records'
+    BYTES_BASE64 = 'base64'
+    BYTES_RAW = 'raw'
+    BYTES_VIEW = 'view'
+    BYTES_LAZY = 'lazy'
+    BYTES_CONVERTERS = {
+        BYTES_BASE64: lambda view: base64.b64encode(view).decode(),
+        BYTES_RAW: bytes,
+        BYTES_VIEW: lambda view: view,
+        BYTES_LAZY: LazyBase64,
+    }
+    TIME_FORMATTED = 'formatted'
+    TIME_CACHED = 'cached'
+    TIME_RAW = 'raw'
+    TIME_LAZY = 'lazy'
+    TIME_CONVERTERS = {
+        TIME_FORMATTED: _format_time,
+        TIME_CACHED: _format_time_cached,
+        TIME_RAW: int,
+        TIME_LAZY: LazyTime,
+    }
 
     # constructors: https://core.telegram.org/schema/json, https://core.telegram.org/schema
-    # assert type 1: assert (constructor == ...
     # assert type 2: assert (result is not None)
-    # assert type 3L assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-
-    def __init__(self, cell):
-        self.stream = io.BytesIO(cell)
-        self.instances = list()
+    # assert type 3L assert (magic == 0x1cb5c415), "magic in _tl_..."
+
+    def __init__(self, cell, track_instances=True, bytes_mode=BYTES_BASE64, lazy=False, output=OUTPUT_MAP,
+                 time_mode=TIME_CACHED, profile=None):
+        """
+        :param cell: байты ячейки кэша
+        :param track_instances: вести полный список instances разобранных объектов,
+            иначе запоминаются только имена, нужные эвристикам парсеров (InstanceFlags)
+        :param bytes_mode: представление TL bytes (file_reference, ключи, превью фото):
+            BYTES_BASE64 - строка base64 (json-совместимо), BYTES_RAW - bytes,
+            BYTES_VIEW - memoryview внутрь ячейки, BYTES_LAZY - LazyBase64
+        :param lazy: сообщения возвращаются как LazyMap: поля до текста сообщения разбираются сразу,
+            media, reply_markup, entities и остальной хвост - при первом обращении к ним
+        :param output: OUTPUT_MAP - объекты ParsedMap (Map с именем парсера в слоте _parser),
+            OUTPUT_RECORDS - компактные записи с __slots__ (example.records), поля по схеме конструктора,
+            to_dict() для json
+        :param time_mode: представление дат (date, edit_date, until_date, ...):
+            TIME_CACHED - строка 'YYYY-mm-dd HH:MM:SS' через кэш 15-минутных интервалов,
+            TIME_FORMATTED - та же строка через datetime на каждое поле, TIME_RAW - unix time (int),
+            TIME_LAZY - LazyTime, форматируется при первом str()
+        :param profile: статистика разбора по конструкторам и *_deserialize (см. profile_stats):
+            None - выключена, True - новый словарь, dict - общий словарь для нескольких ячеек
+        >>> cell = struct.pack('<6I', 0x44f9b43d, 0, 7, 0x9db1bc6d, 42, 0) + b'\\x02hi\\x00'
+        >>> data = TeleData(cell, output=TeleData.OUTPUT_RECORDS)
+        >>> message = data.message_deserialize(data.read_int32)
+        >>> print(type(message).__name__, message.id, message.message, message.media)
+        tl_message 7 hi None
+        >>> data = TeleData(cell)
+        >>> print(message.to_dict() == data.message_deserialize(data.read_int32))
+        True
+        """
+        self.cell = memoryview(cell)
+        self.pos = 0
+        self.instances = list() if track_instances else InstanceFlags()
+        self.bytes_mode = bytes_mode
+        self.convert_bytes = self.BYTES_CONVERTERS[bytes_mode]
+        self.time_mode = time_mode
+        self.convert_time = self.TIME_CONVERTERS[time_mode]
+        self.lazy = lazy
+        self.projection = None
+        self.output = output
+        self.new_params = self.params_factory(output)
+        self.profile = dict() if profile is True else profile
+        if self.profile is not None:
+            self._dispatch = self._dispatch_profiled
+
+    @classmethod
+    def record_types(cls):
+        """
+        :return: {имя парсера: класс записи}, строится по LAYOUTS и RECORD_FIELDS один раз на класс
+        """
+        records = cls.__dict__.get('_record_types')
+        if records is None:
+            records = build_records(cls)
+            cls._record_types = records
+        return records
+
+    @classmethod
+    def params_factory(cls, output):
+        """
+        :param output: OUTPUT_MAP или OUTPUT_RECORDS
+        :return: функция имя парсера -> пустой объект для его полей
+        """
+        if output == cls.OUTPUT_RECORDS:
+            records = cls.record_types()
+            return lambda name: records[name]()
+        if output == cls.OUTPUT_MAP:
+            return _parsed_map
+        raise ValueError("unknown output: {}".format(output))
+
+    def fork(self, pos):
+        """
+        Независимый читатель той же ячейки с теми же параметрами
+        :param pos: позиция курсора нового читателя
+        :return: TeleData
+        """
+        reader = copy.copy(self)
+        reader.pos = pos
+        reader.instances = self.instances.__class__()
+        if self.profile is not None:
+            reader._dispatch = reader._dispatch_profiled
+        return reader
+
+    def resume_at(self, tail, *args):
+        """
+        Загрузчик для LazyMap.defer: дочитывает объект методом tail с текущей позиции курсора
+        :param tail: имя метода, разбирающего хвост объекта: tail(params, *args)
+        :param args: дополнительные аргументы tail (например, flags)
+        :return: функция loader(params)
+        >>> cell = struct.pack('<6I', 0x44f9b43d, 1024, 7, 0x9db1bc6d, 42, 0) + b'\\x02hi\\x00' + struct.pack('<I', 99)
+        >>> data = TeleData(cell, lazy=True)
+        >>> message = data.message_deserialize(data.read_int32)
+        >>> print(message.id, message.message, message.is_loaded())
+        7 hi False
+        >>> print(message.views, message.is_loaded())
+        99 True
+        >>> messages = list(TeleData.decode_many([cell, cell[:-4] + struct.pack('<I', 7)], lazy=True))
+        >>> print([message.views for message in messages])
+        [99, 7]
+        """
+        # ячейка запоминается вместе с позицией: к моменту загрузки reset() мог переключить читателя
+        pos, cell = self.pos, self.cell
+
+        def loader(params):
+            reader = self.fork(pos)
+            reader.cell = cell
+            getattr(reader, tail)(params, *args)
+        return loader
+
+    def reset(self, cell):
+        """
+        Переключение читателя на новую ячейку без создания нового TeleData
+        :param cell: байты ячейки кэша
+        """
+        self.cell = memoryview(cell)
+        self.pos = 0
+        self.instances.clear()
+
+    @classmethod
+    def decode_many(cls, cells, kind='message', skip_errors=False, projection=None, **options):
+        """
+        Потоковый разбор множества ячеек одного типа одним читателем
+        :param cells: итерируемое с байтами ячеек
+        :param kind: тип ячеек, префикс метода *_deserialize (message, user, chat, chat_full, ...)
+        :param skip_errors: вместо исключения на битой ячейке отдавать None
+        :param projection: оставить только указанные поля (см. compile_projection, _dispatch)
+        :param options: параметры TeleData (track_instances, bytes_mode, ...)
+        :return: генератор Map объектов в порядке ячеек
+        >>> cells = [struct.pack('<6I', 0x44f9b43d, 0, mid, 0x9db1bc6d, 42, 0) + b'\\x02hi\\x00' for mid in (1, 2)]
+        >>> for message in TeleData.decode_many(cells + [b'\\x00' * 4], skip_errors=True):
+        ...     print(message and (message.id, message.to_id.user_id, message.message))
+        (1, 42, 'hi')
+        (2, 42, 'hi')
+        None
+        """
+        reader = cls(bytes(), **options)
+        deserialize = getattr(reader, kind + '_deserialize')
+        if projection is not None:
+            projection = cls.compile_projection(projection)
+        for cell in cells:
+            reader.reset(cell)
+            try:
+                yield deserialize(reader.read_int32, projection=projection)
+            except (AssertionError, AttributeError, TypeError, ValueError):
+                if not skip_errors:
+                    raise
+                yield None
 
     def value_on_exception(return_value=int()):
         def wrap(func):
@@ -72,61 +717,165 @@ class TeleData(object):
             return wrapper
         return wrap
 
+    def tell(self):
+        return self.pos
+
+    def at_end(self):
+        return self.pos >= len(self.cell)
+
     @property
-    @value_on_exception()
     def get_int_byte(self):
-        return ord(struct.unpack('c', self.stream.read(1))[0])
+        # value_on_exception развёрнут вручную: примитивы вызываются на каждое поле
+        try:
+            pos = self.pos
+            self.pos = pos + 1
+            return self.cell[pos]
+        except (IndexError, struct.error):
+            # как у BytesIO: неудачное чтение оставляет курсор в конце ячейки
+            self.pos = len(self.cell)
+            return 0
 
     @property
-    @value_on_exception()
     def read_int32(self):
-        return struct.unpack('<I', self.stream.read(4))[0]
+        """
+        int32 из ячейки; за концом ячейки - 0, курсор остаётся в конце ячейки
+        >>> data = TeleData(b'\\x01\\x02')
+        >>> print(data.read_int32, data.tell(), data.read_int32, data.at_end())
+        0 2 0 True
+        """
+        try:
+            pos = self.pos
+            self.pos = pos + 4
+            return _unpack_int32(self.cell, pos)[0]
+        except (IndexError, struct.error):
+            self.pos = len(self.cell)
+            return 0
 
     @property
-    @value_on_exception()
     def read_int64(self):
-        return struct.unpack('<Q', self.stream.read(8))[0]
+        try:
+            pos = self.pos
+            self.pos = pos + 8
+            return _unpack_int64(self.cell, pos)[0]
+        except (IndexError, struct.error):
+            self.pos = len(self.cell)
+            return 0
 
     @property
-    @value_on_exception()
     def read_double(self):
-        return struct.unpack('d', struct.pack('Q', self.read_int64))[0]
+        try:
+            pos = self.pos
+            self.pos = pos + 8
+            return _unpack_double(self.cell, pos)[0]
+        except (IndexError, struct.error):
+            self.pos = len(self.cell)
+            return 0
+
+    def read_tl_slice(self):
+        """
+        Чтение TL строки/байтов за один проход: длина (1 байт или 0xfe + 3 байта), данные,
+        выравнивание до 4 байт считается арифметически, курсор сдвигается один раз
+        :return: memoryview на данные внутри ячейки, None если данные выходят за конец ячейки
+        >>> data = TeleData(b'\\x03abc' + b'\\xfe\\x00\\x01\\x00' + b'x' * 256 + b'\\x01')
+        >>> print(data.read_string, data.tell())
+        abc 4
+        >>> print(len(data.read_string), data.tell())
+        256 264
+        >>> print(repr(data.read_string), data.tell())
+        '' 265
+        """
+        cell = self.cell
+        pos = self.pos
+        size = len(cell)
+        if pos >= size:
+            return None
+        l = cell[pos]
+        if l >= 254:
+            if pos + 4 > size:
+                self.pos = size
+                return None
+            l = cell[pos + 1] | cell[pos + 2] << 8 | cell[pos + 3] << 16
+            start = pos + 4
+        else:
+            start = pos + 1
+        end = start + l
+        if end > size:
+            self.pos = size
+            return None
+        self.pos = pos + ((end - pos + 3) & ~3)
+        return cell[start:end]
 
     @property
-    @value_on_exception(bytes())
     def read_bytes(self):
-        sl = 1
-        l = self.get_int_byte
-        if l >= 254:
-            l = self.get_int_byte | self.get_int_byte << 8 | self.get_int_byte << 16
-            sl = 4
-        string = struct.unpack('{}s'.format(l), self.stream.read(l))[0]
-        i = sl
-        while (l + i) % 4 != 0:
-            c = self.get_int_byte
-            i += 1
-        # FIXME return string OR str(base64.b64encode(string)) OR string.decode('unicode_escape') for json-able
-        return base64.b64encode(string).decode()
+        """
+        TL bytes в представлении bytes_mode; данные за концом ячейки читаются как пустые
+        >>> for mode in (TeleData.BYTES_BASE64, TeleData.BYTES_RAW):
+        ...     print(repr(TeleData(b'\\x05ab', bytes_mode=mode).read_bytes))
+        ''
+        b''
+        """
+        string = self.read_tl_slice()
+        if string is None:
+            string = self.cell[:0]
+        return self.convert_bytes(string)
 
     @property
-    @value_on_exception(str())
     def read_string(self):
-        sl = 1
-        l = self.get_int_byte
-        if l >= 254:
-            l = self.get_int_byte | self.get_int_byte << 8 | self.get_int_byte << 16
-            sl = 4
-        string = struct.unpack('{}s'.format(l), self.stream.read(l))[0]
-        i = sl
-        while (l + i) % 4 != 0:
-            c = self.get_int_byte
-            i += 1
+        string = self.read_tl_slice()
+        if string is None:
+            return str()
+        try:
+            return str(string, 'utf-8')
+        except UnicodeDecodeError:
+            pass
         try:
-            string = string.decode()
+            return str(string, 'unicode_escape')
         except UnicodeDecodeError:
-            string = string.decode('unicode_escape')
+            return str()
+
+    def read_vector(self, deserialize, field=None):
+        """
+        TL вектор объектов: magic, число элементов, элементы
+        :param deserialize: *_deserialize метод элементов
+        :param field: имя поля родителя (для проекции)
+        :return: список элементов
+        >>> peer = struct.pack('<II', 0x9db1bc6d, 42)
+        >>> data = TeleData(struct.pack('<II', 0x1cb5c415, 2) + peer * 2)
+        >>> print(data.read_vector(data.peer_deserialize))
+        [{'user_id': 42}, {'user_id': 42}]
+        """
+        magic = self.read_int32
+        assert (magic == 0x1cb5c415), "magic in {} vector".format(field or deserialize.__name__)
+        read_int32 = TeleData.read_int32.fget
+        return [deserialize(read_int32(self), field) for i in range(self.read_int32)]
 
-        return string
+    def _read_numbers(self, code, size):
+        magic = self.read_int32
+        assert (magic == 0x1cb5c415), "magic in number vector"
+        count = self.read_int32
+        pos = self.pos
+        end = pos + count * size
+        if end > len(self.cell):
+            # обрезанная ячейка: поэлементно, недостающие значения читаются как 0
+            read = TeleData.read_int32.fget if size == 4 else TeleData.read_int64.fget
+            return [read(self) for i in range(count)]
+        self.pos = end
+        return list(struct.unpack_from('<{}{}'.format(count, code), self.cell, pos))
+
+    def read_int32_vector(self):
+        """
+        TL вектор int одним вызовом struct.unpack_from
+        >>> data = TeleData(struct.pack('<5I', 0x1cb5c415, 3, 1, 2, 3))
+        >>> print(data.read_int32_vector(), data.at_end())
+        [1, 2, 3] True
+        """
+        return self._read_numbers('I', 4)
+
+    def read_int64_vector(self):
+        """
+        TL вектор long одним вызовом struct.unpack_from
+        """
+        return self._read_numbers('Q', 8)
 
     @property
     @value_on_exception(bool())
@@ -140,53 +889,290 @@ class TeleData(object):
 
         return False
 
+    @staticmethod
+    def json_default(obj):
+        """
+        default для json.dumps при bytes_mode отличном от BYTES_BASE64 и time_mode=TIME_LAZY
+        >>> import json
+        >>> print(json.dumps([LazyBase64(b'key'), b'key', memoryview(b'key')], default=TeleData.json_default))
+        ["a2V5", "a2V5", "a2V5"]
+        """
+        if isinstance(obj, (LazyBase64, LazyTime)):
+            return str(obj)
+        if isinstance(obj, Record):
+            return obj.to_dict()
+        if isinstance(obj, (bytes, bytearray, memoryview)):
+            return base64.b64encode(obj).decode()
+        raise TypeError("Object of type {} is not JSON serializable".format(type(obj).__name__))
+
     @staticmethod
     def time_from_ts(ts):
+        return _format_time(ts)
+
+    def skip(self, kind):
+        """
+        Пропуск объекта без построения Map: курсор сдвигается за объект
+        :param kind: тип объекта, префикс метода *_deserialize (message, message_media, page_block, ...)
+        :return: (начало, конец) объекта в ячейке, начало указывает на конструктор
+        >>> cell = struct.pack('<6I', 0x44f9b43d, 0, 7, 0x9db1bc6d, 42, 0) + b'\\x02hi\\x00' + struct.pack('<I', 99)
+        >>> data = TeleData(cell)
+        >>> print(data.skip('message'), data.read_int32)
+        (0, 28) 99
+        """
+        start = self.pos
+        reader = self.skipper()
+        reader.skip_object(kind)
+        self.absorb(reader)
+        return start, reader.pos
+
+    def skipper(self):
+        """
+        :return: читатель для пропуска объекта с текущей позиции: SkippedParams вместо Map,
+            строки, байты и векторы без декодирования (SkipReads)
+        """
+        reader = self.fork(self.pos)
+        reader.__class__ = self.skipper_class()
+        reader.__dict__.pop('_dispatch', None)
+        reader.new_params = _skipped_params
+        reader.convert_bytes = self.BYTES_CONVERTERS[self.BYTES_VIEW]
+        reader.convert_time = self.TIME_CONVERTERS[self.TIME_RAW]
+        reader.instances = SeenNames()
+        reader.lazy = False
+        reader.projection = None
+        return reader
+
+    @classmethod
+    def skipper_class(cls):
+        """
+        :return: подкласс cls с чтением SkipReads, создаётся один раз на класс
+        """
+        skipper = cls.__dict__.get('_skipper_class')
+        if skipper is None:
+            if issubclass(cls, SkipReads):
+                return cls
+            skipper = type(cls.__name__ + 'Skipper', (SkipReads, cls), {'_skip_layouts': {}, '_skip_tables': {}})
+            cls._skipper_class = skipper
+        return skipper
+
+    def absorb(self, reader):
+        """
+        Перенос позиции и отмеченных эвристиками имён из вспомогательного читателя
+        :param reader: читатель, созданный skipper()
+        """
+        self.pos = reader.pos
+        for name in InstanceFlags.WATCHED.intersection(reader.instances):
+            self.instances.append(name)
+
+    def skip_vector(self, kind):
+        """
+        Пропуск TL вектора объектов
+        :param kind: тип элементов, префикс метода *_deserialize
+        :return: список (начало, конец) каждого элемента
+        >>> peer = struct.pack('<II', 0x9db1bc6d, 42)
+        >>> data = TeleData(struct.pack('<II', 0x1cb5c415, 2) + peer * 2)
+        >>> print(data.skip_vector('peer'), data.at_end())
+        [(8, 16), (16, 24)] True
+        """
+        magic = self.read_int32
+        assert (magic == 0x1cb5c415), "magic in skip_vector"
+        return [self.skip(kind) for i in range(self.read_int32)]
+
+    @staticmethod
+    def compile_projection(paths):
+        """
+        Дерево проекции из путей вида "media.photo.sizes"
+        :param paths: итерируемое с путями или уже готовое дерево (dict)
+        :return: {поле: поддерево или None - поле целиком}
+        >>> print(TeleData.compile_projection({"id", "to_id.user_id", "media.photo", "media"}) == {
+        ...     "id": None, "to_id": {"user_id": None}, "media": None})
+        True
+        """
+        if isinstance(paths, dict):
+            return paths
+        tree = dict()
+        for path in sorted(paths, key=lambda item: item.count('.')):
+            node = tree
+            keys = path.split('.')
+            for key in keys[:-1]:
+                node = node.setdefault(key, dict())
+                if node is None:
+                    break
+            else:
+                node[keys[-1]] = None
+        return tree
+
+    @classmethod
+    def trim(cls, value, projection):
+        """
+        Оставляет в разобранном дереве только поля проекции
+        :param value: Map, список или лист дерева
+        :param projection: дерево проекции (compile_projection), None - значение целиком
+        :return: новое дерево
+        """
+        if projection is None:
+            return value
+        if isinstance(value, list):
+            return [cls.trim(item, projection) for item in value]
+        if value is None or not hasattr(value, 'get'):
+            return value
+        result = Map()
+        for key, sub in projection.items():
+            item = value.get(key)
+            if item is not None:
+                result[key] = cls.trim(item, sub)
+        return result
+
+    def _parse_projected(self, parser, projection):
+        # парсер не знает имени поля при чтении простых значений: их пропускает только trim,
+        # без разбора проходятся вложенные объекты (_parse_field)
+        outer, lazy = self.projection, self.lazy
+        self.projection, self.lazy = projection, False
         try:
-            result = datetime.datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S')
-        except OSError:
-            result = ts
+            result = parser(self)
+        finally:
+            self.projection, self.lazy = outer, lazy
+        return self.trim(result, projection)
+
+    def _parse_field(self, parser, field):
+        projection = self.projection
+        sub = projection.get(field, SKIPPED)
+        if sub is SKIPPED:
+            reader = self.skipper()
+            result = reader.skip_parser(parser)
+            self.absorb(reader)
+            return result
+        self.projection = sub
+        try:
+            return parser(self)
+        finally:
+            self.projection = projection
+
+    def _dispatch(self, parsers, constructor, field=None, projection=None):
+        """
+        Выбор парсера по таблице конструкторов (см. *_PARSERS в конце класса)
+        :param parsers: таблица {constructor: _tl_* функция}
+        :param constructor: прочитанный идентификатор конструктора
+        :param field: имя поля родителя, в которое пишется объект (для проекции)
+        :param projection: пути полей, которые нужно разобрать (см. compile_projection):
+            вложенные объекты вне проекции пропускаются без построения Map (SkipReads.skip_parser),
+            простые поля (числа, строки, даты) читаются как обычно и отбрасываются trim
+        :return: Map объекта
+        >>> cell = struct.pack('<6I', 0x44f9b43d, 0, 7, 0x9db1bc6d, 42, 0) + b'\\x02hi\\x00'
+        >>> data = TeleData(cell)
+        >>> print(data.message_deserialize(data.read_int32, projection={"id", "to_id.user_id"}))
+        {'id': 7, 'to_id': {'user_id': 42}}
+        """
+        parser = parsers.get(constructor)
+        if parser is None:
+            result = None
+        elif projection is not None:
+            result = self._parse_projected(parser, self.compile_projection(projection))
+        elif field is None or self.projection is None:
+            result = parser(self)
+        else:
+            result = self._parse_field(parser, field)
+        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
         return result
 
+    def _dispatch_profiled(self, parsers, constructor, field=None, projection=None):
+        """
+        _dispatch со счётчиками в self.profile: {имя: [вызовы, байты, секунды]} для _tl_* парсера
+        и *_deserialize метода; байты и время включают вложенные объекты
+        >>> cell = struct.pack('<6I', 0x44f9b43d, 0, 7, 0x9db1bc6d, 42, 0) + b'\\x02hi\\x00'
+        >>> data = TeleData(cell, profile=True)
+        >>> message = data.message_deserialize(data.read_int32)
+        >>> for name, counter in sorted(TeleData.profile_stats(data.profile).items()):
+        ...     print(name, counter.calls, counter.bytes)
+        _tl_message 1 24
+        _tl_peerUser 1 4
+        message_deserialize 1 24
+        peer_deserialize 1 4
+        """
+        dispatchers = self.dispatcher_names()
+        parser = parsers.get(constructor)
+        start = self.pos
+        started = time.perf_counter()
+        try:
+            return TeleData._dispatch(self, parsers, constructor, field, projection)
+        finally:
+            seconds = time.perf_counter() - started
+            size = self.pos - start
+            profile = self.profile
+            for name in (dispatchers.get(id(parsers)), parser.__name__ if parser else hex(constructor)):
+                counter = profile.get(name)
+                if counter is None:
+                    counter = profile[name] = [0, 0, 0.0]
+                counter[0] += 1
+                counter[1] += size
+                counter[2] += seconds
+
+    @classmethod
+    def dispatcher_names(cls):
+        """
+        :return: {id(таблица *_PARSERS): имя *_deserialize метода}, строится один раз на класс
+        """
+        names = cls.__dict__.get('_dispatcher_names')
+        if names is None:
+            names = {id(getattr(cls, name)): name[:-len('_PARSERS')].lower() + '_deserialize'
+                     for name in dir(cls) if name.endswith('_PARSERS')}
+            cls._dispatcher_names = names
+        return names
+
+    @staticmethod
+    def profile_stats(profile):
+        """
+        :param profile: словарь статистики (TeleData.profile)
+        :return: {имя: Map(calls, bytes, seconds)}
+        """
+        return {name: Map(calls=calls, bytes=size, seconds=seconds)
+                for name, (calls, size, seconds) in profile.items()}
+
+    @staticmethod
+    def profile_report(profile, top=None):
+        """
+        Текстовый отчёт по статистике разбора, по убыванию времени
+        :param profile: словарь статистики (TeleData.profile)
+        :param top: число строк отчёта (по умолчанию все)
+        :return: str
+        """
+        rows = sorted(profile.items(), key=lambda item: item[1][2], reverse=True)[:top]
+        lines = ["{:<45} {:>10} {:>12} {:>10} {:>8}".format('name', 'calls', 'bytes', 'ms', 'us/call')]
+        for name, (calls, size, seconds) in rows:
+            lines.append("{:<45} {:>10} {:>12} {:>10.3f} {:>8.2f}".format(
+                name, calls, size, seconds * 1000, seconds * 1e6 / calls))
+        return '\n'.join(lines)
+
     ######################################################
 
     def _tl_peerUser(self):
         constructor = 0x9db1bc6d
-        self.instances.append(inspect.stack()[0][3])
-        params = Map()
-        if self.stream.tell() == len(self.stream.getvalue()):
+        self.instances.append('_tl_peerUser')
+        params = self.new_params('_tl_peerUser')
+        if self.at_end():
             return params
         params.user_id = self.read_int32
         return params
 
     def _tl_peerChannel(self):
         constructor = 0xbddde532
-        params = Map()
+        params = self.new_params('_tl_peerChannel')
         params.channel_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_peerChannel')
         return params
 
     def _tl_peerChat(self):
         constructor = 0xbad0e5bb
-        params = Map()
+        params = self.new_params('_tl_peerChat')
         params.chat_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_peerChat')
         return params
 
-    def peer_deserialize(self, constructor):
-        result = None
-        if constructor == 0x9db1bc6d:
-            result = self._tl_peerUser()
-        elif constructor == 0xbddde532:
-            result = self._tl_peerChannel()
-        elif constructor == 0xbad0e5bb:
-            result = self._tl_peerChat()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+    def peer_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.PEER_PARSERS, constructor, field, projection)
 
     def _tl_messageFwdHeader(self):
         constructor = 0xec338270
-        params = Map()
+        params = self.new_params('_tl_messageFwdHeader')
         flags = self.read_int32
         params.flags = flags
         if (flags & 1) != 0:
@@ -194,7 +1180,7 @@ class TeleData(object):
         if (flags & 32) != 0:
             params.from_name = self.read_string
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         if (flags & 2) != 0:
             params.channel_id = self.read_int32
         if (flags & 4) != 0:
@@ -205,18 +1191,18 @@ class TeleData(object):
             params.saved_from_peer = self.peer_deserialize(constructor)
         if (flags & 16) != 0:
             params.saved_from_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageFwdHeader')
         return params
 
     def _tl_messageFwdHeader_layer96(self):
         constructor = 0x559ebe6d
-        params = Map()
+        params = self.new_params('_tl_messageFwdHeader_layer96')
         flags = self.read_int32
         params.flags = flags
         if (flags & 1) != 0:
             params.from_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         if (flags & 2) != 0:
             params.channel_id = self.read_int32
         if (flags & 4) != 0:
@@ -227,176 +1213,144 @@ class TeleData(object):
             params.saved_from_peer = self.peer_deserialize(constructor)
         if (flags & 16) != 0:
             params.saved_from_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageFwdHeader_layer96')
         return params
 
     def _tl_messageFwdHeader_layer72(self):
         constructor = 0xfadff4ac
-        params = Map()
+        params = self.new_params('_tl_messageFwdHeader_layer72')
         flags = self.read_int32
         params.flags = flags
         if (flags & 1) != 0:
             params.from_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         if (flags & 2) != 0:
             params.channel_id = self.read_int32
         if (flags & 4) != 0:
             params.channel_post = self.read_int32
         if (flags & 8) != 0:
             params.post_author = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageFwdHeader_layer72')
         return params
 
     def _tl_messageFwdHeader_layer68(self):
         constructor = 0xc786ddcb
-        params = Map()
+        params = self.new_params('_tl_messageFwdHeader_layer68')
         flags = self.read_int32
         params.flags = flags
         if (flags & 1) != 0:
             params.from_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         if (flags & 2) != 0:
             params.channel_id = self.read_int32
         if (flags & 4) != 0:
             params.channel_post = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def message_fwd_header_deserialize(self, constructor):
-        result = None
-        if constructor == 0xfadff4ac:
-            result = self._tl_messageFwdHeader_layer72()
-        elif constructor == 0xec338270:
-            result = self._tl_messageFwdHeader()
-        elif constructor == 0x559ebe6d:
-            result = self._tl_messageFwdHeader_layer96()
-        elif constructor == 0xc786ddcb:
-            result = self._tl_messageFwdHeader_layer68()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_messageFwdHeader_layer68')
+        return params
+
+    def message_fwd_header_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.MESSAGE_FWD_HEADER_PARSERS, constructor, field, projection)
 
     def _tl_fileLocation_layer97(self):
         constructor = 0x91d11eb
-        params = Map()
+        params = self.new_params('_tl_fileLocation_layer97')
         params.dc_id = self.read_int32
         params.volume_id = self.read_int64
         params.local_id = self.read_int32
         params.secret = self.read_int64
         params.file_reference = self.read_bytes
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_fileLocation_layer97')
         return params
 
     def _tl_fileLocation_layer82(self):
         constructor = 0x53d69076
-        params = Map()
+        params = self.new_params('_tl_fileLocation_layer82')
         params.dc_id = self.read_int32
         params.volume_id = self.read_int64
         params.local_id = self.read_int32
         params.secret = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_fileLocation_layer82')
         return params
 
     def _tl_fileEncryptedLocation(self):
         constructor = 0x55555554
-        params = Map()
+        params = self.new_params('_tl_fileEncryptedLocation')
         params.dc_id = self.read_int32
         params.volume_id = self.read_int64
         params.local_id = self.read_int32
         params.secret = self.read_int64
         params.key = self.read_bytes
         params.iv = self.read_bytes
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_fileEncryptedLocation')
         return params
 
     def _tl_fileLocationUnavailable(self):
         constructor = 0x7c596b46
-        params = Map()
+        params = self.new_params('_tl_fileLocationUnavailable')
         params.local_id = self.read_int32
         params.secret = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_fileLocationUnavailable')
         return params
 
     def _tl_fileLocation_to_be_depreacted(self):
         constructor = 0xbc7fc6cd
-        params = Map()
+        params = self.new_params('_tl_fileLocation_to_be_depreacted')
         params.volume_id = self.read_int64
         params.local_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def file_location_deserialize(self, constructor):
-        result = None
-        if constructor == 0x53d69076:
-            result = self._tl_fileLocation_layer82()
-        elif constructor == 0x55555554:
-            result = self._tl_fileEncryptedLocation()
-        elif constructor == 0x7c596b46:
-            result = self._tl_fileLocationUnavailable()
-        elif constructor == 0x91d11eb:
-            result = self._tl_fileLocation_layer97()
-        elif constructor == 0xbc7fc6cd:
-            result = self._tl_fileLocation_to_be_depreacted()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_fileLocation_to_be_depreacted')
+        return params
+
+    def file_location_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.FILE_LOCATION_PARSERS, constructor, field, projection)
 
     def _tl_photoSize(self):
         constructor = 0x77bfb61b
-        params = Map()
+        params = self.new_params('_tl_photoSize')
         params.type = self.read_string
-        params.location = self.file_location_deserialize(self.read_int32)
+        params.location = self.file_location_deserialize(self.read_int32, 'location')
         params.w = self.read_int32
         params.h = self.read_int32
         params.size = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_photoSize')
         return params
 
     def _tl_photoSizeEmpty(self):
         constructor = 0xe17e23c
-        params = Map()
+        params = self.new_params('_tl_photoSizeEmpty')
         # startReadPosiition = self.get_position()
         params.typeof = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_photoSizeEmpty')
         return params
 
     def _tl_photoCachedSize(self):
         constructor = 0xe9a734fa
-        params = Map()
+        params = self.new_params('_tl_photoCachedSize')
         params.type = self.read_string
-        params.location = self.file_location_deserialize(self.read_int32)
+        params.location = self.file_location_deserialize(self.read_int32, 'location')
         params.w = self.read_int32
         params.h = self.read_int32
         params.bytes = self.read_bytes
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_photoCachedSize')
         return params
 
     def _tl_photoStrippedSize(self):
         constructor = 0xe0b0bc2e
-        params = Map()
+        params = self.new_params('_tl_photoStrippedSize')
         params.type = self.read_string
         params.bytes = self.read_bytes
         params.w = 50
         params.h = 50
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def photo_size_deserialize(self, constructor):
-        result = None
-        if constructor == 0x77bfb61b:
-            result = self._tl_photoSize()
-        elif constructor == 0xe17e23c:
-            result = self._tl_photoSizeEmpty()
-        elif constructor == 0xe9a734fa:
-            result = self._tl_photoCachedSize()
-        elif constructor == 0xe0b0bc2e:
-            result = self._tl_photoStrippedSize()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_photoStrippedSize')
+        return params
+
+    def photo_size_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.PHOTO_SIZE_PARSERS, constructor, field, projection)
 
     def _tl_photo(self):
         constructor = 0xd07504a5
-        params = Map()
+        params = self.new_params('_tl_photo')
         flags = self.read_int32
         params.flags = flags
         params.has_stickers = (flags & 1) != 0
@@ -404,24 +1358,15 @@ class TeleData(object):
         params.access_hash = self.read_int64
         params.file_reference = self.read_bytes
         date = self.read_int32
-        params.date = self.time_from_ts(date)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        sizes = list()
-        for i in range(0, count):
-            obj = self.photo_size_deserialize(self.read_int32)
-            if obj is None:  # is None по какой-то причине плох в этом месте
-                return
-            sizes.append(obj)
-        params.sizes = sizes
+        params.date = self.convert_time(date)
+        params.sizes = self.read_vector(self.photo_size_deserialize, 'sizes')
         params.dc_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_photo')
         return params
 
     def _tl_photo_layer97(self):
         constructor = 0x9c477dd8
-        params = Map()
+        params = self.new_params('_tl_photo_layer97')
         flags = self.read_int32
         params.flags = flags
         params.has_stickers = (flags & 1) != 0
@@ -429,280 +1374,207 @@ class TeleData(object):
         params.access_hash = self.read_int64
         params.file_reference = self.read_bytes
         date = self.read_int32
-        params.date = self.time_from_ts(date)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        sizes = list()
-        for i in range(0, count):
-            obj = self.photo_size_deserialize(self.read_int32)
-            if obj is None:  # is None по какой-то причине плох в этом месте
-                return
-            sizes.append(obj)
-        params.sizes = sizes
-        self.instances.append(inspect.stack()[0][3])
+        params.date = self.convert_time(date)
+        params.sizes = self.read_vector(self.photo_size_deserialize, 'sizes')
+        self.instances.append('_tl_photo_layer97')
         return params
 
     def _tl_photo_layer82(self):
         constructor = 0x9288dd29
-        params = Map()
+        params = self.new_params('_tl_photo_layer82')
         flags = self.read_int32
         params.flags = flags
         params.has_stickers = (flags & 1) != 0
         params.id = self.read_int64
         params.access_hash = self.read_int64
         date = self.read_int32
-        params.date = self.time_from_ts(date)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        sizes = list()
-        for i in range(0, count):
-            obj = self.photo_size_deserialize(self.read_int32)
-            if obj is None:  # is None по какой-то причине плох в этом месте
-                return
-            sizes.append(obj)
-        params.sizes = sizes
-        self.instances.append(inspect.stack()[0][3])
+        params.date = self.convert_time(date)
+        params.sizes = self.read_vector(self.photo_size_deserialize, 'sizes')
+        self.instances.append('_tl_photo_layer82')
         return params
 
     def _tl_geoPointEmpty(self):
         constructor = 0x1117dd5f
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_geoPointEmpty')
+        self.instances.append('_tl_geoPointEmpty')
         return params
 
     def _tl_geoPoint(self):
         constructor = 0x2049d70c
-        params = Map()
+        params = self.new_params('_tl_geoPoint')
         params._long = self.read_double
         params.lat = self.read_double
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_geoPoint')
         return params
 
-    def geo_point_deserialize(self, constructor):
-        result = None
-        if constructor == 0x1117dd5f:
-            result = self._tl_geoPointEmpty()
-        elif constructor == 0x2049d70c:
-            result = self._tl_geoPoint()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+    def geo_point_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.GEO_POINT_PARSERS, constructor, field, projection)
 
     def _tl_photo_old(self):
         constructor = 0x22b56751
-        params = Map()
+        params = self.new_params('_tl_photo_old')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         params.user_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.caption = self.read_string
-        params.geo = self.geo_point_deserialize(self.read_int32)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        sizes = list()
-        for i in range(0, count):
-            obj = self.photo_size_deserialize(self.read_int32)
-            if obj is None:
-                return
-            sizes.append(obj)
-        params.sizes = sizes
+        params.geo = self.geo_point_deserialize(self.read_int32, 'geo')
+        params.sizes = self.read_vector(self.photo_size_deserialize, 'sizes')
         return params
 
     def _tl_photo_old2(self):
         constructor = 0xc3838076
-        params = Map()
+        params = self.new_params('_tl_photo_old2')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         params.user_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
-        params.geo = self.geo_point_deserialize(self.read_int32)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        sizes = list()
-        for i in range(0, count):
-            obj = self.photo_size_deserialize(self.read_int32)
-            if obj is None:
-                return
-            sizes.append(obj)
-        params.sizes = sizes
+        params.date = self.convert_time(date)
+        params.geo = self.geo_point_deserialize(self.read_int32, 'geo')
+        params.sizes = self.read_vector(self.photo_size_deserialize, 'sizes')
         return params
 
     def _tl_photo_layer55(self):
         constructor = 0xcded42fe
-        params = Map()
+        params = self.new_params('_tl_photo_layer55')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         date = self.read_int32
-        params.date = self.time_from_ts(date)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        sizes = list()
-        for i in range(0, count):
-            obj = self.photo_size_deserialize(self.read_int32)
-            if obj is None:
-                return
-            sizes.append(obj)
-        params.sizes = sizes
-        return params
-
-    def photo_deserialize(self, constructor):
-        result = None
-        if constructor == 0x22b56751:
-            result = self._tl_photo_old()
-        elif constructor == 0xd07504a5:
-            result = self._tl_photo()
-        elif constructor == 0x9c477dd8:
-            result = self._tl_photo_layer97()
-        elif constructor == 0x9288dd29:
-            result = self._tl_photo_layer82()
-        elif constructor == 0xc3838076:
-            result = self._tl_photo_old2()
-        elif constructor == 0xcded42fe:
-            result = self._tl_photo_layer55()
-        elif constructor == 0x2331b22d:
-            result = self._tl_photoEmpty()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params.date = self.convert_time(date)
+        params.sizes = self.read_vector(self.photo_size_deserialize, 'sizes')
+        return params
+
+    def photo_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.PHOTO_PARSERS, constructor, field, projection)
 
-    def page_caption_deserialize(self, constructor):
-        assert (constructor == 0x6f747657), "{} asseratation".format(inspect.stack()[0][3])
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
-        params.credit = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+    def _tl_pageCaption(self):
+        constructor = 0x6f747657
+        params = self.new_params('_tl_pageCaption')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
+        params.credit = self.rich_text_deserialize(self.read_int32, 'credit')
+        self.instances.append('_tl_pageCaption')
         return params
 
+    def page_caption_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.PAGE_CAPTION_PARSERS, constructor, field, projection)
+
     def _tl_pageBlockTitle(self):
         constructor = 0x70abc3fd
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_pageBlockTitle')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
+        self.instances.append('_tl_pageBlockTitle')
         return params
 
     def _tl_pageBlockAuthorDate(self):
         constructor = 0xbaafe5e0
-        params = Map()
-        params.author = self.rich_text_deserialize(self.read_int32)
+        params = self.new_params('_tl_pageBlockAuthorDate')
+        params.author = self.rich_text_deserialize(self.read_int32, 'author')
         published_date = self.read_int32
-        params.published_date = self.time_from_ts(published_date)
-        self.instances.append(inspect.stack()[0][3])
+        params.published_date = self.convert_time(published_date)
+        self.instances.append('_tl_pageBlockAuthorDate')
         return params
 
     def _tl_pageBlockParagraph(self):
         constructor = 0x467a0766
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_pageBlockParagraph')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
+        self.instances.append('_tl_pageBlockParagraph')
         return params
 
     def _tl_pageBlockAnchor(self):
         constructor = 0xce0d37b0
-        params = Map()
+        params = self.new_params('_tl_pageBlockAnchor')
         params.name = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_pageBlockAnchor')
         return params
 
     def _tl_pageBlockHeader(self):
         constructor = 0xbfd064ec
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_pageBlockHeader')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
+        self.instances.append('_tl_pageBlockHeader')
         return params
 
     def _tl_pageBlockList(self):
         constructor = 0x3a58c7f4
-        params = Map()
+        params = self.new_params('_tl_pageBlockList')
         params.ordered = self.read_bool
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        elements = list()
-        for i in range(0, count):
-            obj = self.rich_text_deserialize(self.read_int32)
-            if obj is None:
-                return
-            elements.append(obj)
-        params.elements = elements
-        self.instances.append(inspect.stack()[0][3])
+        params.elements = self.read_vector(self.rich_text_deserialize, 'elements')
+        self.instances.append('_tl_pageBlockList')
         return params
 
     def _tl_pageBlockPhoto(self):
         constructor = 0x1759c560
-        params = Map()
+        params = self.new_params('_tl_pageBlockPhoto')
         flags = self.read_int32
         params.flags = flags
         params.photo_id = self.read_int64
-        params.caption = self.page_caption_deserialize(self.read_int32)
+        params.caption = self.page_caption_deserialize(self.read_int32, 'caption')
         if (flags & 1) != 0:
             params.url = self.read_string
         if (flags & 1) != 0:
             params.webpage_id = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_pageBlockPhoto')
         return params
 
     def _tl_pageBlockDivider(self):
         constructor = 0xdb20b188
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_pageBlockDivider')
+        self.instances.append('_tl_pageBlockDivider')
         return params
 
     def _tl_pageBlockSubheader(self):
         constructor = 0xf12bb6e1
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_pageBlockSubheader')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
+        self.instances.append('_tl_pageBlockSubheader')
         return params
 
     def _tl_pageBlockBlockquote(self):
         constructor = 0x263d7c26
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
-        params.caption = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_pageBlockBlockquote')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
+        params.caption = self.rich_text_deserialize(self.read_int32, 'caption')
+        self.instances.append('_tl_pageBlockBlockquote')
         return params
 
     def _tl_pageBlockVideo(self):
         constructor = 0x7c8fe7b6
-        params = Map()
+        params = self.new_params('_tl_pageBlockVideo')
         flags = self.read_int32
         params.flags = flags
         params.autoplay = (flags & 1) != 0
         params.loop = (flags & 2) != 0
         params.video_id = self.read_int64
-        params.caption = self.page_caption_deserialize(self.read_int32)
+        params.caption = self.page_caption_deserialize(self.read_int32, 'caption')
 
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_pageBlockVideo')
         return params
 
     def _tl_pageBlockVideo_layer82(self):
         constructor = 0xd9d71866
-        params = Map()
+        params = self.new_params('_tl_pageBlockVideo_layer82')
         flags = self.read_int32
         params.flags = flags
         params.autoplay = (flags & 1) != 0
         params.loop = (flags & 2) != 0
         params.video_id = self.read_int64
-        params.caption = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.caption = self.rich_text_deserialize(self.read_int32, 'caption')
+        self.instances.append('_tl_pageBlockVideo_layer82')
         return params
 
     def _tl_pageBlockPreformatted(self):
         constructor = 0xc070d93e
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
+        params = self.new_params('_tl_pageBlockPreformatted')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
         params.language = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_pageBlockPreformatted')
         return params
 
     def _tl_pageBlockEmbed(self):
         constructor = 0xcde200d1
-        params = Map()
+        params = self.new_params('_tl_pageBlockEmbed')
         flags = self.read_int32
         params.flags = flags
         params.full_width = (flags & 1) != 0
@@ -715,54 +1587,45 @@ class TeleData(object):
             params.poster_photo_id = self.read_int64
         params.w = self.read_int32
         params.h = self.read_int32
-        params.caption = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.caption = self.rich_text_deserialize(self.read_int32, 'caption')
+        self.instances.append('_tl_pageBlockEmbed')
         return params
 
     def _tl_pageBlockUnsupported(self):
         constructor = 0x13567e8a
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_pageBlockUnsupported')
+        self.instances.append('_tl_pageBlockUnsupported')
         return params
 
     def _tl_pageBlockAuthorDate_layer60(self):
         constructor = 0x3d5b64f2
-        params = Map()
+        params = self.new_params('_tl_pageBlockAuthorDate_layer60')
         authorString = self.read_string
         params.author = self._tl_textPlain()
         params.author.text = authorString
         published_date = self.read_int32
-        params.published_date = self.time_from_ts(published_date)
-        self.instances.append(inspect.stack()[0][3])
+        params.published_date = self.convert_time(published_date)
+        self.instances.append('_tl_pageBlockAuthorDate_layer60')
         return params
 
     def _tl_pageBlockCollage(self):
         constructor = 0x8b31c4f
-        params = Map()
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        elements = list()
-        for i in range(0, count):
-            obj = self.page_block_deserialize(self.read_int32)
-            if obj is None:
-                return
-            elements.append(obj)
-        params.elements = elements
-        params.caption = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_pageBlockCollage')
+        params.elements = self.read_vector(self.page_block_deserialize, 'elements')
+        params.caption = self.rich_text_deserialize(self.read_int32, 'caption')
+        self.instances.append('_tl_pageBlockCollage')
         return params
 
     def _tl_pageBlockFooter(self):
         constructor = 0x48870999
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_pageBlockFooter')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
+        self.instances.append('_tl_pageBlockFooter')
         return params
 
     def _tl_pageBlockEmbed_layer60(self):
         constructor = 0xd935d8fb
-        params = Map()
+        params = self.new_params('_tl_pageBlockEmbed_layer60')
         flags = self.read_int32
         params.flags = flags
         params.full_width = (flags & 1) != 0
@@ -773,99 +1636,77 @@ class TeleData(object):
             params.html = self.read_string
         params.w = self.read_int32
         params.h = self.read_int32
-        params.caption = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.caption = self.rich_text_deserialize(self.read_int32, 'caption')
+        self.instances.append('_tl_pageBlockEmbed_layer60')
         return params
 
     def _tl_pageBlockSubtitle(self):
         constructor = 0x8ffa9a1f
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_pageBlockSubtitle')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
+        self.instances.append('_tl_pageBlockSubtitle')
         return params
 
     def _tl_pageBlockEmbedPost(self):
         constructor = 0x292c7be9
-        params = Map()
+        params = self.new_params('_tl_pageBlockEmbedPost')
         params.url = self.read_string
         params.webpage_id = self.read_int64
         params.author_photo_id = self.read_int64
         params.author = self.read_string
         date = self.read_int32
-        params.date = self.time_from_ts(date)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        blocks = list()
-        for i in range(0, count):
-            obj = self.page_block_deserialize(self.read_int32)
-            if obj is None:
-                blocks.append(obj)
-        params.blocks = blocks
-        params.caption = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.date = self.convert_time(date)
+        params.blocks = self.read_vector(self.page_block_deserialize, 'blocks')
+        params.caption = self.rich_text_deserialize(self.read_int32, 'caption')
+        self.instances.append('_tl_pageBlockEmbedPost')
         return params
 
     def _tl_chatPhotoEmpty(self):
         constructor = 0x37c1011c
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_chatPhotoEmpty')
+        self.instances.append('_tl_chatPhotoEmpty')
         return params
 
     def _tl_chatPhoto(self):
         constructor = 0x475cdbd5
-        params = Map()
-        params.photo_small = self.file_location_deserialize(self.read_int32)
-        params.photo_big = self.file_location_deserialize(self.read_int32)
+        params = self.new_params('_tl_chatPhoto')
+        params.photo_small = self.file_location_deserialize(self.read_int32, 'photo_small')
+        params.photo_big = self.file_location_deserialize(self.read_int32, 'photo_big')
         params.dc_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_chatPhoto')
         return params
 
     def _tl_chatPhoto_layer97(self):
         constructor = 0x6153276a
-        params = Map()
-        params.photo_small = self.file_location_deserialize(self.read_int32)
-        params.photo_big = self.file_location_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def chat_photo_deserialize(self, constructor):
-        result = None
-        if constructor == 0x37c1011c:
-            result = self._tl_chatPhotoEmpty()
-        elif constructor == 0x6153276a:
-            result = self._tl_chatPhoto_layer97()
-        elif constructor == 0x475cdbd5:
-            result = self._tl_chatPhoto()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params = self.new_params('_tl_chatPhoto_layer97')
+        params.photo_small = self.file_location_deserialize(self.read_int32, 'photo_small')
+        params.photo_big = self.file_location_deserialize(self.read_int32, 'photo_big')
+        self.instances.append('_tl_chatPhoto_layer97')
+        return params
+
+    def chat_photo_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.CHAT_PHOTO_PARSERS, constructor, field, projection)
 
     def _tl_inputChannelEmpty(self):
         constructor = 0xee8c1e86
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_inputChannelEmpty')
+        self.instances.append('_tl_inputChannelEmpty')
         return params
 
     def _tl_inputChannel(self):
         constructor = 0xafeb712e
-        params = Map()
+        params = self.new_params('_tl_inputChannel')
         params.channel_id = self.read_int32
         params.access_hash = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_inputChannel')
         return params
 
-    def input_channel_deserialize(self, constructor):
-        result = None
-        if constructor == 0xee8c1e86:
-            result = self._tl_inputChannelEmpty()
-        elif constructor == 0xafeb712e:
-            result = self._tl_inputChannel()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+    def input_channel_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.INPUT_CHANNEL_PARSERS, constructor, field, projection)
 
     def _tl_chat(self):
         constructor = 0x3bda1bde
-        params = Map()
+        params = self.new_params('_tl_chat')
         flags = self.read_int32
         params.flags = flags
         params.creator = (flags & 1) != 0
@@ -874,23 +1715,23 @@ class TeleData(object):
         params.deactivated = (flags & 32) != 0
         params.id = self.read_int32
         params.title = self.read_string
-        params.photo = self.chat_photo_deserialize(self.read_int32)
+        params.photo = self.chat_photo_deserialize(self.read_int32, 'photo')
         params.participants_count = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.version = self.read_int32
         if (flags & 64) != 0:
-            params.migrated_to = self.input_channel_deserialize(self.read_int32)
+            params.migrated_to = self.input_channel_deserialize(self.read_int32, 'migrated_to')
         if (flags & 16384) != 0:
-            params.admin_rights = self.chat_admin_rights_deserialize(self.read_int32)
+            params.admin_rights = self.chat_admin_rights_deserialize(self.read_int32, 'admin_rights')
         if (flags & 262144) != 0:
-            params.default_banned_rights = self.chat_banned_rights_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+            params.default_banned_rights = self.chat_banned_rights_deserialize(self.read_int32, 'default_banned_rights')
+        self.instances.append('_tl_chat')
         return params
 
     def _tl_chat_layer92(self):
         constructor = 0xd91cdd54
-        params = Map()
+        params = self.new_params('_tl_chat_layer92')
         flags = self.read_int32
         params.flags = flags
         params.creator = (flags & 1) != 0
@@ -901,19 +1742,19 @@ class TeleData(object):
         params.deactivated = (flags & 32) != 0
         params.id = self.read_int32
         params.title = self.read_string
-        params.photo = self.chat_photo_deserialize(self.read_int32)
+        params.photo = self.chat_photo_deserialize(self.read_int32, 'photo')
         params.participants_count = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.version = self.read_int32
         if (flags & 64) != 0:
-            params.migrated_to = self.input_channel_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+            params.migrated_to = self.input_channel_deserialize(self.read_int32, 'migrated_to')
+        self.instances.append('_tl_chat_layer92')
         return params
 
     def _tl_channelAdminRights(self):
         constructor = 0x5d7ceba5
-        params = Map()
+        params = self.new_params('_tl_channelAdminRights')
         flags = self.read_int32
         params.flags = flags
         params.change_info = (flags & 1) != 0
@@ -925,18 +1766,17 @@ class TeleData(object):
         params.invite_link = (flags & 64) != 0
         params.pin_messages = (flags & 128) != 0
         params.add_admins = (flags & 512) != 0
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channelAdminRights')
         return params
 
-    def channel_admin_rights_deserialize(self, constructor):
-        assert (constructor == 0x5d7ceba5), "{} asseratation".format(inspect.stack()[0][3])
-        result = self._tl_channelAdminRights()
-        self.instances.append(inspect.stack()[0][3])
+    def channel_admin_rights_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.CHANNEL_ADMIN_RIGHTS_PARSERS, constructor, field, projection)
+        self.instances.append('channel_admin_rights_deserialize')
         return result
 
     def _tl_channelBannedRights(self):
         constructor = 0x58cf4249
-        params = Map()
+        params = self.new_params('_tl_channelBannedRights')
         flags = self.read_int32
         params.flags = flags
         params.view_messages = (flags & 1) != 0
@@ -948,18 +1788,17 @@ class TeleData(object):
         params.send_inline = (flags & 64) != 0
         params.embed_links = (flags & 128) != 0
         params.until_date = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channelBannedRights')
         return params
 
-    def channel_banned_rights_deserialize(self, constructor):
-        assert (constructor == 0x58cf4249), "{} asseratation".format(inspect.stack()[0][3])
-        result = self._tl_channelBannedRights()
-        self.instances.append(inspect.stack()[0][3])
+    def channel_banned_rights_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.CHANNEL_BANNED_RIGHTS_PARSERS, constructor, field, projection)
+        self.instances.append('channel_banned_rights_deserialize')
         return result
 
     def _tl_channel_layer77(self):
         constructor = 0x450b7115
-        params = Map()
+        params = self.new_params('_tl_channel_layer77')
         flags = self.read_int32
         params.flags = flags
         params.creator = (flags & 1) != 0
@@ -977,24 +1816,24 @@ class TeleData(object):
         params.title = self.read_string
         if (flags & 64) != 0:
             params.username = self.read_string
-        params.photo = self.chat_photo_deserialize(self.read_int32)
+        params.photo = self.chat_photo_deserialize(self.read_int32, 'photo')
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.version = self.read_int32
         if (flags & 512) != 0:
             params.restriction_reason = self.read_string
         if (flags & 16384) != 0:
-            params.admin_rights = self.channel_admin_rights_deserialize(self.read_int32)
+            params.admin_rights = self.channel_admin_rights_deserialize(self.read_int32, 'admin_rights')
         if (flags & 32768) != 0:
-            params.banned_rights = self.channel_banned_rights_deserialize(self.read_int32)
+            params.banned_rights = self.channel_banned_rights_deserialize(self.read_int32, 'banned_rights')
         if (flags & 131072) != 0:
             params.participants_count = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channel_layer77')
         return params
 
     def _tl_chat_admin_rights(self):
         constructor = 0x5fb224d5
-        params = Map()
+        params = self.new_params('_tl_chat_admin_rights')
         flags = self.read_int32
         params.flags = flags
         params.change_info = (flags & 1) != 0
@@ -1005,12 +1844,12 @@ class TeleData(object):
         params.invite_users = (flags & 32) != 0
         params.pin_messages = (flags & 128) != 0
         params.add_admins = (flags & 512) != 0
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_chat_admin_rights')
         return params
 
     def chat_banned_rights(self):
         constructor = 0x9f120418
-        params = Map()
+        params = self.new_params('chat_banned_rights')
         flags = self.read_int32
         params.flags = flags
         params.view_messages = (flags & 1) != 0
@@ -1026,25 +1865,23 @@ class TeleData(object):
         params.invite_users = (flags & 32768) != 0
         params.pin_messages = (flags & 131072) != 0
         until_date = self.read_int64
-        params.until_date = self.time_from_ts(until_date)
-        self.instances.append(inspect.stack()[0][3])
+        params.until_date = self.convert_time(until_date)
+        self.instances.append('chat_banned_rights')
         return params
 
-    def chat_admin_rights_deserialize(self, constructor):
-        assert (constructor == 0x5fb224d5), "{} asseratation".format(inspect.stack()[0][3])
-        result = self._tl_chat_admin_rights()
-        self.instances.append(inspect.stack()[0][3])
+    def chat_admin_rights_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.CHAT_ADMIN_RIGHTS_PARSERS, constructor, field, projection)
+        self.instances.append('chat_admin_rights_deserialize')
         return result
 
-    def chat_banned_rights_deserialize(self, constructor):
-        assert (constructor == 0x9f120418), "{} asseratation".format(inspect.stack()[0][3])
-        result = self.chat_banned_rights()
-        self.instances.append(inspect.stack()[0][3])
+    def chat_banned_rights_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.CHAT_BANNED_RIGHTS_PARSERS, constructor, field, projection)
+        self.instances.append('chat_banned_rights_deserialize')
         return result
 
     def _tl_channel(self):
         constructor = 0x4df30834
-        params = Map()
+        params = self.new_params('_tl_channel')
         flags = self.read_int32
         params.flags = flags
         params.creator = (flags & 1) != 0
@@ -1063,26 +1900,26 @@ class TeleData(object):
         params.title = self.read_string
         if (flags & 64) != 0:
             params.username = self.read_string
-        params.photo = self.chat_photo_deserialize(self.read_int32)
+        params.photo = self.chat_photo_deserialize(self.read_int32, 'photo')
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.version = self.read_int32
         if (flags & 512) != 0:
             params.restriction_reason = self.read_string
         if (flags & 16384) != 0:
-            params.admin_rights = self.chat_admin_rights_deserialize(self.read_int32)
+            params.admin_rights = self.chat_admin_rights_deserialize(self.read_int32, 'admin_rights')
         if (flags & 32768) != 0:
-            params.banned_rights = self.chat_banned_rights_deserialize(self.read_int32)
+            params.banned_rights = self.chat_banned_rights_deserialize(self.read_int32, 'banned_rights')
         if (flags & 262144) != 0:
-            params.default_banned_rights = self.chat_banned_rights_deserialize(self.read_int32)
+            params.default_banned_rights = self.chat_banned_rights_deserialize(self.read_int32, 'default_banned_rights')
         if (flags & 131072) != 0:
             params.participants_count = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channel')
         return params
 
     def _tl_channel_layer92(self):
         constructor = 0xc88974ac
-        params = Map()
+        params = self.new_params('_tl_channel_layer92')
         flags = self.read_int32
         params.flags = flags
         params.creator = (flags & 1) != 0
@@ -1101,24 +1938,24 @@ class TeleData(object):
         params.title = self.read_string
         if (flags & 64) != 0:
             params.username = self.read_string
-        params.photo = self.chat_photo_deserialize(self.read_int32)
+        params.photo = self.chat_photo_deserialize(self.read_int32, 'photo')
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.version = self.read_int32
         if (flags & 512) != 0:
             params.restriction_reason = self.read_string
         if (flags & 16384) != 0:
-            params.admin_rights = self.channel_admin_rights_deserialize(self.read_int32)
+            params.admin_rights = self.channel_admin_rights_deserialize(self.read_int32, 'admin_rights')
         if (flags & 32768) != 0:
-            params.banned_rights = self.channel_banned_rights_deserialize(self.read_int32)
+            params.banned_rights = self.channel_banned_rights_deserialize(self.read_int32, 'banned_rights')
         if (flags & 131072) != 0:
             params.participants_count = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channel_layer92')
         return params
 
     def _tl_channel_layer72(self):
         constructor = 0xcb44b1c
-        params = Map()
+        params = self.new_params('_tl_channel_layer72')
         flags = self.read_int32
         params.flags = flags
         params.creator = (flags & 1) != 0
@@ -1136,44 +1973,44 @@ class TeleData(object):
         params.title = self.read_string
         if (flags & 64) != 0:
             params.username = self.read_string
-        params.photo = self.chat_photo_deserialize(self.read_int32)
+        params.photo = self.chat_photo_deserialize(self.read_int32, 'photo')
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.version = self.read_int32
         if (flags & 512) != 0:
             params.restriction_reason = self.read_string
         if (flags & 16384) != 0:
-            params.admin_rights = self.channel_admin_rights_deserialize(self.read_int32)
+            params.admin_rights = self.channel_admin_rights_deserialize(self.read_int32, 'admin_rights')
         if (flags & 32768) != 0:
-            params.banned_rights = self.channel_banned_rights_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+            params.banned_rights = self.channel_banned_rights_deserialize(self.read_int32, 'banned_rights')
+        self.instances.append('_tl_channel_layer72')
         return params
 
     def _tl_chatEmpty(self):
         constructor = 0x9ba2d800
-        params = Map()
+        params = self.new_params('_tl_chatEmpty')
         params.id = self.read_int32
         params.title = "DELETED"
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_chatEmpty')
         return params
 
     def _tl_chat_old(self):
         constructor = 0x6e9c9bc7
-        params = Map()
+        params = self.new_params('_tl_chat_old')
         params.id = self.read_int32
         params.title = self.read_string
-        params.photo = self.chat_photo_deserialize(self.read_int32)
+        params.photo = self.chat_photo_deserialize(self.read_int32, 'photo')
         params.participants_count = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.left = self.read_bool
         params.version = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_chat_old')
         return params
 
     def _tl_channel_old(self):
         constructor = 0x678e9587
-        params = Map()
+        params = self.new_params('_tl_channel_old')
         flags = self.read_int32
         params.flags = flags
         params.creator = (flags & 1) != 0
@@ -1189,56 +2026,47 @@ class TeleData(object):
         params.title = self.read_string
         if (flags & 64) != 0:
             params.username = self.read_string
-        params.photo = self.chat_photo_deserialize(self.read_int32)
+        params.photo = self.chat_photo_deserialize(self.read_int32, 'photo')
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.version = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channel_old')
         return params
 
     def _tl_pageBlockChannel(self):
         constructor = 0xef1751b5
-        params = Map()
-        params.channel = self.chat_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_pageBlockChannel')
+        params.channel = self.chat_deserialize(self.read_int32, 'channel')
+        self.instances.append('_tl_pageBlockChannel')
         return params
 
     def _tl_pageBlockSlideshow(self):
         constructor = 0x130c8963
-        params = Map()
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        elements = list()
-        for i in range(0, count):
-            obj = self.page_block_deserialize(self.read_int32)
-            if obj is None:
-                return
-            elements.append(obj)
-        params.elements = elements
-        params.caption = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_pageBlockSlideshow')
+        params.elements = self.read_vector(self.page_block_deserialize, 'elements')
+        params.caption = self.rich_text_deserialize(self.read_int32, 'caption')
+        self.instances.append('_tl_pageBlockSlideshow')
         return params
 
     def _tl_pageBlockPullquote(self):
         constructor = 0x4f4456d3
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
-        params.caption = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_pageBlockPullquote')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
+        params.caption = self.rich_text_deserialize(self.read_int32, 'caption')
+        self.instances.append('_tl_pageBlockPullquote')
         return params
 
     def _tl_pageBlockAudio(self):
         constructor = 0x31b81a7f
-        params = Map()
+        params = self.new_params('_tl_pageBlockAudio')
         params.audio_id = self.read_int64
-        params.caption = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.caption = self.rich_text_deserialize(self.read_int32, 'caption')
+        self.instances.append('_tl_pageBlockAudio')
         return params
 
     def _tl_pageRelatedArticle(self):
         constructor = 0xb390dc08
-        params = Map()
+        params = self.new_params('_tl_pageRelatedArticle')
         flags = self.read_int32
         params.flags = flags
         params.url = self.read_string
@@ -1253,337 +2081,172 @@ class TeleData(object):
             params.author = self.read_string
         if (flags & 16) != 0:
             params.published_date = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_pageRelatedArticle')
         return params
 
-    def page_related_article_deserialize(self, constructor):
-        assert (constructor == 0xb390dc08), "{} asseratation".format(inspect.stack()[0][3])
-        result = self._tl_pageRelatedArticle()
-        self.instances.append(inspect.stack()[0][3])
+    def page_related_article_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.PAGE_RELATED_ARTICLE_PARSERS, constructor, field, projection)
+        self.instances.append('page_related_article_deserialize')
         return result
 
     def _tl_pageBlockRlatedArticles(self):
         constructor = 0x16115a96
-        params = Map()
-        params.title = self.rich_text_deserialize(self.read_int32)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        elements = list()
-        for i in range(0, count):
-            obj = self.page_related_article_deserialize(self.read_int32)
-            if obj is None:
-                return
-            elements.append(obj)
-        params.elements = elements
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def page_block_deserialize(self, constructor):
-        result = None
-        if constructor == 0xdb20b188:
-            result = self._tl_pageBlockDivider()
-        elif constructor == 0x1759c560:
-            result = self._tl_pageBlockPhoto()
-        elif constructor == 0x16115a96:
-            result = self._tl_pageBlockRlatedArticles()
-        elif constructor == 0xbaafe5e0:
-            result = self._tl_pageBlockAuthorDate()
-        elif constructor == 0xc070d93e:
-            result = self._tl_pageBlockPreformatted()
-        elif constructor == 0xcde200d1:
-            result = self._tl_pageBlockEmbed()
-        elif constructor == 0xce0d37b0:
-            result = self._tl_pageBlockAnchor()
-        elif constructor == 0xbfd064ec:
-            result = self._tl_pageBlockHeader()
-        elif constructor == 0xd9d71866:
-            result = self._tl_pageBlockVideo_layer82()
-        elif constructor == 0x7c8fe7b6:
-            result = self._tl_pageBlockVideo()
-        elif constructor == 0x13567e8a:
-            result = self._tl_pageBlockUnsupported()
-        elif constructor == 0x467a0766:
-            result = self._tl_pageBlockParagraph()
-        elif constructor == 0x3d5b64f2:
-            result = self._tl_pageBlockAuthorDate_layer60()
-        elif constructor == 0x8b31c4f:
-            result = self._tl_pageBlockCollage()
-        elif constructor == 0x48870999:
-            result = self._tl_pageBlockFooter()
-        elif constructor == 0x3a58c7f4:
-            result = self._tl_pageBlockList()
-        elif constructor == 0xd935d8fb:
-            result = self._tl_pageBlockEmbed_layer60()
-        elif constructor == 0xe9c69982:
-            result = self._tl_pageBlockPhoto_layer82()
-        elif constructor == 0x8ffa9a1f:
-            result = self._tl_pageBlockSubtitle()
-        elif constructor == 0x263d7c26:
-            result = self._tl_pageBlockBlockquote()
-        elif constructor == 0x292c7be9:
-            result = self._tl_pageBlockEmbedPost()
-        elif constructor == 0x70abc3fd:
-            result = self._tl_pageBlockTitle()
-        elif constructor == 0xef1751b5:
-            result = self._tl_pageBlockChannel()
-        elif constructor == 0x39f23300:
-            result = self._tl_pageBlockCover()
-        elif constructor == 0xf12bb6e1:
-            result = self._tl_pageBlockSubheader()
-        elif constructor == 0x130c8963:
-            result = self._tl_pageBlockSlideshow()
-        elif constructor == 0x4f4456d3:
-            result = self._tl_pageBlockPullquote()
-        elif constructor == 0x31b81a7f:
-            result = self._tl_pageBlockAudio()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params = self.new_params('_tl_pageBlockRlatedArticles')
+        params.title = self.rich_text_deserialize(self.read_int32, 'title')
+        params.elements = self.read_vector(self.page_related_article_deserialize, 'elements')
+        self.instances.append('_tl_pageBlockRlatedArticles')
+        return params
+
+    def page_block_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.PAGE_BLOCK_PARSERS, constructor, field, projection)
 
     def _tl_pageBlockCover(self):
         constructor = 0x39f23300
-        params = Map()
-        params.cover = self.page_block_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_pageBlockCover')
+        params.cover = self.page_block_deserialize(self.read_int32, 'cover')
+        self.instances.append('_tl_pageBlockCover')
         return params
 
     def _tl_textEmpty(self):
         constructor = 0xdc3d824f
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_textEmpty')
+        self.instances.append('_tl_textEmpty')
         return params
 
     def _tl_textPlain(self):
         constructor = 0x744694e0
-        params = Map()
+        params = self.new_params('_tl_textPlain')
         params.text = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_textPlain')
         return params
 
     def _tl_textConcat(self):
         constructor = 0x7e6260d7
-        params = Map()
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        texts = list()
-        for i in range(0, count):
-            obj = self.rich_text_deserialize(self.read_int32)
-            if obj is None:
-                return
-            texts.append(obj)
-        params.texts = texts
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_textConcat')
+        params.texts = self.read_vector(self.rich_text_deserialize, 'texts')
+        self.instances.append('_tl_textConcat')
         return params
 
     def _tl_textBold(self):
         constructor = 0x6724abc4
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_textBold')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
+        self.instances.append('_tl_textBold')
         return params
 
     def _tl_textUrl(self):
         constructor = 0x3c2884c1
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
+        params = self.new_params('_tl_textUrl')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
         params.url = self.read_string
         params.webpage_id = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_textUrl')
         return params
 
     def _tl_textItalic(self):
         constructor = 0xd912a59c
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_textItalic')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
+        self.instances.append('_tl_textItalic')
         return params
 
     def _tl_textStrike(self):
         constructor = 0x9bf8bb95
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_textStrike')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
+        self.instances.append('_tl_textStrike')
         return params
 
     def _tl_textFixed(self):
         constructor = 0x6c3f19b9
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_textFixed')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
+        self.instances.append('_tl_textFixed')
         return params
 
     def _tl_textEmail(self):
         constructor = 0xde5a0dd6
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
+        params = self.new_params('_tl_textEmail')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
         params.email = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_textEmail')
         return params
 
     def _tl_textUnderline(self):
         constructor = 0xc12622c4
-        params = Map()
-        params.text = self.rich_text_deserialize(self.read_int32)
+        params = self.new_params('_tl_textUnderline')
+        params.text = self.rich_text_deserialize(self.read_int32, 'text')
         params.email = self.read_string
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def rich_text_deserialize(self, constructor):
-        result = None
-        if constructor == 0xdc3d824f:
-            result = self._tl_textEmpty()
-        elif constructor == 0x3c2884c1:
-            result = self._tl_textUrl()
-        elif constructor == 0x9bf8bb95:
-            result = self._tl_textStrike()
-        elif constructor == 0x6c3f19b9:
-            result = self._tl_textFixed()
-        elif constructor == 0xde5a0dd6:
-            result = self._tl_textEmail()
-        elif constructor == 0x744694e0:
-            result = self._tl_textPlain()
-        elif constructor == 0x7e6260d7:
-            result = self._tl_textConcat()
-        elif constructor == 0x6724abc4:
-            result = self._tl_textBold()
-        elif constructor == 0xd912a59c:
-            result = self._tl_textItalic()
-        elif constructor == 0xc12622c4:
-            result = self._tl_textUnderline()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_textUnderline')
+        return params
+
+    def rich_text_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.RICH_TEXT_PARSERS, constructor, field, projection)
 
     def _tl_pageBlockPhoto_layer82(self):
         constructor = 0xe9c69982
-        params = Map()
+        params = self.new_params('_tl_pageBlockPhoto_layer82')
         params.photo_id = self.read_int64
-        params.caption = self.rich_text_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.caption = self.rich_text_deserialize(self.read_int32, 'caption')
+        self.instances.append('_tl_pageBlockPhoto_layer82')
         return params
 
     def _tl_pageFullPart(self):
         # My method
-        params = Map()
-        blocks = list()
-        photos = list()
-        documents = list()
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        for i in range(0, count):
-            obj = self.page_block_deserialize(self.read_int32)
-            if obj is None:
-                return
-            blocks.append(obj)
-        params.blocks = blocks
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        for i in range(0, count):
-            obj = self.photo_deserialize(self.read_int32)
-            if obj is None:
-                return
-            photos.append(obj)
-        params.photos = photos
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        for i in range(0, count):
-            obj = self.document_deserialize(self.read_int32)
-            if obj is None:
-                return
-            documents.append(obj)
-        params.documents = documents
+        params = self.new_params('_tl_pageFullPart')
+        params.blocks = self.read_vector(self.page_block_deserialize, 'blocks')
+        params.photos = self.read_vector(self.photo_deserialize, 'photos')
+        params.documents = self.read_vector(self.document_deserialize, 'documents')
         return params
 
     def _tl_pageFull_layer67(self):
         constructor = 0xd7a19d69
         params = self._tl_pageFullPart()
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_pageFull_layer67')
         return params
 
     def _tl_pageFull_layer82(self):
         constructor = 0x556ec7aa
         params = self._tl_pageFullPart()
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_pageFull_layer82')
         return params
 
     def _tl_pagePart_layer67(self):
         constructor = 0x8dee6c44
         params = self._tl_pageFullPart()
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_pagePart_layer67')
         return params
 
     def _tl_pagePart_layer82(self):
         constructor = 0x8e3f9ebe
         params = self._tl_pageFullPart()
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_pagePart_layer82')
         return params
 
     def _tl_page(self):
         constructor = 0xae891bec
-        params = Map()
+        params = self.new_params('_tl_page')
         flags = self.read_int32
         params.flags = flags
         params.part = (flags & 1) != 0
         params.rtl = (flags & 2) != 0
         params.url = self.read_string
 
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        blocks = list()
-        for i in range(0, count):
-            obj = self.page_block_deserialize(self.read_int32)
-            if obj is None:
-                return
-            blocks.append(obj)
-        params.blocks = blocks
+        params.blocks = self.read_vector(self.page_block_deserialize, 'blocks')
 
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        photos = list()
-        for i in range(0, count):
-            obj = self.photo_deserialize(self.read_int32)
-            if obj is None:
-                return
-            photos.append(obj)
-        params.photos = photos
+        params.photos = self.read_vector(self.photo_deserialize, 'photos')
 
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        documents = list()
-        for i in range(0, count):
-            obj = self.document_deserialize(self.read_int32)
-            if obj is None:
-                return
-            documents.append(obj)
-        params.documents = documents
-
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def page_deserialize(self, constructor):
-        result = None
-        if constructor == 0x556ec7aa:
-            result = self._tl_pageFull_layer82()
-        elif constructor == 0x8dee6c44:
-            result = self._tl_pagePart_layer67()
-        elif constructor == 0xd7a19d69:
-            result = self._tl_pageFull_layer67()
-        elif constructor == 0x8e3f9ebe:
-            result = self._tl_pagePart_layer82()
-        elif constructor == 0xae891bec:
-            result = self._tl_page()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params.documents = self.read_vector(self.document_deserialize, 'documents')
+
+        self.instances.append('_tl_page')
+        return params
+
+    def page_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.PAGE_PARSERS, constructor, field, projection)
 
     def _tl_webPage(self):
         constructor = 0x5f07b4bc
-        params = Map()
+        params = self.new_params('_tl_webPage')
         flags = self.read_int32
         params.flags = flags
         params.id = self.read_int64
@@ -1599,7 +2262,7 @@ class TeleData(object):
         if (flags & 8) != 0:
             params.description = self.read_string
         if (flags & 16) != 0:
-            params.photo = self.photo_deserialize(self.read_int32)
+            params.photo = self.photo_deserialize(self.read_int32, 'photo')
         if (flags & 32) != 0:
             params.embed_url = self.read_string
         if (flags & 32) != 0:
@@ -1613,22 +2276,22 @@ class TeleData(object):
         if (flags & 256) != 0:
             params.author = self.read_string
         if (flags & 512) != 0:
-            params.document = self.document_deserialize(self.read_int32)
+            params.document = self.document_deserialize(self.read_int32, 'document')
         if (flags & 1024) != 0:
-            params.cached_page = self.page_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+            params.cached_page = self.page_deserialize(self.read_int32, 'cached_page')
+        self.instances.append('_tl_webPage')
         return params
 
     def _tl_webPageEmpty(self):
         constructor = 0xeb1477e8
-        params = Map()
+        params = self.new_params('_tl_webPageEmpty')
         params.id = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_webPageEmpty')
         return params
 
     def _tl_webPage_old(self):
         constructor = 0xa31ea0b5
-        params = Map()
+        params = self.new_params('_tl_webPage_old')
         flags = self.read_int32
         params.flags = flags
         params.id = self.read_int64
@@ -1643,7 +2306,7 @@ class TeleData(object):
         if (flags & 8) != 0:
             params.description = self.read_string
         if (flags & 16) != 0:
-            params.photo = self.photo_deserialize(self.read_int32)
+            params.photo = self.photo_deserialize(self.read_int32, 'photo')
         if (flags & 32) != 0:
             params.embed_url = self.read_string
         if (flags & 32) != 0:
@@ -1656,12 +2319,12 @@ class TeleData(object):
             params.duration = self.read_int32
         if (flags & 256) != 0:
             params.author = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_webPage_old')
         return params
 
     def _tl_webPage_layer58(self):
         constructor = 0xca820ed7
-        params = Map()
+        params = self.new_params('_tl_webPage_layer58')
         flags = self.read_int32
         params.flags = flags
         params.id = self.read_int64
@@ -1676,7 +2339,7 @@ class TeleData(object):
         if (flags & 8) != 0:
             params.description = self.read_string
         if (flags & 16) != 0:
-            params.photo = self.photo_deserialize(self.read_int32)
+            params.photo = self.photo_deserialize(self.read_int32, 'photo')
         if (flags & 32) != 0:
             params.embed_url = self.read_string
         if (flags & 32) != 0:
@@ -1690,61 +2353,45 @@ class TeleData(object):
         if (flags & 256) != 0:
             params.author = self.read_string
         if (flags & 512) != 0:
-            params.document = self.document_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+            params.document = self.document_deserialize(self.read_int32, 'document')
+        self.instances.append('_tl_webPage_layer58')
         return params
 
     def _tl_webPageUrlPending(self):
         constructor = 0xd41a5167
-        params = Map()
+        params = self.new_params('_tl_webPageUrlPending')
         params.url = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_webPageUrlPending')
         return params
 
     def _tl_webPagePending(self):
         constructor = 0xc586da1c
-        params = Map()
+        params = self.new_params('_tl_webPagePending')
         params.id = self.read_int64
         date = self.read_int32
-        params.date = self.time_from_ts(date)
-        self.instances.append(inspect.stack()[0][3])
+        params.date = self.convert_time(date)
+        self.instances.append('_tl_webPagePending')
         return params
 
     def _tl_webPageNotModified(self):
         constructor = 0x85849473
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def web_page_deserialize(self, constructor):
-        result = None
-        if constructor == 0x5f07b4bc:
-            result = self._tl_webPage()
-        elif constructor == 0xa31ea0b5:
-            result = self._tl_webPage_old()
-        elif constructor == 0xd41a5167:
-            result = self._tl_webPageUrlPending()
-        elif constructor == 0xc586da1c:
-            result = self._tl_webPagePending()
-        elif constructor == 0xeb1477e8:
-            result = self._tl_webPageEmpty()
-        elif constructor == 0xca820ed7:
-            result = self._tl_webPage_layer58()
-        elif constructor == 0x85849473:
-            result = self._tl_webPageNotModified()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params = self.new_params('_tl_webPageNotModified')
+        self.instances.append('_tl_webPageNotModified')
+        return params
+
+    def web_page_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.WEB_PAGE_PARSERS, constructor, field, projection)
 
     def _tl_messageMediaWebPage(self):
         constructor = 0xa32dd600
-        params = Map()
-        params.webpage = self.web_page_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageMediaWebPage')
+        params.webpage = self.web_page_deserialize(self.read_int32, 'webpage')
+        self.instances.append('_tl_messageMediaWebPage')
         return params
 
     def _tl_documentAttributeAudio(self):
         constructor = 0x9852f9c6
-        params = Map()
+        params = self.new_params('_tl_documentAttributeAudio')
         flags = self.read_int32
         params.flags = flags
         params.voice = (flags & 1024) != 0
@@ -1755,189 +2402,152 @@ class TeleData(object):
             params.performer = self.read_string
         if (flags & 4) != 0:
             params.waveform = self.read_bytes
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_documentAttributeAudio')
         return params
 
     def _tl_documentAttributeVideo(self):
         constructor = 0xef02ce6
-        params = Map()
+        params = self.new_params('_tl_documentAttributeVideo')
         flags = self.read_int32
         params.flags = flags
         params.round_message = (flags & 1) != 0
         params.duration = self.read_int32
         params.w = self.read_int32
         params.h = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_documentAttributeVideo')
         return params
 
     def _tl_documentAttributeFilename(self):
         constructor = 0x15590068
-        params = Map()
+        params = self.new_params('_tl_documentAttributeFilename')
         params.file_name = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_documentAttributeFilename')
         return params
 
     def _tl_documentAttributeImageSize(self):
         constructor = 0x6c37c15c
-        params = Map()
+        params = self.new_params('_tl_documentAttributeImageSize')
         params.w = self.read_int32
         params.h = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_documentAttributeImageSize')
         return params
 
     def _tl_inputStickerSetID(self):
         constructor = 0x9de7a269
-        params = Map()
+        params = self.new_params('_tl_inputStickerSetID')
         params.id = self.read_int64
         params.access_hash = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_inputStickerSetID')
         return params
 
     def _tl_inputStickerSetShortName(self):
         constructor = 0x861cc8a0
-        params = Map()
+        params = self.new_params('_tl_inputStickerSetShortName')
         params.short_name = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_inputStickerSetShortName')
         return params
 
     def _tl_inputStickerSetEmpty(self):
         constructor = 0xffb62b95
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def input_sticker_set_deserialize(self, constructor):
-        result = None
-        if constructor == 0xffb62b95:
-            result = self._tl_inputStickerSetEmpty()
-        elif constructor == 0x9de7a269:
-            result = self._tl_inputStickerSetID()
-        elif constructor == 0x861cc8a0:
-            result = self._tl_inputStickerSetShortName()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params = self.new_params('_tl_inputStickerSetEmpty')
+        self.instances.append('_tl_inputStickerSetEmpty')
+        return params
+
+    def input_sticker_set_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.INPUT_STICKER_SET_PARSERS, constructor, field, projection)
 
     def _tl_maskCoords(self):
         constructor = 0xaed6dbb2
-        params = Map()
+        params = self.new_params('_tl_maskCoords')
         params.n = self.read_int32
         params.x = self.read_double
         params.y = self.read_double
         params.zoom = self.read_double
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_maskCoords')
         return params
 
-    def mask_coords_deserialize(self, constructor):
-        assert (constructor == 0xaed6dbb2), "{} asseratation".format(inspect.stack()[0][3])
-        result = self._tl_maskCoords()
-        self.instances.append(inspect.stack()[0][3])
+    def mask_coords_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.MASK_COORDS_PARSERS, constructor, field, projection)
+        self.instances.append('mask_coords_deserialize')
         return result
 
     def _tl_documentAttributeSticker(self):
         constructor = 0x6319d612
-        params = Map()
+        params = self.new_params('_tl_documentAttributeSticker')
         flags = self.read_int32
         params.flags = flags
         params.mask = (flags & 2) != 0
         params.alt = self.read_string
-        params.stickerset = self.input_sticker_set_deserialize(self.read_int32)
+        params.stickerset = self.input_sticker_set_deserialize(self.read_int32, 'stickerset')
         if (flags & 1) != 0:
-            params.mask_coords = self.mask_coords_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+            params.mask_coords = self.mask_coords_deserialize(self.read_int32, 'mask_coords')
+        self.instances.append('_tl_documentAttributeSticker')
         return params
 
     def _tl_documentAttributeVideo_layer65(self):
         constructor = 0x5910cccb
-        params = Map()
+        params = self.new_params('_tl_documentAttributeVideo_layer65')
         params.duration = self.read_int32
         params.w = self.read_int32
         params.h = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_documentAttributeVideo_layer65')
         return params
 
     def _tl_documentAttributeAnimated(self):
         constructor = 0x11b58939
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_documentAttributeAnimated')
+        self.instances.append('_tl_documentAttributeAnimated')
         return params
 
     def _tl_documentAttributeSticker_layer55(self):
         constructor = 0x3a556302
-        params = Map()
+        params = self.new_params('_tl_documentAttributeSticker_layer55')
         params.alt = self.read_string
-        params.stickerset = self.input_sticker_set_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.stickerset = self.input_sticker_set_deserialize(self.read_int32, 'stickerset')
+        self.instances.append('_tl_documentAttributeSticker_layer55')
         return params
 
     def _tl_documentAttributeAudio_old(self):
         constructor = 0x51448e5
-        params = Map()
+        params = self.new_params('_tl_documentAttributeAudio_old')
         params.duration = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_documentAttributeAudio_old')
         return params
 
     def _tl_documentAttributeAudio_layer45(self):
         constructor = 0xded218e0
-        params = Map()
+        params = self.new_params('_tl_documentAttributeAudio_layer45')
         params.duration = self.read_int32
         params.title = self.read_string
         params.performer = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_documentAttributeAudio_layer45')
         return params
 
     def _tl_documentAttributeSticker_old(self):
         constructor = 0xfb0a5727
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_documentAttributeSticker_old')
+        self.instances.append('_tl_documentAttributeSticker_old')
         return params
 
     def _tl_documentAttributeHasStickers(self):
         constructor = 0x9801d2f7
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_documentAttributeHasStickers')
+        self.instances.append('_tl_documentAttributeHasStickers')
         return params
 
     def _tl_documentAttributeSticker_old2(self):
         constructor = 0x994c9882
-        params = Map()
+        params = self.new_params('_tl_documentAttributeSticker_old2')
         params.alt = self.read_string
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def document_attribute_deserialize(self, constructor):
-        result = None
-        if constructor == 0x3a556302:
-            result = self._tl_documentAttributeSticker_layer55()
-        elif constructor == 0x51448e5:
-            result = self._tl_documentAttributeAudio_old()
-        elif constructor == 0x6319d612:
-            result = self._tl_documentAttributeSticker()
-        elif constructor == 0x11b58939:
-            result = self._tl_documentAttributeAnimated()
-        elif constructor == 0x15590068:
-            result = self._tl_documentAttributeFilename()
-        elif constructor == 0xef02ce6:
-            result = self._tl_documentAttributeVideo()
-        elif constructor == 0x5910cccb:
-            result = self._tl_documentAttributeVideo_layer65()
-        elif constructor == 0xded218e0:
-            result = self._tl_documentAttributeAudio_layer45()
-        elif constructor == 0xfb0a5727:
-            result = self._tl_documentAttributeSticker_old()
-        elif constructor == 0x9801d2f7:
-            result = self._tl_documentAttributeHasStickers()
-        elif constructor == 0x994c9882:
-            result = self._tl_documentAttributeSticker_old2()
-        elif constructor == 0x6c37c15c:
-            result = self._tl_documentAttributeImageSize()
-        elif constructor == 0x9852f9c6:
-            result = self._tl_documentAttributeAudio()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_documentAttributeSticker_old2')
+        return params
+
+    def document_attribute_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.DOCUMENT_ATTRIBUTE_PARSERS, constructor, field, projection)
 
     def _tl_document(self):
         constructor = 0x9ba29cc1
-        params = Map()
+        params = self.new_params('_tl_document')
         flags = self.read_int32
         params.flags = flags
 
@@ -1945,592 +2555,484 @@ class TeleData(object):
         params.access_hash = self.read_int64
         params.file_reference = self.read_bytes
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.mime_type = self.read_string
         params.size = self.read_int32
         if (flags & 1) != 0:
-            magic = self.read_int32
-            assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-            count = self.read_int32
-            thumbs = list()
-            for i in range(0, count):
-                obj = self.photo_size_deserialize(self.read_int32)
-                if obj is None:
-                    return
-                thumbs.append(obj)
-            params.thumbs = thumbs
+            params.thumbs = self.read_vector(self.photo_size_deserialize, 'thumbs')
         params.dc_id = self.read_int32
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        attributes = list()
-        for i in range(0, count):
-            obj = self.document_attribute_deserialize(self.read_int32)
-            if obj is None:
-                return
-            attributes.append(obj)
-        params.attributes = attributes
-        self.instances.append(inspect.stack()[0][3])
+        params.attributes = self.read_vector(self.document_attribute_deserialize, 'attributes')
+        self.instances.append('_tl_document')
         return params
 
     def _tl_document_layer92(self):
         constructor = 0x59534e4c
-        params = Map()
+        params = self.new_params('_tl_document_layer92')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         params.file_reference = self.read_bytes
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.mime_type = self.read_string
         params.size = self.read_int32
-        params.thumb = self.photo_size_deserialize(self.read_int32)
+        params.thumb = self.photo_size_deserialize(self.read_int32, 'thumb')
         params.dc_id = self.read_int32
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        attributes = list()
-        for i in range(0, count):
-            obj = self.document_attribute_deserialize(self.read_int32)
-            if obj is None:
-                return
-            attributes.append(obj)
-        params.attributes = attributes
-        self.instances.append(inspect.stack()[0][3])
+        params.attributes = self.read_vector(self.document_attribute_deserialize, 'attributes')
+        self.instances.append('_tl_document_layer92')
         return params
 
     def _tl_document_layer82(self):
         constructor = 0x87232bc7
-        params = Map()
+        params = self.new_params('_tl_document_layer82')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.mime_type = self.read_string
         params.size = self.read_int32
-        params.thumb = self.photo_size_deserialize(self.read_int32)
+        params.thumb = self.photo_size_deserialize(self.read_int32, 'thumb')
         params.dc_id = self.read_int32
         params.version = self.read_int32
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        attributes = list()
-        for i in range(0, count):
-            obj = self.document_attribute_deserialize(self.read_int32)
-            if obj is None:
-                return
-            attributes.append(obj)
-        params.attributes = attributes
-        self.instances.append(inspect.stack()[0][3])
+        params.attributes = self.read_vector(self.document_attribute_deserialize, 'attributes')
+        self.instances.append('_tl_document_layer82')
         return params
 
     def _tl_documentEncrypted(self):
         constructor = 0x55555556
-        params = Map()
+        params = self.new_params('_tl_documentEncrypted')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         try:
             params.mime_type = self.read_string
         except Exception:
             params.mime_type = "audio/ogg"
         params.size = self.read_int32
-        params.thumb = self.photo_size_deserialize(self.read_int32)
+        params.thumb = self.photo_size_deserialize(self.read_int32, 'thumb')
         params.dc_id = self.read_int32
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        attributes = list()
-        for i in range(0, count):
-            obj = self.document_attribute_deserialize(self.read_int32)
-            if obj is None:
-                return
-            attributes.append(obj)
-        params.attributes = attributes
+        params.attributes = self.read_vector(self.document_attribute_deserialize, 'attributes')
         params.key = self.read_bytes
         params.iv = self.read_bytes
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_documentEncrypted')
         return params
 
     def _tl_documentEmpty(self):
         constructor = 0x36f8c871
-        params = Map()
+        params = self.new_params('_tl_documentEmpty')
         params.id = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_documentEmpty')
         return params
 
     def _tl_document_old(self):
         constructor = 0x9efc6326
-        params = Map()
+        params = self.new_params('_tl_document_old')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         params.user_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.file_name = self.read_string
         params.mime_type = self.read_string
         params.size = self.read_int32
-        params.thumb = self.photo_size_deserialize(self.read_int32)
+        params.thumb = self.photo_size_deserialize(self.read_int32, 'thumb')
         params.dc_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_document_old')
         return params
 
     def _tl_documentEncrypted_old(self):
         constructor = 0x55555556
-        params = Map()
+        params = self.new_params('_tl_documentEncrypted_old')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         params.user_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.file_name = self.read_string
         params.mime_type = self.read_string
         params.size = self.read_int32
-        params.thumb = self.photo_size_deserialize(self.read_int32)
+        params.thumb = self.photo_size_deserialize(self.read_int32, 'thumb')
         params.dc_id = self.read_int32
         params.key = self.read_bytes
         params.iv = self.read_bytes
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_documentEncrypted_old')
         return params
 
     def _tl_document_layer53(self):
         constructor = 0xf9a39f4f
-        params = Map()
+        params = self.new_params('_tl_document_layer53')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         params.mime_type = self.read_string
         params.size = self.read_int32
-        params.thumb = self.photo_size_deserialize(self.read_int32)
+        params.thumb = self.photo_size_deserialize(self.read_int32, 'thumb')
         params.dc_id = self.read_int32
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        attributes = list()
-        for i in range(0, count):
-            obj = self.document_attribute_deserialize(self.read_int32)
-            if obj is None:
-                return
-            attributes.append(obj)
-        params.attributes = attributes
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def document_deserialize(self, constructor):
-        result = None
-        if constructor == 0x9ba29cc1:
-            result = self._tl_document()
-        elif constructor == 0x59534e4c:
-            result = self._tl_document_layer92()
-        elif constructor == 0x87232bc7:
-            result = self._tl_document_layer82()
-        elif constructor == 0x55555556:
-            result = self._tl_documentEncrypted_old()
-        elif constructor == 0x9efc6326:
-            result = self._tl_document_old()
-        elif constructor == 0x36f8c871:
-            result = self._tl_documentEmpty()
-        elif constructor == 0x55555558:
-            result = self._tl_documentEncrypted()
-        elif constructor == 0xf9a39f4f:
-            result = self._tl_document_layer53()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params.attributes = self.read_vector(self.document_attribute_deserialize, 'attributes')
+        self.instances.append('_tl_document_layer53')
+        return params
+
+    def document_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.DOCUMENT_PARSERS, constructor, field, projection)
 
     def _tl_messageMediaDocument(self):
         constructor = 0x9cb070d7
-        params = Map()
+        params = self.new_params('_tl_messageMediaDocument')
         flags = self.read_int32
         params.flags = flags
         if (flags & 1) != 0:
-            params.document = self.document_deserialize(self.read_int32)
+            params.document = self.document_deserialize(self.read_int32, 'document')
         else:
             params.document = self._tl_documentEmpty()
         if (flags & 2) != 0:
             params.caption = self.read_string
         if (flags & 4) != 0:
             params.ttl_seconds = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageMediaDocument')
         return params
 
     def _tl_messageMediaDocument_layer72(self):
         constructor = 0x7c4414d3
-        params = Map()
+        params = self.new_params('_tl_messageMediaDocument_layer72')
         flags = self.read_int32
         params.flags = flags
         if (flags & 1) != 0:
-            params.document = self.document_deserialize(self.read_int32)
+            params.document = self.document_deserialize(self.read_int32, 'document')
         else:
             params.document = self._tl_documentEmpty()
         if (flags & 2) != 0:
             params.caption = self.read_string
         if (flags & 4) != 0:
             params.ttl_seconds = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageMediaDocument_layer72')
         return params
 
     def _tl_messageMediaDocument_layer68(self):
         constructor = 0xf3e02ea8
-        params = Map()
-        params.document = self.document_deserialize(self.read_int32)
+        params = self.new_params('_tl_messageMediaDocument_layer68')
+        params.document = self.document_deserialize(self.read_int32, 'document')
         params.caption = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageMediaDocument_layer68')
         return params
 
     def _tl_photoEmpty(self):
         constructor = 0x2331b22d
-        params = Map()
+        params = self.new_params('_tl_photoEmpty')
         params.id = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_photoEmpty')
         return params
 
     def _tl_messageMediaPhoto(self):
         constructor = 0x695150d7
-        params = Map()
+        params = self.new_params('_tl_messageMediaPhoto')
         flags = self.read_int32
         params.flags = flags
         if (flags & 1) != 0:
-            params.photo = self.photo_deserialize(self.read_int32)
+            params.photo = self.photo_deserialize(self.read_int32, 'photo')
         else:
             params.photo = self._tl_photoEmpty()
         if (flags & 2) != 0:
             params.caption = self.read_string
         if (flags & 4) != 0:
             params.ttl_seconds = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageMediaPhoto')
         return params
 
     def _tl_messageMediaPhoto_layer72(self):
         constructor = 0xb5223b0f
-        params = Map()
+        params = self.new_params('_tl_messageMediaPhoto_layer72')
         flags = self.read_int32
         params.flags = flags
         if (flags & 1) != 0:
-            params.photo = self.photo_deserialize(self.read_int32)
+            params.photo = self.photo_deserialize(self.read_int32, 'photo')
         else:
             params.photo = self._tl_photoEmpty()
         if (flags & 2) != 0:
             params.caption = self.read_string
         if (flags & 4) != 0:
             params.ttl_seconds = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageMediaPhoto_layer72')
         return params
 
     def _tl_messageMediaContact(self):
         constructor = 0x5e7d2f39
-        params = Map()
+        params = self.new_params('_tl_messageMediaContact')
         params.phone_number = self.read_string
         params.first_name = self.read_string
         params.last_name = self.read_string
         params.user_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageMediaContact')
         return params
 
     def _tl_messageMediaPhoto_layer68(self):
         constructor = 0x3d8ce53d
-        params = Map()
-        params.photo = self.photo_deserialize(self.read_int32)
+        params = self.new_params('_tl_messageMediaPhoto_layer68')
+        params.photo = self.photo_deserialize(self.read_int32, 'photo')
         params.caption = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageMediaPhoto_layer68')
         return params
 
     def _tl_messageMediaUnsupported_old(self):
         constructor = 0x29632a36
-        params = Map()
+        params = self.new_params('_tl_messageMediaUnsupported_old')
         params.bytes = self.read_bytes
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageMediaUnsupported_old')
         return params
 
     def _tl_audioEmpty_layer45(self):
         constructor = 0x586988d8
-        params = Map()
+        params = self.new_params('_tl_audioEmpty_layer45')
         params.id = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_audioEmpty_layer45')
         return params
 
     def _tl_audio_layer45(self):
         constructor = 0xf9e35055
-        params = Map()
+        params = self.new_params('_tl_audio_layer45')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.duration = self.read_int32
         params.mime_type = self.read_string
         params.size = self.read_int32
         params.dc_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_audio_layer45')
         return params
 
     def _tl_audio_old(self):
         constructor = 0x427425e7
-        params = Map()
+        params = self.new_params('_tl_audio_old')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         params.user_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.duration = self.read_int32
         params.size = self.read_int32
         params.dc_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_audio_old')
         return params
 
     def _tl_audioEncrypted(self):
         constructor = 0x555555F6
-        params = Map()
+        params = self.new_params('_tl_audioEncrypted')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         params.user_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.duration = self.read_int32
         params.size = self.read_int32
         params.dc_id = self.read_int32
         params.key = self.read_bytes
         params.iv = self.read_bytes
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_audioEncrypted')
         return params
 
     def _tl_audio_old2(self):
         constructor = 0xc7ac6496
-        params = Map()
+        params = self.new_params('_tl_audio_old2')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         params.user_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.duration = self.read_int32
         params.mime_type = self.read_string
         params.size = self.read_int32
         params.dc_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def audio_deserialize(self, constructor):
-        result = None
-        if constructor == 0x586988d8:
-            result = self._tl_audioEmpty_layer45()
-        elif constructor == 0xf9e35055:
-            result = self._tl_audio_layer45()
-        elif constructor == 0x427425e7:
-            result = self._tl_audio_old()
-        elif constructor == 0x555555F6:
-            result = self._tl_audioEncrypted()
-        elif constructor == 0xc7ac6496:
-            result = self._tl_audio_old2()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_audio_old2')
+        return params
+
+    def audio_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.AUDIO_PARSERS, constructor, field, projection)
 
     def _tl_messageMediaAudio_layer45(self):
         constructor = 0xc6b68300
-        params = Map()
-        params.audio_unused = self.audio_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageMediaAudio_layer45')
+        params.audio_unused = self.audio_deserialize(self.read_int32, 'audio_unused')
+        self.instances.append('_tl_messageMediaAudio_layer45')
         return params
 
     def _tl_messageMediaPhoto_old(self):
         constructor = 0xc8c45a2a
-        params = Map()
-        params.photo = self.photo_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageMediaPhoto_old')
+        params.photo = self.photo_deserialize(self.read_int32, 'photo')
+        self.instances.append('_tl_messageMediaPhoto_old')
         return params
 
     def _tl_messageMediaUnsupported(self):
         constructor = 0x9f84f49e
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageMediaUnsupported')
+        self.instances.append('_tl_messageMediaUnsupported')
         return params
 
     def _tl_messageMediaVenue_layer71(self):
         constructor = 0x7912b71f
-        params = Map()
-        params.geo = self.geo_point_deserialize(self.read_int32)
+        params = self.new_params('_tl_messageMediaVenue_layer71')
+        params.geo = self.geo_point_deserialize(self.read_int32, 'geo')
         params.title = self.read_string
         params.address = self.read_string
         params.provider = self.read_string
         params.venue_id = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageMediaVenue_layer71')
         return params
 
     def _tl_messageMediaVenue(self):
         constructor = 0x2ec0533f
-        params = Map()
-        params.geo = self.geo_point_deserialize(self.read_int32)
+        params = self.new_params('_tl_messageMediaVenue')
+        params.geo = self.geo_point_deserialize(self.read_int32, 'geo')
         params.title = self.read_string
         params.address = self.read_string
         params.provider = self.read_string
         params.venue_id = self.read_string
         params.venue_type = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageMediaVenue')
         return params
 
     def _tl_video_old3(self):
         constructor = 0xee9f4a4d
-        params = Map()
+        params = self.new_params('_tl_video_old3')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         params.user_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.duration = self.read_int32
         params.size = self.read_int32
-        params.thumb = self.photo_size_deserialize(self.read_int32)
+        params.thumb = self.photo_size_deserialize(self.read_int32, 'thumb')
         params.dc_id = self.read_int32
         params.w = self.read_int32
         params.h = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_video_old3')
         return params
 
     def _tl_video_layer45(self):
         constructor = 0xf72887d3
-        params = Map()
+        params = self.new_params('_tl_video_layer45')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.duration = self.read_int32
         params.mime_type = self.read_string
         params.size = self.read_int32
-        params.thumb = self.photo_size_deserialize(self.read_int32)
+        params.thumb = self.photo_size_deserialize(self.read_int32, 'thumb')
         params.dc_id = self.read_int32
         params.w = self.read_int32
         params.h = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_video_layer45')
         return params
 
     def _tl_videoEncrypted(self):
         constructor = 0x55555553
-        params = Map()
+        params = self.new_params('_tl_videoEncrypted')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         params.user_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.caption = self.read_string
         params.duration = self.read_int32
         params.size = self.read_int32
-        params.thumb = self.photo_size_deserialize(self.read_int32)
+        params.thumb = self.photo_size_deserialize(self.read_int32, 'thumb')
         params.dc_id = self.read_int32
         params.w = self.read_int32
         params.h = self.read_int32
         params.key = self.read_bytes
         params.iv = self.read_bytes
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_videoEncrypted')
         return params
 
     def _tl_video_old(self):
         constructor = 0x5a04a49f
-        params = Map()
+        params = self.new_params('_tl_video_old')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         params.user_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.caption = self.read_string
         params.duration = self.read_int32
         params.size = self.read_int32
-        params.thumb = self.photo_size_deserialize(self.read_int32)
+        params.thumb = self.photo_size_deserialize(self.read_int32, 'thumb')
         params.dc_id = self.read_int32
         params.w = self.read_int32
         params.h = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_video_old')
         return params
 
     def _tl_video_old2(self):
         constructor = 0x388fa391
-        params = Map()
+        params = self.new_params('_tl_video_old2')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         params.user_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.caption = self.read_string
         params.duration = self.read_int32
         params.mime_type = self.read_string
         params.size = self.read_int32
-        params.thumb = self.photo_size_deserialize(self.read_int32)
+        params.thumb = self.photo_size_deserialize(self.read_int32, 'thumb')
         params.dc_id = self.read_int32
         params.w = self.read_int32
         params.h = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_video_old2')
         return params
 
     def _tl_videoEmpty_layer45(self):
         constructor = 0xc10658a8
-        params = Map()
+        params = self.new_params('_tl_videoEmpty_layer45')
         params.id = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def video_deserialize(self, constructor):
-        result = None
-        if constructor == 0xee9f4a4d:
-            result = self._tl_video_old3()
-        elif constructor == 0xf72887d3:
-            result = self._tl_video_layer45()
-        elif constructor == 0x55555553:
-            result = self._tl_videoEncrypted()
-        elif constructor == 0x5a04a49f:
-            result = self._tl_video_old()
-        elif constructor == 0x388fa391:
-            result = self._tl_video_old2()
-        elif constructor == 0xc10658a8:
-            result = self._tl_videoEmpty_layer45()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_videoEmpty_layer45')
+        return params
+
+    def video_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.VIDEO_PARSERS, constructor, field, projection)
 
     def _tl_messageMediaVideo_old(self):
         constructor = 0xa2d24290
-        params = Map()
-        params.video_unused = self.video_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageMediaVideo_old')
+        params.video_unused = self.video_deserialize(self.read_int32, 'video_unused')
+        self.instances.append('_tl_messageMediaVideo_old')
         return params
 
     def _tl_messageMediaDocument_old(self):
         constructor = 0x2fda2204
-        params = Map()
+        params = self.new_params('_tl_messageMediaDocument_old')
         document = self.document_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageMediaDocument_old')
         return params
 
     def _tl_messageMediaVideo_layer45(self):
         constructor = 0x5bcf1675
-        params = Map()
-        params.video_unused = self.video_deserialize(self.read_int32)
+        params = self.new_params('_tl_messageMediaVideo_layer45')
+        params.video_unused = self.video_deserialize(self.read_int32, 'video_unused')
         params.caption = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageMediaVideo_layer45')
         return params
 
     def _tl_webDocument(self):
         constructor = 0xc61acbd8
-        params = Map()
+        params = self.new_params('_tl_webDocument')
         params.url = self.read_string
         params.access_hash = self.read_int64
         params.size = self.read_int32
         params.mime_type = self.read_string
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        attributes = list()
-        for i in range(0, count):
-            obj = self.document_attribute_deserialize(self.read_int32)
-            if obj is None:
-                return
-            attributes.append(obj)
-        params.attributes = attributes
+        params.attributes = self.read_vector(self.document_attribute_deserialize, 'attributes')
         params.dc_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_webDocument')
         return params
 
-    def web_document_deserialize(self, constructor):
-        assert (constructor == 0xc61acbd8), "{} asseratation".format(inspect.stack()[0][3])
-        result = self._tl_webDocument()
-        self.instances.append(inspect.stack()[0][3])
+    def web_document_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.WEB_DOCUMENT_PARSERS, constructor, field, projection)
+        self.instances.append('web_document_deserialize')
         return result
 
     def _tl_messageMediaInvoice(self):
         constructor = 0x84551347
-        params = Map()
+        params = self.new_params('_tl_messageMediaInvoice')
         flags = self.read_int32
         params.flags = flags
         params.shipping_address_requested = (flags & 2) != 0
@@ -2538,33 +3040,33 @@ class TeleData(object):
         params.title = self.read_string
         params.description = self.read_string
         if (flags & 1) != 0:
-            params.photo = self.web_document_deserialize(self.read_int32)
+            params.photo = self.web_document_deserialize(self.read_int32, 'photo')
         if (flags & 4) != 0:
             params.receipt_msg_id = self.read_int32
         params.currency = self.read_string
         params.total_amount = self.read_int64
         params.start_param = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageMediaInvoice')
         return params
 
     def _tl_messageMediaGeo(self):
         constructor = 0x56e0d474
-        params = Map()
-        params.geo = self.geo_point_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageMediaGeo')
+        params.geo = self.geo_point_deserialize(self.read_int32, 'geo')
+        self.instances.append('_tl_messageMediaGeo')
         return params
 
     def _tl_messageMediaGeoLive(self):
         constructor = 0x7c3c2609
-        params = Map()
-        params.geo = self.geo_point_deserialize(self.read_int32)
+        params = self.new_params('_tl_messageMediaGeoLive')
+        params.geo = self.geo_point_deserialize(self.read_int32, 'geo')
         params.period = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageMediaGeoLive')
         return params
 
     def _tl_game(self):
         constructor = 0xbdf9653b
-        params = Map()
+        params = self.new_params('_tl_game')
         flags = self.read_int32
         params.flags = flags
         params.id = self.read_int64
@@ -2572,168 +3074,99 @@ class TeleData(object):
         params.short_name = self.read_string
         params.title = self.read_string
         params.description = self.read_string
-        params.photo = self.photo_deserialize(self.read_int32)
+        params.photo = self.photo_deserialize(self.read_int32, 'photo')
         if (flags & 1) != 0:
-            params.document = self.document_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+            params.document = self.document_deserialize(self.read_int32, 'document')
+        self.instances.append('_tl_game')
         return params
 
-    def game_deserialize(self, constructor):
-        assert (constructor == 0xbdf9653b), "{} asseratation".format(inspect.stack()[0][3])
-        result = self._tl_game()
-        self.instances.append(inspect.stack()[0][3])
+    def game_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.GAME_PARSERS, constructor, field, projection)
+        self.instances.append('game_deserialize')
         return result
 
     def _tl_poll_answer_votes(self):
         constructor = 0x3b6ddad2
-        params = Map()
+        params = self.new_params('_tl_poll_answer_votes')
         flags = self.read_int32
         params.flags = flags
         params.chosen = (flags & 1) != 0
         params.option = self.read_bytes
         params.voters = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_poll_answer_votes')
         return params
 
-    def poll_answer_votes_deserialize(self, constructor):
-        assert (constructor == 0x3b6ddad2), "{} asseratation".format(inspect.stack()[0][3])
-        result = self._tl_poll_answer_votes()
-        self.instances.append(inspect.stack()[0][3])
+    def poll_answer_votes_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.POLL_ANSWER_VOTES_PARSERS, constructor, field, projection)
+        self.instances.append('poll_answer_votes_deserialize')
         return result
 
     def _tl_messageMediaGame(self):
         constructor = 0xfdb19008
-        params = Map()
-        params.game = self.game_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageMediaGame')
+        params.game = self.game_deserialize(self.read_int32, 'game')
+        self.instances.append('_tl_messageMediaGame')
         return params
 
     def _tl_poll_result(self):
         constructor = 0x5755785a
-        params = Map()
+        params = self.new_params('_tl_poll_result')
         flags = self.read_int32
         params.flags = flags
         params.min = (flags & 1) != 0
         if (flags & 2) != 0:
-            magic = self.read_int32
-            assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-            count = self.read_int32
-            results = list()
-            for i in range(0, count):
-                obj = self.poll_answer_votes_deserialize(self.read_int32)
-                if obj is None:
-                    return
-                results.append(obj)
-            params.results = results
+            params.results = self.read_vector(self.poll_answer_votes_deserialize, 'results')
         if (flags & 4) != 0:
             params.total_votes = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_poll_result')
         return params
 
-    def poll_result_deserialize(self, constructor):
-        assert (constructor == 0x5755785a), "{} asseratation".format(inspect.stack()[0][3])
-        result = self._tl_poll_result()
-        self.instances.append(inspect.stack()[0][3])
+    def poll_result_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.POLL_RESULT_PARSERS, constructor, field, projection)
+        self.instances.append('poll_result_deserialize')
         return result
 
     def _tl_poll_answer(self):
         constructor = 0x6ca9c2e9
-        params = Map()
+        params = self.new_params('_tl_poll_answer')
         params.text = self.read_string
         params.option = self.read_bytes
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_poll_answer')
         return params
 
-    def poll_answer_deserialize(self, constructor):
-        assert (constructor == 0x6ca9c2e9), "{} asseratation".format(inspect.stack()[0][3])
-        result = self._tl_poll_answer()
-        self.instances.append(inspect.stack()[0][3])
+    def poll_answer_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.POLL_ANSWER_PARSERS, constructor, field, projection)
+        self.instances.append('poll_answer_deserialize')
         return result
 
     def _tl_poll(self):
         constructor = 0xd5529d06
-        params = Map()
+        params = self.new_params('_tl_poll')
         flags = self.read_int32
         params.id = self.read_int64
         params.flags = flags
         params.closed = (flags & 1) != 0
         params.question = self.read_string
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        answers = list()
-        for i in range(0, count):
-            obj = self.poll_answer_deserialize(self.read_int32)
-            if obj is None:
-                return
-            answers.append(obj)
-        params.answers = answers
+        params.answers = self.read_vector(self.poll_answer_deserialize, 'answers')
 
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_poll')
         return params
 
-    def poll_deserialize(self, constructor):
-        assert (constructor == 0xd5529d06), "{} asseratation".format(inspect.stack()[0][3])
-        result = self._tl_poll()
-        self.instances.append(inspect.stack()[0][3])
+    def poll_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.POLL_PARSERS, constructor, field, projection)
+        self.instances.append('poll_deserialize')
         return result
 
     def _tl_messageMediaPoll(self):
         constructor = 0x4bd6e798
-        params = Map()
-        params.poll = self.poll_deserialize(self.read_int32)
-        params.results = self.poll_result_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def message_media_deserialize(self, constructor):
-        result = None
-        if constructor == 0x29632a36:
-            result = self._tl_messageMediaUnsupported_old()
-        elif constructor == 0xc6b68300:
-            result = self._tl_messageMediaAudio_layer45()
-        elif constructor == 0xc8c45a2a:
-            result = self._tl_messageMediaPhoto_old()
-        elif constructor == 0x9f84f49e:
-            result = self._tl_messageMediaUnsupported()
-        elif constructor == 0x3ded6320:
-            result = self._tl_messageMediaEmpty()
-        elif constructor == 0x7912b71f:
-            result = self._tl_messageMediaVenue_layer71()
-        elif constructor == 0x7c3c2609:
-            result = self._tl_messageMediaGeoLive()
-        elif constructor == 0x2ec0533f:
-            result = self._tl_messageMediaVenue()
-        elif constructor == 0xa2d24290:
-            result = self._tl_messageMediaVideo_old()
-        elif constructor == 0x2fda2204:
-            result = self._tl_messageMediaDocument_old()
-        elif constructor == 0xf3e02ea8:
-            result = self._tl_messageMediaDocument_layer68()
-        elif constructor == 0xfdb19008:
-            result = self._tl_messageMediaGame()
-        elif constructor == 0x7c4414d3:
-            result = self._tl_messageMediaDocument_layer72()
-        elif constructor == 0x5e7d2f39:
-            result = self._tl_messageMediaContact()
-        elif constructor == 0x3d8ce53d:
-            result = self._tl_messageMediaPhoto_layer68()
-        elif constructor == 0x5bcf1675:
-            result = self._tl_messageMediaVideo_layer45()
-        elif constructor == 0x56e0d474:
-            result = self._tl_messageMediaGeo()
-        elif constructor == 0xa32dd600:
-            result = self._tl_messageMediaWebPage()
-        elif constructor == 0x84551347:
-            result = self._tl_messageMediaInvoice()
-        elif constructor == 0xb5223b0f:
-            result = self._tl_messageMediaPhoto_layer72()
-        elif constructor == 0x695150d7:
-            result = self._tl_messageMediaPhoto()
-        elif constructor == 0x4bd6e798:
-            result = self._tl_messageMediaPoll()
-        elif constructor == 0x9cb070d7:
-            result = self._tl_messageMediaDocument()
+        params = self.new_params('_tl_messageMediaPoll')
+        params.poll = self.poll_deserialize(self.read_int32, 'poll')
+        params.results = self.poll_result_deserialize(self.read_int32, 'results')
+        self.instances.append('_tl_messageMediaPoll')
+        return params
+
+    def message_media_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.MESSAGE_MEDIA_PARSERS, constructor, field, projection)
         if result is not None and result.video_unused is not None:
             mediaDocument = self._tl_messageMediaDocument()
             if '_tl_videoEncrypted' in self.instances:
@@ -2792,1062 +3225,783 @@ class TeleData(object):
             result = mediaDocument
             if mediaDocument.caption is None:
                 mediaDocument.caption = ""
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
         return result
 
     def _tl_messageMediaEmpty(self):
         constructor = 0x3ded6320
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageMediaEmpty')
+        self.instances.append('_tl_messageMediaEmpty')
         return params
 
     def _tl_messageEntityMention(self):
         constructor = 0xfa04579d
-        params = Map()
+        params = self.new_params('_tl_messageEntityMention')
         params.offset = self.read_int32
         params.length = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageEntityMention')
         return params
 
     def _tl_messageEntityUrl(self):
         constructor = 0x6ed02538
-        params = Map()
+        params = self.new_params('_tl_messageEntityUrl')
         params.offset = self.read_int32
         params.length = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageEntityUrl')
         return params
 
     def _tl_messageEntityHashtag(self):
         constructor = 0x6f635b0d
-        params = Map()
+        params = self.new_params('_tl_messageEntityHashtag')
         params.offset = self.read_int32
         params.length = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageEntityHashtag')
         return params
 
     def _tl_messageEntityBold(self):
         constructor = 0xbd610bc9
-        params = Map()
+        params = self.new_params('_tl_messageEntityBold')
         params.offset = self.read_int32
         params.length = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageEntityBold')
         return params
 
     def _tl_messageEntityTextUrl(self):
         constructor = 0x76a6d327
-        params = Map()
+        params = self.new_params('_tl_messageEntityTextUrl')
         params.offset = self.read_int32
         params.length = self.read_int32
         params.url = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageEntityTextUrl')
         return params
 
     def _tl_messageEntityItalic(self):
         constructor = 0x826f8b60
-        params = Map()
+        params = self.new_params('_tl_messageEntityItalic')
         params.offset = self.read_int32
         params.length = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageEntityItalic')
         return params
 
     def _tl_messageEntityBotCommand(self):
         constructor = 0x6cef8ac7
-        params = Map()
+        params = self.new_params('_tl_messageEntityBotCommand')
         params.offset = self.read_int32
         params.length = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageEntityBotCommand')
         return params
 
     def _tl_messageEntityEmail(self):
         constructor = 0x64e475c2
-        params = Map()
+        params = self.new_params('_tl_messageEntityEmail')
         params.offset = self.read_int32
         params.length = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageEntityEmail')
         return params
 
     def _tl_messageEntityPre(self):
         constructor = 0x73924be0
-        params = Map()
+        params = self.new_params('_tl_messageEntityPre')
         params.offset = self.read_int32
         params.length = self.read_int32
         params.language = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageEntityPre')
         return params
 
     def _tl_messageEntityUnknown(self):
         constructor = 0xbb92ba95
-        params = Map()
+        params = self.new_params('_tl_messageEntityUnknown')
         params.offset = self.read_int32
         params.length = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageEntityUnknown')
         return params
 
     def _tl_messageEntityMentionName(self):
         constructor = 0x352dca58
-        params = Map()
+        params = self.new_params('_tl_messageEntityMentionName')
         params.offset = self.read_int32
         params.length = self.read_int32
         params.user_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageEntityMentionName')
         return params
 
     def _tl_inputUserEmpty(self):
         constructor = 0xb98886cf
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_inputUserEmpty')
+        self.instances.append('_tl_inputUserEmpty')
         return params
 
     def _tl_inputUserSelf(self):
         constructor = 0xf7c1b13f
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_inputUserSelf')
+        self.instances.append('_tl_inputUserSelf')
         return params
 
     def _tl_inputUser(self):
         constructor = 0xd8292816
-        params = Map()
+        params = self.new_params('_tl_inputUser')
         params.user_id = self.read_int32
         params.access_hash = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_inputUser')
         return params
 
-    def input_user_deserialize(self, constructor):
-        result = None
-        if constructor == 0xb98886cf:
-            result = self._tl_inputUserEmpty()
-        elif constructor == 0xf7c1b13f:
-            result = self._tl_inputUserSelf()
-        elif constructor == 0xd8292816:
-            result = self._tl_inputUser()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+    def input_user_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.INPUT_USER_PARSERS, constructor, field, projection)
 
     def _tl_inputMessageEntityMentionName(self):
         constructor = 0x208e68c9
-        params = Map()
+        params = self.new_params('_tl_inputMessageEntityMentionName')
         params.offset = self.read_int32
         params.length = self.read_int32
-        params.user_id = self.input_user_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.user_id = self.input_user_deserialize(self.read_int32, 'user_id')
+        self.instances.append('_tl_inputMessageEntityMentionName')
         return params
 
     def _tl_messageEntityCode(self):
         constructor = 0x28a20571
-        params = Map()
+        params = self.new_params('_tl_messageEntityCode')
         params.offset = self.read_int32
         params.length = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageEntityCode')
         return params
 
     def _tl_messageEntityPhone(self):
         constructor = 0x9b69e34b
-        params = Map()
+        params = self.new_params('_tl_messageEntityPhone')
         params.offset = self.read_int32
         params.length = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def message_entity_deserialize(self, constructor):
-        result = None
-        if constructor == 0x76a6d327:
-            result = self._tl_messageEntityTextUrl()
-        elif constructor == 0x9b69e34b:
-            result = self._tl_messageEntityPhone()
-        elif constructor == 0x6cef8ac7:
-            result = self._tl_messageEntityBotCommand()
-        elif constructor == 0x64e475c2:
-            result = self._tl_messageEntityEmail()
-        elif constructor == 0x73924be0:
-            result = self._tl_messageEntityPre()
-        elif constructor == 0xbb92ba95:
-            result = self._tl_messageEntityUnknown()
-        elif constructor == 0x6ed02538:
-            result = self._tl_messageEntityUrl()
-        elif constructor == 0x826f8b60:
-            result = self._tl_messageEntityItalic()
-        elif constructor == 0xfa04579d:
-            result = self._tl_messageEntityMention()
-        elif constructor == 0x352dca58:
-            result = self._tl_messageEntityMentionName()
-        elif constructor == 0x208e68c9:
-            result = self._tl_inputMessageEntityMentionName()
-        elif constructor == 0xbd610bc9:
-            result = self._tl_messageEntityBold()
-        elif constructor == 0x6f635b0d:
-            result = self._tl_messageEntityHashtag()
-        elif constructor == 0x28a20571:
-            result = self._tl_messageEntityCode()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_messageEntityPhone')
+        return params
+
+    def message_entity_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.MESSAGE_ENTITY_PARSERS, constructor, field, projection)
 
     def _tl_keyboardButtonCallback(self):
         constructor = 0x683a5e46
-        params = Map()
+        params = self.new_params('_tl_keyboardButtonCallback')
         params.text = self.read_string
         params.data = self.read_bytes
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_keyboardButtonCallback')
         return params
 
     def _tl_keyboardButtonRequestPhone(self):
         constructor = 0xb16a6c29
-        params = Map()
+        params = self.new_params('_tl_keyboardButtonRequestPhone')
         params.text = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_keyboardButtonRequestPhone')
         return params
 
     def _tl_keyboardButtonGame(self):
         constructor = 0x50f41ccf
-        params = Map()
+        params = self.new_params('_tl_keyboardButtonGame')
         params.text = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_keyboardButtonGame')
         return params
 
     def _tl_keyboardButtonUrl(self):
         constructor = 0x258aff05
-        params = Map()
+        params = self.new_params('_tl_keyboardButtonUrl')
         params.text = self.read_string
         params.url = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_keyboardButtonUrl')
         return params
 
     def _tl_keyboardButtonSwitchInline(self):
         constructor = 0x568a748
-        params = Map()
+        params = self.new_params('_tl_keyboardButtonSwitchInline')
         flags = self.read_int32
         params.flags = flags
         params.same_peer = (flags & 1) != 0
         params.text = self.read_string
         params.query = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_keyboardButtonSwitchInline')
         return params
 
     def _tl_keyboardButtonRequestGeoLocation(self):
         constructor = 0xfc796b3f
-        params = Map()
+        params = self.new_params('_tl_keyboardButtonRequestGeoLocation')
         params.text = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_keyboardButtonRequestGeoLocation')
         return params
 
     def _tl_keyboardButtonBuy(self):
         constructor = 0xafd93fbb
-        params = Map()
+        params = self.new_params('_tl_keyboardButtonBuy')
         params.text = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_keyboardButtonBuy')
         return params
 
     def _tl_keyboardButton(self):
         constructor = 0xa2fa4880
-        params = Map()
+        params = self.new_params('_tl_keyboardButton')
         params.text = self.read_string
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def keyboard_button_deserialize(self, constructor):
-        result = None
-        if constructor == 0xb16a6c29:
-            result = self._tl_keyboardButtonRequestPhone()
-        elif constructor == 0x50f41ccf:
-            result = self._tl_keyboardButtonGame()
-        elif constructor == 0x258aff05:
-            result = self._tl_keyboardButtonUrl()
-        elif constructor == 0x568a748:
-            result = self._tl_keyboardButtonSwitchInline()
-        elif constructor == 0xfc796b3f:
-            result = self._tl_keyboardButtonRequestGeoLocation()
-        elif constructor == 0xafd93fbb:
-            result = self._tl_keyboardButtonBuy()
-        elif constructor == 0x683a5e46:
-            result = self._tl_keyboardButtonCallback()
-        elif constructor == 0xa2fa4880:
-            result = self._tl_keyboardButton()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_keyboardButton')
+        return params
+
+    def keyboard_button_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.KEYBOARD_BUTTON_PARSERS, constructor, field, projection)
 
     def _tl_keyboardButtonRow(self):
         constructor = 0x77608b83
-        params = Map()
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        buttons = list()
-        for i in range(0, count):
-            obj = self.keyboard_button_deserialize(self.read_int32)
-            if obj is None:
-                return
-            buttons.append(obj)
-        params.buttons = buttons
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def keyboard_button_row_deserialize(self, constructor):
-        assert (constructor == 0x77608b83), "{} asseratation".format(inspect.stack()[0][3])
-        result = self._tl_keyboardButtonRow()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_keyboardButtonRow')
+        params.buttons = self.read_vector(self.keyboard_button_deserialize, 'buttons')
+        self.instances.append('_tl_keyboardButtonRow')
+        return params
+
+    def keyboard_button_row_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.KEYBOARD_BUTTON_ROW_PARSERS, constructor, field, projection)
+        self.instances.append('keyboard_button_row_deserialize')
         return result
 
     def _tl_replyInlineMarkup(self):
         constructor = 0x48a30254
-        params = Map()
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        rows = list()
-        for i in range(0, count):
-            obj = self.keyboard_button_row_deserialize(self.read_int32)
-            if obj is None:
-                return
-            rows.append(obj)
-        params.rows = rows
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_replyInlineMarkup')
+        params.rows = self.read_vector(self.keyboard_button_row_deserialize, 'rows')
+        self.instances.append('_tl_replyInlineMarkup')
         return params
 
     def _tl_replyKeyboardHide(self):
         constructor = 0xa03e5b85
-        params = Map()
+        params = self.new_params('_tl_replyKeyboardHide')
         flags = self.read_int32
         params.flags = flags
         params.selective = (flags & 4) != 0
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_replyKeyboardHide')
         return params
 
     def _tl_replyKeyboardForceReply(self):
         constructor = 0xf4108aa0
-        params = Map()
+        params = self.new_params('_tl_replyKeyboardForceReply')
         flags = self.read_int32
         params.flags = flags
         params.single_use = (flags & 2) != 0
         params.selective = (flags & 4) != 0
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_replyKeyboardForceReply')
         return params
 
     def _tl_replyKeyboardMarkup(self):
         constructor = 0x3502758c
-        params = Map()
+        params = self.new_params('_tl_replyKeyboardMarkup')
         flags = self.read_int32
         params.flags = flags
         params.resize = (flags & 1) != 0
         params.single_use = (flags & 2) != 0
         params.selective = (flags & 4) != 0
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        rows = list()
-        for i in range(0, count):
-            obj = self.keyboard_button_row_deserialize(self.read_int32)
-            if obj is None:
-                return
-            rows.append(obj)
-        params.rows = rows
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def reply_markup_deserialize(self, constructor):
-        result = None
-        if constructor == 0x48a30254:
-            result = self._tl_replyInlineMarkup()
-        elif constructor == 0xa03e5b85:
-            result = self._tl_replyKeyboardHide()
-        elif constructor == 0xf4108aa0:
-            result = self._tl_replyKeyboardForceReply()
-        elif constructor == 0x3502758c:
-            result = self._tl_replyKeyboardMarkup()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params.rows = self.read_vector(self.keyboard_button_row_deserialize, 'rows')
+        self.instances.append('_tl_replyKeyboardMarkup')
+        return params
+
+    def reply_markup_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.REPLY_MARKUP_PARSERS, constructor, field, projection)
 
     def _tl_messageActionChatAddUser(self):
         constructor = 0x488a7337
-        params = Map()
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        users = list()
-        for i in range(0, count):
-            users.append(self.read_int32)
-        params.users = users
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageActionChatAddUser')
+        params.users = self.read_int32_vector()
+        self.instances.append('_tl_messageActionChatAddUser')
         return params
 
     def _tl_messageActionUserJoined(self):
         constructor = 0x55555550
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageActionUserJoined')
+        self.instances.append('_tl_messageActionUserJoined')
         return params
 
     def _tl_decryptedMessageActionNoop(self):
         constructor = 0xa82fdd63
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_decryptedMessageActionNoop')
+        self.instances.append('_tl_decryptedMessageActionNoop')
         return params
 
     def _tl_decryptedMessageActionAcceptKey(self):
         constructor = 0x6fe1735b
-        params = Map()
+        params = self.new_params('_tl_decryptedMessageActionAcceptKey')
         params.exchange_id = self.read_int64
         params.g_b = self.read_bytes
         params.key_fingerprint = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_decryptedMessageActionAcceptKey')
         return params
 
     def _tl_decryptedMessageActionNotifyLayer(self):
         constructor = 0xf3048883
-        params = Map()
+        params = self.new_params('_tl_decryptedMessageActionNotifyLayer')
         params.layer = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_decryptedMessageActionNotifyLayer')
         return params
 
     def _tl_decryptedMessageActionSetMessageTTL(self):
         constructor = 0xa1733aec
-        params = Map()
+        params = self.new_params('_tl_decryptedMessageActionSetMessageTTL')
         params.ttl_seconds = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_decryptedMessageActionSetMessageTTL')
         return params
 
     def _tl_decryptedMessageActionDeleteMessages(self):
         constructor = 0x65614304
-        params = Map()
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        random_ids = list()
-        for i in range(0, count):
-            random_ids.append(self.read_int64)
-        params.random_ids = random_ids
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_decryptedMessageActionDeleteMessages')
+        params.random_ids = self.read_int64_vector()
+        self.instances.append('_tl_decryptedMessageActionDeleteMessages')
         return params
 
     def _tl_decryptedMessageActionCommitKey(self):
         constructor = 0xec2e0b9b
-        params = Map()
+        params = self.new_params('_tl_decryptedMessageActionCommitKey')
         params.exchange_id = self.read_int64
         params.key_fingerprint = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_decryptedMessageActionCommitKey')
         return params
 
     def _tl_decryptedMessageActionAbortKey(self):
         constructor = 0xdd05ec6b
-        params = Map()
+        params = self.new_params('_tl_decryptedMessageActionAbortKey')
         params.exchange_id = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_decryptedMessageActionAbortKey')
         return params
 
     def _tl_decryptedMessageActionFlushHistory(self):
         constructor = 0x6719e45c
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_decryptedMessageActionFlushHistory')
+        self.instances.append('_tl_decryptedMessageActionFlushHistory')
         return params
 
     def _tl_sendMessageGamePlayAction(self):
         constructor = 0xdd6a8f48
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_sendMessageGamePlayAction')
+        self.instances.append('_tl_sendMessageGamePlayAction')
         return params
 
     def _tl_sendMessageRecordAudioAction(self):
         constructor = 0xd52f73f7
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_sendMessageRecordAudioAction')
+        self.instances.append('_tl_sendMessageRecordAudioAction')
         return params
 
     def _tl_sendMessageUploadVideoAction_old(self):
         constructor = 0x92042ff7
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_sendMessageUploadVideoAction_old')
+        self.instances.append('_tl_sendMessageUploadVideoAction_old')
         return params
 
     def _tl_sendMessageUploadAudioAction_old(self):
         constructor = 0xe6ac8a6f
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_sendMessageUploadAudioAction_old')
+        self.instances.append('_tl_sendMessageUploadAudioAction_old')
         return params
 
     def _tl_sendMessageUploadAudioAction(self):
         constructor = 0xf351d7ab
-        params = Map()
+        params = self.new_params('_tl_sendMessageUploadAudioAction')
         params.progress = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_sendMessageUploadAudioAction')
         return params
 
     def _tl_sendMessageUploadPhotoAction(self):
         constructor = 0xd1d34a26
-        params = Map()
+        params = self.new_params('_tl_sendMessageUploadPhotoAction')
         params.progress = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_sendMessageUploadPhotoAction')
         return params
 
     def _tl_sendMessageUploadDocumentAction_old(self):
         constructor = 0x8faee98e
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_sendMessageUploadDocumentAction_old')
+        self.instances.append('_tl_sendMessageUploadDocumentAction_old')
         return params
 
     def _tl_sendMessageUploadVideoAction(self):
         constructor = 0xe9763aec
-        params = Map()
+        params = self.new_params('_tl_sendMessageUploadVideoAction')
         params.progress = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_sendMessageUploadVideoAction')
         return params
 
     def _tl_sendMessageCancelAction(self):
         constructor = 0xfd5ec8f5
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_sendMessageCancelAction')
+        self.instances.append('_tl_sendMessageCancelAction')
         return params
 
     def _tl_sendMessageGeoLocationAction(self):
         constructor = 0x176f8ba1
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_sendMessageGeoLocationAction')
+        self.instances.append('_tl_sendMessageGeoLocationAction')
         return params
 
     def _tl_sendMessageChooseContactAction(self):
         constructor = 0x628cbc6f
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_sendMessageChooseContactAction')
+        self.instances.append('_tl_sendMessageChooseContactAction')
         return params
 
     def _tl_sendMessageRecordRoundAction(self):
         constructor = 0x88f27fbc
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_sendMessageRecordRoundAction')
+        self.instances.append('_tl_sendMessageRecordRoundAction')
         return params
 
     def _tl_sendMessageUploadRoundAction(self):
         constructor = 0x243e1c66
-        params = Map()
+        params = self.new_params('_tl_sendMessageUploadRoundAction')
         params.progress = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_sendMessageUploadRoundAction')
         return params
 
     def _tl_sendMessageTypingAction(self):
         constructor = 0x16bf744e
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_sendMessageTypingAction')
+        self.instances.append('_tl_sendMessageTypingAction')
         return params
 
     def _tl_sendMessageUploadPhotoAction_old(self):
         constructor = 0x990a3c1a
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_sendMessageUploadPhotoAction_old')
+        self.instances.append('_tl_sendMessageUploadPhotoAction_old')
         return params
 
     def _tl_sendMessageUploadDocumentAction(self):
         constructor = 0xaa0cd9e4
-        params = Map()
+        params = self.new_params('_tl_sendMessageUploadDocumentAction')
         params.progress = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_sendMessageUploadDocumentAction')
         return params
 
     def _tl_sendMessageRecordVideoAction(self):
         constructor = 0xa187d66f
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def send_message_action_deserialize(self, constructor):
-        result = None
-        if constructor == 0xdd6a8f48:
-            result = self._tl_sendMessageGamePlayAction()
-        elif constructor == 0xd52f73f7:
-            result = self._tl_sendMessageRecordAudioAction()
-        elif constructor == 0x92042ff7:
-            result = self._tl_sendMessageUploadVideoAction_old()
-        elif constructor == 0xe6ac8a6f:
-            result = self._tl_sendMessageUploadAudioAction_old()
-        elif constructor == 0xf351d7ab:
-            result = self._tl_sendMessageUploadAudioAction()
-        elif constructor == 0xd1d34a26:
-            result = self._tl_sendMessageUploadPhotoAction()
-        elif constructor == 0x8faee98e:
-            result = self._tl_sendMessageUploadDocumentAction_old()
-        elif constructor == 0xe9763aec:
-            result = self._tl_sendMessageUploadVideoAction()
-        elif constructor == 0xfd5ec8f5:
-            result = self._tl_sendMessageCancelAction()
-        elif constructor == 0x176f8ba1:
-            result = self._tl_sendMessageGeoLocationAction()
-        elif constructor == 0x628cbc6f:
-            result = self._tl_sendMessageChooseContactAction()
-        elif constructor == 0x88f27fbc:
-            result = self._tl_sendMessageRecordRoundAction()
-        elif constructor == 0x243e1c66:
-            result = self._tl_sendMessageUploadRoundAction()
-        elif constructor == 0x16bf744e:
-            result = self._tl_sendMessageTypingAction()
-        elif constructor == 0x990a3c1a:
-            result = self._tl_sendMessageUploadPhotoAction_old()
-        elif constructor == 0xaa0cd9e4:
-            result = self._tl_sendMessageUploadDocumentAction()
-        elif constructor == 0xa187d66f:
-            result = self._tl_sendMessageRecordVideoAction()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params = self.new_params('_tl_sendMessageRecordVideoAction')
+        self.instances.append('_tl_sendMessageRecordVideoAction')
+        return params
+
+    def send_message_action_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.SEND_MESSAGE_ACTION_PARSERS, constructor, field, projection)
 
     def _tl_decryptedMessageActionTyping(self):
         constructor = 0xccb27641
-        params = Map()
-        params.action = self.send_message_action_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_decryptedMessageActionTyping')
+        params.action = self.send_message_action_deserialize(self.read_int32, 'action')
+        self.instances.append('_tl_decryptedMessageActionTyping')
         return params
 
     def _tl_decryptedMessageActionReadMessages(self):
         constructor = 0xc4f40be
-        params = Map()
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        random_ids = list()
-        for i in range(0, count):
-            random_ids.append(self.read_int64)
-        params.random_ids = random_ids
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_decryptedMessageActionReadMessages')
+        params.random_ids = self.read_int64_vector()
+        self.instances.append('_tl_decryptedMessageActionReadMessages')
         return params
 
     def _tl_decryptedMessageActionResend(self):
         constructor = 0x511110b0
-        params = Map()
+        params = self.new_params('_tl_decryptedMessageActionResend')
         params.start_seq_no = self.read_int32
         params.end_seq_no = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_decryptedMessageActionResend')
         return params
 
     def _tl_decryptedMessageActionRequestKey(self):
         constructor = 0xf3c9611b
-        params = Map()
+        params = self.new_params('_tl_decryptedMessageActionRequestKey')
         params.exchange_id = self.read_int64
         params.g_a = self.read_bytes
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_decryptedMessageActionRequestKey')
         return params
 
     def _tl_decryptedMessageActionScreenshotMessages(self):
         constructor = 0x8ac1f475
-        params = Map()
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        random_ids = list()
-        for i in range(0, count):
-            random_ids.append(self.read_int64)
-        params.random_ids = random_ids
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def decrypted_message_action_deserialize(self, constructor):
-        result = None
-        if constructor == 0xa1733aec:
-            result = self._tl_decryptedMessageActionSetMessageTTL()
-        elif constructor == 0xf3048883:
-            result = self._tl_decryptedMessageActionNotifyLayer()
-        elif constructor == 0x65614304:
-            result = self._tl_decryptedMessageActionDeleteMessages()
-        elif constructor == 0xec2e0b9b:
-            result = self._tl_decryptedMessageActionCommitKey()
-        elif constructor == 0xdd05ec6b:
-            result = self._tl_decryptedMessageActionAbortKey()
-        elif constructor == 0x6719e45c:
-            result = self._tl_decryptedMessageActionFlushHistory()
-        elif constructor == 0xccb27641:
-            result = self._tl_decryptedMessageActionTyping()
-        elif constructor == 0x6fe1735b:
-            result = self._tl_decryptedMessageActionAcceptKey()
-        elif constructor == 0xc4f40be:
-            result = self._tl_decryptedMessageActionReadMessages()
-        elif constructor == 0x511110b0:
-            result = self._tl_decryptedMessageActionResend()
-        elif constructor == 0xf3c9611b:
-            result = self._tl_decryptedMessageActionRequestKey()
-        elif constructor == 0x8ac1f475:
-            result = self._tl_decryptedMessageActionScreenshotMessages()
-        elif constructor == 0xa82fdd63:
-            result = self._tl_decryptedMessageActionNoop()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params = self.new_params('_tl_decryptedMessageActionScreenshotMessages')
+        params.random_ids = self.read_int64_vector()
+        self.instances.append('_tl_decryptedMessageActionScreenshotMessages')
+        return params
+
+    def decrypted_message_action_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.DECRYPTED_MESSAGE_ACTION_PARSERS, constructor, field, projection)
 
     def _tl_messageEncryptedAction(self):
         constructor = 0x555555F7
-        params = Map()
-        params.encryptedAction = self.decrypted_message_action_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageEncryptedAction')
+        params.encryptedAction = self.decrypted_message_action_deserialize(self.read_int32, 'encryptedAction')
+        self.instances.append('_tl_messageEncryptedAction')
         return params
 
     def _tl_messageActionHistoryClear(self):
         constructor = 0x9fbab604
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageActionHistoryClear')
+        self.instances.append('_tl_messageActionHistoryClear')
         return params
 
     def _tl_messageActionChatCreate(self):
         constructor = 0xa6638b9a
-        params = Map()
+        params = self.new_params('_tl_messageActionChatCreate')
         params.title = self.read_string
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        users = list()
-        for i in range(0, count):
-            users.append(self.read_int32)
-        params.users = users
-        self.instances.append(inspect.stack()[0][3])
+        params.users = self.read_int32_vector()
+        self.instances.append('_tl_messageActionChatCreate')
         return params
 
     def _tl_messageActionChatEditPhoto(self):
         constructor = 0x7fcb13a8
-        params = Map()
-        params.photo = self.photo_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageActionChatEditPhoto')
+        params.photo = self.photo_deserialize(self.read_int32, 'photo')
+        self.instances.append('_tl_messageActionChatEditPhoto')
         return params
 
     def _tl_messageActionChatDeleteUser(self):
         constructor = 0xb2ae9b0c
-        params = Map()
+        params = self.new_params('_tl_messageActionChatDeleteUser')
         params.user_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageActionChatDeleteUser')
         return params
 
     def _tl_messageActionChannelCreate(self):
         constructor = 0x95d2ac92
-        params = Map()
+        params = self.new_params('_tl_messageActionChannelCreate')
         params.title = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageActionChannelCreate')
         return params
 
     def _tl_messageActionChatDeletePhoto(self):
         constructor = 0x95e3fbef
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageActionChatDeletePhoto')
+        self.instances.append('_tl_messageActionChatDeletePhoto')
         return params
 
     def _tl_messageActionChatEditTitle(self):
         constructor = 0xb5a1ce5a
-        params = Map()
+        params = self.new_params('_tl_messageActionChatEditTitle')
         params.title = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageActionChatEditTitle')
         return params
 
     def _tl_messageActionEmpty(self):
         constructor = 0xb6aef7b0
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageActionEmpty')
+        self.instances.append('_tl_messageActionEmpty')
         return params
 
     def _tl_messageActionLoginUnknownLocation(self):
         constructor = 0x555555F5
-        params = Map()
+        params = self.new_params('_tl_messageActionLoginUnknownLocation')
         params.title = self.read_string
         params.address = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageActionLoginUnknownLocation')
         return params
 
     def _tl_messageActionChatMigrateTo(self):
         constructor = 0x51bdb021
-        params = Map()
+        params = self.new_params('_tl_messageActionChatMigrateTo')
         params.channel_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageActionChatMigrateTo')
         return params
 
     def _tl_messageActionScreenshotTaken(self):
         constructor = 0x4792929b
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageActionScreenshotTaken')
+        self.instances.append('_tl_messageActionScreenshotTaken')
         return params
 
     def _tl_messageActionChannelMigrateFrom(self):
         constructor = 0xb055eaee
-        params = Map()
+        params = self.new_params('_tl_messageActionChannelMigrateFrom')
         params.title = self.read_string
         params.chat_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageActionChannelMigrateFrom')
         return params
 
     def _tl_messageActionCreatedBroadcastList(self):
         constructor = 0x55555557
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageActionCreatedBroadcastList')
+        self.instances.append('_tl_messageActionCreatedBroadcastList')
         return params
 
     def _tl_messageActionUserUpdatedPhoto(self):
         constructor = 0x55555551
-        params = Map()
-        params.newUserPhoto = self.user_profile_photo_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageActionUserUpdatedPhoto')
+        params.newUserPhoto = self.user_profile_photo_deserialize(self.read_int32, 'newUserPhoto')
+        self.instances.append('_tl_messageActionUserUpdatedPhoto')
         return params
 
     def _tl_messageActionChatAddUser_old(self):
         constructor = 0x5e3cfc4b
-        params = Map()
+        params = self.new_params('_tl_messageActionChatAddUser_old')
         params.user_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageActionChatAddUser_old')
         return params
 
     def _tl_messageActionTTLChange(self):
         constructor = 0x55555552
-        params = Map()
+        params = self.new_params('_tl_messageActionTTLChange')
         params.ttl = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageActionTTLChange')
         return params
 
     def _tl_messageActionGeoChatCheckin(self):
         constructor = 0xc7d53de
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageActionGeoChatCheckin')
+        self.instances.append('_tl_messageActionGeoChatCheckin')
         return params
 
     def _tl_messageActionChatJoinedByLink(self):
         constructor = 0xf89cf5e8
-        params = Map()
+        params = self.new_params('_tl_messageActionChatJoinedByLink')
         params.inviter_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageActionChatJoinedByLink')
         return params
 
     def _tl_messageActionPinMessage(self):
         constructor = 0x94bd38ed
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_messageActionPinMessage')
+        self.instances.append('_tl_messageActionPinMessage')
         return params
 
     def _tl_messageActionPhoneCall(self):
         constructor = 0x80e11a7f
-        params = Map()
+        params = self.new_params('_tl_messageActionPhoneCall')
         flags = self.read_int32
         params.flags = flags
         params.call_id = self.read_int64
         if (flags & 1) != 0:
-            params.reason = self.phone_call_discard_reason_deserialize(self.read_int32)
+            params.reason = self.phone_call_discard_reason_deserialize(self.read_int32, 'reason')
         if (flags & 2) != 0:
             params.duration = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageActionPhoneCall')
         return params
 
     def _tl_messageActionPaymentSent(self):
         constructor = 0x40699cd0
-        params = Map()
+        params = self.new_params('_tl_messageActionPaymentSent')
         params.currency = self.read_string
         params.total_amount = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageActionPaymentSent')
         return params
 
     def _tl_messageActionGameScore(self):
         constructor = 0x92a72876
-        params = Map()
+        params = self.new_params('_tl_messageActionGameScore')
         params.game_id = self.read_int64
         params.score = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageActionGameScore')
         return params
 
     def _tl_messageActionGeoChatCreate(self):
         constructor = 0x6f038ebc
-        params = Map()
+        params = self.new_params('_tl_messageActionGeoChatCreate')
         params.title = self.read_string
         params.address = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageActionGeoChatCreate')
         return params
 
     def _tl_messageActionCustomAction(self):
         constructor = 0xfae69f56
-        params = Map()
+        params = self.new_params('_tl_messageActionCustomAction')
         params.message = self.read_string
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def message_action_deserialize(self, constructor):
-        result = None
-        if constructor == 0x555555F5:
-            result = self._tl_messageActionLoginUnknownLocation()
-        elif constructor == 0x555555F7:
-            result = self._tl_messageEncryptedAction()
-        elif constructor == 0xfae69f56:
-            result = self._tl_messageActionCustomAction()
-        elif constructor == 0xa6638b9a:
-            result = self._tl_messageActionChatCreate()
-        elif constructor == 0x51bdb021:
-            result = self._tl_messageActionChatMigrateTo()
-        elif constructor == 0x4792929b:
-            result = self._tl_messageActionScreenshotTaken()
-        elif constructor == 0x9fbab604:
-            result = self._tl_messageActionHistoryClear()
-        elif constructor == 0x7fcb13a8:
-            result = self._tl_messageActionChatEditPhoto()
-        elif constructor == 0xb055eaee:
-            result = self._tl_messageActionChannelMigrateFrom()
-        elif constructor == 0x488a7337:
-            result = self._tl_messageActionChatAddUser()
-        elif constructor == 0xb2ae9b0c:
-            result = self._tl_messageActionChatDeleteUser()
-        elif constructor == 0x55555557:
-            result = self._tl_messageActionCreatedBroadcastList()
-        elif constructor == 0x55555550:
-            result = self._tl_messageActionUserJoined()
-        elif constructor == 0x55555551:
-            result = self._tl_messageActionUserUpdatedPhoto()
-        elif constructor == 0x5e3cfc4b:
-            result = self._tl_messageActionChatAddUser_old()
-        elif constructor == 0x55555552:
-            result = self._tl_messageActionTTLChange()
-        elif constructor == 0xc7d53de:
-            result = self._tl_messageActionGeoChatCheckin()
-        elif constructor == 0xf89cf5e8:
-            result = self._tl_messageActionChatJoinedByLink()
-        elif constructor == 0x95d2ac92:
-            result = self._tl_messageActionChannelCreate()
-        elif constructor == 0x94bd38ed:
-            result = self._tl_messageActionPinMessage()
-        elif constructor == 0x95e3fbef:
-            result = self._tl_messageActionChatDeletePhoto()
-        elif constructor == 0x80e11a7f:
-            result = self._tl_messageActionPhoneCall()
-        elif constructor == 0xb5a1ce5a:
-            result = self._tl_messageActionChatEditTitle()
-        elif constructor == 0x40699cd0:
-            result = self._tl_messageActionPaymentSent()
-        elif constructor == 0xb6aef7b0:
-            result = self._tl_messageActionEmpty()
-        elif constructor == 0x92a72876:
-            result = self._tl_messageActionGameScore()
-        elif constructor == 0x6f038ebc:
-            result = self._tl_messageActionGeoChatCreate()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_messageActionCustomAction')
+        return params
+
+    def message_action_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.MESSAGE_ACTION_PARSERS, constructor, field, projection)
 
     def _tl_phoneCallDiscardReasonHangup(self):
         constructor = 0x57adc690
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_phoneCallDiscardReasonHangup')
+        self.instances.append('_tl_phoneCallDiscardReasonHangup')
         return params
 
     def _tl_phoneCallDiscardReasonBusy(self):
         constructor = 0xfaf7e8c9
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_phoneCallDiscardReasonBusy')
+        self.instances.append('_tl_phoneCallDiscardReasonBusy')
         return params
 
     def _tl_phoneCallDiscardReasonMissed(self):
         constructor = 0x85e42301
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_phoneCallDiscardReasonMissed')
+        self.instances.append('_tl_phoneCallDiscardReasonMissed')
         return params
 
     def _tl_phoneCallDiscardReasonDisconnect(self):
         constructor = 0xe095c1a0
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def phone_call_discard_reason_deserialize(self, constructor):
-        result = None
-        if constructor == 0x57adc690:
-            result = self._tl_phoneCallDiscardReasonHangup()
-        elif constructor == 0xfaf7e8c9:
-            result = self._tl_phoneCallDiscardReasonBusy()
-        elif constructor == 0x85e42301:
-            result = self._tl_phoneCallDiscardReasonMissed()
-        elif constructor == 0xe095c1a0:
-            result = self._tl_phoneCallDiscardReasonDisconnect()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params = self.new_params('_tl_phoneCallDiscardReasonDisconnect')
+        self.instances.append('_tl_phoneCallDiscardReasonDisconnect')
+        return params
+
+    def phone_call_discard_reason_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.PHONE_CALL_DISCARD_REASON_PARSERS, constructor, field, projection)
 
     def _tl_userProfilePhoto(self):
         constructor = 0xecd75d8c
-        params = Map()
+        params = self.new_params('_tl_userProfilePhoto')
         params.photo_id = self.read_int64
-        params.photo_small = self.file_location_deserialize(self.read_int32)
-        params.photo_big = self.file_location_deserialize(self.read_int32)
+        params.photo_small = self.file_location_deserialize(self.read_int32, 'photo_small')
+        params.photo_big = self.file_location_deserialize(self.read_int32, 'photo_big')
         params.dc_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_userProfilePhoto')
         return params
 
     def _tl_userProfilePhoto_layer97(self):
         constructor = 0xd559d8c8
-        params = Map()
+        params = self.new_params('_tl_userProfilePhoto_layer97')
         params.photo_id = self.read_int64
-        params.photo_small = self.file_location_deserialize(self.read_int32)
-        params.photo_big = self.file_location_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.photo_small = self.file_location_deserialize(self.read_int32, 'photo_small')
+        params.photo_big = self.file_location_deserialize(self.read_int32, 'photo_big')
+        self.instances.append('_tl_userProfilePhoto_layer97')
         return params
 
     def _tl_userProfilePhotoEmpty(self):
         constructor = 0x4f11bae1
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_userProfilePhotoEmpty')
+        self.instances.append('_tl_userProfilePhotoEmpty')
         return params
 
     def _tl_userProfilePhoto_old(self):
         constructor = 0x990d1493
-        params = Map()
-        params.photo_small = self.file_location_deserialize(self.read_int32)
-        params.photo_big = self.file_location_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def user_profile_photo_deserialize(self, constructor):
-        result = None
-        if constructor == 0xecd75d8c:
-            result = self._tl_userProfilePhoto()
-        elif constructor == 0x4f11bae1:
-            result = self._tl_userProfilePhotoEmpty()
-        elif constructor == 0xd559d8c8:
-            result = self._tl_userProfilePhoto_layer97()
-        elif constructor == 0x990d1493:
-            result = self._tl_userProfilePhoto_old()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params = self.new_params('_tl_userProfilePhoto_old')
+        params.photo_small = self.file_location_deserialize(self.read_int32, 'photo_small')
+        params.photo_big = self.file_location_deserialize(self.read_int32, 'photo_big')
+        self.instances.append('_tl_userProfilePhoto_old')
+        return params
+
+    def user_profile_photo_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.USER_PROFILE_PHOTO_PARSERS, constructor, field, projection)
 
     def _tl_userStatusOffline(self):
         constructor = 0x8c703f
-        params = Map()
+        params = self.new_params('_tl_userStatusOffline')
         params.expires = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_userStatusOffline')
         return params
 
     def _tl_userStatusRecently(self):
         constructor = 0xe26f42f1
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_userStatusRecently')
+        self.instances.append('_tl_userStatusRecently')
         return params
 
     def _tl_userStatusOnline(self):
         constructor = 0xedb93949
-        params = Map()
+        params = self.new_params('_tl_userStatusOnline')
         params.expires = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_userStatusOnline')
         return params
 
     def _tl_userStatusLastWeek(self):
         constructor = 0x7bf09fc
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_userStatusLastWeek')
+        self.instances.append('_tl_userStatusLastWeek')
         return params
 
     def _tl_userStatusEmpty(self):
         constructor = 0x9d05049
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_userStatusEmpty')
+        self.instances.append('_tl_userStatusEmpty')
         return params
 
     def _tl_userStatusLastMonth(self):
         constructor = 0x77ebc742
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def user_status_deserialize(self, constructor):
-        result = None
-        if constructor == 0x8c703f:
-            result = self._tl_userStatusOffline()
-        elif constructor == 0x7bf09fc:
-            result = self._tl_userStatusLastWeek()
-        elif constructor == 0x9d05049:
-            result = self._tl_userStatusEmpty()
-        elif constructor == 0x77ebc742:
-            result = self._tl_userStatusLastMonth()
-        elif constructor == 0xedb93949:
-            result = self._tl_userStatusOnline()
-        elif constructor == 0xe26f42f1:
-            result = self._tl_userStatusRecently()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params = self.new_params('_tl_userStatusLastMonth')
+        self.instances.append('_tl_userStatusLastMonth')
+        return params
+
+    def user_status_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.USER_STATUS_PARSERS, constructor, field, projection)
 
     def _tl_user_layer65(self):
-        params = Map()
+        params = self.new_params('_tl_user_layer65')
         flags = self.read_int32
         params.flags = flags
         params.self = (flags & 1024) != 0
@@ -3873,149 +4027,133 @@ class TeleData(object):
         if (flags & 16) != 0:
             params.phone = self.read_string
         if (flags & 32) != 0:
-            params.photo = self.user_profile_photo_deserialize(self.read_int32)
+            params.photo = self.user_profile_photo_deserialize(self.read_int32, 'photo')
         if (flags & 64) != 0:
-            params.status = self.user_status_deserialize(self.read_int32)
+            params.status = self.user_status_deserialize(self.read_int32, 'status')
         if (flags & 16384) != 0:
             params.bot_info_version = self.read_int32
         if (flags & 262144) != 0:
             params.restriction_reason = self.read_string
         if (flags & 524288) != 0:
             params.bot_inline_placeholder = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_user_layer65')
         return params
 
     def _tl_encryptedChat(self):
         constructor = 0xfa56ce36
-        params = Map()
+        params = self.new_params('_tl_encryptedChat')
         params.id = self.read_int32
         params.access_hash = self.read_int64
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.admin_id = self.read_int32
         params.participant_id = self.read_int32
         params.g_a_or_b = self.read_bytes
         params.key_fingerprint = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_encryptedChat')
         return params
 
     def _tl_encryptedChatRequested_old(self):
         constructor = 0xfda9a7b7
-        params = Map()
+        params = self.new_params('_tl_encryptedChatRequested_old')
         params.id = self.read_int32
         params.access_hash = self.read_int64
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.admin_id = self.read_int32
         params.participant_id = self.read_int32
         params.g_a = self.read_bytes
         params.nonce = self.read_bytes
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_encryptedChatRequested_old')
         return params
 
     def _tl_encryptedChatRequested(self):
         constructor = 0xc878527e
-        params = Map()
+        params = self.new_params('_tl_encryptedChatRequested')
         params.id = self.read_int32
         params.access_hash = self.read_int64
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.admin_id = self.read_int32
         params.participant_id = self.read_int32
         params.g_a = self.read_bytes
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_encryptedChatRequested')
         return params
 
     def _tl_encryptedChat_old(self):
         constructor = 0x6601d14f
-        params = Map()
+        params = self.new_params('_tl_encryptedChat_old')
         params.id = self.read_int32
         params.access_hash = self.read_int64
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.admin_id = self.read_int32
         params.participant_id = self.read_int32
         params.g_a_or_b = self.read_bytes
         params.nonce = self.read_bytes
         params.key_fingerprint = self.read_int64
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_encryptedChat_old')
         return params
 
     def _tl_encryptedChatEmpty(self):
         constructor = 0xab7ec0a0
-        params = Map()
+        params = self.new_params('_tl_encryptedChatEmpty')
         params.id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_encryptedChatEmpty')
         return params
 
     def _tl_encryptedChatWaiting(self):
         constructor = 0x3bf703dc
-        params = Map()
+        params = self.new_params('_tl_encryptedChatWaiting')
         params.id = self.read_int32
         params.access_hash = self.read_int64
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.admin_id = self.read_int32
         params.participant_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_encryptedChatWaiting')
         return params
 
     def _tl_encryptedChatDiscarded(self):
         constructor = 0x13d6dd27
-        params = Map()
+        params = self.new_params('_tl_encryptedChatDiscarded')
         params.id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def encrypted_chat_deserialize(self, constructor):
-        result = None
-        if constructor == 0xfda9a7b7:
-            result = self._tl_encryptedChatRequested_old()
-        elif constructor == 0xc878527e:
-            result = self._tl_encryptedChatRequested()
-        elif constructor == 0xfa56ce36:
-            result = self._tl_encryptedChat()
-        elif constructor == 0x6601d14f:
-            result = self._tl_encryptedChat_old()
-        elif constructor == 0xab7ec0a0:
-            result = self._tl_encryptedChatEmpty()
-        elif constructor == 0x3bf703dc:
-            result = self._tl_encryptedChatWaiting()
-        elif constructor == 0x13d6dd27:
-            result = self._tl_encryptedChatDiscarded()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_encryptedChatDiscarded')
+        return params
+
+    def encrypted_chat_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.ENCRYPTED_CHAT_PARSERS, constructor, field, projection)
 
     def _tl_userContact_old2(self):
         constructor = 0xcab35e18
-        params = Map()
+        params = self.new_params('_tl_userContact_old2')
         params.id = self.read_int32
         params.first_name = self.read_string
         params.last_name = self.read_string
         params.username = self.read_string
         params.access_hash = self.read_int64
         params.phone = self.read_string
-        params.photo = self.user_profile_photo_deserialize(self.read_int32)
-        params.status = self.user_status_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.photo = self.user_profile_photo_deserialize(self.read_int32, 'photo')
+        params.status = self.user_status_deserialize(self.read_int32, 'status')
+        self.instances.append('_tl_userContact_old2')
         return params
 
     def _tl_userContact_old(self):
         constructor = 0xf2fb8319
-        params = Map()
+        params = self.new_params('_tl_userContact_old')
         params.id = self.read_int32
         params.first_name = self.read_string
         params.last_name = self.read_string
         params.access_hash = self.read_int64
         params.phone = self.read_string
-        params.photo = self.user_profile_photo_deserialize(self.read_int32)
-        params.status = self.user_status_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.photo = self.user_profile_photo_deserialize(self.read_int32, 'photo')
+        params.status = self.user_status_deserialize(self.read_int32, 'status')
+        self.instances.append('_tl_userContact_old')
         return params
 
     def _tl_user(self):
         constructor = 0x2e13f4c3
-        params = Map()
+        params = self.new_params('_tl_user')
         flags = self.read_int32
         params.flags = flags
         params.self = (flags & 1024) != 0
@@ -4041,9 +4179,9 @@ class TeleData(object):
         if (flags & 16) != 0:
             params.phone = self.read_string
         if (flags & 32) != 0:
-            params.photo = self.user_profile_photo_deserialize(self.read_int32)
+            params.photo = self.user_profile_photo_deserialize(self.read_int32, 'photo')
         if (flags & 64) != 0:
-            params.status = self.user_status_deserialize(self.read_int32)
+            params.status = self.user_status_deserialize(self.read_int32, 'status')
         if (flags & 16384) != 0:
             params.bot_info_version = self.read_int32
         if (flags & 262144) != 0:
@@ -4052,115 +4190,115 @@ class TeleData(object):
             params.bot_inline_placeholder = self.read_string
         if (flags & 4194304) != 0:
             params.lang_code = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_user')
         return params
 
     def _tl_userSelf_old(self):
         constructor = 0x720535ec
-        params = Map()
+        params = self.new_params('_tl_userSelf_old')
         params.id = self.read_int32
         params.first_name = self.read_string
         params.last_name = self.read_string
         params.phone = self.read_string
-        params.photo = self.user_profile_photo_deserialize(self.read_int32)
-        params.status = self.user_status_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.photo = self.user_profile_photo_deserialize(self.read_int32, 'photo')
+        params.status = self.user_status_deserialize(self.read_int32, 'status')
+        self.instances.append('_tl_userSelf_old')
         return params
 
     def _tl_userSelf_old3(self):
         constructor = 0x1c60e608
-        params = Map()
+        params = self.new_params('_tl_userSelf_old3')
         params.id = self.read_int32
         params.first_name = self.read_string
         params.last_name = self.read_string
         params.username = self.read_string
         params.phone = self.read_string
-        params.photo = self.user_profile_photo_deserialize(self.read_int32)
-        params.status = self.user_status_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.photo = self.user_profile_photo_deserialize(self.read_int32, 'photo')
+        params.status = self.user_status_deserialize(self.read_int32, 'status')
+        self.instances.append('_tl_userSelf_old3')
         return params
 
     def _tl_userDeleted_old2(self):
         constructor = 0xd6016d7a
-        params = Map()
+        params = self.new_params('_tl_userDeleted_old2')
         params.id = self.read_int32
         params.first_name = self.read_string
         params.last_name = self.read_string
         params.username = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_userDeleted_old2')
         return params
 
     def _tl_userEmpty(self):
         constructor = 0x200250ba
-        params = Map()
+        params = self.new_params('_tl_userEmpty')
         params.id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_userEmpty')
         return params
 
     def _tl_userRequest_old(self):
         constructor = 0x22e8ceb0
-        params = Map()
+        params = self.new_params('_tl_userRequest_old')
         params.id = self.read_int32
         params.first_name = self.read_string
         params.last_name = self.read_string
         params.access_hash = self.read_int64
         params.phone = self.read_string
-        params.photo = self.user_profile_photo_deserialize(self.read_int32)
-        params.status = self.user_status_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.photo = self.user_profile_photo_deserialize(self.read_int32, 'photo')
+        params.status = self.user_status_deserialize(self.read_int32, 'status')
+        self.instances.append('_tl_userRequest_old')
         return params
 
     def _tl_userForeign_old(self):
         constructor = 0x5214c89d
-        params = Map()
+        params = self.new_params('_tl_userForeign_old')
         params.id = self.read_int32
         params.first_name = self.read_string
         params.last_name = self.read_string
         params.access_hash = self.read_int64
-        params.photo = self.user_profile_photo_deserialize(self.read_int32)
-        params.status = self.user_status_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.photo = self.user_profile_photo_deserialize(self.read_int32, 'photo')
+        params.status = self.user_status_deserialize(self.read_int32, 'status')
+        self.instances.append('_tl_userForeign_old')
         return params
 
     def _tl_userForeign_old2(self):
         constructor = 0x75cf7a8
-        params = Map()
+        params = self.new_params('_tl_userForeign_old2')
         params.id = self.read_int32
         params.first_name = self.read_string
         params.last_name = self.read_string
         params.username = self.read_string
         params.access_hash = self.read_int64
-        params.photo = self.user_profile_photo_deserialize(self.read_int32)
-        params.status = self.user_status_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.photo = self.user_profile_photo_deserialize(self.read_int32, 'photo')
+        params.status = self.user_status_deserialize(self.read_int32, 'status')
+        self.instances.append('_tl_userForeign_old2')
         return params
 
     def _tl_userRequest_old2(self):
         constructor = 0xd9ccc4ef
-        params = Map()
+        params = self.new_params('_tl_userRequest_old2')
         params.id = self.read_int32
         params.first_name = self.read_string
         params.last_name = self.read_string
         params.username = self.read_string
         params.access_hash = self.read_int64
         params.phone = self.read_string
-        params.photo = self.user_profile_photo_deserialize(self.read_int32)
-        params.status = self.user_status_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.photo = self.user_profile_photo_deserialize(self.read_int32, 'photo')
+        params.status = self.user_status_deserialize(self.read_int32, 'status')
+        self.instances.append('_tl_userRequest_old2')
         return params
 
     def _tl_userDeleted_old(self):
         constructor = 0xb29ad7cc
-        params = Map()
+        params = self.new_params('_tl_userDeleted_old')
         params.id = self.read_int32
         params.first_name = self.read_string
         params.last_name = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_userDeleted_old')
         return params
 
     def _tl_user_old(self):
         constructor = 0x22e49072
-        params = Map()
+        params = self.new_params('_tl_user_old')
         flags = self.read_int32
         params.flags = flags
         params.self = (flags & 1024) != 0
@@ -4184,76 +4322,44 @@ class TeleData(object):
         if (flags & 16) != 0:
             params.phone = self.read_string
         if (flags & 32) != 0:
-            params.photo = self.user_profile_photo_deserialize(self.read_int32)
+            params.photo = self.user_profile_photo_deserialize(self.read_int32, 'photo')
         if (flags & 64) != 0:
-            params.status = self.user_status_deserialize(self.read_int32)
+            params.status = self.user_status_deserialize(self.read_int32, 'status')
         if (flags & 16384) != 0:
             params.bot_info_version = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_user_old')
         return params
 
     def _tl_userSelf_old2(self):
         constructor = 0x7007b451
-        params = Map()
+        params = self.new_params('_tl_userSelf_old2')
         params.id = self.read_int32
         params.first_name = self.read_string
         params.last_name = self.read_string
         params.username = self.read_string
         params.phone = self.read_string
-        params.photo = self.user_profile_photo_deserialize(self.read_int32)
-        params.status = self.user_status_deserialize(self.read_int32)
+        params.photo = self.user_profile_photo_deserialize(self.read_int32, 'photo')
+        params.status = self.user_status_deserialize(self.read_int32, 'status')
         params.inactive = self.read_bool
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def user_deserialize(self, constructor):
-        result = None
-        if constructor == 0xcab35e18:
-            result = self._tl_userContact_old2()
-        elif constructor == 0xf2fb8319:
-            result = self._tl_userContact_old()
-        elif constructor == 0x2e13f4c3:
-            result = self._tl_user()
-        elif constructor == 0x720535ec:
-            result = self._tl_userSelf_old()
-        elif constructor == 0x1c60e608:
-            result = self._tl_userSelf_old3()
-        elif constructor == 0xd6016d7a:
-            result = self._tl_userDeleted_old2()
-        elif constructor == 0x200250ba:
-            result = self._tl_userEmpty()
-        elif constructor == 0x22e8ceb0:
-            result = self._tl_userRequest_old()
-        elif constructor == 0x5214c89d:
-            result = self._tl_userForeign_old()
-        elif constructor == 0x75cf7a8:
-            result = self._tl_userForeign_old2()
-        elif constructor == 0xd9ccc4ef:
-            result = self._tl_userRequest_old2()
-        elif constructor == 0xb29ad7cc:
-            result = self._tl_userDeleted_old()
-        elif constructor == 0xd10d979a:
-            result = self._tl_user_layer65()
-        elif constructor == 0x22e49072:
-            result = self._tl_user_old()
-        elif constructor == 0x7007b451:
-            result = self._tl_userSelf_old2()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_userSelf_old2')
+        return params
+
+    def user_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.USER_PARSERS, constructor, field, projection)
 
     def _tl_chatForbidden_old(self):
         constructor = 0xfb0ccc41
-        params = Map()
+        params = self.new_params('_tl_chatForbidden_old')
         params.id = self.read_int32
         params.title = self.read_string
         date = self.read_int32
-        params.date = self.time_from_ts(date)
-        self.instances.append(inspect.stack()[0][3])
+        params.date = self.convert_time(date)
+        self.instances.append('_tl_chatForbidden_old')
         return params
 
     def _tl_chat_old2(self):
         constructor = 0x7312bc48
-        params = Map()
+        params = self.new_params('_tl_chat_old2')
         flags = self.read_int32
         params.flags = flags
         params.creator = (flags & 1) != 0
@@ -4264,17 +4370,17 @@ class TeleData(object):
         params.deactivated = (flags & 32) != 0
         params.id = self.read_int32
         params.title = self.read_string
-        params.photo = self.chat_photo_deserialize(self.read_int32)
+        params.photo = self.chat_photo_deserialize(self.read_int32, 'photo')
         params.participants_count = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.version = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_chat_old2')
         return params
 
     def _tl_channelForbidden(self):
         constructor = 0x289da732
-        params = Map()
+        params = self.new_params('_tl_channelForbidden')
         flags = self.read_int32
         params.flags = flags
         params.broadcast = (flags & 32) != 0
@@ -4284,13 +4390,13 @@ class TeleData(object):
         params.title = self.read_string
         if (flags & 65536) != 0:
             until_date = self.read_int32
-            params.until_date = self.time_from_ts(until_date)
-        self.instances.append(inspect.stack()[0][3])
+            params.until_date = self.convert_time(until_date)
+        self.instances.append('_tl_channelForbidden')
         return params
 
     def _tl_channelForbidden_layer67(self):
         constructor = 0x8537784f
-        params = Map()
+        params = self.new_params('_tl_channelForbidden_layer67')
         flags = self.read_int32
         params.flags = flags
         params.broadcast = (flags & 32) != 0
@@ -4298,12 +4404,12 @@ class TeleData(object):
         params.id = self.read_int32
         params.access_hash = self.read_int64
         params.title = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channelForbidden_layer67')
         return params
 
     def _tl_channel_layer48(self):
         constructor = 0x4b1b7506
-        params = Map()
+        params = self.new_params('_tl_channel_layer48')
         flags = self.read_int32
         params.flags = flags
         params.creator = (flags & 1) != 0
@@ -4321,53 +4427,53 @@ class TeleData(object):
         params.title = self.read_string
         if (flags & 64) != 0:
             params.username = self.read_string
-            params.photo = self.chat_photo_deserialize(self.read_int32)
+            params.photo = self.chat_photo_deserialize(self.read_int32, 'photo')
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.version = self.read_int32
         if (flags & 512) != 0:
             params.restriction_reason = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channel_layer48')
         return params
 
     def _tl_geoChat(self):
         constructor = 0x75eaea5a
-        params = Map()
+        params = self.new_params('_tl_geoChat')
         params.id = self.read_int32
         params.access_hash = self.read_int64
         params.title = self.read_string
         params.address = self.read_string
         params.venue = self.read_string
-        params.geo = self.geo_point_deserialize(self.read_int32)
-        params.photo = self.chat_photo_deserialize(self.read_int32)
+        params.geo = self.geo_point_deserialize(self.read_int32, 'geo')
+        params.photo = self.chat_photo_deserialize(self.read_int32, 'photo')
         params.participants_count = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.checked_in = self.read_bool
         params.version = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_geoChat')
         return params
 
     def _tl_channelForbidden_layer52(self):
         constructor = 0x2d85832c
-        params = Map()
+        params = self.new_params('_tl_channelForbidden_layer52')
         params.id = self.read_int32
         params.access_hash = self.read_int64
         params.title = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channelForbidden_layer52')
         return params
 
     def _tl_chatForbidden(self):
         constructor = 0x7328bdb
-        params = Map()
+        params = self.new_params('_tl_chatForbidden')
         params.id = self.read_int32
         params.title = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_chatForbidden')
         return params
 
     def _tl_channel_layer67(self):
         constructor = 0xa14dca52
-        params = Map()
+        params = self.new_params('_tl_channel_layer67')
         flags = self.read_int32
         params.flags = flags
         params.creator = (flags & 1) != 0
@@ -4387,59 +4493,21 @@ class TeleData(object):
         params.title = self.read_string
         if (flags & 64) != 0:
             params.username = self.read_string
-        params.photo = self.chat_photo_deserialize(self.read_int32)
+        params.photo = self.chat_photo_deserialize(self.read_int32, 'photo')
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.version = self.read_int32
         if (flags & 512) != 0:
             params.restriction_reason = self.read_string
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def chat_deserialize(self, constructor):
-        result = None
-        if constructor == 0xfb0ccc41:
-            result = self._tl_chatForbidden_old()
-        elif constructor == 0x7312bc48:
-            result = self._tl_chat_old2()
-        elif constructor == 0x289da732:
-            result = self._tl_channelForbidden()
-        elif constructor == 0x8537784f:
-            result = self._tl_channelForbidden_layer67()
-        elif constructor == 0x4b1b7506:
-            result = self._tl_channel_layer48()
-        elif constructor == 0x75eaea5a:
-            result = self._tl_geoChat()
-        elif constructor == 0x2d85832c:
-            result = self._tl_channelForbidden_layer52()
-        elif constructor == 0x7328bdb:
-            result = self._tl_chatForbidden()
-        elif constructor == 0xa14dca52:
-            result = self._tl_channel_layer67()
-        elif constructor == 0x678e9587:
-            result = self._tl_channel_old()
-        elif constructor == 0x6e9c9bc7:
-            result = self._tl_chat_old()
-        elif constructor == 0x9ba2d800:
-            result = self._tl_chatEmpty()
-        elif constructor == 0xcb44b1c:
-            result = self._tl_channel_layer72()
-        elif constructor == 0xd91cdd54:
-            result = self._tl_chat_layer92()
-        elif constructor == 0x3bda1bde:
-            result = self._tl_chat()
-        elif constructor == 0x4df30834:
-            result = self._tl_channel()
-        elif constructor == 0x450b7115:
-            result = self._tl_channel_layer77()
-        elif constructor == 0xc88974ac:
-            result = self._tl_channel_layer92()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_channel_layer67')
+        return params
+
+    def chat_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.CHAT_PARSERS, constructor, field, projection)
 
     def _tl_message_secret(self):
         constructor = 0x555555fa
-        params = Map()
+        params = self.new_params('_tl_message_secret')
         flags = self.read_int32
         params.flags = flags
         params.unread = (flags & 1) != 0
@@ -4449,21 +4517,12 @@ class TeleData(object):
         params.id = self.read_int32
         params.ttl = self.read_int32
         params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
-        params.media = self.message_media_deserialize(self.read_int32)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        entities = list()
-        for i in range(0, count):
-            obj = self.message_entity_deserialize(self.read_int32)
-            if obj is None:
-                return
-            entities.append(obj)
-        params.entities = entities
+        params.media = self.message_media_deserialize(self.read_int32, 'media')
+        params.entities = self.read_vector(self.message_entity_deserialize, 'entities')
         if (flags & 2048) != 0:
             params.via_bot_name = self.read_string
         if (flags & 8) != 0:
@@ -4477,12 +4536,12 @@ class TeleData(object):
                              and len(params.message) != 0
                              and params.message.startswith("-1")):
             params.attachPath = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_message_secret')
         return params
 
     def _tl_message_secret_layer72(self):
         constructor = 0x555555f9
-        params = Map()
+        params = self.new_params('_tl_message_secret_layer72')
         flags = self.read_int32
         params.flags = flags
         params.unread = (flags & 1) != 0
@@ -4492,21 +4551,12 @@ class TeleData(object):
         params.id = self.read_int32
         params.ttl = self.read_int32
         params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
-        params.media = self.message_media_deserialize(self.read_int32)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        entities = list()
-        for i in range(0, count):
-            obj = self.message_entity_deserialize(self.read_int32)
-            if obj is None:
-                return
-            entities.append(obj)
-        params.entities = entities
+        params.media = self.message_media_deserialize(self.read_int32, 'media')
+        params.entities = self.read_vector(self.message_entity_deserialize, 'entities')
         if (flags & 2048) != 0:
             params.via_bot_name = self.read_string
         if (flags & 8) != 0:
@@ -4518,12 +4568,12 @@ class TeleData(object):
                              and len(params.message) != 0
                              and params.message.startswith("-1")):
             params.attachPath = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_message_secret_layer72')
         return params
 
     def _tl_message_layer72(self):
         constructor = 0x90dddc11
-        params = Map()
+        params = _lazy_parsed_map('_tl_message_layer72') if self.lazy else self.new_params('_tl_message_layer72')
         flags = self.read_int32
         params.flags = flags
         params.unread = (flags & 1) != 0
@@ -4536,43 +4586,40 @@ class TeleData(object):
         params.id = self.read_int32
         if (flags & 256) != 0:
             params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         if params.from_id == 0:
             if params.to_id.user_id != 0:
                 params.from_id = params.to_id.user_id
             else:
                 params.from_id = -params.to_id.channel_id
         if (flags & 4) != 0:
-            params.fwd_from = self.message_fwd_header_deserialize(self.read_int32)
+            params.fwd_from = self.message_fwd_header_deserialize(self.read_int32, 'fwd_from')
         if (flags & 2048) != 0:
             params.via_bot_id = self.read_int32
         if (flags & 8) != 0:
             params.reply_to_msg_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
+        if self.lazy:
+            params.defer(self.resume_at('_tl_message_layer72_tail', flags))
+            return params
+        return self._tl_message_layer72_tail(params, flags)
+
+    def _tl_message_layer72_tail(self, params, flags):
         if (flags & 512) != 0:
-            params.media = self.message_media_deserialize(self.read_int32)
+            params.media = self.message_media_deserialize(self.read_int32, 'media')
         else:
             params.media = self._tl_messageMediaEmpty()
         if (flags & 64) != 0:
-            params.reply_markup = self.reply_markup_deserialize(self.read_int32)
+            params.reply_markup = self.reply_markup_deserialize(self.read_int32, 'reply_markup')
         if (flags & 128) != 0:
-            magic = self.read_int32
-            assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-            count = self.read_int32
-            entities = list()
-            for i in range(0, count):
-                obj = self.message_entity_deserialize(self.read_int32)
-                if obj is None:
-                    return
-                entities.append(obj)
-            params.entities = entities
+            params.entities = self.read_vector(self.message_entity_deserialize, 'entities')
         if (flags & 1024) != 0:
             params.views = self.read_int32
         if (flags & 32768) != 0:
             edit_date = self.read_int32
-            params.edit_date = self.time_from_ts(edit_date)
+            params.edit_date = self.convert_time(edit_date)
         if (flags & 65536) != 0:
             params.author = self.read_string
         if params.id < 0 or (params.media is not None
@@ -4584,12 +4631,12 @@ class TeleData(object):
             params.attachPath = self.read_string
         if (flags & self.MESSAGE_FLAG_FWD) != 0 and params.id < 0:
             params.fwd_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_message_layer72')
         return params
 
     def _tl_message_layer68(self):
         constructor = 0xc09be45f
-        params = Map()
+        params = _lazy_parsed_map('_tl_message_layer68') if self.lazy else self.new_params('_tl_message_layer68')
         flags = self.read_int32
         params.flags = flags
         params.unread = (flags & 1) != 0
@@ -4602,43 +4649,40 @@ class TeleData(object):
         params.id = self.read_int32
         if (flags & 256) != 0:
             params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         if params.from_id == 0:
             if params.to_id.user_id != 0:
                 params.from_id = params.to_id.user_id
             else:
                 params.from_id = -params.to_id.channel_id
         if (flags & 4) != 0:
-            params.fwd_from = self.message_fwd_header_deserialize(self.read_int32)
+            params.fwd_from = self.message_fwd_header_deserialize(self.read_int32, 'fwd_from')
         if (flags & 2048) != 0:
             params.via_bot_id = self.read_int32
         if (flags & 8) != 0:
             params.reply_to_msg_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
+        if self.lazy:
+            params.defer(self.resume_at('_tl_message_layer68_tail', flags))
+            return params
+        return self._tl_message_layer68_tail(params, flags)
+
+    def _tl_message_layer68_tail(self, params, flags):
         if (flags & 512) != 0:
-            params.media = self.message_media_deserialize(self.read_int32)
+            params.media = self.message_media_deserialize(self.read_int32, 'media')
         else:
             params.media = self._tl_messageMediaEmpty()
         if (flags & 64) != 0:
-            params.reply_markup = self.reply_markup_deserialize(self.read_int32)
+            params.reply_markup = self.reply_markup_deserialize(self.read_int32, 'reply_markup')
         if (flags & 128) != 0:
-            magic = self.read_int32
-            assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-            count = self.read_int32
-            entities = list()
-            for i in range(0, count):
-                obj = self.message_entity_deserialize(self.read_int32)
-                if obj is None:
-                    return
-                entities.append(obj)
-            params.entities = entities
+            params.entities = self.read_vector(self.message_entity_deserialize, 'entities')
         if (flags & 1024) != 0:
             params.views = self.read_int32
         if (flags & 32768) != 0:
             edit_date = self.read_int32
-            params.edit_date = self.time_from_ts(edit_date)
+            params.edit_date = self.convert_time(edit_date)
         if params.id < 0 or (params.media is not None
                              and ('_tl_messageMediaEmpty' not in self.instances)
                              and ('_tl_messageMediaWebPage' not in self.instances)
@@ -4648,12 +4692,12 @@ class TeleData(object):
             params.attachPath = self.read_string
         if (flags & self.MESSAGE_FLAG_FWD) != 0 and params.id < 0:
             params.fwd_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_message_layer68')
         return params
 
     def _tl_messageService(self):
         constructor = 0x9e19a1f6
-        params = Map()
+        params = self.new_params('_tl_messageService')
         flags = self.read_int32
         params.flags = flags
         params.unread = (flags & 1) != 0
@@ -4665,18 +4709,18 @@ class TeleData(object):
         params.id = self.read_int32
         if (flags & 256) != 0:
             params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         if (flags & 8) != 0:
             params.reply_to_msg_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
-        params.action = self.message_action_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.date = self.convert_time(date)
+        params.action = self.message_action_deserialize(self.read_int32, 'action')
+        self.instances.append('_tl_messageService')
         return params
 
     def _tl_message_old5(self):
         constructor = 0xf07814c8
-        params = Map()
+        params = self.new_params('_tl_message_old5')
         flags = self.read_int32 | self.MESSAGE_FLAG_HAS_FROM_ID | self.MESSAGE_FLAG_HAS_MEDIA
         params.flags = flags
         params.unread = (flags & 1) != 0
@@ -4685,7 +4729,7 @@ class TeleData(object):
         params.media_unread = (flags & 32) != 0
         params.id = self.read_int32
         params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         if (flags & 4) != 0:
             params.fwd_from = self._tl_messageFwdHeader()
             params.fwd_from.from_id = self.read_int32
@@ -4694,22 +4738,13 @@ class TeleData(object):
         if (flags & 8) != 0:
             params.reply_to_msg_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
-        params.media = self.message_media_deserialize(self.read_int32)
+        params.media = self.message_media_deserialize(self.read_int32, 'media')
         if (flags & 64) != 0:
-            params.reply_markup = self.reply_markup_deserialize(self.read_int32)
+            params.reply_markup = self.reply_markup_deserialize(self.read_int32, 'reply_markup')
         if (flags & 128) != 0:
-            magic = self.read_int32
-            assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-            count = self.read_int32
-            entities = list()
-            for i in range(0, count):
-                obj = self.message_entity_deserialize(self.read_int32)
-                if obj is None:
-                    return
-                entities.append(obj)
-            params.entities = entities
+            params.entities = self.read_vector(self.message_entity_deserialize, 'entities')
         if params.id < 0 or (params.media is not None
                              and ('_tl_messageMediaEmpty' not in self.instances)
                              and ('_tl_messageMediaWebPage' not in self.instances)
@@ -4719,12 +4754,12 @@ class TeleData(object):
             params.attachPath = self.read_string
         if (flags & self.MESSAGE_FLAG_FWD) != 0 and params.id < 0:
             params.fwd_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_message_old5')
         return params
 
     def _tl_messageService_old2(self):
         constructor = 0x1d86f70e
-        params = Map()
+        params = self.new_params('_tl_messageService_old2')
         flags = self.read_int32
         params.unread = (flags & 1) != 0
         params.out = (flags & 2) != 0
@@ -4732,18 +4767,18 @@ class TeleData(object):
         params.media_unread = (flags & 32) != 0
         params.id = self.read_int32
         params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         date = self.read_int32
-        params.date = self.time_from_ts(date)
-        params.action = self.message_action_deserialize(self.read_int32)
+        params.date = self.convert_time(date)
+        params.action = self.message_action_deserialize(self.read_int32, 'action')
         flags |= self.MESSAGE_FLAG_HAS_FROM_ID
         params.flags = flags
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageService_old2')
         return params
 
     def _tl_message_old3(self):
         constructor = 0xa7ab1991
-        params = Map()
+        params = self.new_params('_tl_message_old3')
         flags = self.read_int32 | self.MESSAGE_FLAG_HAS_FROM_ID | self.MESSAGE_FLAG_HAS_MEDIA
         params.flags = flags
         params.unread = (flags & 1) != 0
@@ -4752,7 +4787,7 @@ class TeleData(object):
         params.media_unread = (flags & 32) != 0
         params.id = self.read_int32
         params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         if (flags & 4) != 0:
             params.fwd_from = self._tl_messageFwdHeader()
             params.fwd_from.from_id = self.read_int32
@@ -4761,9 +4796,9 @@ class TeleData(object):
         if (flags & 8) != 0:
             params.reply_to_msg_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
-        params.media = self.message_media_deserialize(self.read_int32)
+        params.media = self.message_media_deserialize(self.read_int32, 'media')
         if params.id < 0 or (params.media is not None
                              and ('_tl_messageMediaEmpty' not in self.instances)
                              and ('_tl_messageMediaWebPage' not in self.instances)
@@ -4773,12 +4808,12 @@ class TeleData(object):
             params.attachPath = self.read_string
         if (flags & self.MESSAGE_FLAG_FWD) != 0 and params.id < 0:
             params.fwd_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_message_old3')
         return params
 
     def _tl_message_old4(self):
         constructor = 0xc3060325
-        params = Map()
+        params = self.new_params('_tl_message_old4')
         flags = self.read_int32 | self.MESSAGE_FLAG_HAS_FROM_ID | self.MESSAGE_FLAG_HAS_MEDIA
         params.flags = flags
         params.unread = (flags & 1) != 0
@@ -4787,7 +4822,7 @@ class TeleData(object):
         params.media_unread = (flags & 32) != 0
         params.id = self.read_int32
         params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         if (flags & 4) != 0:
             params.fwd_from = self._tl_messageFwdHeader()
             params.fwd_from.from_id = self.read_int32
@@ -4796,11 +4831,11 @@ class TeleData(object):
         if (flags & 8) != 0:
             params.reply_to_msg_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
-        params.media = self.message_media_deserialize(self.read_int32)
+        params.media = self.message_media_deserialize(self.read_int32, 'media')
         if (flags & 64) != 0:
-            params.reply_markup = self.reply_markup_deserialize(self.read_int32)
+            params.reply_markup = self.reply_markup_deserialize(self.read_int32, 'reply_markup')
         if params.id < 0 or (params.media is not None
                              and ('_tl_messageMediaEmpty' not in self.instances)
                              and ('_tl_messageMediaWebPage' not in self.instances)
@@ -4810,12 +4845,12 @@ class TeleData(object):
             params.attachPath = self.read_string
         if (flags & self.MESSAGE_FLAG_FWD) != 0 and params.id < 0:
             params.fwd_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_message_old4')
         return params
 
     def _tl_message_layer47(self):
         constructor = 0xc992e15c
-        params = Map()
+        params = self.new_params('_tl_message_layer47')
         flags = self.read_int32
         params.flags = flags
         params.unread = (flags & 1) != 0
@@ -4825,7 +4860,7 @@ class TeleData(object):
         params.id = self.read_int32
         if (flags & 256) != 0:
             params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         if params.from_id == 0:
             if params.to_id.user_id != 0:
                 params.from_id = params.to_id.user_id
@@ -4833,7 +4868,7 @@ class TeleData(object):
                 params.from_id = -params.to_id.channel_id
         if (flags & 4) != 0:
             params.fwd_from = self._tl_messageFwdHeader()
-            params.peer = self.peer_deserialize(self.read_int32)
+            params.peer = self.peer_deserialize(self.read_int32, 'peer')
             if '_tl_peerChannel' in self.instances:
                 params.fwd_from.channel_id = params.peer.channel_id
                 params.fwd_from.flags |= 2
@@ -4846,25 +4881,16 @@ class TeleData(object):
         if (flags & 8) != 0:
             params.reply_to_msg_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
         if (flags & 512) != 0:
-            params.media = self.message_media_deserialize(self.read_int32)
+            params.media = self.message_media_deserialize(self.read_int32, 'media')
         else:
             params.media = self._tl_messageMediaEmpty()
         if (flags & 64) != 0:
-            params.reply_markup = self.reply_markup_deserialize(self.read_int32)
+            params.reply_markup = self.reply_markup_deserialize(self.read_int32, 'reply_markup')
         if (flags & 128) != 0:
-            magic = self.read_int32
-            assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-            count = self.read_int32
-            entities = list()
-            for i in range(0, count):
-                obj = self.message_entity_deserialize(self.read_int32)
-                if obj is None:
-                    return
-                entities.append(obj)
-            params.entities = entities
+            params.entities = self.read_vector(self.message_entity_deserialize, 'entities')
         if (flags & 1024) != 0:
             params.views = self.read_int32
         if params.id < 0 or (params.media is not None
@@ -4876,12 +4902,12 @@ class TeleData(object):
             params.attachPath = self.read_string
         if (flags & self.MESSAGE_FLAG_FWD) != 0 and params.id < 0:
             params.fwd_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_message_layer47')
         return params
 
     def _tl_message_old7(self):
         constructor = 0x5ba66c13
-        params = Map()
+        params = self.new_params('_tl_message_old7')
         flags = self.read_int32
         params.flags = flags
         params.unread = (flags & 1) != 0
@@ -4891,7 +4917,7 @@ class TeleData(object):
         params.id = self.read_int32
         if (flags & 256) != 0:
             params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         if params.from_id == 0:
             if params.to_id.user_id != 0:
                 params.from_id = params.to_id.user_id
@@ -4899,7 +4925,7 @@ class TeleData(object):
                 params.from_id = -params.to_id.channel_id
         if (flags & 4) != 0:
             params.fwd_from = self._tl_messageFwdHeader()
-            params.peer = self.peer_deserialize(self.read_int32)
+            params.peer = self.peer_deserialize(self.read_int32, 'peer')
             if '_tl_peerChannel' in self.instances:
                 params.fwd_from.channel_id = params.peer.channel_id
                 params.fwd_from.flags |= 2
@@ -4910,25 +4936,16 @@ class TeleData(object):
         if (flags & 8) != 0:
             params.reply_to_msg_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
         if (flags & 512) != 0:
-            params.media = self.message_media_deserialize(self.read_int32)
+            params.media = self.message_media_deserialize(self.read_int32, 'media')
         else:
             params.media = self._tl_messageMediaEmpty()
         if (flags & 64) != 0:
-            params.reply_markup = self.reply_markup_deserialize(self.read_int32)
+            params.reply_markup = self.reply_markup_deserialize(self.read_int32, 'reply_markup')
         if (flags & 128) != 0:
-            magic = self.read_int32
-            assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-            count = self.read_int32
-            entities = list()
-            for i in range(0, count):
-                obj = self.message_entity_deserialize(self.read_int32)
-                if obj is None:
-                    return
-                entities.append(obj)
-            params.entities = entities
+            params.entities = self.read_vector(self.message_entity_deserialize, 'entities')
         if (flags & 1024) != 0:
             params.views = self.read_int32
         if params.id < 0 or (params.media is not None
@@ -4940,12 +4957,12 @@ class TeleData(object):
             params.attachPath = self.read_string
         if (flags & self.MESSAGE_FLAG_FWD) != 0 and params.id < 0:
             params.fwd_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_message_old7')
         return params
 
     def _tl_messageService_layer48(self):
         constructor = 0xc06b9607
-        params = Map()
+        params = self.new_params('_tl_messageService_layer48')
         flags = self.read_int32
         params.flags = flags
         params.unread = (flags & 1) != 0
@@ -4957,29 +4974,29 @@ class TeleData(object):
         params.id = self.read_int32
         if (flags & 256) != 0:
             params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         if params.from_id == 0:
             if params.to_id.user_id != 0:
                 params.from_id = params.to_id.user_id
             else:
                 params.from_id = -params.to_id.channel_id
         date = self.read_int32
-        params.date = self.time_from_ts(date)
-        params.action = self.message_action_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.date = self.convert_time(date)
+        params.action = self.message_action_deserialize(self.read_int32, 'action')
+        self.instances.append('_tl_messageService_layer48')
         return params
 
     def _tl_messageEmpty(self):
         constructor = 0x83e5de54
-        params = Map()
+        params = self.new_params('_tl_messageEmpty')
         params.id = self.read_int32
         params.to_id = self._tl_peerUser()
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageEmpty')
         return params
 
     def _tl_message_old6(self):
         constructor = 0x2bebfa86
-        params = Map()
+        params = self.new_params('_tl_message_old6')
         flags = self.read_int32 | self.MESSAGE_FLAG_HAS_FROM_ID
         params.flags = flags
         params.unread = (flags & 1) != 0
@@ -4988,7 +5005,7 @@ class TeleData(object):
         params.media_unread = (flags & 32) != 0
         params.id = self.read_int32
         params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         if (flags & 4) != 0:
             params.fwd_from = self._tl_messageFwdHeader()
             params.fwd_from.from_id = self.read_int32
@@ -4997,25 +5014,16 @@ class TeleData(object):
         if (flags & 8) != 0:
             params.reply_to_msg_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
         if (flags & 512) != 0:
-            params.media = self.message_media_deserialize(self.read_int32)
+            params.media = self.message_media_deserialize(self.read_int32, 'media')
         else:
             params.media = self._tl_messageMediaEmpty()
         if (flags & 64) != 0:
-            params.reply_markup = self.reply_markup_deserialize(self.read_int32)
+            params.reply_markup = self.reply_markup_deserialize(self.read_int32, 'reply_markup')
         if (flags & 128) != 0:
-            magic = self.read_int32
-            assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-            count = self.read_int32
-            entities = list()
-            for i in range(0, count):
-                obj = self.message_entity_deserialize(self.read_int32)
-                if obj is None:
-                    return
-                entities.append(obj)
-            params.entities = entities
+            params.entities = self.read_vector(self.message_entity_deserialize, 'entities')
         if params.id < 0 or (params.media is not None
                              and ('_tl_messageMediaEmpty' not in self.instances)
                              and ('_tl_messageMediaWebPage' not in self.instances)
@@ -5025,12 +5033,12 @@ class TeleData(object):
             params.attachPath = self.read_string
         if (flags & self.MESSAGE_FLAG_FWD) != 0 and params.id < 0:
             params.fwd_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_message_old6')
         return params
 
     def _tl_messageForwarded_old2(self):
         constructor = 0xa367e716
-        params = Map()
+        params = self.new_params('_tl_messageForwarded_old2')
         flags = self.read_int32
         params.unread = (flags & 1) != 0
         params.out = (flags & 2) != 0
@@ -5042,13 +5050,13 @@ class TeleData(object):
         params.fwd_from.flags |= 1
         params.fwd_from.date = self.read_int32
         params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
         flags |= self.MESSAGE_FLAG_FWD | self.MESSAGE_FLAG_HAS_FROM_ID | self.MESSAGE_FLAG_HAS_MEDIA
         params.flags = flags
-        params.media = self.message_media_deserialize(self.read_int32)
+        params.media = self.message_media_deserialize(self.read_int32, 'media')
         if params.id < 0:
             params.fwd_msg_id = self.read_int32
         if params.id < 0 or (params.media is not None
@@ -5058,12 +5066,12 @@ class TeleData(object):
                              and len(params.message) != 0
                              and params.message.startswith("-1")):
             params.attachPath = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageForwarded_old2')
         return params
 
     def _tl_messageForwarded_old(self):  # FIXME May be .flags is wrong: self.read_int32 -> None
         constructor = 0x5f46804
-        params = Map()
+        params = self.new_params('_tl_messageForwarded_old')
         flags = self.read_int32
         params.id = self.read_int32
         params.fwd_from = self._tl_messageFwdHeader()
@@ -5071,15 +5079,15 @@ class TeleData(object):
         params.fwd_from.flags |= 1
         params.fwd_from.date = self.read_int32
         params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         params.out = self.read_bool
         params.unread = self.read_bool
         flags |= self.MESSAGE_FLAG_FWD | self.MESSAGE_FLAG_HAS_FROM_ID | self.MESSAGE_FLAG_HAS_MEDIA
         params.flags = flags
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
-        params.media = self.message_media_deserialize(self.read_int32)
+        params.media = self.message_media_deserialize(self.read_int32, 'media')
         if params.id < 0:
             params.fwd_msg_id = self.read_int32
         if params.id < 0 or (params.media is not None
@@ -5089,12 +5097,12 @@ class TeleData(object):
                              and len(params.message) != 0
                              and params.message.startswith("-1")):
             params.attachPath = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_messageForwarded_old')
         return params
 
     def _tl_message_old2(self):
         constructor = 0x567699b3
-        params = Map()
+        params = self.new_params('_tl_message_old2')
         flags = self.read_int32 | self.MESSAGE_FLAG_HAS_FROM_ID | self.MESSAGE_FLAG_HAS_MEDIA
         params.flags = flags
         params.unread = (flags & 1) != 0
@@ -5103,11 +5111,11 @@ class TeleData(object):
         params.media_unread = (flags & 32) != 0
         params.id = self.read_int32
         params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
-        params.media = self.message_media_deserialize(self.read_int32)
+        params.media = self.message_media_deserialize(self.read_int32, 'media')
         if params.id < 0 or (params.media is not None
                              and ('_tl_messageMediaEmpty' not in self.instances)
                              and ('_tl_messageMediaWebPage' not in self.instances)
@@ -5115,41 +5123,41 @@ class TeleData(object):
                              and len(params.message) != 0
                              and params.message.startswith("-1")):
             params.attachPath = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_message_old2')
         return params
 
     def _tl_messageService_old(self):  # FIXME May be .flags is wrong: self.read_int32 -> None
         constructor = 0x9f8d60bb
-        params = Map()
+        params = self.new_params('_tl_messageService_old')
         flags = self.read_int32
         params.id = self.read_int32
         params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         params.out = self.read_bool
         params.unread = self.read_bool
         flags |= self.MESSAGE_FLAG_HAS_FROM_ID
         params.flags = flags
         date = self.read_int32
-        params.date = self.time_from_ts(date)
-        params.action = self.message_action_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+        params.date = self.convert_time(date)
+        params.action = self.message_action_deserialize(self.read_int32, 'action')
+        self.instances.append('_tl_messageService_old')
         return params
 
     def _tl_message_old(self):  # FIXME May be .flags is wrong: self.read_int32 -> None
         constructor = 0x22eb6aba
-        params = Map()
+        params = self.new_params('_tl_message_old')
         flags = self.read_int32
         params.id = self.read_int32
         params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         params.out = self.read_bool
         params.unread = self.read_bool
         flags |= self.MESSAGE_FLAG_HAS_FROM_ID | self.MESSAGE_FLAG_HAS_MEDIA
         params.flags = flags
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
-        params.media = self.message_media_deserialize(self.read_int32)
+        params.media = self.message_media_deserialize(self.read_int32, 'media')
         if params.id < 0 or (params.media is not None
                              and ('_tl_messageMediaEmpty' not in self.instances)
                              and ('_tl_messageMediaWebPage' not in self.instances)
@@ -5157,12 +5165,12 @@ class TeleData(object):
                              and len(params.message) != 0
                              and params.message.startswith("-1")):
             params.attachPath = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_message_old')
         return params
 
     def _tl_message(self):
         constructor = 0x44f9b43d
-        params = Map()
+        params = _lazy_parsed_map('_tl_message') if self.lazy else self.new_params('_tl_message')
         flags = self.read_int32
         params.flags = flags
         params.out = (flags & 2) != 0
@@ -5173,38 +5181,35 @@ class TeleData(object):
         params.id = self.read_int32
         if (flags & 256) != 0:
             params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         if (flags & 4) != 0:
-            params.fwd_from = self.message_fwd_header_deserialize(self.read_int32)
+            params.fwd_from = self.message_fwd_header_deserialize(self.read_int32, 'fwd_from')
         if (flags & 2048) != 0:
             params.via_bot_id = self.read_int32
         if (flags & 8) != 0:
             params.reply_to_msg_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
+        if self.lazy:
+            params.defer(self.resume_at('_tl_message_tail', flags))
+            return params
+        return self._tl_message_tail(params, flags)
+
+    def _tl_message_tail(self, params, flags):
         if (flags & 512) != 0:
-            params.media = self.message_media_deserialize(self.read_int32)
+            params.media = self.message_media_deserialize(self.read_int32, 'media')
             if params.media:
                 ttl = params.media.ttl_seconds
         if (flags & 64) != 0:
-            params.reply_markup = self.reply_markup_deserialize(self.read_int32)
+            params.reply_markup = self.reply_markup_deserialize(self.read_int32, 'reply_markup')
         if (flags & 128) != 0:
-            magic = self.read_int32
-            assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-            count = self.read_int32
-            entities = list()
-            for i in range(0, count):
-                obj = self.message_entity_deserialize(self.read_int32)
-                if obj is None:
-                    return
-                entities.append(obj)
-            params.entities = entities
+            params.entities = self.read_vector(self.message_entity_deserialize, 'entities')
         if (flags & 1024) != 0:
             params.views = self.read_int32
         if (flags & 32768) != 0:
             edit_date = self.read_int32
-            params.edit_date = self.time_from_ts(edit_date)
+            params.edit_date = self.convert_time(edit_date)
         if (flags & 65536) != 0:
             params.author = self.read_string
         if (flags & 131072) != 0:
@@ -5218,12 +5223,12 @@ class TeleData(object):
             params.attachPath = self.read_string
         if (flags & self.MESSAGE_FLAG_FWD) != 0 and params.id < 0:
             params.fwd_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_message')
         return params
 
     def _tl_message_secret_old(self):
         constructor = 0x555555F8
-        params = Map()
+        params = self.new_params('_tl_message_secret_old')
         flags = self.read_int32 | self.MESSAGE_FLAG_HAS_FROM_ID | self.MESSAGE_FLAG_HAS_MEDIA
         params.flags = flags
         params.unread = (flags & 1) != 0
@@ -5233,11 +5238,11 @@ class TeleData(object):
         params.id = self.read_int32
         params.ttl = self.read_int32
         params.from_id = self.read_int32
-        params.to_id = self.peer_deserialize(self.read_int32)
+        params.to_id = self.peer_deserialize(self.read_int32, 'to_id')
         date = self.read_int32
-        params.date = self.time_from_ts(date)
+        params.date = self.convert_time(date)
         params.message = self.read_string
-        params.media = self.message_media_deserialize(self.read_int32)
+        params.media = self.message_media_deserialize(self.read_int32, 'media')
         if params.id < 0 or (params.media is not None
                              and ('_tl_messageMediaEmpty' not in self.instances)
                              and ('_tl_messageMediaWebPage' not in self.instances)
@@ -5245,256 +5250,149 @@ class TeleData(object):
                              and len(params.message) != 0
                              and params.message.startswith("-1")):
             params.attachPath = self.read_string
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def message_deserialize(self, constructor):
-        result = None
-        if constructor == 0x1d86f70e:
-            result = self._tl_messageService_old2()
-        elif constructor == 0xa7ab1991:
-            result = self._tl_message_old3()
-        elif constructor == 0xc3060325:
-            result = self._tl_message_old4()
-        elif constructor == 0x555555fa:
-            result = self._tl_message_secret()
-        elif constructor == 0x555555f9:
-            result = self._tl_message_secret_layer72()
-        elif constructor == 0x90dddc11:
-            result = self._tl_message_layer72()
-        elif constructor == 0xc09be45f:
-            result = self._tl_message_layer68()
-        elif constructor == 0xc992e15c:
-            result = self._tl_message_layer47()
-        elif constructor == 0x5ba66c13:
-            result = self._tl_message_old7()
-        elif constructor == 0xc06b9607:
-            result = self._tl_messageService_layer48()
-        elif constructor == 0x83e5de54:
-            result = self._tl_messageEmpty()
-        elif constructor == 0x2bebfa86:
-            result = self._tl_message_old6()
-        elif constructor == 0x44f9b43d:
-            result = self._tl_message()
-        elif constructor == 0xa367e716:
-            result = self._tl_messageForwarded_old2()
-        elif constructor == 0x5f46804:
-            result = self._tl_messageForwarded_old()
-        elif constructor == 0x567699b3:
-            result = self._tl_message_old2()
-        elif constructor == 0x9f8d60bb:
-            result = self._tl_messageService_old()
-        elif constructor == 0x22eb6aba:
-            result = self._tl_message_old()
-        elif constructor == 0x555555F8:
-            result = self._tl_message_secret_old()
-        elif constructor == 0x9e19a1f6:
-            result = self._tl_messageService()
-        elif constructor == 0xf07814c8:
-            result = self._tl_message_old5()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_message_secret_old')
+        return params
+
+    def message_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.MESSAGE_PARSERS, constructor, field, projection)
 
     def _tl_botInfoEmpty_layer48(self):
         constructor = 0xbb2e37ce
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_botInfoEmpty_layer48')
+        self.instances.append('_tl_botInfoEmpty_layer48')
         return params
 
     def _tl_botCommand(self):
         constructor = 0xc27ac8c7
-        params = Map()
+        params = self.new_params('_tl_botCommand')
         command = self.read_string
         description = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_botCommand')
         return params
 
-    def bot_command_deserialize(self, constructor):
-        assert (constructor == 0xc27ac8c7), "{} asseratation".format(inspect.stack()[0][3])
-        result = self._tl_botCommand()
-        self.instances.append(inspect.stack()[0][3])
+    def bot_command_deserialize(self, constructor, field=None, projection=None):
+        result = self._dispatch(self.BOT_COMMAND_PARSERS, constructor, field, projection)
+        self.instances.append('bot_command_deserialize')
         return result
 
     def _tl_botInfo(self):
         constructor = 0x98e81d3a
-        params = Map()
+        params = self.new_params('_tl_botInfo')
         params.user_id = self.read_int32
         params.description = self.read_string
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        commands = list()
-        for i in range(0, count):
-            obj = self.bot_command_deserialize(self.read_int32)
-            if obj is None:
-                return
-            commands.append(obj)
-        params.commands = commands
-        self.instances.append(inspect.stack()[0][3])
+        params.commands = self.read_vector(self.bot_command_deserialize, 'commands')
+        self.instances.append('_tl_botInfo')
         return params
 
     def _tl_botInfo_layer48(self):
         constructor = 0x9cf585d
-        params = Map()
+        params = self.new_params('_tl_botInfo_layer48')
         params.user_id = self.read_int32
         params.version = self.read_int32
         params.myvar = self.read_string
         params.description = self.read_string
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        commands = list()
-        for i in range(0, count):
-            obj = self.bot_command_deserialize(self.read_int32)
-            if obj is None:
-                return
-            commands.append(obj)
-        params.commands = commands
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def bot_info_deserialize(self, constructor):
-        result = None
-        if constructor == 0xbb2e37ce:
-            result = self._tl_botInfoEmpty_layer48()
-        elif constructor == 0x98e81d3a:
-            result = self. _tl_botInfo()
-        elif constructor == 0x9cf585d:
-            result = self._tl_botInfo_layer48()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params.commands = self.read_vector(self.bot_command_deserialize, 'commands')
+        self.instances.append('_tl_botInfo_layer48')
+        return params
+
+    def bot_info_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.BOT_INFO_PARSERS, constructor, field, projection)
 
     def _tl_chatParticipantCreator(self):
         constructor = 0xda13538a
-        params = Map()
+        params = self.new_params('_tl_chatParticipantCreator')
         params.user_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_chatParticipantCreator')
         return params
 
     def _tl_chatParticipant(self):
         constructor = 0xc8d7493e
-        params = Map()
+        params = self.new_params('_tl_chatParticipant')
         params.user_id = self.read_int32
         params.inviter_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
-        self.instances.append(inspect.stack()[0][3])
+        params.date = self.convert_time(date)
+        self.instances.append('_tl_chatParticipant')
         return params
 
     def _tl_chatParticipantAdmin(self):
         constructor = 0xe2d6e436
-        params = Map()
+        params = self.new_params('_tl_chatParticipantAdmin')
         params.user_id = self.read_int32
         params.inviter_id = self.read_int32
         date = self.read_int32
-        params.date = self.time_from_ts(date)
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def chat_participant_deserialize(self, constructor):
-        result = None
-        if constructor == 0xc8d7493e:
-            result = self._tl_chatParticipant()
-        elif constructor == 0xda13538a:
-            result = self._tl_chatParticipantCreator()
-        elif constructor == 0xe2d6e436:
-            result = self._tl_chatParticipantAdmin()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params.date = self.convert_time(date)
+        self.instances.append('_tl_chatParticipantAdmin')
+        return params
+
+    def chat_participant_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.CHAT_PARTICIPANT_PARSERS, constructor, field, projection)
 
     def _tl_chatParticipantsForbidden(self):
         constructor = 0xfc900c2b
-        params = Map()
+        params = self.new_params('_tl_chatParticipantsForbidden')
         flags = self.read_int32
         params.flags = flags
         params.chat_id = self.read_int32
         if (flags & 1) != 0:
-            params.self_participant = self.chat_participant_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+            params.self_participant = self.chat_participant_deserialize(self.read_int32, 'self_participant')
+        self.instances.append('_tl_chatParticipantsForbidden')
         return params
 
     def _tl_chatParticipants(self):
         constructor = 0x3f460fed
-        params = Map()
+        params = self.new_params('_tl_chatParticipants')
         params.chat_id = self.read_int32
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        participants = list()
-        for i in range(0, count):
-            obj = self.chat_participant_deserialize(self.read_int32)
-            if obj is None:
-                return
-            participants.append(obj)
-        params.participants = participants
+        params.participants = self.read_vector(self.chat_participant_deserialize, 'participants')
         params.version = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_chatParticipants')
         return params
 
     def _tl_chatParticipants_old(self):
         constructor = 0x7841b415
-        params = Map()
+        params = self.new_params('_tl_chatParticipants_old')
         params.chat_id = self.read_int32
         params.admin_id = self.read_int32
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        participants = list()
-        for i in range(0, count):
-            obj = self.chat_participant_deserialize(self.read_int32)
-            if obj is None:
-                return
-            participants.append(obj)
-        params.participants = participants
+        params.participants = self.read_vector(self.chat_participant_deserialize, 'participants')
         params.version = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_chatParticipants_old')
         return params
 
     def _tl_chatParticipantsForbidden_old(self):
         constructor = 0xfd2bb8a
-        params = Map()
+        params = self.new_params('_tl_chatParticipantsForbidden_old')
         params.chat_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def chat_participants_deserialize(self, constructor):
-        result = None
-        if constructor == 0xfc900c2b:
-            result = self._tl_chatParticipantsForbidden()
-        elif constructor == 0x3f460fed:
-            result = self._tl_chatParticipants()
-        elif constructor == 0x7841b415:
-            result = self._tl_chatParticipants_old()
-        elif constructor == 0xfd2bb8a:
-            result = self._tl_chatParticipantsForbidden_old()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        self.instances.append('_tl_chatParticipantsForbidden_old')
+        return params
+
+    def chat_participants_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.CHAT_PARTICIPANTS_PARSERS, constructor, field, projection)
 
     def _tl_peerNotifySettings_layer77(self):
         constructor = 0x9acda4c0
-        params = Map()
+        params = self.new_params('_tl_peerNotifySettings_layer77')
         flags = self.read_int32
         params.flags = flags
         params.show_previews = (flags & 1) != 0
         params.silent = (flags & 2) != 0
         params.mute_until = self.read_int32
         params.sound = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_peerNotifySettings_layer77')
         return params
 
     def _tl_peerNotifySettings_layer47(self):
         constructor = 0x8d5e11ee
-        params = Map()
+        params = self.new_params('_tl_peerNotifySettings_layer47')
         params.mute_until = self.read_int32
         params.sound = self.read_string
         params.show_previews = self.read_bool
         params.events_mask = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_peerNotifySettings_layer47')
         return params
 
     def _tl_peerNotifySettings(self):
         constructor = 0xaf509d20
-        params = Map()
+        params = self.new_params('_tl_peerNotifySettings')
         flags = self.read_int32
         params.flags = flags
         if (flags & 1) != 0:
@@ -5505,63 +5403,47 @@ class TeleData(object):
             mute_until = self.read_int32
         if (flags & 8) != 0:
             sound = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_peerNotifySettings')
         return params
 
     def _tl_peerNotifySettingsEmpty(self):
         constructor = 0x70a68512
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def peer_notify_settings_deserialize(self, constructor):
-        result = None
-        if constructor == 0x9acda4c0:
-            result = self._tl_peerNotifySettings_layer77()
-        elif constructor == 0xaf509d20:
-            result = self._tl_peerNotifySettings()
-        elif constructor == 0x8d5e11ee:
-            result = self._tl_peerNotifySettings_layer47()
-        elif constructor == 0x70a68512:
-            result = self._tl_peerNotifySettingsEmpty()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params = self.new_params('_tl_peerNotifySettingsEmpty')
+        self.instances.append('_tl_peerNotifySettingsEmpty')
+        return params
+
+    def peer_notify_settings_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.PEER_NOTIFY_SETTINGS_PARSERS, constructor, field, projection)
 
     def _tl_chatInviteEmpty(self):
         constructor = 0x69df3769
-        params = Map()
-        self.instances.append(inspect.stack()[0][3])
+        params = self.new_params('_tl_chatInviteEmpty')
+        self.instances.append('_tl_chatInviteEmpty')
         return params
 
     def _tl_chatInviteExported(self):
         constructor = 0xfc2e05bc
-        params = Map()
+        params = self.new_params('_tl_chatInviteExported')
         params.link = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_chatInviteExported')
         return params
 
-    def exported_chat_invite_deserialize(self, constructor):
-        result = None
-        if constructor == 0xfc2e05bc:
-            result = self._tl_chatInviteExported()
-        elif constructor == 0x69df3769:
-            result = self._tl_chatInviteEmpty()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+    def exported_chat_invite_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.EXPORTED_CHAT_INVITE_PARSERS, constructor, field, projection)
 
     def _tl_stickerSet_old(self):
         constructor = 0xa7a43b17
-        params = Map()
+        params = self.new_params('_tl_stickerSet_old')
         params.id = self.read_int64
         params.access_hash = self.read_int64
         params.title = self.read_string
         params.short_name = self.read_string
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_stickerSet_old')
         return params
 
     def _tl_stickerSet(self):
         constructor = 0xcd303b41
-        params = Map()
+        params = self.new_params('_tl_stickerSet')
         flags = self.read_int32
         params.flags = flags
         params.installed = (flags & 1) != 0
@@ -5574,73 +5456,49 @@ class TeleData(object):
         params.short_name = self.read_string
         params.count = self.read_int32
         params.hash = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_stickerSet')
         return params
 
-    def sticker_set_deserialize(self, constructor):
-        result = None
-        if constructor == 0xa7a43b17:
-            result = self._tl_stickerSet_old()
-        elif constructor == 0xcd303b41:
-            result = self._tl_stickerSet()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+    def sticker_set_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.STICKER_SET_PARSERS, constructor, field, projection)
 
     def _tl_chatFull(self):
         constructor = 0x1b7c9db3
-        params = Map()
+        params = self.new_params('_tl_chatFull')
         flags = self.read_int32
         params.flags = flags
         params.can_set_username = (flags & 128) != 0
         params.id = self.read_int32
         params.about = self.read_string
-        params.participants = self.chat_participants_deserialize(self.read_int32)
+        params.participants = self.chat_participants_deserialize(self.read_int32, 'participants')
         if (flags & 4) != 0:
-            params.chat_photo = self.photo_deserialize(self.read_int32)
-        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32)
-        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32)
+            params.chat_photo = self.photo_deserialize(self.read_int32, 'chat_photo')
+        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32, 'notify_settings')
+        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32, 'exported_invite')
         if (flags & 8) != 0:
-            magic = self.read_int32
-            assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-            count = self.read_int32
-            bot_info = list()
-            for i in range(0, count):
-                obj = self.bot_info_deserialize(self.read_int32)
-                if obj is None:
-                    return
-                bot_info.append(obj)
-            params.bot_info = bot_info
+            params.bot_info = self.read_vector(self.bot_info_deserialize, 'bot_info')
         if (flags & 64) != 0:
             params.pinned_msg_id = self.read_int32
         if (flags & 2048) != 0:
             params.folder_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_chatFull')
         return params
 
     def _tl_chatFull_layer87(self):
         constructor = 0x2e02a614
-        params = Map()
+        params = self.new_params('_tl_chatFull_layer87')
         params.id = self.read_int32
-        params.participants = self.chat_participants_deserialize(self.read_int32)
-        params.chat_photo = self.photo_deserialize(self.read_int32)
-        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32)
-        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        bot_info = list()
-        for i in range(0, count):
-            obj = self.bot_info_deserialize(self.read_int32)
-            if obj is None:
-                return
-            bot_info.append(obj)
-        params.bot_info = bot_info
-        self.instances.append(inspect.stack()[0][3])
+        params.participants = self.chat_participants_deserialize(self.read_int32, 'participants')
+        params.chat_photo = self.photo_deserialize(self.read_int32, 'chat_photo')
+        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32, 'notify_settings')
+        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32, 'exported_invite')
+        params.bot_info = self.read_vector(self.bot_info_deserialize, 'bot_info')
+        self.instances.append('_tl_chatFull_layer87')
         return params
 
     def _tl_channelFull_layer67(self):
         constructor = 0xc3d5512f
-        params = Map()
+        params = self.new_params('_tl_channelFull_layer67')
         flags = self.read_int32
         params.flags = flags
         params.can_view_participants = (flags & 8) != 0
@@ -5656,31 +5514,22 @@ class TeleData(object):
         params.read_inbox_max_id = self.read_int32
         params.read_outbox_max_id = self.read_int32
         params.unread_count = self.read_int32
-        params.chat_photo = self.photo_deserialize(self.read_int32)
-        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32)
-        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        bot_info = list()
-        for i in range(0, count):
-            obj = self.bot_info_deserialize(self.read_int32)
-            if obj is None:
-                return
-            bot_info.append(obj)
-        params.bot_info = bot_info
+        params.chat_photo = self.photo_deserialize(self.read_int32, 'chat_photo')
+        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32, 'notify_settings')
+        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32, 'exported_invite')
+        params.bot_info = self.read_vector(self.bot_info_deserialize, 'bot_info')
         if (flags & 16) != 0:
             params.migrated_from_chat_id = self.read_int32
         if (flags & 16) != 0:
             params.migrated_from_max_id = self.read_int32
         if (flags & 32) != 0:
             params.pinned_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channelFull_layer67')
         return params
 
     def _tl_channelFull_layer70(self):
         constructor = 0x95cb5f57
-        params = Map()
+        params = self.new_params('_tl_channelFull_layer70')
         flags = self.read_int32
         params.flags = flags
         params.can_view_participants = (flags & 8) != 0
@@ -5698,31 +5547,22 @@ class TeleData(object):
         params.read_inbox_max_id = self.read_int32
         params.read_outbox_max_id = self.read_int32
         params.unread_count = self.read_int32
-        params.chat_photo = self.photo_deserialize(self.read_int32)
-        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32)
-        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        bot_info = list()
-        for i in range(0, count):
-            obj = self.bot_info_deserialize(self.read_int32)
-            if obj is None:
-                return
-            bot_info.append(obj)
-        params.bot_info = bot_info
+        params.chat_photo = self.photo_deserialize(self.read_int32, 'chat_photo')
+        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32, 'notify_settings')
+        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32, 'exported_invite')
+        params.bot_info = self.read_vector(self.bot_info_deserialize, 'bot_info')
         if (flags & 16) != 0:
             params.migrated_from_chat_id = self.read_int32
         if (flags & 16) != 0:
             params.migrated_from_max_id = self.read_int32
         if (flags & 32) != 0:
             params.pinned_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channelFull_layer70')
         return params
 
     def _tl_channelFull_layer71(self):
         constructor = 0x17f45fcf
-        params = Map()
+        params = self.new_params('_tl_channelFull_layer71')
         flags = self.read_int32
         params.flags = flags
         params.can_view_participants = (flags & 8) != 0
@@ -5741,19 +5581,10 @@ class TeleData(object):
         params.read_inbox_max_id = self.read_int32
         params.read_outbox_max_id = self.read_int32
         params.unread_count = self.read_int32
-        params.chat_photo = self.photo_deserialize(self.read_int32)
-        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32)
-        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        bot_info = list()
-        for i in range(0, count):
-            obj = self.bot_info_deserialize(self.read_int32)
-            if obj is None:
-                return
-            bot_info.append(obj)
-        params.bot_info = bot_info
+        params.chat_photo = self.photo_deserialize(self.read_int32, 'chat_photo')
+        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32, 'notify_settings')
+        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32, 'exported_invite')
+        params.bot_info = self.read_vector(self.bot_info_deserialize, 'bot_info')
         if (flags & 16) != 0:
             params.migrated_from_chat_id = self.read_int32
         if (flags & 16) != 0:
@@ -5761,13 +5592,13 @@ class TeleData(object):
         if (flags & 32) != 0:
             params.pinned_msg_id = self.read_int32
         if (flags & 256) != 0:
-            params.stickerset = self.sticker_set_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
+            params.stickerset = self.sticker_set_deserialize(self.read_int32, 'stickerset')
+        self.instances.append('_tl_channelFull_layer71')
         return params
 
     def _tl_channelFull_layer72(self):
         constructor = 0x76af5481
-        params = Map()
+        params = self.new_params('_tl_channelFull_layer72')
         flags = self.read_int32
         params.flags = flags
         params.can_view_participants = (flags & 8) != 0
@@ -5787,19 +5618,10 @@ class TeleData(object):
         params.read_inbox_max_id = self.read_int32
         params.read_outbox_max_id = self.read_int32
         params.unread_count = self.read_int32
-        params.chat_photo = self.photo_deserialize(self.read_int32)
-        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32)
-        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        bot_info = list()
-        for i in range(0, count):
-            obj = self.bot_info_deserialize(self.read_int32)
-            if obj is None:
-                return
-            bot_info.append(obj)
-        params.bot_info = bot_info
+        params.chat_photo = self.photo_deserialize(self.read_int32, 'chat_photo')
+        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32, 'notify_settings')
+        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32, 'exported_invite')
+        params.bot_info = self.read_vector(self.bot_info_deserialize, 'bot_info')
         if (flags & 16) != 0:
             params.migrated_from_chat_id = self.read_int32
         if (flags & 16) != 0:
@@ -5807,15 +5629,15 @@ class TeleData(object):
         if (flags & 32) != 0:
             params.pinned_msg_id = self.read_int32
         if (flags & 256) != 0:
-            params.stickerset = self.sticker_set_deserialize(self.read_int32)
+            params.stickerset = self.sticker_set_deserialize(self.read_int32, 'stickerset')
         if (flags & 512) != 0:
             params.available_min_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channelFull_layer72')
         return params
 
     def _tl_channelFull_layer89(self):
         constructor = 0xcbb62890
-        params = Map()
+        params = self.new_params('_tl_channelFull_layer89')
         flags = self.read_int32
         params.flags = flags
         params.can_view_participants = (flags & 8) != 0
@@ -5835,19 +5657,10 @@ class TeleData(object):
         params.read_inbox_max_id = self.read_int32
         params.read_outbox_max_id = self.read_int32
         params.unread_count = self.read_int32
-        params.chat_photo = self.photo_deserialize(self.read_int32)
-        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32)
-        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        bot_info = list()
-        for i in range(0, count):
-            obj = self.bot_info_deserialize(self.read_int32)
-            if obj is None:
-                return
-            bot_info.append(obj)
-        params.bot_info = bot_info
+        params.chat_photo = self.photo_deserialize(self.read_int32, 'chat_photo')
+        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32, 'notify_settings')
+        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32, 'exported_invite')
+        params.bot_info = self.read_vector(self.bot_info_deserialize, 'bot_info')
         if (flags & 16) != 0:
             params.migrated_from_chat_id = self.read_int32
         if (flags & 16) != 0:
@@ -5855,17 +5668,17 @@ class TeleData(object):
         if (flags & 32) != 0:
             params.pinned_msg_id = self.read_int32
         if (flags & 256) != 0:
-            params.stickerset = self.sticker_set_deserialize(self.read_int32)
+            params.stickerset = self.sticker_set_deserialize(self.read_int32, 'stickerset')
         if (flags & 512) != 0:
             params.available_min_id = self.read_int32
         if (flags & 2048) != 0:
             params.call_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channelFull_layer89')
         return params
 
     def _tl_channelFull(self):
         constructor = 0x9882e516
-        params = Map()
+        params = self.new_params('_tl_channelFull')
         flags = self.read_int32
         params.flags = flags
         params.can_view_participants = (flags & 8) != 0
@@ -5888,19 +5701,10 @@ class TeleData(object):
         params.read_inbox_max_id = self.read_int32
         params.read_outbox_max_id = self.read_int32
         params.unread_count = self.read_int32
-        params.chat_photo = self.photo_deserialize(self.read_int32)
-        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32)
-        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        bot_info = list()
-        for i in range(0, count):
-            obj = self.bot_info_deserialize(self.read_int32)
-            if obj is None:
-                return
-            bot_info.append(obj)
-        params.bot_info = bot_info
+        params.chat_photo = self.photo_deserialize(self.read_int32, 'chat_photo')
+        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32, 'notify_settings')
+        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32, 'exported_invite')
+        params.bot_info = self.read_vector(self.bot_info_deserialize, 'bot_info')
         if (flags & 16) != 0:
             params.migrated_from_chat_id = self.read_int32
         if (flags & 16) != 0:
@@ -5908,19 +5712,19 @@ class TeleData(object):
         if (flags & 32) != 0:
             params.pinned_msg_id = self.read_int32
         if (flags & 256) != 0:
-            params.stickerset = self.sticker_set_deserialize(self.read_int32)
+            params.stickerset = self.sticker_set_deserialize(self.read_int32, 'stickerset')
         if (flags & 512) != 0:
             params.available_min_id = self.read_int32
         if (flags & 2048) != 0:
             params.call_msg_id = self.read_int32
         if (flags & 8192) != 0:
             params.linked_chat_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channelFull')
         return params
 
     def _tl_channelFull_layer52(self):
         constructor = 0x97bee562
-        params = Map()
+        params = self.new_params('_tl_channelFull_layer52')
         flags = self.read_int32
         params.flags = flags
         params.can_view_participants = (flags & 8) != 0
@@ -5936,30 +5740,21 @@ class TeleData(object):
         params.read_inbox_max_id = self.read_int32
         params.unread_count = self.read_int32
         params.unread_important_count = self.read_int32
-        params.chat_photo = self.photo_deserialize(self.read_int32)
-        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32)
-        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        bot_info = list()
-        for i in range(0, count):
-            obj = self.bot_info_deserialize(self.read_int32)
-            if obj is None:
-                return
-            bot_info.append(obj)
-        params.bot_info = bot_info
+        params.chat_photo = self.photo_deserialize(self.read_int32, 'chat_photo')
+        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32, 'notify_settings')
+        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32, 'exported_invite')
+        params.bot_info = self.read_vector(self.bot_info_deserialize, 'bot_info')
         if (flags & 16) != 0:
             params.migrated_from_chat_id = self.read_int32
         if (flags & 16) != 0:
             params.migrated_from_max_id = self.read_int32
         if (flags & 32) != 0:
             params.pinned_msg_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channelFull_layer52')
         return params
 
     def _tl_channelFull_layer48(self):
-        params = Map()
+        params = self.new_params('_tl_channelFull_layer48')
         flags = self.read_int32
         params.flags = flags
         params.can_view_participants = (flags & 8) != 0
@@ -5974,29 +5769,20 @@ class TeleData(object):
         params.read_inbox_max_id = self.read_int32
         params.unread_count = self.read_int32
         params.unread_important_count = self.read_int32
-        params.chat_photo = self.photo_deserialize(self.read_int32)
-        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32)
-        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32)
-        magic = self.read_int32
-        assert (magic == 0x1cb5c415), "magic in {}".format(inspect.stack()[0][3])
-        count = self.read_int32
-        bot_info = list()
-        for i in range(0, count):
-            obj = self.bot_info_deserialize(self.read_int32)
-            if obj is None:
-                return
-            bot_info.append(obj)
-        params.bot_info = bot_info
+        params.chat_photo = self.photo_deserialize(self.read_int32, 'chat_photo')
+        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32, 'notify_settings')
+        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32, 'exported_invite')
+        params.bot_info = self.read_vector(self.bot_info_deserialize, 'bot_info')
         if (flags & 16) != 0:
             params.migrated_from_chat_id = self.read_int32
         if (flags & 16) != 0:
             params.migrated_from_max_id = self.read_int32
-        self.instances.append(inspect.stack()[0][3])
+        self.instances.append('_tl_channelFull_layer48')
         return params
 
     def _tl_channelFull_old(self):
         constructor = 0xfab31aa3
-        params = Map()
+        params = self.new_params('_tl_channelFull_old')
         flags = self.read_int32
         params.flags = flags
         params.can_view_participants = (flags & 8) != 0
@@ -6011,43 +5797,1109 @@ class TeleData(object):
         params.read_inbox_max_id = self.read_int32
         params.unread_count = self.read_int32
         params.unread_important_count = self.read_int32
-        params.chat_photo = self.photo_deserialize(self.read_int32)
-        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32)
-        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32)
-        self.instances.append(inspect.stack()[0][3])
-        return params
-
-    def chat_full_deserialize(self, constructor):
-        result = None
-        if constructor == 0x1b7c9db3:
-            result = self._tl_chatFull()
-        elif constructor == 0x22a235da:
-            result = self._tl_chatFull_layer98()
-        elif constructor == 0xedd2a791:
-            result = self._tl_chatFull_layer92()
-        elif constructor == 0x2e02a614:
-            result = self._tl_chatFull_layer87()
-        elif constructor == 0x9882e516:
-            result = self._tl_channelFull()
-        elif constructor == 0x1c87a71a:
-            result = self._tl_channelFull_layer98()
-        elif constructor == 0x3648977:
-            result = self._tl_channelFull_layer99()
-        elif constructor == 0xcbb62890:
-            result = self._tl_channelFull_layer89()
-        elif constructor == 0x17f45fcf:
-            result = self._tl_channelFull_layer71()
-        elif constructor == 0x76af5481:
-            result = self._tl_channelFull_layer72()
-        elif constructor == 0x95cb5f57:
-            result = self._tl_channelFull_layer70()
-        elif constructor == 0x97bee562:
-            result = self._tl_channelFull_layer52()
-        elif constructor == 0xc3d5512f:
-            result = self._tl_channelFull_layer67()
-        elif constructor == 0x9e341ddf:
-            result = self._tl_channelFull_layer48()
-        elif constructor == 0xfab31aa3:
-            result = self._tl_channelFull_old()
-        assert (result is not None), "constructor hex={0}, int={1} not defined".format(hex(constructor), constructor)
-        return result
+        params.chat_photo = self.photo_deserialize(self.read_int32, 'chat_photo')
+        params.notify_settings = self.peer_notify_settings_deserialize(self.read_int32, 'notify_settings')
+        params.exported_invite = self.exported_chat_invite_deserialize(self.read_int32, 'exported_invite')
+        self.instances.append('_tl_channelFull_old')
+        return params
+
+    def chat_full_deserialize(self, constructor, field=None, projection=None):
+        return self._dispatch(self.CHAT_FULL_PARSERS, constructor, field, projection)
+
+    ######################################################
+    # таблицы конструкторов для *_deserialize, строятся один раз при создании класса
+
+    PEER_PARSERS = {
+        0x9db1bc6d: _tl_peerUser,
+        0xbddde532: _tl_peerChannel,
+        0xbad0e5bb: _tl_peerChat,
+    }
+
+    MESSAGE_FWD_HEADER_PARSERS = {
+        0xfadff4ac: _tl_messageFwdHeader_layer72,
+        0xec338270: _tl_messageFwdHeader,
+        0x559ebe6d: _tl_messageFwdHeader_layer96,
+        0xc786ddcb: _tl_messageFwdHeader_layer68,
+    }
+
+    FILE_LOCATION_PARSERS = {
+        0x53d69076: _tl_fileLocation_layer82,
+        0x55555554: _tl_fileEncryptedLocation,
+        0x7c596b46: _tl_fileLocationUnavailable,
+        0x91d11eb: _tl_fileLocation_layer97,
+        0xbc7fc6cd: _tl_fileLocation_to_be_depreacted,
+    }
+
+    PHOTO_SIZE_PARSERS = {
+        0x77bfb61b: _tl_photoSize,
+        0xe17e23c: _tl_photoSizeEmpty,
+        0xe9a734fa: _tl_photoCachedSize,
+        0xe0b0bc2e: _tl_photoStrippedSize,
+    }
+
+    GEO_POINT_PARSERS = {
+        0x1117dd5f: _tl_geoPointEmpty,
+        0x2049d70c: _tl_geoPoint,
+    }
+
+    PHOTO_PARSERS = {
+        0x22b56751: _tl_photo_old,
+        0xd07504a5: _tl_photo,
+        0x9c477dd8: _tl_photo_layer97,
+        0x9288dd29: _tl_photo_layer82,
+        0xc3838076: _tl_photo_old2,
+        0xcded42fe: _tl_photo_layer55,
+        0x2331b22d: _tl_photoEmpty,
+    }
+
+    CHAT_PHOTO_PARSERS = {
+        0x37c1011c: _tl_chatPhotoEmpty,
+        0x6153276a: _tl_chatPhoto_layer97,
+        0x475cdbd5: _tl_chatPhoto,
+    }
+
+    INPUT_CHANNEL_PARSERS = {
+        0xee8c1e86: _tl_inputChannelEmpty,
+        0xafeb712e: _tl_inputChannel,
+    }
+
+    PAGE_BLOCK_PARSERS = {
+        0xdb20b188: _tl_pageBlockDivider,
+        0x1759c560: _tl_pageBlockPhoto,
+        0x16115a96: _tl_pageBlockRlatedArticles,
+        0xbaafe5e0: _tl_pageBlockAuthorDate,
+        0xc070d93e: _tl_pageBlockPreformatted,
+        0xcde200d1: _tl_pageBlockEmbed,
+        0xce0d37b0: _tl_pageBlockAnchor,
+        0xbfd064ec: _tl_pageBlockHeader,
+        0xd9d71866: _tl_pageBlockVideo_layer82,
+        0x7c8fe7b6: _tl_pageBlockVideo,
+        0x13567e8a: _tl_pageBlockUnsupported,
+        0x467a0766: _tl_pageBlockParagraph,
+        0x3d5b64f2: _tl_pageBlockAuthorDate_layer60,
+        0x8b31c4f: _tl_pageBlockCollage,
+        0x48870999: _tl_pageBlockFooter,
+        0x3a58c7f4: _tl_pageBlockList,
+        0xd935d8fb: _tl_pageBlockEmbed_layer60,
+        0xe9c69982: _tl_pageBlockPhoto_layer82,
+        0x8ffa9a1f: _tl_pageBlockSubtitle,
+        0x263d7c26: _tl_pageBlockBlockquote,
+        0x292c7be9: _tl_pageBlockEmbedPost,
+        0x70abc3fd: _tl_pageBlockTitle,
+        0xef1751b5: _tl_pageBlockChannel,
+        0x39f23300: _tl_pageBlockCover,
+        0xf12bb6e1: _tl_pageBlockSubheader,
+        0x130c8963: _tl_pageBlockSlideshow,
+        0x4f4456d3: _tl_pageBlockPullquote,
+        0x31b81a7f: _tl_pageBlockAudio,
+    }
+
+    RICH_TEXT_PARSERS = {
+        0xdc3d824f: _tl_textEmpty,
+        0x3c2884c1: _tl_textUrl,
+        0x9bf8bb95: _tl_textStrike,
+        0x6c3f19b9: _tl_textFixed,
+        0xde5a0dd6: _tl_textEmail,
+        0x744694e0: _tl_textPlain,
+        0x7e6260d7: _tl_textConcat,
+        0x6724abc4: _tl_textBold,
+        0xd912a59c: _tl_textItalic,
+        0xc12622c4: _tl_textUnderline,
+    }
+
+    PAGE_PARSERS = {
+        0x556ec7aa: _tl_pageFull_layer82,
+        0x8dee6c44: _tl_pagePart_layer67,
+        0xd7a19d69: _tl_pageFull_layer67,
+        0x8e3f9ebe: _tl_pagePart_layer82,
+        0xae891bec: _tl_page,
+    }
+
+    WEB_PAGE_PARSERS = {
+        0x5f07b4bc: _tl_webPage,
+        0xa31ea0b5: _tl_webPage_old,
+        0xd41a5167: _tl_webPageUrlPending,
+        0xc586da1c: _tl_webPagePending,
+        0xeb1477e8: _tl_webPageEmpty,
+        0xca820ed7: _tl_webPage_layer58,
+        0x85849473: _tl_webPageNotModified,
+    }
+
+    INPUT_STICKER_SET_PARSERS = {
+        0xffb62b95: _tl_inputStickerSetEmpty,
+        0x9de7a269: _tl_inputStickerSetID,
+        0x861cc8a0: _tl_inputStickerSetShortName,
+    }
+
+    DOCUMENT_ATTRIBUTE_PARSERS = {
+        0x3a556302: _tl_documentAttributeSticker_layer55,
+        0x51448e5: _tl_documentAttributeAudio_old,
+        0x6319d612: _tl_documentAttributeSticker,
+        0x11b58939: _tl_documentAttributeAnimated,
+        0x15590068: _tl_documentAttributeFilename,
+        0xef02ce6: _tl_documentAttributeVideo,
+        0x5910cccb: _tl_documentAttributeVideo_layer65,
+        0xded218e0: _tl_documentAttributeAudio_layer45,
+        0xfb0a5727: _tl_documentAttributeSticker_old,
+        0x9801d2f7: _tl_documentAttributeHasStickers,
+        0x994c9882: _tl_documentAttributeSticker_old2,
+        0x6c37c15c: _tl_documentAttributeImageSize,
+        0x9852f9c6: _tl_documentAttributeAudio,
+    }
+
+    DOCUMENT_PARSERS = {
+        0x9ba29cc1: _tl_document,
+        0x59534e4c: _tl_document_layer92,
+        0x87232bc7: _tl_document_layer82,
+        0x55555556: _tl_documentEncrypted_old,
+        0x9efc6326: _tl_document_old,
+        0x36f8c871: _tl_documentEmpty,
+        0x55555558: _tl_documentEncrypted,
+        0xf9a39f4f: _tl_document_layer53,
+    }
+
+    AUDIO_PARSERS = {
+        0x586988d8: _tl_audioEmpty_layer45,
+        0xf9e35055: _tl_audio_layer45,
+        0x427425e7: _tl_audio_old,
+        0x555555F6: _tl_audioEncrypted,
+        0xc7ac6496: _tl_audio_old2,
+    }
+
+    VIDEO_PARSERS = {
+        0xee9f4a4d: _tl_video_old3,
+        0xf72887d3: _tl_video_layer45,
+        0x55555553: _tl_videoEncrypted,
+        0x5a04a49f: _tl_video_old,
+        0x388fa391: _tl_video_old2,
+        0xc10658a8: _tl_videoEmpty_layer45,
+    }
+
+    MESSAGE_MEDIA_PARSERS = {
+        0x29632a36: _tl_messageMediaUnsupported_old,
+        0xc6b68300: _tl_messageMediaAudio_layer45,
+        0xc8c45a2a: _tl_messageMediaPhoto_old,
+        0x9f84f49e: _tl_messageMediaUnsupported,
+        0x3ded6320: _tl_messageMediaEmpty,
+        0x7912b71f: _tl_messageMediaVenue_layer71,
+        0x7c3c2609: _tl_messageMediaGeoLive,
+        0x2ec0533f: _tl_messageMediaVenue,
+        0xa2d24290: _tl_messageMediaVideo_old,
+        0x2fda2204: _tl_messageMediaDocument_old,
+        0xf3e02ea8: _tl_messageMediaDocument_layer68,
+        0xfdb19008: _tl_messageMediaGame,
+        0x7c4414d3: _tl_messageMediaDocument_layer72,
+        0x5e7d2f39: _tl_messageMediaContact,
+        0x3d8ce53d: _tl_messageMediaPhoto_layer68,
+        0x5bcf1675: _tl_messageMediaVideo_layer45,
+        0x56e0d474: _tl_messageMediaGeo,
+        0xa32dd600: _tl_messageMediaWebPage,
+        0x84551347: _tl_messageMediaInvoice,
+        0xb5223b0f: _tl_messageMediaPhoto_layer72,
+        0x695150d7: _tl_messageMediaPhoto,
+        0x4bd6e798: _tl_messageMediaPoll,
+        0x9cb070d7: _tl_messageMediaDocument,
+    }
+
+    INPUT_USER_PARSERS = {
+        0xb98886cf: _tl_inputUserEmpty,
+        0xf7c1b13f: _tl_inputUserSelf,
+        0xd8292816: _tl_inputUser,
+    }
+
+    MESSAGE_ENTITY_PARSERS = {
+        0x76a6d327: _tl_messageEntityTextUrl,
+        0x9b69e34b: _tl_messageEntityPhone,
+        0x6cef8ac7: _tl_messageEntityBotCommand,
+        0x64e475c2: _tl_messageEntityEmail,
+        0x73924be0: _tl_messageEntityPre,
+        0xbb92ba95: _tl_messageEntityUnknown,
+        0x6ed02538: _tl_messageEntityUrl,
+        0x826f8b60: _tl_messageEntityItalic,
+        0xfa04579d: _tl_messageEntityMention,
+        0x352dca58: _tl_messageEntityMentionName,
+        0x208e68c9: _tl_inputMessageEntityMentionName,
+        0xbd610bc9: _tl_messageEntityBold,
+        0x6f635b0d: _tl_messageEntityHashtag,
+        0x28a20571: _tl_messageEntityCode,
+    }
+
+    KEYBOARD_BUTTON_PARSERS = {
+        0xb16a6c29: _tl_keyboardButtonRequestPhone,
+        0x50f41ccf: _tl_keyboardButtonGame,
+        0x258aff05: _tl_keyboardButtonUrl,
+        0x568a748: _tl_keyboardButtonSwitchInline,
+        0xfc796b3f: _tl_keyboardButtonRequestGeoLocation,
+        0xafd93fbb: _tl_keyboardButtonBuy,
+        0x683a5e46: _tl_keyboardButtonCallback,
+        0xa2fa4880: _tl_keyboardButton,
+    }
+
+    REPLY_MARKUP_PARSERS = {
+        0x48a30254: _tl_replyInlineMarkup,
+        0xa03e5b85: _tl_replyKeyboardHide,
+        0xf4108aa0: _tl_replyKeyboardForceReply,
+        0x3502758c: _tl_replyKeyboardMarkup,
+    }
+
+    SEND_MESSAGE_ACTION_PARSERS = {
+        0xdd6a8f48: _tl_sendMessageGamePlayAction,
+        0xd52f73f7: _tl_sendMessageRecordAudioAction,
+        0x92042ff7: _tl_sendMessageUploadVideoAction_old,
+        0xe6ac8a6f: _tl_sendMessageUploadAudioAction_old,
+        0xf351d7ab: _tl_sendMessageUploadAudioAction,
+        0xd1d34a26: _tl_sendMessageUploadPhotoAction,
+        0x8faee98e: _tl_sendMessageUploadDocumentAction_old,
+        0xe9763aec: _tl_sendMessageUploadVideoAction,
+        0xfd5ec8f5: _tl_sendMessageCancelAction,
+        0x176f8ba1: _tl_sendMessageGeoLocationAction,
+        0x628cbc6f: _tl_sendMessageChooseContactAction,
+        0x88f27fbc: _tl_sendMessageRecordRoundAction,
+        0x243e1c66: _tl_sendMessageUploadRoundAction,
+        0x16bf744e: _tl_sendMessageTypingAction,
+        0x990a3c1a: _tl_sendMessageUploadPhotoAction_old,
+        0xaa0cd9e4: _tl_sendMessageUploadDocumentAction,
+        0xa187d66f: _tl_sendMessageRecordVideoAction,
+    }
+
+    DECRYPTED_MESSAGE_ACTION_PARSERS = {
+        0xa1733aec: _tl_decryptedMessageActionSetMessageTTL,
+        0xf3048883: _tl_decryptedMessageActionNotifyLayer,
+        0x65614304: _tl_decryptedMessageActionDeleteMessages,
+        0xec2e0b9b: _tl_decryptedMessageActionCommitKey,
+        0xdd05ec6b: _tl_decryptedMessageActionAbortKey,
+        0x6719e45c: _tl_decryptedMessageActionFlushHistory,
+        0xccb27641: _tl_decryptedMessageActionTyping,
+        0x6fe1735b: _tl_decryptedMessageActionAcceptKey,
+        0xc4f40be: _tl_decryptedMessageActionReadMessages,
+        0x511110b0: _tl_decryptedMessageActionResend,
+        0xf3c9611b: _tl_decryptedMessageActionRequestKey,
+        0x8ac1f475: _tl_decryptedMessageActionScreenshotMessages,
+        0xa82fdd63: _tl_decryptedMessageActionNoop,
+    }
+
+    MESSAGE_ACTION_PARSERS = {
+        0x555555F5: _tl_messageActionLoginUnknownLocation,
+        0x555555F7: _tl_messageEncryptedAction,
+        0xfae69f56: _tl_messageActionCustomAction,
+        0xa6638b9a: _tl_messageActionChatCreate,
+        0x51bdb021: _tl_messageActionChatMigrateTo,
+        0x4792929b: _tl_messageActionScreenshotTaken,
+        0x9fbab604: _tl_messageActionHistoryClear,
+        0x7fcb13a8: _tl_messageActionChatEditPhoto,
+        0xb055eaee: _tl_messageActionChannelMigrateFrom,
+        0x488a7337: _tl_messageActionChatAddUser,
+        0xb2ae9b0c: _tl_messageActionChatDeleteUser,
+        0x55555557: _tl_messageActionCreatedBroadcastList,
+        0x55555550: _tl_messageActionUserJoined,
+        0x55555551: _tl_messageActionUserUpdatedPhoto,
+        0x5e3cfc4b: _tl_messageActionChatAddUser_old,
+        0x55555552: _tl_messageActionTTLChange,
+        0xc7d53de: _tl_messageActionGeoChatCheckin,
+        0xf89cf5e8: _tl_messageActionChatJoinedByLink,
+        0x95d2ac92: _tl_messageActionChannelCreate,
+        0x94bd38ed: _tl_messageActionPinMessage,
+        0x95e3fbef: _tl_messageActionChatDeletePhoto,
+        0x80e11a7f: _tl_messageActionPhoneCall,
+        0xb5a1ce5a: _tl_messageActionChatEditTitle,
+        0x40699cd0: _tl_messageActionPaymentSent,
+        0xb6aef7b0: _tl_messageActionEmpty,
+        0x92a72876: _tl_messageActionGameScore,
+        0x6f038ebc: _tl_messageActionGeoChatCreate,
+    }
+
+    PHONE_CALL_DISCARD_REASON_PARSERS = {
+        0x57adc690: _tl_phoneCallDiscardReasonHangup,
+        0xfaf7e8c9: _tl_phoneCallDiscardReasonBusy,
+        0x85e42301: _tl_phoneCallDiscardReasonMissed,
+        0xe095c1a0: _tl_phoneCallDiscardReasonDisconnect,
+    }
+
+    USER_PROFILE_PHOTO_PARSERS = {
+        0xecd75d8c: _tl_userProfilePhoto,
+        0x4f11bae1: _tl_userProfilePhotoEmpty,
+        0xd559d8c8: _tl_userProfilePhoto_layer97,
+        0x990d1493: _tl_userProfilePhoto_old,
+    }
+
+    USER_STATUS_PARSERS = {
+        0x8c703f: _tl_userStatusOffline,
+        0x7bf09fc: _tl_userStatusLastWeek,
+        0x9d05049: _tl_userStatusEmpty,
+        0x77ebc742: _tl_userStatusLastMonth,
+        0xedb93949: _tl_userStatusOnline,
+        0xe26f42f1: _tl_userStatusRecently,
+    }
+
+    ENCRYPTED_CHAT_PARSERS = {
+        0xfda9a7b7: _tl_encryptedChatRequested_old,
+        0xc878527e: _tl_encryptedChatRequested,
+        0xfa56ce36: _tl_encryptedChat,
+        0x6601d14f: _tl_encryptedChat_old,
+        0xab7ec0a0: _tl_encryptedChatEmpty,
+        0x3bf703dc: _tl_encryptedChatWaiting,
+        0x13d6dd27: _tl_encryptedChatDiscarded,
+    }
+
+    USER_PARSERS = {
+        0xcab35e18: _tl_userContact_old2,
+        0xf2fb8319: _tl_userContact_old,
+        0x2e13f4c3: _tl_user,
+        0x720535ec: _tl_userSelf_old,
+        0x1c60e608: _tl_userSelf_old3,
+        0xd6016d7a: _tl_userDeleted_old2,
+        0x200250ba: _tl_userEmpty,
+        0x22e8ceb0: _tl_userRequest_old,
+        0x5214c89d: _tl_userForeign_old,
+        0x75cf7a8: _tl_userForeign_old2,
+        0xd9ccc4ef: _tl_userRequest_old2,
+        0xb29ad7cc: _tl_userDeleted_old,
+        0xd10d979a: _tl_user_layer65,
+        0x22e49072: _tl_user_old,
+        0x7007b451: _tl_userSelf_old2,
+    }
+
+    CHAT_PARSERS = {
+        0xfb0ccc41: _tl_chatForbidden_old,
+        0x7312bc48: _tl_chat_old2,
+        0x289da732: _tl_channelForbidden,
+        0x8537784f: _tl_channelForbidden_layer67,
+        0x4b1b7506: _tl_channel_layer48,
+        0x75eaea5a: _tl_geoChat,
+        0x2d85832c: _tl_channelForbidden_layer52,
+        0x7328bdb: _tl_chatForbidden,
+        0xa14dca52: _tl_channel_layer67,
+        0x678e9587: _tl_channel_old,
+        0x6e9c9bc7: _tl_chat_old,
+        0x9ba2d800: _tl_chatEmpty,
+        0xcb44b1c: _tl_channel_layer72,
+        0xd91cdd54: _tl_chat_layer92,
+        0x3bda1bde: _tl_chat,
+        0x4df30834: _tl_channel,
+        0x450b7115: _tl_channel_layer77,
+        0xc88974ac: _tl_channel_layer92,
+    }
+
+    MESSAGE_PARSERS = {
+        0x1d86f70e: _tl_messageService_old2,
+        0xa7ab1991: _tl_message_old3,
+        0xc3060325: _tl_message_old4,
+        0x555555fa: _tl_message_secret,
+        0x555555f9: _tl_message_secret_layer72,
+        0x90dddc11: _tl_message_layer72,
+        0xc09be45f: _tl_message_layer68,
+        0xc992e15c: _tl_message_layer47,
+        0x5ba66c13: _tl_message_old7,
+        0xc06b9607: _tl_messageService_layer48,
+        0x83e5de54: _tl_messageEmpty,
+        0x2bebfa86: _tl_message_old6,
+        0x44f9b43d: _tl_message,
+        0xa367e716: _tl_messageForwarded_old2,
+        0x5f46804: _tl_messageForwarded_old,
+        0x567699b3: _tl_message_old2,
+        0x9f8d60bb: _tl_messageService_old,
+        0x22eb6aba: _tl_message_old,
+        0x555555F8: _tl_message_secret_old,
+        0x9e19a1f6: _tl_messageService,
+        0xf07814c8: _tl_message_old5,
+    }
+
+    BOT_INFO_PARSERS = {
+        0xbb2e37ce: _tl_botInfoEmpty_layer48,
+        0x98e81d3a: _tl_botInfo,
+        0x9cf585d: _tl_botInfo_layer48,
+    }
+
+    CHAT_PARTICIPANT_PARSERS = {
+        0xc8d7493e: _tl_chatParticipant,
+        0xda13538a: _tl_chatParticipantCreator,
+        0xe2d6e436: _tl_chatParticipantAdmin,
+    }
+
+    CHAT_PARTICIPANTS_PARSERS = {
+        0xfc900c2b: _tl_chatParticipantsForbidden,
+        0x3f460fed: _tl_chatParticipants,
+        0x7841b415: _tl_chatParticipants_old,
+        0xfd2bb8a: _tl_chatParticipantsForbidden_old,
+    }
+
+    PEER_NOTIFY_SETTINGS_PARSERS = {
+        0x9acda4c0: _tl_peerNotifySettings_layer77,
+        0xaf509d20: _tl_peerNotifySettings,
+        0x8d5e11ee: _tl_peerNotifySettings_layer47,
+        0x70a68512: _tl_peerNotifySettingsEmpty,
+    }
+
+    EXPORTED_CHAT_INVITE_PARSERS = {
+        0xfc2e05bc: _tl_chatInviteExported,
+        0x69df3769: _tl_chatInviteEmpty,
+    }
+
+    STICKER_SET_PARSERS = {
+        0xa7a43b17: _tl_stickerSet_old,
+        0xcd303b41: _tl_stickerSet,
+    }
+
+    CHAT_FULL_PARSERS = {
+        0x1b7c9db3: _tl_chatFull,
+        # 0x22a235da: _tl_chatFull_layer98,  парсер не реализован
+        # 0xedd2a791: _tl_chatFull_layer92,  парсер не реализован
+        0x2e02a614: _tl_chatFull_layer87,
+        0x9882e516: _tl_channelFull,
+        # 0x1c87a71a: _tl_channelFull_layer98,  парсер не реализован
+        # 0x3648977: _tl_channelFull_layer99,  парсер не реализован
+        0xcbb62890: _tl_channelFull_layer89,
+        0x17f45fcf: _tl_channelFull_layer71,
+        0x76af5481: _tl_channelFull_layer72,
+        0x95cb5f57: _tl_channelFull_layer70,
+        0x97bee562: _tl_channelFull_layer52,
+        0xc3d5512f: _tl_channelFull_layer67,
+        0x9e341ddf: _tl_channelFull_layer48,
+        0xfab31aa3: _tl_channelFull_old,
+    }
+
+    PAGE_CAPTION_PARSERS = {
+        0x6f747657: _tl_pageCaption,
+    }
+
+    CHANNEL_ADMIN_RIGHTS_PARSERS = {
+        0x5d7ceba5: _tl_channelAdminRights,
+    }
+
+    CHANNEL_BANNED_RIGHTS_PARSERS = {
+        0x58cf4249: _tl_channelBannedRights,
+    }
+
+    CHAT_ADMIN_RIGHTS_PARSERS = {
+        0x5fb224d5: _tl_chat_admin_rights,
+    }
+
+    CHAT_BANNED_RIGHTS_PARSERS = {
+        0x9f120418: chat_banned_rights,
+    }
+
+    PAGE_RELATED_ARTICLE_PARSERS = {
+        0xb390dc08: _tl_pageRelatedArticle,
+    }
+
+    MASK_COORDS_PARSERS = {
+        0xaed6dbb2: _tl_maskCoords,
+    }
+
+    WEB_DOCUMENT_PARSERS = {
+        0xc61acbd8: _tl_webDocument,
+    }
+
+    GAME_PARSERS = {
+        0xbdf9653b: _tl_game,
+    }
+
+    POLL_ANSWER_VOTES_PARSERS = {
+        0x3b6ddad2: _tl_poll_answer_votes,
+    }
+
+    POLL_RESULT_PARSERS = {
+        0x5755785a: _tl_poll_result,
+    }
+
+    POLL_ANSWER_PARSERS = {
+        0x6ca9c2e9: _tl_poll_answer,
+    }
+
+    POLL_PARSERS = {
+        0xd5529d06: _tl_poll,
+    }
+
+    KEYBOARD_BUTTON_ROW_PARSERS = {
+        0x77608b83: _tl_keyboardButtonRow,
+    }
+
+    BOT_COMMAND_PARSERS = {
+        0xc27ac8c7: _tl_botCommand,
+    }
+
+    ######################################################
+    # поля объектов в порядке чтения (нотация TL): имя:тип, флаги - имя:#, необязательное поле - имя:флаги.бит?тип,
+    # true - признак из флагов без чтения; int, long, double, Bool, string, bytes, Vector<int>, Vector<long>,
+    # вложенный объект - префикс *_deserialize его типа (peer, photo_size, ...), Vector<тип> - вектор объектов,
+    # _tl_* - прямой вызов парсера. По описанию читатель пропуска (SkipReads) проходит объект без парсера;
+    # парсеры с эвристиками (attachPath, at_end, старые слои, которые *_deserialize переделывает
+    # в новые объекты) не описаны и пропускаются как есть
+    LAYOUTS = {
+        '_tl_peerUser': 'user_id:int',
+        '_tl_peerChannel': 'channel_id:int',
+        '_tl_peerChat': 'chat_id:int',
+        '_tl_messageFwdHeader_layer72': 'flags:# from_id:flags.0?int date:int channel_id:flags.1?int '
+                                        'channel_post:flags.2?int post_author:flags.3?int',
+        '_tl_messageFwdHeader_layer68': 'flags:# from_id:flags.0?int date:int channel_id:flags.1?int '
+                                        'channel_post:flags.2?int',
+        '_tl_fileLocation_layer97': 'dc_id:int volume_id:long local_id:int secret:long file_reference:bytes',
+        '_tl_fileLocation_layer82': 'dc_id:int volume_id:long local_id:int secret:long',
+        '_tl_fileEncryptedLocation': 'dc_id:int volume_id:long local_id:int secret:long key:bytes iv:bytes',
+        '_tl_fileLocationUnavailable': 'local_id:int secret:long',
+        '_tl_fileLocation_to_be_depreacted': 'volume_id:long local_id:int',
+        '_tl_photoSize': 'type:string location:file_location w:int h:int size:int',
+        '_tl_photoSizeEmpty': 'typeof:string',
+        '_tl_photoCachedSize': 'type:string location:file_location w:int h:int bytes:bytes',
+        '_tl_photo': 'flags:# has_stickers:flags.0?true id:long access_hash:long file_reference:bytes date:int '
+                     'sizes:Vector<photo_size> dc_id:int',
+        '_tl_photo_layer97': 'flags:# has_stickers:flags.0?true id:long access_hash:long file_reference:bytes date:int '
+                             'sizes:Vector<photo_size>',
+        '_tl_photo_layer82': 'flags:# has_stickers:flags.0?true id:long access_hash:long date:int '
+                             'sizes:Vector<photo_size>',
+        '_tl_geoPointEmpty': '',
+        '_tl_geoPoint': '_long:double lat:double',
+        '_tl_photo_old': 'id:long access_hash:long user_id:int date:int caption:string geo:geo_point '
+                         'sizes:Vector<photo_size>',
+        '_tl_photo_old2': 'id:long access_hash:long user_id:int date:int geo:geo_point sizes:Vector<photo_size>',
+        '_tl_photo_layer55': 'id:long access_hash:long date:int sizes:Vector<photo_size>',
+        '_tl_pageCaption': 'text:rich_text credit:rich_text',
+        '_tl_pageBlockTitle': 'text:rich_text',
+        '_tl_pageBlockAuthorDate': 'author:rich_text published_date:int',
+        '_tl_pageBlockParagraph': 'text:rich_text',
+        '_tl_pageBlockAnchor': 'name:string',
+        '_tl_pageBlockHeader': 'text:rich_text',
+        '_tl_pageBlockList': 'ordered:Bool elements:Vector<rich_text>',
+        '_tl_pageBlockPhoto': 'flags:# photo_id:long caption:page_caption url:flags.0?string webpage_id:flags.0?long',
+        '_tl_pageBlockDivider': '',
+        '_tl_pageBlockSubheader': 'text:rich_text',
+        '_tl_pageBlockBlockquote': 'text:rich_text caption:rich_text',
+        '_tl_pageBlockVideo': 'flags:# autoplay:flags.0?true loop:flags.1?true video_id:long caption:page_caption',
+        '_tl_pageBlockVideo_layer82': 'flags:# autoplay:flags.0?true loop:flags.1?true video_id:long caption:rich_text',
+        '_tl_pageBlockPreformatted': 'text:rich_text language:string',
+        '_tl_pageBlockEmbed': 'flags:# full_width:flags.0?true allow_scrolling:flags.3?true url:flags.1?string '
+                              'html:flags.2?string poster_photo_id:flags.4?long w:int h:int caption:rich_text',
+        '_tl_pageBlockUnsupported': '',
+        '_tl_pageBlockCollage': 'elements:Vector<page_block> caption:rich_text',
+        '_tl_pageBlockFooter': 'text:rich_text',
+        '_tl_pageBlockEmbed_layer60': 'flags:# full_width:flags.0?true allow_scrolling:flags.3?true url:flags.1?string '
+                                      'html:flags.2?string w:int h:int caption:rich_text',
+        '_tl_pageBlockSubtitle': 'text:rich_text',
+        '_tl_pageBlockEmbedPost': 'url:string webpage_id:long author_photo_id:long author:string date:int '
+                                  'blocks:Vector<page_block> caption:rich_text',
+        '_tl_chatPhotoEmpty': '',
+        '_tl_chatPhoto': 'photo_small:file_location photo_big:file_location dc_id:int',
+        '_tl_chatPhoto_layer97': 'photo_small:file_location photo_big:file_location',
+        '_tl_inputChannelEmpty': '',
+        '_tl_inputChannel': 'channel_id:int access_hash:long',
+        '_tl_chat': 'flags:# creator:flags.0?true kicked:flags.1?true left:flags.2?true deactivated:flags.5?true '
+                    'id:int title:string photo:chat_photo participants_count:int date:int version:int '
+                    'migrated_to:flags.6?input_channel admin_rights:flags.14?chat_admin_rights '
+                    'default_banned_rights:flags.18?chat_banned_rights',
+        '_tl_chat_layer92': 'flags:# creator:flags.0?true kicked:flags.1?true left:flags.2?true '
+                            'admins_enabled:flags.3?true admin:flags.4?true deactivated:flags.5?true id:int '
+                            'title:string photo:chat_photo participants_count:int date:int version:int '
+                            'migrated_to:flags.6?input_channel',
+        '_tl_channelAdminRights': 'flags:# change_info:flags.0?true post_messages:flags.1?true '
+                                  'edit_messages:flags.2?true delete_messages:flags.3?true ban_users:flags.4?true '
+                                  'invite_users:flags.5?true invite_link:flags.6?true pin_messages:flags.7?true '
+                                  'add_admins:flags.9?true',
+        '_tl_channelBannedRights': 'flags:# view_messages:flags.0?true send_messages:flags.1?true '
+                                   'send_media:flags.2?true send_stickers:flags.3?true send_gifs:flags.4?true '
+                                   'send_games:flags.5?true send_inline:flags.6?true embed_links:flags.7?true '
+                                   'until_date:int',
+        '_tl_channel_layer77': 'flags:# creator:flags.0?true left:flags.2?true broadcast:flags.5?true '
+                               'verified:flags.7?true megagroup:flags.8?true restricted:flags.9?true '
+                               'democracy:flags.10?true signatures:flags.11?true min:flags.12?true id:int '
+                               'access_hash:flags.13?long title:string username:flags.6?string photo:chat_photo '
+                               'date:int version:int restriction_reason:flags.9?string '
+                               'admin_rights:flags.14?channel_admin_rights '
+                               'banned_rights:flags.15?channel_banned_rights participants_count:flags.17?int',
+        '_tl_chat_admin_rights': 'flags:# change_info:flags.0?true post_messages:flags.1?true '
+                                 'edit_messages:flags.2?true delete_messages:flags.3?true ban_users:flags.4?true '
+                                 'invite_users:flags.5?true pin_messages:flags.7?true add_admins:flags.9?true',
+        '_tl_channel': 'flags:# creator:flags.0?true left:flags.2?true broadcast:flags.5?true verified:flags.7?true '
+                       'megagroup:flags.8?true restricted:flags.9?true signatures:flags.11?true min:flags.12?true '
+                       'scam:flags.19?true has_link:flags.20?true id:int access_hash:flags.13?long title:string '
+                       'username:flags.6?string photo:chat_photo date:int version:int '
+                       'restriction_reason:flags.9?string admin_rights:flags.14?chat_admin_rights '
+                       'banned_rights:flags.15?chat_banned_rights default_banned_rights:flags.18?chat_banned_rights '
+                       'participants_count:flags.17?int',
+        '_tl_channel_layer92': 'flags:# creator:flags.0?true left:flags.2?true editor:flags.3?true '
+                               'broadcast:flags.5?true verified:flags.7?true megagroup:flags.8?true '
+                               'restricted:flags.9?true democracy:flags.10?true signatures:flags.11?true '
+                               'min:flags.12?true id:int access_hash:flags.13?long title:string '
+                               'username:flags.6?string photo:chat_photo date:int version:int '
+                               'restriction_reason:flags.9?string admin_rights:flags.14?channel_admin_rights '
+                               'banned_rights:flags.15?channel_banned_rights participants_count:flags.17?int',
+        '_tl_channel_layer72': 'flags:# creator:flags.0?true left:flags.2?true broadcast:flags.5?true '
+                               'verified:flags.7?true megagroup:flags.8?true restricted:flags.9?true '
+                               'democracy:flags.10?true signatures:flags.11?true min:flags.12?true id:int '
+                               'access_hash:flags.13?long title:string username:flags.6?string photo:chat_photo '
+                               'date:int version:int restriction_reason:flags.9?string '
+                               'admin_rights:flags.14?channel_admin_rights '
+                               'banned_rights:flags.15?channel_banned_rights',
+        '_tl_chat_old': 'id:int title:string photo:chat_photo participants_count:int date:int left:Bool version:int',
+        '_tl_channel_old': 'flags:# creator:flags.0?true kicked:flags.1?true left:flags.2?true moderator:flags.4?true '
+                           'broadcast:flags.5?true verified:flags.7?true megagroup:flags.8?true '
+                           'explicit_content:flags.9?true id:int access_hash:long title:string username:flags.6?string '
+                           'photo:chat_photo date:int version:int',
+        '_tl_pageBlockChannel': 'channel:chat',
+        '_tl_pageBlockSlideshow': 'elements:Vector<page_block> caption:rich_text',
+        '_tl_pageBlockPullquote': 'text:rich_text caption:rich_text',
+        '_tl_pageBlockAudio': 'audio_id:long caption:rich_text',
+        '_tl_pageRelatedArticle': 'flags:# url:string webpage_id:long title:flags.0?string description:flags.1?string '
+                                  'photo_id:flags.2?long author:flags.3?string published_date:flags.4?int',
+        '_tl_pageBlockRlatedArticles': 'title:rich_text elements:Vector<page_related_article>',
+        '_tl_pageBlockCover': 'cover:page_block',
+        '_tl_textEmpty': '',
+        '_tl_textPlain': 'text:string',
+        '_tl_textConcat': 'texts:Vector<rich_text>',
+        '_tl_textBold': 'text:rich_text',
+        '_tl_textUrl': 'text:rich_text url:string webpage_id:long',
+        '_tl_textItalic': 'text:rich_text',
+        '_tl_textStrike': 'text:rich_text',
+        '_tl_textFixed': 'text:rich_text',
+        '_tl_textEmail': 'text:rich_text email:string',
+        '_tl_textUnderline': 'text:rich_text email:string',
+        '_tl_pageBlockPhoto_layer82': 'photo_id:long caption:rich_text',
+        '_tl_pageFullPart': 'blocks:Vector<page_block> photos:Vector<photo> documents:Vector<document>',
+        '_tl_page': 'flags:# part:flags.0?true rtl:flags.1?true url:string blocks:Vector<page_block> '
+                    'photos:Vector<photo> documents:Vector<document>',
+        '_tl_webPage': 'flags:# id:long url:string display_url:string hash:int typeof:flags.0?string '
+                       'site_name:flags.1?string title:flags.2?string description:flags.3?string photo:flags.4?photo '
+                       'embed_url:flags.5?string embed_type:flags.5?string embed_width:flags.6?int '
+                       'embed_height:flags.6?int duration:flags.7?int author:flags.8?string document:flags.9?document '
+                       'cached_page:flags.10?page',
+        '_tl_webPageEmpty': 'id:long',
+        '_tl_webPage_old': 'flags:# id:long url:string display_url:string type:flags.0?string site_name:flags.1?string '
+                           'title:flags.2?string description:flags.3?string photo:flags.4?photo '
+                           'embed_url:flags.5?string embed_type:flags.5?string embed_width:flags.6?int '
+                           'embed_height:flags.6?int duration:flags.7?int author:flags.8?string',
+        '_tl_webPage_layer58': 'flags:# id:long url:string display_url:string type:flags.0?string '
+                               'site_name:flags.1?string title:flags.2?string description:flags.3?string '
+                               'photo:flags.4?photo embed_url:flags.5?string embed_type:flags.5?string '
+                               'embed_width:flags.6?int embed_height:flags.6?int duration:flags.7?int '
+                               'author:flags.8?string document:flags.9?document',
+        '_tl_webPageUrlPending': 'url:string',
+        '_tl_webPagePending': 'id:long date:int',
+        '_tl_webPageNotModified': '',
+        '_tl_messageMediaWebPage': 'webpage:web_page',
+        '_tl_documentAttributeAudio': 'flags:# voice:flags.10?true duration:int title:flags.0?string '
+                                      'performer:flags.1?string waveform:flags.2?bytes',
+        '_tl_documentAttributeVideo': 'flags:# round_message:flags.0?true duration:int w:int h:int',
+        '_tl_documentAttributeFilename': 'file_name:string',
+        '_tl_documentAttributeImageSize': 'w:int h:int',
+        '_tl_inputStickerSetID': 'id:long access_hash:long',
+        '_tl_inputStickerSetShortName': 'short_name:string',
+        '_tl_inputStickerSetEmpty': '',
+        '_tl_maskCoords': 'n:int x:double y:double zoom:double',
+        '_tl_documentAttributeSticker': 'flags:# mask:flags.1?true alt:string stickerset:input_sticker_set '
+                                        'mask_coords:flags.0?mask_coords',
+        '_tl_documentAttributeVideo_layer65': 'duration:int w:int h:int',
+        '_tl_documentAttributeAnimated': '',
+        '_tl_documentAttributeSticker_layer55': 'alt:string stickerset:input_sticker_set',
+        '_tl_documentAttributeAudio_old': 'duration:int',
+        '_tl_documentAttributeAudio_layer45': 'duration:int title:string performer:string',
+        '_tl_documentAttributeSticker_old': '',
+        '_tl_documentAttributeHasStickers': '',
+        '_tl_documentAttributeSticker_old2': 'alt:string',
+        '_tl_document': 'flags:# id:long access_hash:long file_reference:bytes date:int mime_type:string size:int '
+                        'thumbs:flags.0?Vector<photo_size> dc_id:int attributes:Vector<document_attribute>',
+        '_tl_document_layer92': 'id:long access_hash:long file_reference:bytes date:int mime_type:string size:int '
+                                'thumb:photo_size dc_id:int attributes:Vector<document_attribute>',
+        '_tl_document_layer82': 'id:long access_hash:long date:int mime_type:string size:int thumb:photo_size '
+                                'dc_id:int version:int attributes:Vector<document_attribute>',
+        '_tl_documentEmpty': 'id:long',
+        '_tl_document_old': 'id:long access_hash:long user_id:int date:int file_name:string mime_type:string size:int '
+                            'thumb:photo_size dc_id:int',
+        '_tl_documentEncrypted_old': 'id:long access_hash:long user_id:int date:int file_name:string mime_type:string '
+                                     'size:int thumb:photo_size dc_id:int key:bytes iv:bytes',
+        '_tl_document_layer53': 'id:long access_hash:long mime_type:string size:int thumb:photo_size dc_id:int '
+                                'attributes:Vector<document_attribute>',
+        '_tl_messageMediaDocument_layer68': 'document:document caption:string',
+        '_tl_photoEmpty': 'id:long',
+        '_tl_messageMediaContact': 'phone_number:string first_name:string last_name:string user_id:int',
+        '_tl_messageMediaPhoto_layer68': 'photo:photo caption:string',
+        '_tl_messageMediaUnsupported_old': 'bytes:bytes',
+        '_tl_audioEmpty_layer45': 'id:long',
+        '_tl_audio_layer45': 'id:long access_hash:long date:int duration:int mime_type:string size:int dc_id:int',
+        '_tl_audio_old': 'id:long access_hash:long user_id:int date:int duration:int size:int dc_id:int',
+        '_tl_audioEncrypted': 'id:long access_hash:long user_id:int date:int duration:int size:int dc_id:int key:bytes '
+                              'iv:bytes',
+        '_tl_audio_old2': 'id:long access_hash:long user_id:int date:int duration:int mime_type:string size:int '
+                          'dc_id:int',
+        '_tl_messageMediaPhoto_old': 'photo:photo',
+        '_tl_messageMediaUnsupported': '',
+        '_tl_messageMediaVenue_layer71': 'geo:geo_point title:string address:string provider:string venue_id:string',
+        '_tl_messageMediaVenue': 'geo:geo_point title:string address:string provider:string venue_id:string '
+                                 'venue_type:string',
+        '_tl_video_old3': 'id:long access_hash:long user_id:int date:int duration:int size:int thumb:photo_size '
+                          'dc_id:int w:int h:int',
+        '_tl_video_layer45': 'id:long access_hash:long date:int duration:int mime_type:string size:int '
+                             'thumb:photo_size dc_id:int w:int h:int',
+        '_tl_videoEncrypted': 'id:long access_hash:long user_id:int date:int caption:string duration:int size:int '
+                              'thumb:photo_size dc_id:int w:int h:int key:bytes iv:bytes',
+        '_tl_video_old': 'id:long access_hash:long user_id:int date:int caption:string duration:int size:int '
+                         'thumb:photo_size dc_id:int w:int h:int',
+        '_tl_video_old2': 'id:long access_hash:long user_id:int date:int caption:string duration:int mime_type:string '
+                          'size:int thumb:photo_size dc_id:int w:int h:int',
+        '_tl_videoEmpty_layer45': 'id:long',
+        '_tl_webDocument': 'url:string access_hash:long size:int mime_type:string '
+                           'attributes:Vector<document_attribute> dc_id:int',
+        '_tl_messageMediaInvoice': 'flags:# shipping_address_requested:flags.1?true test:flags.3?true title:string '
+                                   'description:string photo:flags.0?web_document receipt_msg_id:flags.2?int '
+                                   'currency:string total_amount:long start_param:string',
+        '_tl_messageMediaGeo': 'geo:geo_point',
+        '_tl_messageMediaGeoLive': 'geo:geo_point period:int',
+        '_tl_game': 'flags:# id:long access_hash:long short_name:string title:string description:string photo:photo '
+                    'document:flags.0?document',
+        '_tl_poll_answer_votes': 'flags:# chosen:flags.0?true option:bytes voters:string',
+        '_tl_messageMediaGame': 'game:game',
+        '_tl_poll_result': 'flags:# min:flags.0?true results:flags.1?Vector<poll_answer_votes> total_votes:flags.2?int',
+        '_tl_poll_answer': 'text:string option:bytes',
+        '_tl_poll': 'flags:# id:long closed:flags.0?true question:string answers:Vector<poll_answer>',
+        '_tl_messageMediaPoll': 'poll:poll results:poll_result',
+        '_tl_messageMediaEmpty': '',
+        '_tl_messageEntityMention': 'offset:int length:int',
+        '_tl_messageEntityUrl': 'offset:int length:int',
+        '_tl_messageEntityHashtag': 'offset:int length:int',
+        '_tl_messageEntityBold': 'offset:int length:int',
+        '_tl_messageEntityTextUrl': 'offset:int length:int url:string',
+        '_tl_messageEntityItalic': 'offset:int length:int',
+        '_tl_messageEntityBotCommand': 'offset:int length:int',
+        '_tl_messageEntityEmail': 'offset:int length:int',
+        '_tl_messageEntityPre': 'offset:int length:int language:string',
+        '_tl_messageEntityUnknown': 'offset:int length:int',
+        '_tl_messageEntityMentionName': 'offset:int length:int user_id:int',
+        '_tl_inputUserEmpty': '',
+        '_tl_inputUserSelf': '',
+        '_tl_inputUser': 'user_id:int access_hash:long',
+        '_tl_inputMessageEntityMentionName': 'offset:int length:int user_id:input_user',
+        '_tl_messageEntityCode': 'offset:int length:int',
+        '_tl_messageEntityPhone': 'offset:int length:int',
+        '_tl_keyboardButtonCallback': 'text:string data:bytes',
+        '_tl_keyboardButtonRequestPhone': 'text:string',
+        '_tl_keyboardButtonGame': 'text:string',
+        '_tl_keyboardButtonUrl': 'text:string url:string',
+        '_tl_keyboardButtonSwitchInline': 'flags:# same_peer:flags.0?true text:string query:string',
+        '_tl_keyboardButtonRequestGeoLocation': 'text:string',
+        '_tl_keyboardButtonBuy': 'text:string',
+        '_tl_keyboardButton': 'text:string',
+        '_tl_keyboardButtonRow': 'buttons:Vector<keyboard_button>',
+        '_tl_replyInlineMarkup': 'rows:Vector<keyboard_button_row>',
+        '_tl_replyKeyboardHide': 'flags:# selective:flags.2?true',
+        '_tl_replyKeyboardForceReply': 'flags:# single_use:flags.1?true selective:flags.2?true',
+        '_tl_replyKeyboardMarkup': 'flags:# resize:flags.0?true single_use:flags.1?true selective:flags.2?true '
+                                   'rows:Vector<keyboard_button_row>',
+        '_tl_messageActionChatAddUser': 'users:Vector<int>',
+        '_tl_messageActionUserJoined': '',
+        '_tl_decryptedMessageActionNoop': '',
+        '_tl_decryptedMessageActionAcceptKey': 'exchange_id:long g_b:bytes key_fingerprint:long',
+        '_tl_decryptedMessageActionNotifyLayer': 'layer:int',
+        '_tl_decryptedMessageActionSetMessageTTL': 'ttl_seconds:int',
+        '_tl_decryptedMessageActionDeleteMessages': 'random_ids:Vector<long>',
+        '_tl_decryptedMessageActionCommitKey': 'exchange_id:long key_fingerprint:long',
+        '_tl_decryptedMessageActionAbortKey': 'exchange_id:long',
+        '_tl_decryptedMessageActionFlushHistory': '',
+        '_tl_sendMessageGamePlayAction': '',
+        '_tl_sendMessageRecordAudioAction': '',
+        '_tl_sendMessageUploadVideoAction_old': '',
+        '_tl_sendMessageUploadAudioAction_old': '',
+        '_tl_sendMessageUploadAudioAction': 'progress:int',
+        '_tl_sendMessageUploadPhotoAction': 'progress:int',
+        '_tl_sendMessageUploadDocumentAction_old': '',
+        '_tl_sendMessageUploadVideoAction': 'progress:int',
+        '_tl_sendMessageCancelAction': '',
+        '_tl_sendMessageGeoLocationAction': '',
+        '_tl_sendMessageChooseContactAction': '',
+        '_tl_sendMessageRecordRoundAction': '',
+        '_tl_sendMessageUploadRoundAction': 'progress:int',
+        '_tl_sendMessageTypingAction': '',
+        '_tl_sendMessageUploadPhotoAction_old': '',
+        '_tl_sendMessageUploadDocumentAction': 'progress:int',
+        '_tl_sendMessageRecordVideoAction': '',
+        '_tl_decryptedMessageActionTyping': 'action:send_message_action',
+        '_tl_decryptedMessageActionReadMessages': 'random_ids:Vector<long>',
+        '_tl_decryptedMessageActionResend': 'start_seq_no:int end_seq_no:int',
+        '_tl_decryptedMessageActionRequestKey': 'exchange_id:long g_a:bytes',
+        '_tl_decryptedMessageActionScreenshotMessages': 'random_ids:Vector<long>',
+        '_tl_messageEncryptedAction': 'encryptedAction:decrypted_message_action',
+        '_tl_messageActionHistoryClear': '',
+        '_tl_messageActionChatCreate': 'title:string users:Vector<int>',
+        '_tl_messageActionChatEditPhoto': 'photo:photo',
+        '_tl_messageActionChatDeleteUser': 'user_id:int',
+        '_tl_messageActionChannelCreate': 'title:string',
+        '_tl_messageActionChatDeletePhoto': '',
+        '_tl_messageActionChatEditTitle': 'title:string',
+        '_tl_messageActionEmpty': '',
+        '_tl_messageActionLoginUnknownLocation': 'title:string address:string',
+        '_tl_messageActionChatMigrateTo': 'channel_id:int',
+        '_tl_messageActionScreenshotTaken': '',
+        '_tl_messageActionChannelMigrateFrom': 'title:string chat_id:int',
+        '_tl_messageActionCreatedBroadcastList': '',
+        '_tl_messageActionUserUpdatedPhoto': 'newUserPhoto:user_profile_photo',
+        '_tl_messageActionChatAddUser_old': 'user_id:int',
+        '_tl_messageActionTTLChange': 'ttl:int',
+        '_tl_messageActionGeoChatCheckin': '',
+        '_tl_messageActionChatJoinedByLink': 'inviter_id:int',
+        '_tl_messageActionPinMessage': '',
+        '_tl_messageActionPhoneCall': 'flags:# call_id:long reason:flags.0?phone_call_discard_reason '
+                                      'duration:flags.1?int',
+        '_tl_messageActionPaymentSent': 'currency:string total_amount:long',
+        '_tl_messageActionGameScore': 'game_id:long score:int',
+        '_tl_messageActionGeoChatCreate': 'title:string address:string',
+        '_tl_messageActionCustomAction': 'message:string',
+        '_tl_phoneCallDiscardReasonHangup': '',
+        '_tl_phoneCallDiscardReasonBusy': '',
+        '_tl_phoneCallDiscardReasonMissed': '',
+        '_tl_phoneCallDiscardReasonDisconnect': '',
+        '_tl_userProfilePhoto': 'photo_id:long photo_small:file_location photo_big:file_location dc_id:int',
+        '_tl_userProfilePhoto_layer97': 'photo_id:long photo_small:file_location photo_big:file_location',
+        '_tl_userProfilePhotoEmpty': '',
+        '_tl_userProfilePhoto_old': 'photo_small:file_location photo_big:file_location',
+        '_tl_userStatusOffline': 'expires:int',
+        '_tl_userStatusRecently': '',
+        '_tl_userStatusOnline': 'expires:int',
+        '_tl_userStatusLastWeek': '',
+        '_tl_userStatusEmpty': '',
+        '_tl_userStatusLastMonth': '',
+        '_tl_user_layer65': 'flags:# self:flags.10?true contact:flags.11?true mutual_contact:flags.12?true '
+                            'deleted:flags.13?true bot:flags.14?true bot_chat_history:flags.15?true '
+                            'bot_nochats:flags.16?true verified:flags.17?true restricted:flags.18?true '
+                            'min:flags.20?true bot_inline_geo:flags.21?true id:int access_hash:flags.0?long '
+                            'first_name:flags.1?string last_name:flags.2?string username:flags.3?string '
+                            'phone:flags.4?string photo:flags.5?user_profile_photo status:flags.6?user_status '
+                            'bot_info_version:flags.14?int restriction_reason:flags.18?string '
+                            'bot_inline_placeholder:flags.19?string',
+        '_tl_encryptedChat': 'id:int access_hash:long date:int admin_id:int participant_id:int g_a_or_b:bytes '
+                             'key_fingerprint:long',
+        '_tl_encryptedChatRequested_old': 'id:int access_hash:long date:int admin_id:int participant_id:int g_a:bytes '
+                                          'nonce:bytes',
+        '_tl_encryptedChatRequested': 'id:int access_hash:long date:int admin_id:int participant_id:int g_a:bytes',
+        '_tl_encryptedChat_old': 'id:int access_hash:long date:int admin_id:int participant_id:int g_a_or_b:bytes '
+                                 'nonce:bytes key_fingerprint:long',
+        '_tl_encryptedChatEmpty': 'id:int',
+        '_tl_encryptedChatWaiting': 'id:int access_hash:long date:int admin_id:int participant_id:int',
+        '_tl_encryptedChatDiscarded': 'id:int',
+        '_tl_userContact_old2': 'id:int first_name:string last_name:string username:string access_hash:long '
+                                'phone:string photo:user_profile_photo status:user_status',
+        '_tl_userContact_old': 'id:int first_name:string last_name:string access_hash:long phone:string '
+                               'photo:user_profile_photo status:user_status',
+        '_tl_user': 'flags:# self:flags.10?true contact:flags.11?true mutual_contact:flags.12?true '
+                    'deleted:flags.13?true bot:flags.14?true bot_chat_history:flags.15?true bot_nochats:flags.16?true '
+                    'verified:flags.17?true restricted:flags.18?true min:flags.20?true bot_inline_geo:flags.21?true '
+                    'id:int access_hash:flags.0?long first_name:flags.1?string last_name:flags.2?string '
+                    'username:flags.3?string phone:flags.4?string photo:flags.5?user_profile_photo '
+                    'status:flags.6?user_status bot_info_version:flags.14?int restriction_reason:flags.18?string '
+                    'bot_inline_placeholder:flags.19?string lang_code:flags.22?string',
+        '_tl_userSelf_old': 'id:int first_name:string last_name:string phone:string photo:user_profile_photo '
+                            'status:user_status',
+        '_tl_userSelf_old3': 'id:int first_name:string last_name:string username:string phone:string '
+                             'photo:user_profile_photo status:user_status',
+        '_tl_userDeleted_old2': 'id:int first_name:string last_name:string username:string',
+        '_tl_userEmpty': 'id:int',
+        '_tl_userRequest_old': 'id:int first_name:string last_name:string access_hash:long phone:string '
+                               'photo:user_profile_photo status:user_status',
+        '_tl_userForeign_old': 'id:int first_name:string last_name:string access_hash:long photo:user_profile_photo '
+                               'status:user_status',
+        '_tl_userForeign_old2': 'id:int first_name:string last_name:string username:string access_hash:long '
+                                'photo:user_profile_photo status:user_status',
+        '_tl_userRequest_old2': 'id:int first_name:string last_name:string username:string access_hash:long '
+                                'phone:string photo:user_profile_photo status:user_status',
+        '_tl_userDeleted_old': 'id:int first_name:string last_name:string',
+        '_tl_user_old': 'flags:# self:flags.10?true contact:flags.11?true mutual_contact:flags.12?true '
+                        'deleted:flags.13?true bot:flags.14?true bot_chat_history:flags.15?true '
+                        'bot_nochats:flags.16?true verified:flags.17?true explicit_content:flags.18?true id:int '
+                        'access_hash:flags.0?long first_name:flags.1?string last_name:flags.2?string '
+                        'username:flags.3?string phone:flags.4?string photo:flags.5?user_profile_photo '
+                        'status:flags.6?user_status bot_info_version:flags.14?int',
+        '_tl_userSelf_old2': 'id:int first_name:string last_name:string username:string phone:string '
+                             'photo:user_profile_photo status:user_status inactive:Bool',
+        '_tl_chatForbidden_old': 'id:int title:string date:int',
+        '_tl_chat_old2': 'flags:# creator:flags.0?true kicked:flags.1?true left:flags.2?true '
+                         'admins_enabled:flags.3?true admin:flags.4?true deactivated:flags.5?true id:int title:string '
+                         'photo:chat_photo participants_count:int date:int version:int',
+        '_tl_channelForbidden_layer67': 'flags:# broadcast:flags.5?true megagroup:flags.8?true id:int access_hash:long '
+                                        'title:string',
+        '_tl_channel_layer48': 'flags:# creator:flags.0?true kicked:flags.1?true left:flags.2?true '
+                               'moderator:flags.4?true broadcast:flags.5?true verified:flags.7?true '
+                               'megagroup:flags.8?true restricted:flags.9?true democracy:flags.10?true '
+                               'signatures:flags.11?true id:int access_hash:long title:string username:flags.6?string '
+                               'photo:flags.6?chat_photo date:int version:int restriction_reason:flags.9?string',
+        '_tl_geoChat': 'id:int access_hash:long title:string address:string venue:string geo:geo_point '
+                       'photo:chat_photo participants_count:int date:int checked_in:Bool version:int',
+        '_tl_channelForbidden_layer52': 'id:int access_hash:long title:string',
+        '_tl_chatForbidden': 'id:int title:string',
+        '_tl_channel_layer67': 'flags:# creator:flags.0?true kicked:flags.1?true left:flags.2?true '
+                               'moderator:flags.4?true broadcast:flags.5?true verified:flags.7?true '
+                               'megagroup:flags.8?true restricted:flags.9?true democracy:flags.10?true '
+                               'signatures:flags.11?true min:flags.12?true id:int access_hash:flags.13?long '
+                               'title:string username:flags.6?string photo:chat_photo date:int version:int '
+                               'restriction_reason:flags.9?string',
+        '_tl_messageService': 'flags:# unread:flags.0?true out:flags.1?true mentioned:flags.4?true '
+                              'media_unread:flags.5?true silent:flags.13?true post:flags.14?true id:int '
+                              'from_id:flags.8?int to_id:peer reply_to_msg_id:flags.3?int date:int '
+                              'action:message_action',
+        '_tl_messageEmpty': 'id:int to_id:_tl_peerUser',
+        '_tl_botInfoEmpty_layer48': '',
+        '_tl_botInfo': 'user_id:int description:string commands:Vector<bot_command>',
+        '_tl_botInfo_layer48': 'user_id:int version:int myvar:string description:string commands:Vector<bot_command>',
+        '_tl_chatParticipantCreator': 'user_id:int',
+        '_tl_chatParticipant': 'user_id:int inviter_id:int date:int',
+        '_tl_chatParticipantAdmin': 'user_id:int inviter_id:int date:int',
+        '_tl_chatParticipantsForbidden': 'flags:# chat_id:int self_participant:flags.0?chat_participant',
+        '_tl_chatParticipants': 'chat_id:int participants:Vector<chat_participant> version:int',
+        '_tl_chatParticipants_old': 'chat_id:int admin_id:int participants:Vector<chat_participant> version:int',
+        '_tl_chatParticipantsForbidden_old': 'chat_id:int',
+        '_tl_peerNotifySettings_layer77': 'flags:# show_previews:flags.0?true silent:flags.1?true mute_until:int '
+                                          'sound:string',
+        '_tl_peerNotifySettings_layer47': 'mute_until:int sound:string show_previews:Bool events_mask:int',
+        '_tl_peerNotifySettingsEmpty': '',
+        '_tl_chatInviteEmpty': '',
+        '_tl_chatInviteExported': 'link:string',
+        '_tl_stickerSet_old': 'id:long access_hash:long title:string short_name:string',
+        '_tl_stickerSet': 'flags:# installed:flags.0?true archived:flags.1?true official:flags.2?true '
+                          'masks:flags.3?true id:long access_hash:long title:string short_name:string count:int '
+                          'hash:int',
+        '_tl_chatFull': 'flags:# can_set_username:flags.7?true id:int about:string participants:chat_participants '
+                        'chat_photo:flags.2?photo notify_settings:peer_notify_settings '
+                        'exported_invite:exported_chat_invite bot_info:flags.3?Vector<bot_info> '
+                        'pinned_msg_id:flags.6?int folder_id:flags.11?int',
+        '_tl_chatFull_layer87': 'id:int participants:chat_participants chat_photo:photo '
+                                'notify_settings:peer_notify_settings exported_invite:exported_chat_invite '
+                                'bot_info:Vector<bot_info>',
+        '_tl_channelFull_layer67': 'flags:# can_view_participants:flags.3?true can_set_username:flags.6?true id:int '
+                                   'about:string participants_count:flags.0?int admins_count:flags.1?int '
+                                   'kicked_count:flags.2?int read_inbox_max_id:int read_outbox_max_id:int '
+                                   'unread_count:int chat_photo:photo notify_settings:peer_notify_settings '
+                                   'exported_invite:exported_chat_invite bot_info:Vector<bot_info> '
+                                   'migrated_from_chat_id:flags.4?int migrated_from_max_id:flags.4?int '
+                                   'pinned_msg_id:flags.5?int',
+        '_tl_channelFull_layer70': 'flags:# can_view_participants:flags.3?true can_set_username:flags.6?true id:int '
+                                   'about:string participants_count:flags.0?int admins_count:flags.1?int '
+                                   'kicked_count:flags.2?int banned_count:flags.2?int read_inbox_max_id:int '
+                                   'read_outbox_max_id:int unread_count:int chat_photo:photo '
+                                   'notify_settings:peer_notify_settings exported_invite:exported_chat_invite '
+                                   'bot_info:Vector<bot_info> migrated_from_chat_id:flags.4?int '
+                                   'migrated_from_max_id:flags.4?int pinned_msg_id:flags.5?int',
+        '_tl_channelFull_layer71': 'flags:# can_view_participants:flags.3?true can_set_username:flags.6?true '
+                                   'can_set_stickers:flags.7?true id:int about:string participants_count:flags.0?int '
+                                   'admins_count:flags.1?int kicked_count:flags.2?int banned_count:flags.2?int '
+                                   'read_inbox_max_id:int read_outbox_max_id:int unread_count:int chat_photo:photo '
+                                   'notify_settings:peer_notify_settings exported_invite:exported_chat_invite '
+                                   'bot_info:Vector<bot_info> migrated_from_chat_id:flags.4?int '
+                                   'migrated_from_max_id:flags.4?int pinned_msg_id:flags.5?int '
+                                   'stickerset:flags.8?sticker_set',
+        '_tl_channelFull_layer72': 'flags:# can_view_participants:flags.3?true can_set_username:flags.6?true '
+                                   'can_set_stickers:flags.7?true hidden_prehistory:flags.10?true id:int about:string '
+                                   'participants_count:flags.0?int admins_count:flags.1?int kicked_count:flags.2?int '
+                                   'banned_count:flags.2?int read_inbox_max_id:int read_outbox_max_id:int '
+                                   'unread_count:int chat_photo:photo notify_settings:peer_notify_settings '
+                                   'exported_invite:exported_chat_invite bot_info:Vector<bot_info> '
+                                   'migrated_from_chat_id:flags.4?int migrated_from_max_id:flags.4?int '
+                                   'pinned_msg_id:flags.5?int stickerset:flags.8?sticker_set '
+                                   'available_min_id:flags.9?int',
+        '_tl_channelFull_layer89': 'flags:# can_view_participants:flags.3?true can_set_username:flags.6?true '
+                                   'can_set_stickers:flags.7?true hidden_prehistory:flags.10?true id:int about:string '
+                                   'participants_count:flags.0?int admins_count:flags.1?int kicked_count:flags.2?int '
+                                   'banned_count:flags.2?int read_inbox_max_id:int read_outbox_max_id:int '
+                                   'unread_count:int chat_photo:photo notify_settings:peer_notify_settings '
+                                   'exported_invite:exported_chat_invite bot_info:Vector<bot_info> '
+                                   'migrated_from_chat_id:flags.4?int migrated_from_max_id:flags.4?int '
+                                   'pinned_msg_id:flags.5?int stickerset:flags.8?sticker_set '
+                                   'available_min_id:flags.9?int call_msg_id:flags.11?int',
+        '_tl_channelFull': 'flags:# can_view_participants:flags.3?true can_set_username:flags.6?true '
+                           'can_set_stickers:flags.7?true hidden_prehistory:flags.10?true can_view_stats:flags.12?true '
+                           'id:int about:string participants_count:flags.0?int admins_count:flags.1?int '
+                           'kicked_count:flags.2?int banned_count:flags.2?int online_count:flags.13?int '
+                           'read_inbox_max_id:int read_outbox_max_id:int unread_count:int chat_photo:photo '
+                           'notify_settings:peer_notify_settings exported_invite:exported_chat_invite '
+                           'bot_info:Vector<bot_info> migrated_from_chat_id:flags.4?int '
+                           'migrated_from_max_id:flags.4?int pinned_msg_id:flags.5?int stickerset:flags.8?sticker_set '
+                           'available_min_id:flags.9?int call_msg_id:flags.11?int linked_chat_id:flags.13?int',
+        '_tl_channelFull_layer52': 'flags:# can_view_participants:flags.3?true can_set_username:flags.6?true id:int '
+                                   'about:string participants_count:flags.0?int admins_count:flags.1?int '
+                                   'kicked_count:flags.2?int read_inbox_max_id:int unread_count:int '
+                                   'unread_important_count:int chat_photo:photo notify_settings:peer_notify_settings '
+                                   'exported_invite:exported_chat_invite bot_info:Vector<bot_info> '
+                                   'migrated_from_chat_id:flags.4?int migrated_from_max_id:flags.4?int '
+                                   'pinned_msg_id:flags.5?int',
+        '_tl_channelFull_layer48': 'flags:# can_view_participants:flags.3?true id:int about:string '
+                                   'participants_count:flags.0?int admins_count:flags.1?int kicked_count:flags.2?int '
+                                   'read_inbox_max_id:int unread_count:int unread_important_count:int chat_photo:photo '
+                                   'notify_settings:peer_notify_settings exported_invite:exported_chat_invite '
+                                   'bot_info:Vector<bot_info> migrated_from_chat_id:flags.4?int '
+                                   'migrated_from_max_id:flags.4?int',
+        '_tl_channelFull_old': 'flags:# can_view_participants:flags.3?true id:int about:string '
+                               'participants_count:flags.0?int admins_count:flags.1?int kicked_count:flags.2?int '
+                               'read_inbox_max_id:int unread_count:int unread_important_count:int chat_photo:photo '
+                               'notify_settings:peer_notify_settings exported_invite:exported_chat_invite',
+
+    }
+
+    # поля записей (OUTPUT_RECORDS) сверх LAYOUTS: все поля парсеров без описания и поля,
+    # которые заполняют эвристики и *_deserialize (thumb.type у старых аудио и т.п.)
+    RECORD_FIELDS = {
+        '_tl_messageFwdHeader': ('flags', 'from_id', 'from_name', 'date', 'channel_id', 'channel_post', 'post_author',
+                                 'saved_from_peer', 'saved_from_msg_id'),
+        '_tl_messageFwdHeader_layer96': ('flags', 'from_id', 'date', 'channel_id', 'channel_post', 'post_author',
+                                         'saved_from_peer', 'saved_from_msg_id'),
+        '_tl_photoSizeEmpty': ('type',),
+        '_tl_photoStrippedSize': ('type', 'bytes', 'w', 'h'),
+        '_tl_pageBlockAuthorDate_layer60': ('author', 'published_date'),
+        'chat_banned_rights': ('flags', 'view_messages', 'send_messages', 'send_media', 'send_stickers', 'send_gifs',
+                               'send_games', 'send_inline', 'embed_links', 'send_polls', 'change_info',
+                               'invite_users', 'pin_messages', 'until_date'),
+        '_tl_chatEmpty': ('id', 'title'),
+        '_tl_documentEncrypted': ('id', 'access_hash', 'date', 'mime_type', 'size', 'thumb', 'dc_id', 'attributes',
+                                  'key', 'iv'),
+        '_tl_messageMediaDocument': ('flags', 'document', 'caption', 'ttl_seconds'),
+        '_tl_messageMediaDocument_layer72': ('flags', 'document', 'caption', 'ttl_seconds'),
+        '_tl_messageMediaPhoto': ('flags', 'photo', 'caption', 'ttl_seconds'),
+        '_tl_messageMediaPhoto_layer72': ('flags', 'photo', 'caption', 'ttl_seconds'),
+        '_tl_messageMediaAudio_layer45': ('audio_unused',),
+        '_tl_messageMediaVideo_old': ('video_unused',),
+        '_tl_messageMediaVideo_layer45': ('video_unused', 'caption'),
+        '_tl_channelForbidden': ('flags', 'broadcast', 'megagroup', 'id', 'access_hash', 'title', 'until_date'),
+        '_tl_message_secret': ('flags', 'unread', 'out', 'mentioned', 'media_unread', 'id', 'ttl', 'from_id', 'to_id',
+                               'date', 'message', 'media', 'entities', 'via_bot_name', 'reply_to_random_id',
+                               'grouped_id', 'attachPath'),
+        '_tl_message_secret_layer72': ('flags', 'unread', 'out', 'mentioned', 'media_unread', 'id', 'ttl', 'from_id',
+                                       'to_id', 'date', 'message', 'media', 'entities', 'via_bot_name',
+                                       'reply_to_random_id', 'attachPath'),
+        '_tl_message_layer72': ('flags', 'unread', 'out', 'mentioned', 'media_unread', 'silent', 'post',
+                                'with_my_score', 'id', 'from_id', 'to_id', 'fwd_from', 'via_bot_id',
+                                'reply_to_msg_id', 'date', 'message', 'media', 'reply_markup', 'entities', 'views',
+                                'edit_date', 'author', 'attachPath', 'fwd_msg_id'),
+        '_tl_message_layer68': ('flags', 'unread', 'out', 'mentioned', 'media_unread', 'silent', 'post',
+                                'with_my_score', 'id', 'from_id', 'to_id', 'fwd_from', 'via_bot_id',
+                                'reply_to_msg_id', 'date', 'message', 'media', 'reply_markup', 'entities', 'views',
+                                'edit_date', 'attachPath', 'fwd_msg_id'),
+        '_tl_message_old5': ('flags', 'unread', 'out', 'mentioned', 'media_unread', 'id', 'from_id', 'to_id',
+                             'fwd_from', 'reply_to_msg_id', 'date', 'message', 'media', 'reply_markup', 'entities',
+                             'attachPath', 'fwd_msg_id'),
+        '_tl_messageService_old2': ('unread', 'out', 'mentioned', 'media_unread', 'id', 'from_id', 'to_id', 'date',
+                                    'action', 'flags'),
+        '_tl_message_old3': ('flags', 'unread', 'out', 'mentioned', 'media_unread', 'id', 'from_id', 'to_id',
+                             'fwd_from', 'reply_to_msg_id', 'date', 'message', 'media', 'attachPath', 'fwd_msg_id'),
+        '_tl_message_old4': ('flags', 'unread', 'out', 'mentioned', 'media_unread', 'id', 'from_id', 'to_id',
+                             'fwd_from', 'reply_to_msg_id', 'date', 'message', 'media', 'reply_markup', 'attachPath',
+                             'fwd_msg_id'),
+        '_tl_message_layer47': ('flags', 'unread', 'out', 'mentioned', 'media_unread', 'id', 'from_id', 'to_id',
+                                'fwd_from', 'peer', 'via_bot_id', 'reply_to_msg_id', 'date', 'message', 'media',
+                                'reply_markup', 'entities', 'views', 'attachPath', 'fwd_msg_id'),
+        '_tl_message_old7': ('flags', 'unread', 'out', 'mentioned', 'media_unread', 'id', 'from_id', 'to_id',
+                             'fwd_from', 'peer', 'reply_to_msg_id', 'date', 'message', 'media', 'reply_markup',
+                             'entities', 'views', 'attachPath', 'fwd_msg_id'),
+        '_tl_messageService_layer48': ('flags', 'unread', 'out', 'mentioned', 'media_unread', 'silent', 'post', 'id',
+                                       'from_id', 'to_id', 'date', 'action'),
+        '_tl_message_old6': ('flags', 'unread', 'out', 'mentioned', 'media_unread', 'id', 'from_id', 'to_id',
+                             'fwd_from', 'reply_to_msg_id', 'date', 'message', 'media', 'reply_markup', 'entities',
+                             'attachPath', 'fwd_msg_id'),
+        '_tl_messageForwarded_old2': ('unread', 'out', 'mentioned', 'media_unread', 'id', 'fwd_from', 'from_id',
+                                      'to_id', 'date', 'message', 'flags', 'media', 'fwd_msg_id', 'attachPath'),
+        '_tl_messageForwarded_old': ('id', 'fwd_from', 'from_id', 'to_id', 'out', 'unread', 'flags', 'date',
+                                     'message', 'media', 'fwd_msg_id', 'attachPath'),
+        '_tl_message_old2': ('flags', 'unread', 'out', 'mentioned', 'media_unread', 'id', 'from_id', 'to_id', 'date',
+                             'message', 'media', 'attachPath'),
+        '_tl_messageService_old': ('id', 'from_id', 'to_id', 'out', 'unread', 'flags', 'date', 'action'),
+        '_tl_message_old': ('id', 'from_id', 'to_id', 'out', 'unread', 'flags', 'date', 'message', 'media',
+                            'attachPath'),
+        '_tl_message': ('flags', 'out', 'mentioned', 'media_unread', 'silent', 'post', 'id', 'from_id', 'to_id',
+                        'fwd_from', 'via_bot_id', 'reply_to_msg_id', 'date', 'message', 'media', 'reply_markup',
+                        'entities', 'views', 'edit_date', 'author', 'grouped_id', 'attachPath', 'fwd_msg_id'),
+        '_tl_message_secret_old': ('flags', 'unread', 'out', 'mentioned', 'media_unread', 'id', 'ttl', 'from_id',
+                                   'to_id', 'date', 'message', 'media', 'attachPath'),
+        '_tl_peerNotifySettings': ('flags',),
+    }
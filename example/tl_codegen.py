@@ -0,0 +1,267 @@
+"""
+Генератор модуля парсеров по схеме TL (строки вида name#id field:type ... = Type;)
+Запуск: python -m example.tl_codegen schema.tl parsers.py
+"""
+import re
+import sys
+import collections
+
+VECTOR = 0x1cb5c415
+BOOL_TRUE = 0x997275b5
+
+Param = collections.namedtuple('Param', 'name type flags bit')
+Constructor = collections.namedtuple('Constructor', 'name id params type')
+
+_LINE = re.compile(r'^([\w.]+)#([0-9a-fA-F]{1,8})\s*(.*?)\s*=\s*([\w.<>%]+)\s*;$')
+_FLAG = re.compile(r'^(\w+)\.(\d+)\?(.+)$')
+# Vector<T> - с magic, vector<T> и %Vector<T> - голый вектор: только число элементов
+_VECTOR_TYPE = re.compile(r'^(%?[Vv])ector<(.+)>$')
+# встроенные типы в начале схем: int ? = Int; vector#1cb5c415 {t:Type} # [ t ] = Vector t;
+# int128 4*[ int ] = Int128;
+_BUILTIN = re.compile(r'^\S+ .*\?.*=|^.*=\s*\w+ \w+\s*;$|^\w+\s+\d+\s*\*\s*\[\s*\w+\s*\]\s*=\s*\w+\s*;$')
+_NUMBERS = {'int': ('I', 4), 'long': ('Q', 8), 'double': ('d', 8)}
+
+
+def parse_schema(text):
+    """
+    Разбор схемы TL: конструкторы до секции ---functions---, обобщённые параметры {X:Type} пропускаются
+    :param text: текст схемы
+    :return: список Constructor
+    >>> schema = parse_schema('''
+    ... int ? = Int;
+    ... vector#1cb5c415 {t:Type} # [ t ] = Vector t;
+    ... int128 4*[ int ] = Int128;
+    ... int256 8*[ int ] = Int256;
+    ... // comment
+    ... peerUser#9db1bc6d user_id:int = Peer;
+    ... message#44f9b43d flags:# out:flags.1?true id:int from_id:flags.8?int to_id:Peer = Message;
+    ... ---functions---
+    ... messages.getHistory#afa92846 peer:InputPeer = messages.Messages;
+    ... ''')
+    >>> print([(item.name, hex(item.id), item.type) for item in schema])
+    [('peerUser', '0x9db1bc6d', 'Peer'), ('message', '0x44f9b43d', 'Message')]
+    >>> print(schema[1].params[3])
+    Param(name='from_id', type='int', flags='flags', bit=8)
+    """
+    constructors = list()
+    for line in text.splitlines():
+        line = line.split('//', 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith('---'):
+            if line.strip('-') == 'functions':
+                break
+            continue
+        match = _LINE.match(line)
+        if match is None:
+            if _BUILTIN.match(line):
+                continue
+            raise ValueError("unsupported TL line: {}".format(line))
+        name, number, fields, result = match.groups()
+        params = list()
+        for field in fields.split():
+            if field.startswith('{'):
+                continue
+            field_name, field_type = field.split(':', 1)
+            flag = _FLAG.match(field_type)
+            if flag:
+                params.append(Param(field_name, flag.group(3), flag.group(1), int(flag.group(2))))
+            else:
+                params.append(Param(field_name, field_type, None, None))
+        constructors.append(Constructor(name, int(number, 16), tuple(params), result))
+    return constructors
+
+
+def function_name(name):
+    return '_tl_' + name.replace('.', '_')
+
+
+class _Writer(object):
+    def __init__(self):
+        self.lines = list()
+        self.level = 1
+
+    def __call__(self, line):
+        self.lines.append('    ' * self.level + line)
+
+
+def _is_time(param):
+    return param.type == 'int' and (param.name == 'date' or param.name.endswith('_date'))
+
+
+def _bare_constructor(type_name, by_name, by_type):
+    # голый тип: %Type - единственный конструктор типа Type, имя со строчной буквы - сам конструктор
+    bare = type_name.lstrip('%')
+    if type_name.startswith('%') and bare in by_type:
+        items = by_type[bare]
+        if len(items) != 1:
+            raise ValueError("bare type {} has {} constructors".format(type_name, len(items)))
+        return items[0]
+    if bare not in by_name:
+        raise ValueError("unknown bare type: {}".format(type_name))
+    return by_name[bare]
+
+
+def _emit_read(out, target, type_name, by_name, by_type, param, depth=0):
+    # чтение значения типа type_name в target; внутри функции курсор - локальная pos
+    vector = _VECTOR_TYPE.match(type_name)
+    if type_name in _NUMBERS:
+        code, size = _NUMBERS[type_name]
+        value = '_unpack_{}(cell, pos)[0]'.format(type_name)
+        if param is not None and _is_time(param):
+            value = 'convert_time({})'.format(value)
+        out('{} = {}'.format(target, value))
+        out('pos += {}'.format(size))
+    elif type_name in ('int128', 'int256'):
+        size = 16 if type_name == 'int128' else 32
+        out('{} = convert_bytes(cell[pos:pos + {}])'.format(target, size))
+        out('pos += {}'.format(size))
+    elif type_name == 'Bool':
+        out('{} = _unpack_int(cell, pos)[0] == 0x{:x}'.format(target, BOOL_TRUE))
+        out('pos += 4')
+    elif type_name in ('string', 'bytes'):
+        out('reader.pos = pos')
+        out('{} = reader.read_{}'.format(target, type_name))
+        out('pos = reader.pos')
+    elif vector:
+        boxed, item = vector.group(1) == 'V', vector.group(2)
+        magic, count, items, value = ('{}{}'.format(name, depth) for name in ('magic', 'count', 'items', 'item'))
+        if boxed:
+            out('{}, {} = _unpack_vector(cell, pos)'.format(magic, count))
+            out('assert {} == 0x{:x}, "magic in {} vector"'.format(magic, VECTOR, param.name if param else item))
+            out('pos += 8')
+        else:
+            out('{} = _unpack_int(cell, pos)[0]'.format(count))
+            out('pos += 4')
+        if item in _NUMBERS:
+            code, size = _NUMBERS[item]
+            out("{} = list(unpack_from('<{{}}{}'.format({}), cell, pos))".format(target, code, count))
+            out('pos += {} * {}'.format(count, size))
+        else:
+            out('{} = list()'.format(items))
+            out('for i{} in range({}):'.format(depth, count))
+            out.level += 1
+            _emit_read(out, value, item, by_name, by_type, None, depth + 1)
+            out('{}.append({})'.format(items, value))
+            out.level -= 1
+            out('{} = {}'.format(target, items))
+    else:
+        out('reader.pos = pos')
+        if type_name.startswith('%') or type_name[:1].islower():
+            constructor = _bare_constructor(type_name, by_name, by_type)
+            out('{} = {}(reader)'.format(target, function_name(constructor.name)))
+        else:
+            out('{} = parse(reader)'.format(target))
+        out('pos = reader.pos')
+
+
+def generate(constructors, source='schema', layer=None):
+    """
+    Исходный код модуля парсеров: функция _tl_<name>(reader) на каждый конструктор,
+    чтение int/long/double/Bool встроено (struct.unpack_from по локальной позиции),
+    маски флагов - константы в коде, PARSERS - таблица {constructor: функция}.
+    reader - TeleData (cell, pos, read_string, read_bytes, convert_bytes, convert_time)
+    :param constructors: результат parse_schema
+    :param source: имя файла схемы (для заголовка модуля)
+    :param layer: номер слоя схемы
+    :return: текст модуля
+    >>> import struct
+    >>> from example.telegram import TeleData
+    >>> schema = parse_schema('''
+    ... peerUser#9db1bc6d user_id:int = Peer;
+    ... message#44f9b43d flags:# out:flags.1?true id:int from_id:flags.8?int to_id:Peer date:int message:string = Message;
+    ... ''')
+    >>> namespace = dict()
+    >>> exec(generate(schema), namespace)
+    >>> cell = struct.pack('<6I', 0x44f9b43d, 2, 7, 0x9db1bc6d, 42, 0) + b'\\x02hi\\x00'
+    >>> print(namespace['parse'](TeleData(cell, time_mode=TeleData.TIME_RAW)))
+    {'flags': 2, 'out': True, 'id': 7, 'to_id': {'user_id': 42}, 'date': 0, 'message': 'hi'}
+    >>> schema = parse_schema('''
+    ... point#1a2b3c4d x:int y:int = Point;
+    ... polygon#5e6f7a8b points:Vector<%Point> ids:vector<int> corners:vector<point> = Polygon;
+    ... ''')
+    >>> namespace = dict()
+    >>> exec(generate(schema), namespace)
+    >>> cell = struct.pack('<8I', 0x5e6f7a8b, 0x1cb5c415, 2, 1, 2, 3, 4, 2) + struct.pack('<5I', 5, 6, 1, 7, 8)
+    >>> print(namespace['parse'](TeleData(cell)))
+    {'points': [{'x': 1, 'y': 2}, {'x': 3, 'y': 4}], 'ids': [5, 6], 'corners': [{'x': 7, 'y': 8}]}
+    """
+    by_name = {item.name: item for item in constructors}
+    by_type = dict()
+    for item in constructors:
+        by_type.setdefault(item.type, []).append(item)
+    lines = [
+        '"""',
+        'Сгенерировано example/tl_codegen.py из {}, не редактировать вручную'.format(source),
+        '"""',
+        'import struct',
+        '',
+        'from map import Map',
+        '',
+        'LAYER = {!r}'.format(layer),
+        "_unpack_int = struct.Struct('<I').unpack_from",
+        "_unpack_long = struct.Struct('<Q').unpack_from",
+        "_unpack_double = struct.Struct('<d').unpack_from",
+        "_unpack_vector = struct.Struct('<II').unpack_from",
+        'unpack_from = struct.unpack_from',
+        '',
+        '',
+        'def parse(reader):',
+        '    constructor = _unpack_int(reader.cell, reader.pos)[0]',
+        '    reader.pos += 4',
+        '    parser = PARSERS.get(constructor)',
+        '    if parser is None:',
+        '        raise ValueError("constructor hex={} not in schema".format(hex(constructor)))',
+        '    return parser(reader)',
+    ]
+    for item in constructors:
+        out = _Writer()
+        out('cell = reader.cell')
+        out('pos = reader.pos')
+        out('convert_time = reader.convert_time')
+        out('convert_bytes = reader.convert_bytes')
+        out('params = Map()')
+        for param in item.params:
+            target = 'params[{!r}]'.format(param.name)
+            if param.type == '#':
+                _emit_read(out, param.name, 'int', by_name, by_type, None)
+                out('{} = {}'.format(target, param.name))
+                continue
+            if param.flags is None:
+                if param.type != 'true':
+                    _emit_read(out, target, param.type, by_name, by_type, param)
+                continue
+            mask = '0x{:x}'.format(1 << param.bit)
+            if param.type == 'true':
+                out('{} = ({} & {}) != 0'.format(target, param.flags, mask))
+                continue
+            out('if {} & {}:'.format(param.flags, mask))
+            out.level += 1
+            _emit_read(out, target, param.type, by_name, by_type, param)
+            out.level -= 1
+        out('reader.pos = pos')
+        out('return params')
+        lines += ['', '', 'def {}(reader):'.format(function_name(item.name)),
+                  '    # {}#{:08x} = {}'.format(item.name, item.id, item.type)]
+        lines += out.lines
+    lines += ['', '', 'PARSERS = {']
+    lines += ['    0x{:08x}: {},'.format(item.id, function_name(item.name)) for item in constructors]
+    lines += ['}', '']
+    return '\n'.join(lines)
+
+
+def main(argv):
+    if len(argv) != 3:
+        print("usage: python -m example.tl_codegen schema.tl parsers.py")
+        return 2
+    with open(argv[1], encoding='utf-8') as schema:
+        text = schema.read()
+    layer = re.search(r'//\s*LAYER\s+(\d+)', text)
+    source = generate(parse_schema(text), argv[1], int(layer.group(1)) if layer else None)
+    with open(argv[2], 'w', encoding='utf-8') as module:
+        module.write(source)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
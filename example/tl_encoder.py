@@ -0,0 +1,595 @@
+"""
+Запись разобранных TeleData объектов (Map, записи example.records) обратно в байты TL
+Функции записи строятся по исходному коду _tl_* парсеров: порядок и типы полей те же, что при чтении,
+конструкторы берутся из тех же таблиц *_PARSERS
+"""
+import ast
+import time
+import base64
+import struct
+import inspect
+import linecache
+import textwrap
+import functools
+
+from example.telegram import TeleData, _TIME_FORMAT
+
+VECTOR = 0x1cb5c415
+BOOL_TRUE = 0x997275b5
+BOOL_FALSE = 0xbc799737
+
+_pack_int32 = struct.Struct('<I').pack_into
+_pack_int64 = struct.Struct('<Q').pack_into
+_pack_double = struct.Struct('<d').pack_into
+
+# self.read_* -> метод TeleWriter
+_READS = {
+    'read_int32': 'int32', 'read_int64': 'int64', 'read_double': 'double',
+    'read_string': 'string', 'read_bytes': 'bytes', 'read_bool': 'bool',
+}
+_NUMBER_VECTORS = {'read_int32_vector': 'int32_vector', 'read_int64_vector': 'int64_vector'}
+
+
+def time_to_ts(value):
+    """
+    Обратное к TeleData.convert_time: строка 'YYYY-mm-dd HH:MM:SS' (местное время), LazyTime или int
+    :return: unix time
+    >>> from example.telegram import LazyTime
+    >>> print(time_to_ts(TeleData.TIME_CONVERTERS[TeleData.TIME_FORMATTED](1500000000)), time_to_ts(LazyTime(7)))
+    1500000000 7
+    """
+    if isinstance(value, str):
+        return int(time.mktime(time.strptime(value, _TIME_FORMAT)))
+    return int(value)
+
+
+class TeleWriter(object):
+    """
+    Запись примитивов TL в заранее выделенный bytearray; при нехватке места буфер удваивается,
+    после reset() тот же буфер используется для следующей ячейки
+    >>> writer = TeleWriter(8)
+    >>> writer.int32(0x9db1bc6d)
+    >>> writer.string('hi')
+    >>> writer.bool(True)
+    >>> print(writer.getvalue().hex(), len(writer.buffer))
+    6dbcb19d02686900b5757299 16
+    """
+    def __init__(self, size=4096):
+        """
+        :param size: начальный размер буфера
+        """
+        self.buffer = bytearray(size)
+        self.pos = 0
+
+    def reset(self):
+        self.pos = 0
+
+    def getvalue(self):
+        """
+        :return: записанные байты
+        """
+        return bytes(memoryview(self.buffer)[:self.pos])
+
+    def reserve(self, size):
+        """
+        :param size: сколько байт будет записано с текущей позиции
+        """
+        end = self.pos + size
+        length = len(self.buffer)
+        if end > length:
+            self.buffer.extend(bytes(max(end, 2 * length) - length))
+
+    def int32(self, value):
+        pos = self.pos
+        if pos + 4 > len(self.buffer):
+            self.reserve(4)
+        _pack_int32(self.buffer, pos, value & 0xffffffff)
+        self.pos = pos + 4
+
+    def int64(self, value):
+        pos = self.pos
+        if pos + 8 > len(self.buffer):
+            self.reserve(8)
+        _pack_int64(self.buffer, pos, value & 0xffffffffffffffff)
+        self.pos = pos + 8
+
+    def double(self, value):
+        pos = self.pos
+        if pos + 8 > len(self.buffer):
+            self.reserve(8)
+        _pack_double(self.buffer, pos, value)
+        self.pos = pos + 8
+
+    def bool(self, value):
+        self.int32(BOOL_TRUE if value else BOOL_FALSE)
+
+    def tl_slice(self, data):
+        """
+        TL строка/байты: длина (1 байт или 0xfe + 3 байта), данные, нули до границы 4 байт
+        :param data: bytes, bytearray или memoryview
+        """
+        size = len(data)
+        head = 1 if size < 254 else 4
+        total = (head + size + 3) & ~3
+        self.reserve(total)
+        buffer = self.buffer
+        pos = self.pos
+        if head == 1:
+            buffer[pos] = size
+        else:
+            buffer[pos:pos + 4] = (size << 8 | 254).to_bytes(4, 'little')
+        end = pos + head + size
+        buffer[pos + head:end] = data
+        buffer[end:pos + total] = bytes(pos + total - end)
+        self.pos = pos + total
+
+    def string(self, value):
+        self.tl_slice(value.encode('utf-8'))
+
+    def bytes(self, value):
+        """
+        :param value: bytes, memoryview, LazyBase64 или строка base64 (все режимы TeleData.bytes_mode)
+        """
+        if isinstance(value, str):
+            value = base64.b64decode(value)
+        elif not isinstance(value, (bytes, bytearray, memoryview)):
+            value = bytes(value)
+        self.tl_slice(value)
+
+    def _numbers(self, code, size, values):
+        self.int32(VECTOR)
+        self.int32(len(values))
+        self.reserve(size * len(values))
+        mask = (1 << size * 8) - 1
+        struct.pack_into('<{}{}'.format(len(values), code), self.buffer, self.pos, *(value & mask for value in values))
+        self.pos += size * len(values)
+
+    def int32_vector(self, values):
+        self._numbers('I', 4, values)
+
+    def int64_vector(self, values):
+        self._numbers('Q', 8, values)
+
+
+def _self_attr(node):
+    # self.<имя> -> имя
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 'self':
+        return node.attr
+    return None
+
+
+def _params_field(node):
+    # params.<поле> -> поле
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 'params':
+        return node.attr
+    return None
+
+
+def _reads(node):
+    # выражение читает ячейку: self.read_*, self.*_deserialize(...), self._tl_*()
+    for item in ast.walk(node):
+        name = _self_attr(item)
+        if name and (name.startswith('read_') or name.startswith('_tl_') or name.endswith('_deserialize')
+                     or name == 'get_int_byte'):
+            return True
+    return False
+
+
+def _table(cls, deserialize):
+    table = deserialize[:-len('_deserialize')].upper() + '_PARSERS'
+    if not isinstance(getattr(cls, table, None), dict):
+        raise _Unsupported("no table {}".format(table))
+    return table
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class _Condition(ast.NodeTransformer):
+    # params.<поле> -> params.get(поле), self.<КОНСТАНТА> -> значение; другие обращения к self не переносимы
+    def __init__(self, cls):
+        self.cls = cls
+        self.portable = True
+
+    def visit_Attribute(self, node):
+        field = _params_field(node)
+        if field is not None:
+            return ast.parse('params.get({!r})'.format(field), mode='eval').body
+        name = _self_attr(node)
+        if name is not None:
+            value = getattr(self.cls, name, None)
+            if name.isupper() and isinstance(value, int):
+                return ast.Constant(value)
+            self.portable = False
+        return self.generic_visit(node)
+
+
+class _Compiler(object):
+    """
+    Перевод тела _tl_* парсера в функцию записи: чтения полей становятся записью params[поле],
+    производные поля (флаги-признаки, вычисленные значения) пропускаются;
+    значения, которые парсер читает, но не сохраняет, записать нельзя - причины собираются в unsupported,
+    такие конструкторы TeleEncoder отвергает до записи
+    """
+    def __init__(self, cls, name):
+        self.cls = cls
+        self.name = name
+        self.lines = list()
+        self.level = 1
+        # локальная переменная -> (поле, дата через convert_time)
+        self.stored = dict()
+        # поле -> (метод записи, таблица или парсер) и поля, которые парсер заполняет всегда
+        # (включая продолжение _tail): для выбора конструктора по полям объекта
+        self.kinds = dict()
+        self.always = set()
+        self.unsupported = list()
+
+    def out(self, line):
+        self.lines.append('    ' * self.level + line)
+
+    def compile(self):
+        function = getattr(self.cls, self.name)
+        node = ast.parse(textwrap.dedent(inspect.getsource(function))).body[0]
+        args = [arg.arg for arg in node.args.args[1:]]
+        if args[:1] == ['params']:
+            args = args[1:]
+        for item in ast.walk(node):
+            if isinstance(item, ast.Assign) and len(item.targets) == 1 and _params_field(item.targets[0]):
+                field, value = _params_field(item.targets[0]), item.value
+                if isinstance(value, ast.Call) and _self_attr(value.func) == 'convert_time' and value.args:
+                    value, converted = value.args[0], True
+                else:
+                    converted = False
+                if isinstance(value, ast.Name):
+                    self.stored.setdefault(value.id, (field, converted))
+        self.block(node.body)
+        header = 'def {}(encoder, w, {}):'.format(self.name, ', '.join(['params'] + args))
+        return '\n'.join([header] + (self.lines or ['    pass']))
+
+    def block(self, statements):
+        for statement in statements:
+            try:
+                self.statement(statement)
+            except _Unsupported as e:
+                self.unsupported.append(str(e))
+
+    def write(self, kind, value):
+        # запись значения выражения value прочитанного вида kind
+        method, argument = kind
+        if method == 'object':
+            self.out('encoder.object(w, {}, {!r})'.format(value, argument))
+        elif method == 'vector':
+            self.out('encoder.vector(w, {}, {!r})'.format(value, argument))
+        elif method == 'bare':
+            self.out('encoder.bare(w, {}, {!r})'.format(value, argument))
+        else:
+            self.out('w.{}({})'.format(method, value))
+
+    def read_kind(self, node):
+        """
+        :return: (метод записи, таблица или парсер) для выражения чтения, None - выражение ничего не читает
+        """
+        name = _self_attr(node)
+        if name in _READS:
+            return _READS[name], None
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+            # flags = self.read_int32 | MESSAGE_FLAG_... : пишется сохранённое значение
+            left = node.left
+            while isinstance(left, ast.BinOp) and isinstance(left.op, ast.BitOr):
+                left = left.left
+            if _self_attr(left) == 'read_int32' and not _reads(node.right):
+                return 'int32', None
+        if isinstance(node, ast.Call):
+            name = _self_attr(node.func) or ''
+            if name in _NUMBER_VECTORS and not node.args:
+                return _NUMBER_VECTORS[name], None
+            if name == 'read_vector' and node.args and (_self_attr(node.args[0]) or '').endswith('_deserialize'):
+                return 'vector', _table(self.cls, _self_attr(node.args[0]))
+            if name.endswith('_deserialize') and node.args and _self_attr(node.args[0]) == 'read_int32':
+                return 'object', _table(self.cls, name)
+            if name.startswith('_tl_') and not node.args:
+                return 'bare', name
+        if _reads(node):
+            raise _Unsupported("cannot write {}".format(ast.unparse(node)))
+        return None
+
+    def statement(self, node):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            if self.level == 1 and _params_field(target):
+                self.always.add(_params_field(target))
+            kind = self.read_kind(node.value)
+            if kind is None:
+                return
+            field = _params_field(target)
+            if field is not None:
+                self.kinds.setdefault(field, kind)
+                self.write(kind, 'params[{!r}]'.format(field))
+            elif isinstance(target, ast.Name) and target.id == 'params' and kind[0] == 'bare':
+                self.write(kind, 'params')
+            elif isinstance(target, ast.Name) and target.id in self.stored and kind[0] in _READS.values():
+                field, converted = self.stored[target.id]
+                value = 'params[{!r}]'.format(field)
+                self.out('{} = {}'.format(target.id, 'time_to_ts({})'.format(value) if converted else value))
+                self.write(kind, target.id)
+            elif isinstance(target, ast.Name):
+                raise _Unsupported("{} is not kept in the decoded object".format(target.id))
+            else:
+                raise _Unsupported("cannot write {}".format(ast.unparse(target)))
+        elif isinstance(node, ast.If):
+            self.branch(node)
+        elif isinstance(node, ast.Try):
+            self.block(node.body)
+        elif isinstance(node, ast.Return):
+            self.returns(node.value)
+        elif _reads(node):
+            raise _Unsupported("cannot write {}".format(ast.unparse(node)))
+
+    def returns(self, value):
+        if isinstance(value, ast.Name) and value.id == 'params':
+            self.out('return')
+            return
+        name = _self_attr(value.func) if isinstance(value, ast.Call) else None
+        if name and name.startswith('_tl_') and value.args and ast.unparse(value.args[0]) == 'params':
+            # продолжение объекта (_tl_message_tail): те же params и аргументы
+            self.out('encoder.tail(w, {!r}, {})'.format(name, ', '.join(ast.unparse(arg) for arg in value.args)))
+            tail = compile_encoder(self.cls, name)
+            self.always.update(tail.always)
+            self.unsupported.extend(tail.unsupported)
+            self.out('return')
+            return
+        raise _Unsupported("cannot write return {}".format(ast.unparse(value)))
+
+    def condition(self, test):
+        """
+        :return: условие для функции записи, None - условие зависит от состояния читателя
+        """
+        rewrite = _Condition(self.cls)
+        test = rewrite.visit(ast.parse(ast.unparse(test), mode='eval').body)
+        return ast.unparse(test) if rewrite.portable else None
+
+    def branch(self, node):
+        # условия на self.lazy и self.at_end() при записи ложны: объект пишется целиком
+        if any(_self_attr(item) in ('lazy', 'at_end') for item in ast.walk(node.test)):
+            self.block(node.orelse)
+            return
+        if not _reads(node):
+            return
+        test = self.condition(node.test)
+        if test is None:
+            # эвристика по self.instances: поле было прочитано, если оно есть в объекте
+            fields = sorted({_params_field(item.targets[0]) for item in ast.walk(node)
+                             if isinstance(item, ast.Assign) and _params_field(item.targets[0]) and _reads(item.value)})
+            if not fields:
+                raise _Unsupported("cannot write {}".format(ast.unparse(node.test)))
+            test = ' or '.join('params.get({!r}) is not None'.format(field) for field in fields)
+        self.out('if {}:'.format(test))
+        self.level += 1
+        size = len(self.lines)
+        self.block(node.body)
+        if len(self.lines) == size:
+            self.out('pass')
+        self.level -= 1
+        if node.orelse and _reads(ast.Module(node.orelse, [])):
+            self.out('else:')
+            self.level += 1
+            self.block(node.orelse)
+            self.level -= 1
+
+
+@functools.lru_cache(maxsize=None)
+def compile_encoder(cls, name):
+    """
+    :param cls: класс с _tl_* парсерами (TeleData)
+    :param name: имя парсера
+    :return: функция записи (encoder, w, params, *аргументы продолжения); unsupported - причины,
+        по которым объект этого конструктора записать нельзя (пусто - можно)
+    >>> print(compile_encoder(TeleData, '_tl_botCommand').unsupported)
+    ('command is not kept in the decoded object', 'description is not kept in the decoded object')
+    >>> print(inspect.getsource(compile_encoder(TeleData, '_tl_photoSize')))
+    def _tl_photoSize(encoder, w, params):
+        w.string(params['type'])
+        encoder.object(w, params['location'], 'FILE_LOCATION_PARSERS')
+        w.int32(params['w'])
+        w.int32(params['h'])
+        w.int32(params['size'])
+        return
+    """
+    compiler = _Compiler(cls, name)
+    source = compiler.compile()
+    namespace = {'time_to_ts': time_to_ts}
+    filename = '<tl_encoder {}>'.format(name)
+    exec(compile(source, filename, 'exec'), namespace)
+    function = namespace[name]
+    function.kinds = compiler.kinds
+    function.always = frozenset(compiler.always)
+    function.unsupported = tuple(compiler.unsupported)
+    # исходный код для inspect и трассировок
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    return function
+
+
+@functools.lru_cache(maxsize=None)
+def _constructors(cls, table):
+    # {имя парсера: конструктор}, при повторах имени - первый конструктор таблицы
+    ids = dict()
+    for constructor, parser in getattr(cls, table).items():
+        ids.setdefault(parser.__name__, constructor)
+    return ids
+
+
+class TeleEncoder(object):
+    """
+    Запись объектов TeleData в TL. Конструктор объекта - имя парсера, сохранённое при разборе
+    (слот _parser у ParsedMap и у записей OUTPUT_RECORDS); у собранных вручную Map он определяется
+    по набору полей среди парсеров таблицы, а если полям подходят несколько конструкторов
+    (messageEntityBold и messageEntityItalic, ...), запись прерывается с ValueError.
+    Флаги пишутся как сохранены в поле flags: чтобы убрать необязательное поле, нужно снять и его бит.
+    Даты в режиме TIME_CACHED/TIME_FORMATTED переводятся обратно через местное время,
+    байты в любом bytes_mode; точное совпадение с исходной ячейкой гарантируют TIME_RAW и TIME_LAZY
+    >>> import os
+    >>> from map import Map
+    >>> samples = os.path.dirname(os.path.abspath(__file__))
+    >>> for name in ('data1', 'data2'):
+    ...     with open(os.path.join(samples, name), 'rb') as sample:
+    ...         cell = sample.read()
+    ...     reader = TeleData(cell)
+    ...     message = reader.message_deserialize(reader.read_int32)
+    ...     encoder = TeleEncoder()
+    ...     print(name, encoder.encode(message) == cell[:reader.pos])
+    data1 True
+    data2 True
+    >>> message.message = 'redacted'
+    >>> reader = TeleData(encoder.encode(message))
+    >>> print(reader.message_deserialize(reader.read_int32).message, reader.at_end(), len(reader.cell))
+    redacted True 12360
+    >>> cell = struct.pack('<6I', 0x44f9b43d, 0, 7, 0x9db1bc6d, 42, 0) + b'\\x02hi\\x00'
+    >>> reader = TeleData(cell, lazy=True)
+    >>> message = reader.message_deserialize(reader.read_int32)
+    >>> print(TeleEncoder().encode(message) == cell, TeleEncoder().encode(Map(message)) == cell)
+    True True
+    """
+    def __init__(self, reader_class=TeleData, size=4096):
+        """
+        :param reader_class: класс с _tl_* парсерами и таблицами *_PARSERS
+        :param size: начальный размер буфера записи
+        """
+        self.reader_class = reader_class
+        self.writer = TeleWriter(size)
+        self.schemas = {name: frozenset(record.__slots__) for name, record in reader_class.record_types().items()}
+        self._matches = dict()
+
+    def encode(self, value, kind='message'):
+        """
+        :param value: объект, возвращённый <kind>_deserialize
+        :param kind: тип объекта, префикс метода *_deserialize (message, user, chat_full, ...)
+        :return: bytes ячейки
+        """
+        writer = self.writer
+        writer.reset()
+        self.object(writer, value, kind.upper() + '_PARSERS')
+        return writer.getvalue()
+
+    def encode_many(self, values, kind='message'):
+        """
+        Потоковая запись в один и тот же буфер
+        :param values: итерируемое с объектами одного типа
+        :param kind: тип объектов
+        :return: генератор bytes в порядке объектов
+        >>> import os
+        >>> cells = list()
+        >>> for name in ('data1', 'data2'):
+        ...     with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), name), 'rb') as sample:
+        ...         cells.append(sample.read()[:-4])
+        >>> messages = list(TeleData.decode_many(cells, output=TeleData.OUTPUT_RECORDS, bytes_mode=TeleData.BYTES_VIEW))
+        >>> print(list(TeleEncoder().encode_many(messages)) == cells)
+        True
+        """
+        for value in values:
+            yield self.encode(value, kind)
+
+    def parser_name(self, value, table):
+        """
+        :param value: объект
+        :param table: имя таблицы *_PARSERS
+        :return: имя парсера, которым был прочитан объект
+        :raises ValueError: конструктор не определяется однозначно или объект этого конструктора записать нельзя
+        >>> from map import Map
+        >>> TeleEncoder().parser_name(Map(expires=1500000000), 'USER_STATUS_PARSERS')
+        Traceback (most recent call last):
+            ...
+        ValueError: ambiguous constructor in USER_STATUS_PARSERS: _tl_userStatusOffline, _tl_userStatusOnline
+        >>> reader = TeleData(struct.pack('<I', 1500000000), output=TeleData.OUTPUT_RECORDS)
+        >>> print(TeleEncoder().parser_name(reader.user_status_deserialize(0x8c703f), 'USER_STATUS_PARSERS'))
+        _tl_userStatusOffline
+        """
+        name = self._match(value, table)
+        self.writer_function(name)
+        return name
+
+    def writer_function(self, name):
+        """
+        :param name: имя парсера
+        :return: функция записи объектов этого парсера (compile_encoder)
+        :raises ValueError: парсер читает значения, которые не сохраняет в объекте
+        >>> TeleEncoder().writer_function('_tl_messageMediaDocument_old')
+        Traceback (most recent call last):
+            ...
+        ValueError: _tl_messageMediaDocument_old cannot be encoded: document is not kept in the decoded object
+        """
+        function = compile_encoder(self.reader_class, name)
+        if function.unsupported:
+            raise ValueError("{} cannot be encoded: {}".format(name, '; '.join(function.unsupported)))
+        return function
+
+    def _match(self, value, table):
+        names = _constructors(self.reader_class, table)
+        name = getattr(value, '_parser', None)
+        if name in names:
+            return name
+        keys = frozenset(value.keys())
+        candidates = self._matches.get((table, keys))
+        if candidates is None:
+            # парсеры, схема которых содержит все поля объекта
+            schemas = self.schemas
+            candidates = sorted(name for name in names if keys <= schemas.get(name, ()))
+            self._matches[(table, keys)] = candidates
+        fits = [name for name in candidates if self._fits(value, name)]
+        if len(fits) == 1:
+            return fits[0]
+        if fits:
+            # одинаковые по полям конструкторы (messageEntityUrl и messageEntityPhone, ...) различает
+            # только имя парсера, сохранённое при разборе
+            raise ValueError("ambiguous constructor in {}: {}".format(table, ', '.join(fits)))
+        raise ValueError("no constructor in {} with fields {}".format(table, sorted(keys)))
+
+    def _fits(self, value, name):
+        # у объекта есть все поля, которые парсер name заполняет всегда,
+        # значения полей подходят по виду к его записи: объект таблицы поля, список, строка, число
+        encoder = compile_encoder(self.reader_class, name)
+        if not all(value.get(field) is not None for field in encoder.always):
+            return False
+        for field, (kind, argument) in encoder.kinds.items():
+            item = value.get(field)
+            if item is None:
+                continue
+            if kind == 'object':
+                keys = frozenset(item.keys()) if hasattr(item, 'keys') else None
+                fits = keys is not None and any(
+                    keys <= self.schemas.get(other, ()) for other in _constructors(self.reader_class, argument))
+            elif kind == 'bare':
+                fits = hasattr(item, 'keys') and frozenset(item.keys()) <= self.schemas.get(argument, ())
+            elif kind.endswith('vector'):
+                fits = isinstance(item, list)
+            elif kind == 'string':
+                fits = isinstance(item, str)
+            else:
+                fits = not hasattr(item, 'keys') and not isinstance(item, list)
+            if not fits:
+                return False
+        return True
+
+    def object(self, w, value, table):
+        """
+        Конструктор и поля объекта (чтение через *_deserialize(self.read_int32))
+        """
+        name = self._match(value, table)
+        function = self.writer_function(name)
+        w.int32(_constructors(self.reader_class, table)[name])
+        function(self, w, value)
+
+    def vector(self, w, values, table):
+        w.int32(VECTOR)
+        w.int32(len(values))
+        for value in values:
+            self.object(w, value, table)
+
+    def bare(self, w, value, name):
+        """
+        Поля объекта без конструктора (чтение прямым вызовом self._tl_*())
+        """
+        self.writer_function(name)(self, w, value)
+
+    def tail(self, w, name, params, *args):
+        self.writer_function(name)(self, w, params, *args)
@@ -1,20 +1,39 @@
-import re
+import json
 import typing
-from collections import Mapping
+import operator
+import functools
+import itertools
+from collections.abc import Mapping
+
+
+def _is_dunder(key):
+    # служебное имя __*__; ключи-не строки служебными не бывают
+    return key.__class__ is str and len(key) > 4 and key[:2] == '__' and key[-2:] == '__'
+
+
+class _IndexStamp(object):
+    # общая метка индекса build_index и вложенных в его дерево Map: valid=False - индекс устарел;
+    # слот __index у Map: None или [(paths, ends, stamp) своего индекса или None, stamp-ы чужих индексов, ...]
+    __slots__ = ('valid',)
+
+    def __init__(self):
+        self.valid = True
 
 
 class Map(dict):
     """
     Класс для хранения атрибутов в стиле Java. Имеет ссылочный тип, но не ссылочный конструктор
     не генерирует исключения при обращении к несуществующему ключу, при удалении несуществующено ключа
+    Значения хранятся только в самом словаре: __dict__ у экземпляров нет, атрибуты читаются через __getattr__
     """
-    __re__ = re.compile("^__.+__$")
-    __protected__ = list()
+    __slots__ = ('__index',)
+    __protected__ = frozenset()
 
     def __new__(cls, seq=None, **kwargs):
         instance = super(Map, cls).__new__(typing.cast(typing.Type[Map], cls))  # cast to avoid mypy error
+        object.__setattr__(instance, '_Map__index', None)
         if not cls.__protected__:
-            cls.__protected__ = dir(instance)
+            cls.__protected__ = frozenset(dir(instance))
         return instance
 
     def __init__(self, seq=None, **kwargs):
@@ -46,17 +65,106 @@ class Map(dict):
         5 False
         >>> print(group)
         {'boris': {'name': 'Boris', 'age': 5}, 'julia': {'name': 'Julia', 'age': 6}}
+        >>> print(hasattr(group, '__dict__'), group.julia.name, getattr(group.julia, 'age'))
+        False Julia 6
         """
-        if seq is None:
-            seq = dict()
-        super(Map, self).__init__(seq, **kwargs)
-        for k, v in list(seq.items()) + list(kwargs.items()):
-            self.check_protected(k)
+        super(Map, self).__init__()
+        items = kwargs.items() if seq is None else itertools.chain(seq.items(), kwargs.items())
+        for k, v in items:
             if isinstance(v, Mapping):
                 self[k] = Map(v)
             else:
                 self[k] = v
 
+    @classmethod
+    def from_tree(cls, tree, share=False):
+        """
+        Строит дерево Map из вложенных Mapping и list за один проход без рекурсии
+        (в отличие от конструктора, словари внутри списков тоже становятся Map)
+        :param tree: Mapping или list
+        :param share: списки исходного дерева переиспользуются (элементы заменяются на месте),
+            иначе создаются новые списки; листья не копируются в обоих случаях
+        :return: Map (или list, если корнем был список)
+        >>> source = {"name": "Boris", "pets": [{"name": "Rex"}, "cat"], "info": {"age": 5}}
+        >>> tree = Map.from_tree(source)
+        >>> print(tree.pets[0].name, tree.info.age, type(tree.pets[0]).__name__, tree.pets is source["pets"])
+        Rex 5 Map False
+        >>> shared = Map.from_tree(source, share=True)
+        >>> print(shared.pets is source["pets"], type(source["pets"][0]).__name__)
+        True Map
+        >>> deep = {"level": 0}
+        >>> for level in range(1, 5000):
+        ...     deep = {"level": level, "child": deep}
+        >>> print(Map.from_tree(deep).child.child.level)
+        4997
+        >>> Map.from_tree({"keys": 1})
+        Traceback (most recent call last):
+            ...
+        KeyError: 'keys attribute is protected'
+        """
+        stack = list()
+        new_node = cls._node_factory()
+        protected = cls.__protected__
+
+        def convert(value):
+            if isinstance(value, Mapping):
+                node = new_node(())
+                stack.append((node, value.items(), True))
+                return node
+            if isinstance(value, list):
+                node = value if share else [None] * len(value)
+                stack.append((node, enumerate(value), False))
+                return node
+            return value
+
+        root = convert(tree)
+        while stack:
+            node, items, is_map = stack.pop()
+            if is_map:
+                for key, value in items:
+                    if key in protected or _is_dunder(key):
+                        raise KeyError("{} attribute is protected".format(key))
+                    dict.__setitem__(node, key, convert(value))
+            else:
+                for key, value in items:
+                    node[key] = convert(value)
+        return root
+
+    @classmethod
+    def from_json(cls, data):
+        """
+        Разбор JSON сразу в дерево Map (object_pairs_hook), без промежуточных dict
+        :param data: JSON документ, bytes или str
+        :return: Map (или list, если корнем JSON был массив)
+        >>> tree = Map.from_json(b'{"users": [{"name": "Boris", "age": 5}], "place": "White House"}')
+        >>> print(tree.users[0].name, type(tree.users[0]).__name__)
+        Boris Map
+        >>> Map.from_json('{"user": {"__class__": 1}}')
+        Traceback (most recent call last):
+            ...
+        KeyError: '__class__ attribute is protected'
+        """
+        return json.loads(data, object_pairs_hook=cls._node_factory())
+
+    @classmethod
+    def _node_factory(cls):
+        # узлы для from_tree/from_json: pairs -> cls с проверенными ключами;
+        # Map создаётся без __new__/__init__ на Python, наследники со своим __init__ - через конструктор
+        protected = cls().__protected__
+        if cls.__init__ is not Map.__init__:
+            return lambda pairs: cls(dict(pairs))
+
+        def new_node(pairs):
+            node = dict.__new__(cls)
+            object.__setattr__(node, '_Map__index', None)
+            dict.update(node, pairs)
+            for key in node:
+                if key in protected or _is_dunder(key):
+                    raise KeyError("{} attribute is protected".format(key))
+            return node
+
+        return new_node
+
     def check_protected(self, key):
         """
         :param key: (any immutable) key
@@ -71,42 +179,81 @@ class Map(dict):
         Traceback (most recent call last):
             ...
         KeyError: '__some_other__ attribute is protected'
+        >>> example.keys = 1
+        Traceback (most recent call last):
+            ...
+        KeyError: 'keys attribute is protected'
+        >>> example[('__tuple__',)] = 2
+        >>> print(example)
+        {'item': 4, ('__tuple__',): 2}
         """
-        if key in self.__protected__ or self.__re__.match(str(key)):
+        if key in self.__protected__ or _is_dunder(key):
             raise KeyError("{} attribute is protected".format(key))
 
     def __getattr__(self, attr):
+        """
+        :param attr: имя атрибута
+        :return: значение ключа или None, служебные __имена__ не подменяются (нужно для pickle)
+        >>> import pickle
+        >>> restored = pickle.loads(pickle.dumps(Map(name="Boris", info={"age": 5})))
+        >>> print(restored.info.age, restored.missing)
+        5 None
+        """
+        if _is_dunder(attr):
+            raise AttributeError(attr)
         return self.get(attr)
 
-    def __setattr__(self, key, value):
-        self.check_protected(key)
-        self.__setitem__(key, value)
-
     def __setitem__(self, key, value):
-        super(Map, self).__setitem__(key, value)
-        self.check_protected(key)
-        self.__dict__.update({key: value})
+        # check_protected, встроенная: через этот путь проходит каждое поле в парсерах
+        if key in self.__protected__ or (
+                key.__class__ is str and len(key) > 4 and key[:2] == '__' and key[-2:] == '__'):
+            raise KeyError("{} attribute is protected".format(key))
+        dict.__setitem__(self, key, value)
+        if self.__index is not None:
+            self.drop_index()
+
+    __setattr__ = __setitem__
 
     def __delattr__(self, item):
-        self.check_protected(item)
         self.__delitem__(item)
 
     def __delitem__(self, key):
         self.check_protected(key)
+        self.drop_index()
         try:
             super(Map, self).__delitem__(key)
-            del self.__dict__[key]
         except KeyError:
             pass
 
-    def _uncover(self, map_object, result, _way=None):
+    def update(self, *args, **kwargs):
+        self.drop_index()
+        super(Map, self).update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self.drop_index()
+        return super(Map, self).setdefault(key, default)
+
+    def pop(self, key, *default):
+        self.drop_index()
+        return super(Map, self).pop(key, *default)
+
+    def popitem(self):
+        self.drop_index()
+        return super(Map, self).popitem()
+
+    def clear(self):
+        self.drop_index()
+        super(Map, self).clear()
+
+    def __getstate__(self):
+        # индекс путей не сериализуется и не копируется
+        return None
+
+    def uncover(self):
         """
-        Метод раскрывает Map дерево в список путей к листьям дерева (рекурсивно)
+        Метод возвращает раскрытое дерево Map
         Корректно работает со списками списков, но корнем должен быть Мар
-        :param map_object: исходый Map объект
-        :param result: список путей к листьям, пути оформлены как списки
-        :param _way: скрытый атрибут с текущим путём
-        :return:
+        :return: список путей к листьям, пути оформлены как списки
         >>> m = Map({
         ...    1: Map({10: "v10"}),
         ...    2: Map({21: "v21",
@@ -125,40 +272,119 @@ class Map(dict):
         >>> print(unc[length//2:])  # second part
         [[3], [4, 0], [4, 1], [4, 2, 0], [4, 2, 1], [4, 2, 2, 422], [4, 3], [4, 4]]
         """
-        if not _way:
-            _way = list()
-
-        if isinstance(map_object, Map):
-            for key in map_object.keys():
-                _way.append(key)
-                self._uncover(map_object[key], result, _way)
-            if _way:
-                _way.pop()
-        elif isinstance(map_object, list):
-            for i, item in enumerate(map_object):
-                _way.append(i)
-                self._uncover(item, result, _way)
+        return [list(way) for way in self.iter_uncover(shared=True)]
+
+    def iter_uncover(self, shared=False):
+        """
+        Генератор путей к листьям дерева в том же порядке, что и uncover, без рекурсии
+        и без накопления всех путей в памяти
+        :param shared: отдавать один и тот же список пути, изменяемый на месте между шагами
+            (общий префикс не копируется; список нужно скопировать, если он нужен после шага)
+        :return: итератор путей-кортежей (или общего списка при shared=True)
+        >>> m = Map({1: Map({10: "v10"}), 2: ["v20", Map({211: "v211"})], 3: "v3"})
+        >>> print(list(m.iter_uncover()))
+        [(1, 10), (2, 0), (2, 1, 211), (3,)]
+        >>> print([way[-1] for way in m.iter_uncover(shared=True)])
+        [10, 0, 211, 3]
+        >>> deep = {"leaf": "v"}
+        >>> for level in range(5000):
+        ...     deep = {"child": deep}
+        >>> print(len(next(Map.from_tree(deep).iter_uncover())))
+        5001
+        """
+        way = list()
+        stack = [iter(self.items())]
+        while stack:
+            for key, value in stack[-1]:
+                way.append(key)
+                if isinstance(value, Map):
+                    stack.append(iter(value.items()))
+                    break
+                if isinstance(value, list):
+                    stack.append(enumerate(value))
+                    break
+                yield way if shared else tuple(way)
+                way.pop()
             else:
-                _way.pop()
+                stack.pop()
+                if way:
+                    way.pop()
+
+    def build_index(self):
+        """
+        Строит индекс путей к листьям: ключ -> пути, содержащие ключ (и отдельно - оканчивающиеся им).
+        Пока индекс есть, find_key не раскрывает дерево заново. Изменение самого Map или любого
+        вложенного Map сбрасывает индекс; после изменения вложенных списков индекс нужно
+        сбросить вручную (drop_index)
+        :return: self
+        >>> m = Map({10: Map({11: "v11", 12: "v12"}), 20: ["v20", Map({11: "v211"})]})
+        >>> print(list(m.build_index().find_key(11)), list(m.find_key(1)), list(m.find_key(12, True)))
+        [[10, 11], [20, 1, 11]] [[20, 1, 11]] [[10, 12]]
+        >>> m[30] = Map({11: "v31"})
+        >>> print(m.has_index(), list(m.find_key(11)))
+        False [[10, 11], [20, 1, 11], [30, 11]]
+        >>> m.build_index()[20][1].c = 2
+        >>> print(m.has_index(), list(m.find_key('c')))
+        False [[20, 1, 'c']]
+        """
+        paths = dict()
+        ends = dict()
+        for way in self.uncover():
+            for key in dict.fromkeys(way):
+                paths.setdefault(key, []).append(way)
+            ends.setdefault(way[-1], []).append(way)
+        stamp = _IndexStamp()
+        watch = self.__index
+        if watch is None:
+            object.__setattr__(self, '_Map__index', [(paths, ends, stamp)])
         else:
-            result.append(_way[:])
-            _way.pop()
+            if watch[0] is not None:
+                watch[0][2].valid = False
+            watch[0] = (paths, ends, stamp)
+        # вложенные Map помнят stamp: их изменение сбрасывает индекс корня (см. drop_index)
+        stack = list(dict.values(self))
+        while stack:
+            value = stack.pop()
+            if isinstance(value, Map):
+                watch = value.__index
+                if watch is None:
+                    object.__setattr__(value, '_Map__index', [None, stamp])
+                else:
+                    watch[1:] = [item for item in watch[1:] if item.valid]
+                    watch.append(stamp)
+                stack.extend(dict.values(value))
+            elif isinstance(value, (list, tuple)):
+                stack.extend(value)
+        return self
 
-    def uncover(self):
+    def _own_index(self):
+        watch = self.__index
+        if watch is None or watch[0] is None or not watch[0][2].valid:
+            return None
+        return watch[0]
+
+    def has_index(self):
+        return self._own_index() is not None
+
+    def drop_index(self):
         """
-        Метод возвращает раскрытое дерево Map
-        :return: список путей к листьям
+        Сбрасывает индекс этого Map и индексы всех Map, в дерево которых он входит
         """
-        uncovered = list()
-        self._uncover(self, uncovered)
-        return uncovered
+        watch = self.__index
+        if watch is not None:
+            object.__setattr__(self, '_Map__index', None)
+            if watch[0] is not None:
+                watch[0][2].valid = False
+            for stamp in watch[1:]:
+                stamp.valid = False
 
-    def find_key(self, key, at_end_only=False):
+    def find_key(self, key, at_end_only=False, first=False):
         """
         Находит полные пути в дереве с вхождениями ключа
         (служит для поиска путей, содержащих ключ, к листьям)
         :param key: искомый ключ
         :param at_end_only: искать только среди листьев
+        :param first: остановиться на первом найденном пути
         :return: итератор с путями
         >>> m = Map({
         ...    10: Map({11: "v11", 12: "v12"}),
@@ -181,15 +407,23 @@ class Map(dict):
         [[20, 23, 1, 231], [20, 23, 1, 232, 0], [20, 23, 1, 232, 1], [40, 1], [40, 2, 1]]
         >>> print(list(m.find_key(1, True)))  # second element of each list inside root Map
         [[20, 23, 1, 232, 1], [40, 1], [40, 2, 1]]
+        >>> print(list(m.find_key(232, first=True)))
+        [[20, 23, 0, 232]]
         """
-        # TODO подумать, может стоит добавить параметр для возвращения первого вхождения
-        for item in self.uncover():
-            if not at_end_only:
-                if key in item:
-                    yield item
-            else:
-                if key == item[-1]:
-                    yield item
+        index = self._own_index()
+        if index is not None:
+            try:
+                found = index[1 if at_end_only else 0].get(key, ())
+            except TypeError:  # нехешируемый ключ в путях не встречается
+                found = ()
+            for item in found[:1] if first else found:
+                yield list(item)
+            return
+        for item in self.iter_uncover(shared=True):
+            if key == item[-1] if at_end_only else key in item:
+                yield list(item)
+                if first:
+                    return
 
     def get_value(self, way):
         """
@@ -226,6 +460,189 @@ class Map(dict):
         else:
             return value
 
+    @staticmethod
+    def compile_path(way):
+        """
+        Готовый к повторному использованию аналог get_value для одного пути:
+        путь компилируется в функцию с цепочкой обращений по индексу value[k0][k1]...
+        :param way: путь к листу дерева
+        :return: функция дерево -> значение листа (KeyError/IndexError, если пути нет)
+        >>> webpage_id = Map.compile_path(["media", "webpage", "id"])
+        >>> print(webpage_id(Map(media={"webpage": {"id": 7}})))
+        7
+        """
+        return _compile_paths((tuple(way),), True)
+
+    @staticmethod
+    def compile_paths(ways):
+        """
+        Компиляция нескольких путей в одну функцию: общие префиксы путей проходятся один раз
+        :param ways: пути к листьям дерева
+        :return: функция дерево -> список значений в порядке ways
+        """
+        return _compile_paths(tuple(tuple(way) for way in ways), False)
+
+    @staticmethod
+    def values_at(maps, way, default=None):
+        """
+        Применяет один путь к списку деревьев
+        :param maps: итерируемое с Map
+        :param way: путь к листу (или функция из compile_path)
+        :param default: значение для деревьев, в которых пути нет
+        :return: список значений
+        >>> messages = [Map(media={"webpage": {"id": 7}}), Map(id=1), Map(media={"webpage": {"id": 9}})]
+        >>> print(Map.values_at(messages, ["media", "webpage", "id"]))
+        [7, None, 9]
+        """
+        accessor = way if callable(way) else Map.compile_path(way)
+        result = list()
+        append = result.append
+        for item in maps:
+            try:
+                append(accessor(item))
+            except (KeyError, IndexError, TypeError):
+                append(default)
+        return result
+
+    def get_values(self, ways):
+        """
+        Значения нескольких путей за один обход (compile_paths, скомпилированные наборы путей кэшируются)
+        :param ways: пути к листьям дерева
+        :return: список значений в порядке ways
+        >>> m = Map({20: Map({23: [Map({231: "v231", 232: "v232"}), "v230"]}), 30: "v3"})
+        >>> print(m.get_values([[20, 23, 0, 232], [30], [20, 23, 1], [20, 23, 0, 231]]))
+        ['v232', 'v3', 'v230', 'v231']
+        >>> m.get_values([[20, 24]])
+        Traceback (most recent call last):
+            ...
+        KeyError: 24
+        """
+        return self.compile_paths(ways)(self)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_paths(ways, single):
+    # дерево префиксов путей: узел [продолжения по ключу, номера путей, оканчивающихся в узле];
+    # каждому узлу соответствует локальная переменная vN = vM[kN] сгенерированной функции
+    trie = [dict(), list()]
+    for number, way in enumerate(ways):
+        node = trie
+        for key in way:
+            child = node[0].get(key)
+            if child is None:
+                child = node[0][key] = [dict(), list()]
+            node = child
+        node[1].append(number)
+    constants = dict()
+    lines = list()
+    results = [None] * len(ways)
+    stack = [('v', trie)]
+    while stack:
+        name, node = stack.pop()
+        for number in node[1]:
+            results[number] = name
+        for key, child in node[0].items():
+            number = len(constants)
+            constants['k%d' % number] = key
+            lines.append('    v{0} = {1}[k{0}]'.format(number, name))
+            stack.append(('v%d' % number, child))
+    lines.append('    return {}'.format(results[0] if single else '[{}]'.format(', '.join(results))))
+    source = 'def accessor(v):\n{}\n'.format('\n'.join(lines))
+    exec(compile(source, '<Map.compile_path>', 'exec'), constants)
+    return constants['accessor']
+
+
+class LazyMap(Map):
+    """
+    Map с отложенной частью: loader дозаполняет словарь при первом обращении
+    к отсутствующему ключу или к содержимому целиком (итерация, len, items, json.dumps)
+    """
+    __slots__ = ('_loader',)
+
+    def __init__(self, seq=None, **kwargs):
+        object.__setattr__(self, '_loader', None)
+        super(LazyMap, self).__init__(seq, **kwargs)
+
+    def defer(self, loader):
+        """
+        :param loader: функция loader(lazy_map), записывающая отложенные ключи
+        :return:
+        >>> calls = list()
+        >>> def load_tail(target):
+        ...     calls.append(1)
+        ...     target.media = Map(caption="photo")
+        >>> message = LazyMap(id=1)
+        >>> message.defer(load_tail)
+        >>> print(message.id, calls)
+        1 []
+        >>> print(message.media.caption, calls)
+        photo [1]
+        >>> print(message.reply_markup, calls)
+        None [1]
+        >>> late = LazyMap(id=2)
+        >>> late.defer(load_tail)
+        >>> print(sorted(late), late.is_loaded())
+        ['id', 'media'] True
+        """
+        object.__setattr__(self, '_loader', loader)
+
+    def is_loaded(self):
+        return self._loader is None
+
+    def materialize(self):
+        """
+        Принудительная загрузка отложенной части
+        :return: self
+        """
+        loader = self._loader
+        if loader is not None:
+            object.__setattr__(self, '_loader', None)
+            loader(self)
+        return self
+
+    def __missing__(self, key):
+        if self._loader is None:
+            raise KeyError(key)
+        self.materialize()
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        if self._loader is not None and not dict.__contains__(self, key):
+            self.materialize()
+        return super(LazyMap, self).get(key, default)
+
+    def __contains__(self, key):
+        return dict.__contains__(self.materialize(), key)
+
+    def __iter__(self):
+        return dict.__iter__(self.materialize())
+
+    def __len__(self):
+        return dict.__len__(self.materialize())
+
+    def __eq__(self, other):
+        if isinstance(other, LazyMap):
+            other.materialize()
+        return dict.__eq__(self.materialize(), other)
+
+    def __reduce_ex__(self, protocol):
+        # загрузчик не сериализуется: копия и pickle получают уже загруженный обычный Map
+        return Map, (), None, None, iter(dict.items(self.materialize()))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return dict.__repr__(self.materialize())
+
+    def keys(self):
+        return dict.keys(self.materialize())
+
+    def values(self):
+        return dict.values(self.materialize())
+
+    def items(self):
+        return dict.items(self.materialize())
+
 
 class IMDict(dict):
     """
@@ -260,18 +677,35 @@ class IMDict(dict):
         ValueError: target value is None
         """
         super(IMDict, self).__init__(*args, **kwargs)
-        for k, v in kwargs.items():
-            self[k] = v
         self.dict = dict(self)
         self._hash = None
+        # ключи постоянны: позиции ключей, число не-None значений и граница _last,
+        # правее которой все значения None (popitem, is_empty и pop за O(1) амортизированно)
+        self._keys = list(self.dict)
+        self._position = {key: position for position, key in enumerate(self._keys)}
+        self._live = sum(1 for value in self.dict.values() if value is not None)
+        self._last = len(self._keys) - 1
 
     def __hash__(self):
+        """
+        Хеш текущего содержимого: XOR хешей пар (ключ, значение), поддерживается в __setitem__
+        :return:
+        >>> first = IMDict(first="First", second="Second")
+        >>> second = IMDict(first="First", second=None)
+        >>> print(hash(first) == hash(second))
+        False
+        >>> second["second"] = "Second"
+        >>> print(hash(first) == hash(second), len({first, second}))
+        True 1
+        """
         if self._hash is None:
-            self._hash = hash(frozenset(self.dict.items()))
+            self._hash = functools.reduce(operator.xor, map(hash, self.items()), 0)
         return self._hash
 
+    __service__ = frozenset(('_hash', 'dict', '_keys', '_position', '_live', '_last'))
+
     def __setattr__(self, key, value):
-        if key == '_hash' or key == 'dict':
+        if key in self.__service__:
             self.__dict__.update({key: value})
         else:
             raise AttributeError("'IMDict' object has no attribute '{}'"
@@ -279,8 +713,23 @@ class IMDict(dict):
 
     def __setitem__(self, key, value):
         if key in self:
+            state = self.__dict__
+            old = super(IMDict, self).__getitem__(key)
             super(IMDict, self).__setitem__(key, value)
-        elif key == '_hash' or key == 'dict':
+            if old is None:
+                if value is not None:
+                    state['_live'] += 1
+                    position = state['_position'][key]
+                    if position > state['_last']:
+                        state['_last'] = position
+            elif value is None:
+                state['_live'] -= 1
+            if state['_hash'] is not None:
+                try:
+                    state['_hash'] ^= hash((key, old)) ^ hash((key, value))
+                except TypeError:  # нехешируемое значение: __hash__ пересчитает (и сообщит об ошибке)
+                    state['_hash'] = None
+        elif key in self.__service__:
             self.__dict__.update({key: value})
         else:
             raise KeyError("Unexpected key {}, expect {}"
@@ -318,6 +767,22 @@ class IMDict(dict):
             else:
                 self[key] = updater[key]
 
+    def __ior__(self, other):
+        """
+        |= через update: чужие ключи пропускаются, _live, _last и _hash поддерживаются
+        :param other: Mapping или пары (ключ, значение)
+        :return: self
+        >>> imd = IMDict(first="First", second=None)
+        >>> hashed = hash(imd)
+        >>> imd |= {"second": "Second", "third": "Third"}
+        >>> print(imd, imd.is_empty(), hash(imd) == hash(IMDict(first="First", second="Second")))
+        {'first': 'First', 'second': 'Second'} False True
+        >>> print(imd.popitem())
+        ('second', 'Second')
+        """
+        self.update(dict(other))
+        return self
+
     def clear(self):
         """
         :return:
@@ -348,14 +813,17 @@ class IMDict(dict):
             ...
         ValueError: popitem(): dictionary values are all None
         """
-        for i in range(len(self)):
-            pop_index = -i-1
-            pop_key = list(self.keys())[pop_index]
-            pop_value = list(self.values())[pop_index]
-            if pop_value is not None:
-                pair = pop_key, self[pop_key]
-                self[pop_key] = None
-                return pair
+        keys = self._keys
+        last = self._last
+        if self._live:
+            while super(IMDict, self).__getitem__(keys[last]) is None:
+                last -= 1
+            pop_key = keys[last]
+            pair = pop_key, self[pop_key]
+            self[pop_key] = None
+            self._last = last - 1
+            return pair
+        self._last = -1
         raise ValueError('popitem(): dictionary values are all None')
 
     def is_empty(self):
@@ -370,10 +838,7 @@ class IMDict(dict):
         >>> print(imd.is_empty())
         True
         """
-        for value in self.values():
-            if value is not None:
-                return False
-        return True
+        return not self._live
 
     def pop(self, k, d=None):
         """
@@ -410,3 +875,29 @@ class IMDict(dict):
             return k, d
         else:
             raise KeyError("Unexpected key {}, expect {}".format(k, self.keys()))
+
+
+class FrozenIMDict(IMDict):
+    """
+    Полностью неизменяемый IMDict: ни ключи, ни значения не меняются, хеш вычисляется один раз
+    (подходит для ключей кэшей и элементов множеств)
+    >>> frozen = FrozenIMDict(first="First", second="Second")
+    >>> print(frozen["first"], hash(frozen) == hash(IMDict(first="First", second="Second")))
+    First True
+    >>> frozen["first"] = "Last"
+    Traceback (most recent call last):
+        ...
+    TypeError: 'FrozenIMDict' object is immutable
+    >>> frozen.pop("first")
+    Traceback (most recent call last):
+        ...
+    TypeError: 'FrozenIMDict' object is immutable
+    >>> frozen |= {"first": "Last"}
+    Traceback (most recent call last):
+        ...
+    TypeError: 'FrozenIMDict' object is immutable
+    """
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("'FrozenIMDict' object is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = update = clear = popitem = pop = setdefault = _immutable